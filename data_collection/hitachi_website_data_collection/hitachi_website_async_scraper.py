@@ -0,0 +1,752 @@
+"""
+Hitachi Website Asyncio Scraping Backend
+
+Event-loop variants of scrape_bushing_data and scrape_catalog_data plus matching
+batch drivers. Every request is a coroutine, so thousands of requests can be in
+flight under a semaphore from a single OS thread instead of one blocking
+requests.get call (or one worker thread) per request.
+
+Page validation, parsing, raw HTML storage and error logging are shared with the
+blocking scrapers (process_bushing_page / process_catalog_page), so the CSV files,
+error logs and raw HTML written by this backend are the same as the serial ones.
+Parsing runs on the default thread pool and saving results on one writer thread,
+so the event loop only moves bytes. Transient failures are retried from a
+RetryQueue after the main pass (--max-retries), and a key that succeeds again is
+cleared from the error log, as in the blocking batch scrapers.
+
+The HTTP transport is pluggable: anything with `async get(url, headers)` and
+`async close()` methods works. Two transports are provided:
+    stream  - stdlib-only HTTP/1.1 client built on asyncio streams (always available)
+    aiohttp - pooled aiohttp client session (used when aiohttp is installed)
+
+Usage:
+    python hitachi_website_async_scraper.py crossref --start 1 --end 50000 --concurrency 500 --delay 0.01
+    python hitachi_website_async_scraper.py crossref --indices 42131,42246 --mode overwrite
+    python hitachi_website_async_scraper.py catalog --all --concurrency 200 --delay 0.05
+    python hitachi_website_async_scraper.py catalog --styles 138W0800XA,196W1620UW --transport stream
+    python hitachi_website_async_scraper.py crossref --start 1 --end 50000 --storage sqlite
+    python hitachi_website_async_scraper.py crossref --start 1 --end 50000 --max-retries 5
+
+Author: Data Collection System
+Date: October 16, 2026
+Version: 1.0 - Initial asyncio backend
+"""
+
+import argparse
+import asyncio
+import gzip
+import os
+import ssl
+import sys
+import time
+import zlib
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, Iterable, Optional, Tuple
+from urllib.parse import urlsplit
+
+import pandas as pd
+
+import hitachi_website_data_scraper as crossref
+import hitachi_website_catalog_scraper as catalog
+import hitachi_website_data_batch_scraper as crossref_batch
+import hitachi_website_catalog_batch_scraper as catalog_batch
+import hitachi_website_error_types as error_types
+from hitachi_website_rate_limiter import RateLimiter, AdaptiveRateLimiter
+from hitachi_website_retry_queue import RetryQueue
+from hitachi_website_csv_writer import close_all_writers
+from scraping_http_client import (
+    HITACHI_HEADERS,
+    notify_response,
+    add_response_listener,
+    remove_response_listener
+)
+
+try:
+    import aiohttp
+except ImportError:  # Optional dependency - the stream transport needs only the stdlib
+    aiohttp = None
+
+logger = crossref.logger
+
+REQUEST_TIMEOUT = 30.0
+
+# Same browser headers as the blocking scrapers; brotli is dropped because the
+# stdlib cannot decode it, and the stream transport manages Connection itself
+REQUEST_HEADERS = {
+    key: value for key, value in HITACHI_HEADERS.items() if key != 'Connection'
+}
+REQUEST_HEADERS['Accept-Encoding'] = 'gzip, deflate'
+
+
+class TransportError(ConnectionError):
+    """Network-level failure (connection refused/reset, malformed response, ...)."""
+
+
+@dataclass
+class TransportResponse:
+    """HTTP response returned by an async transport."""
+    status: int
+    reason: str
+    url: str
+    content: bytes
+    headers: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def text(self) -> str:
+        """
+        Decode the body the way requests.Response.text does: charset from the
+        Content-Type header, ISO-8859-1 for text/* without a charset.
+        """
+        content_type = self.headers.get('content-type', '')
+        encoding = None
+        for param in content_type.split(';')[1:]:
+            key, _, value = param.strip().partition('=')
+            if key.lower() == 'charset' and value:
+                encoding = value.strip('\'"')
+        if encoding is None and content_type.startswith('text'):
+            encoding = 'ISO-8859-1'
+        try:
+            return self.content.decode(encoding or 'utf-8', errors='replace')
+        except LookupError:
+            return self.content.decode('utf-8', errors='replace')
+
+
+class StreamTransport:
+    """
+    Minimal HTTP/1.1 GET client on asyncio streams (stdlib only).
+    Opens one connection per request; supports https, chunked transfer
+    encoding and gzip/deflate content encoding.
+    """
+
+    def __init__(self, timeout: float = REQUEST_TIMEOUT):
+        self.timeout = timeout
+        self._ssl_context = ssl.create_default_context()
+
+    async def get(self, url: str, headers: Dict[str, str]) -> TransportResponse:
+        return await asyncio.wait_for(self._get(url, headers), timeout=self.timeout)
+
+    async def _get(self, url: str, headers: Dict[str, str]) -> TransportResponse:
+        parts = urlsplit(url)
+        is_https = parts.scheme == 'https'
+        port = parts.port or (443 if is_https else 80)
+        target = (parts.path or '/') + (f"?{parts.query}" if parts.query else '')
+
+        try:
+            reader, writer = await asyncio.open_connection(
+                parts.hostname, port, ssl=self._ssl_context if is_https else None
+            )
+        except OSError as e:
+            raise TransportError(f"Failed to connect to {parts.netloc}: {e}") from e
+
+        try:
+            request_headers = {'Host': parts.netloc, **headers, 'Connection': 'close'}
+            head = f"GET {target} HTTP/1.1\r\n"
+            head += ''.join(f"{key}: {value}\r\n" for key, value in request_headers.items())
+            writer.write((head + "\r\n").encode('latin-1'))
+            await writer.drain()
+
+            status_line = (await reader.readline()).decode('latin-1').strip()
+            version, _, rest = status_line.partition(' ')
+            if not version.startswith('HTTP/'):
+                raise TransportError(f"Malformed status line from {parts.netloc}: {status_line[:50]!r}")
+            status_text, _, reason = rest.partition(' ')
+
+            response_headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b'\r\n', b'\n', b''):
+                    break
+                key, _, value = line.decode('latin-1').partition(':')
+                response_headers[key.strip().lower()] = value.strip()
+
+            if 'chunked' in response_headers.get('transfer-encoding', '').lower():
+                body = await self._read_chunked(reader)
+            elif 'content-length' in response_headers:
+                body = await reader.readexactly(int(response_headers['content-length']))
+            else:
+                body = await reader.read()
+
+            encoding = response_headers.get('content-encoding', '').lower()
+            if encoding == 'gzip':
+                body = gzip.decompress(body)
+            elif encoding == 'deflate':
+                try:
+                    body = zlib.decompress(body)
+                except zlib.error:
+                    body = zlib.decompress(body, -zlib.MAX_WBITS)
+
+            return TransportResponse(int(status_text), reason, url, body, response_headers)
+
+        except (OSError, asyncio.IncompleteReadError, ValueError, zlib.error) as e:
+            raise TransportError(f"Connection to {parts.netloc} failed: {e}") from e
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except (OSError, ssl.SSLError):
+                pass
+
+    @staticmethod
+    async def _read_chunked(reader: asyncio.StreamReader) -> bytes:
+        chunks = []
+        while True:
+            size_line = await reader.readline()
+            size = int(size_line.split(b';')[0].strip() or b'0', 16)
+            if size == 0:
+                # Consume optional trailers up to the terminating blank line
+                while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+                    pass
+                return b''.join(chunks)
+            chunks.append(await reader.readexactly(size))
+            await reader.readline()
+
+    async def close(self):
+        pass
+
+
+class AiohttpTransport:
+    """Pooled aiohttp session (requires the optional aiohttp package)."""
+
+    def __init__(self, limit: int = 100, timeout: float = REQUEST_TIMEOUT):
+        if aiohttp is None:
+            raise ImportError("aiohttp is not installed - use the stream transport instead")
+        self._limit = limit
+        self._timeout = aiohttp.ClientTimeout(total=timeout)
+        self._session = None
+
+    async def get(self, url: str, headers: Dict[str, str]) -> TransportResponse:
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self._limit),
+                timeout=self._timeout
+            )
+        try:
+            async with self._session.get(url, headers=headers) as response:
+                content = await response.read()
+                return TransportResponse(
+                    response.status, response.reason or '', url, content,
+                    {key.lower(): value for key, value in response.headers.items()}
+                )
+        except aiohttp.ClientError as e:
+            raise TransportError(str(e)) from e
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+def create_transport(name: str = 'auto', concurrency: int = 100):
+    """
+    Build an async transport by name.
+
+    Args:
+        name: 'auto' (aiohttp if installed, else stream), 'stream' or 'aiohttp'
+        concurrency: Connection pool size hint for pooled transports
+
+    Returns:
+        Transport instance
+    """
+    if name == 'aiohttp' or (name == 'auto' and aiohttp is not None):
+        return AiohttpTransport(limit=concurrency)
+    return StreamTransport()
+
+
+async def _fetch_and_process(key, label: str, url: str, transport,
+                             log_error: Callable, discard_raw_html: Callable,
+                             process_page: Callable) -> Optional[Dict[str, str]]:
+    """
+    Fetch one page and hand it to the shared page processor.
+    Mirrors the status and exception handling of the blocking scrapers so the
+    error log messages are identical.
+    """
+    subject = f"{label} {key}"
+    start = time.monotonic()
+    try:
+        try:
+            response = await transport.get(url, REQUEST_HEADERS)
+        except (asyncio.TimeoutError, TransportError) as e:
+            notify_response(None, time.monotonic() - start, e)
+            raise
+        notify_response(response.status, time.monotonic() - start)
+
+        if response.status == 404:
+            log_error(key, 'Page not found (HTTP 404)', error_types.HTTP_404, 404)
+            logger.warning(f"{subject.capitalize()} not found (404)")
+            discard_raw_html(key, error_types.HTTP_404)
+            return None
+        elif response.status == 403:
+            log_error(key, 'Access forbidden (HTTP 403)', error_types.HTTP_403, 403)
+            logger.warning(f"Access forbidden for {subject} (403)")
+            discard_raw_html(key, error_types.HTTP_403)
+            return None
+        elif response.status >= 400:
+            kind = 'Client' if response.status < 500 else 'Server'
+            message = f"{response.status} {kind} Error: {response.reason} for url: {url}"
+            error_type = error_types.http_error_type(response.status)
+            log_error(key, f'HTTP error {response.status}: {message[:100]}', error_type, response.status)
+            logger.error(f"HTTP error for {subject}: {message}")
+            discard_raw_html(key, error_type)
+            return None
+
+        # Parsing is CPU work - keep it off the event loop
+        return await asyncio.get_running_loop().run_in_executor(
+            None, lambda: process_page(key, response.text, response.content)
+        )
+
+    except asyncio.TimeoutError:
+        log_error(key, f'Request timeout after {REQUEST_TIMEOUT:.0f} seconds', error_types.TIMEOUT)
+        logger.error(f"Timeout fetching data for {subject}")
+        discard_raw_html(key, error_types.TIMEOUT)
+        return None
+
+    except TransportError as e:
+        log_error(key, f'Network connection error: {str(e)[:100]}', error_types.CONNECTION_ERROR)
+        logger.error(f"Connection error for {subject}: {e}")
+        discard_raw_html(key, error_types.CONNECTION_ERROR)
+        return None
+
+    except Exception as e:
+        log_error(key, f'Unexpected error: {str(e)[:100]}', error_types.UNKNOWN_ERROR)
+        logger.error(f"Unexpected error for {subject}: {e}")
+        discard_raw_html(key, error_types.UNKNOWN_ERROR)
+        return None
+
+
+async def scrape_bushing_data_async(index: int, transport) -> Optional[Dict[str, str]]:
+    """
+    Asyncio variant of hitachi_website_data_scraper.scrape_bushing_data.
+
+    Args:
+        index: The bushing index number to scrape
+        transport: Async HTTP transport (see create_transport)
+
+    Returns:
+        Dictionary containing scraped data or None if scraping fails
+    """
+    url = f"{crossref.BASE_URL}?INDEX={index}"
+    logger.info(f"Scraping data for index {index} from {url}")
+    return await _fetch_and_process(
+        index, 'index', url, transport,
+        crossref.log_error_to_csv, crossref.discard_raw_html, crossref.process_bushing_page
+    )
+
+
+async def scrape_catalog_data_async(style_number: str, transport) -> Optional[Dict[str, str]]:
+    """
+    Asyncio variant of hitachi_website_catalog_scraper.scrape_catalog_data.
+
+    Args:
+        style_number: The ABB style number to scrape (e.g., "138W0800XA")
+        transport: Async HTTP transport (see create_transport)
+
+    Returns:
+        Dictionary containing scraped catalog data or None if scraping fails
+    """
+    url = f"{catalog.BASE_URL}?StyleNumber={style_number}&Language=English&Units=English"
+    logger.info(f"Scraping catalog data for style {style_number} from {url}")
+    return await _fetch_and_process(
+        style_number, 'style', url, transport,
+        catalog.log_error_to_csv, catalog.discard_raw_html, catalog.process_catalog_page
+    )
+
+
+async def run_batch_async(keys: Iterable, should_skip: Callable[[int, object], bool],
+                          fetch: Callable[[object, object], Awaitable],
+                          record: Callable[[int, object, object, int], bool],
+                          concurrency: int = 100, delay: float = 0.0,
+                          transport=None, adaptive: bool = False,
+                          max_rate: float = 20.0, max_retries: int = 0,
+                          last_error_type: Optional[Callable[[object], Optional[str]]] = None,
+                          describe: Callable[[int, object], str] = lambda pos, key: str(key),
+                          log_error: Optional[Callable] = None,
+                          close: Optional[Callable[[], None]] = None) -> Tuple[int, int, int]:
+    """
+    Generic asyncio batch driver.
+
+    Keys are visited in order; skipped keys never start a request. At most
+    `concurrency` requests are in flight at once (bounded by a semaphore, so
+    only that many task objects exist at any time), and `delay` acts as a
+    global requests-per-second budget like --delay in the threaded scrapers.
+    Results are recorded as they complete, one at a time on a writer thread.
+    A key that fails with a transient error is retried after the main pass with
+    exponential backoff and only counts as failed once max_retries is exhausted.
+    An exception escaping fetch or record is logged as UNKNOWN_ERROR and counts
+    as a failure. A key listed again while its earlier request is in flight
+    waits until that one is recorded, so the skip check sees the same state
+    as in a serial run and two writes of one key never overlap.
+
+    Args:
+        keys: Keys (indices or style numbers) in processing order
+        should_skip: Callable(pos, key) -> True if the key was skipped
+        fetch: Coroutine function(key, transport) -> scraped dict or None
+        record: Callable(pos, key, data, attempt) -> True if the record was saved
+        concurrency: Maximum number of requests in flight
+        delay: Delay in seconds between request starts (0 = unlimited)
+        transport: Async transport (created and closed here if omitted)
+        adaptive: Steer the request rate with the AIMD controller
+        max_rate: Upper bound in requests/second for the adaptive controller
+        max_retries: Retries per key for transient errors (0 = none)
+        last_error_type: Callable(key) -> error type of the key's last failure
+        describe: Callable(pos, key) -> key label for the retry lines
+        log_error: The scraper's log_error_to_csv, for exceptions escaping fetch or record
+        close: Callable() run after the writers are closed (e.g. the status map)
+
+    Returns:
+        Tuple of (success_count, failure_count, skipped_count)
+    """
+    own_transport = transport is None
+    if own_transport:
+        transport = create_transport('auto', concurrency)
+
+    if adaptive:
+        limiter = AdaptiveRateLimiter.from_delay(delay, max_rate=max_rate)
+        add_response_listener(limiter.observe)
+    else:
+        limiter = RateLimiter.from_delay(delay)
+    loop = asyncio.get_running_loop()
+    # Results are saved by one thread, in completion order, as the blocking scrapers do
+    writer = ThreadPoolExecutor(max_workers=1)
+    semaphore = asyncio.Semaphore(concurrency)
+    tasks = set()
+    in_flight = Counter()   # keys with a started request whose result is not recorded yet
+    retry_queue = RetryQueue()
+    counts = {'success': 0, 'failure': 0, 'skipped': 0}
+
+    async def worker(pos: int, key, attempt: int):
+        try:
+            await limiter.acquire_async()
+            data = await fetch(key, transport)
+            if not data and last_error_type is not None:
+                error_type = last_error_type(key)
+                if error_types.is_transient_error(error_type) and attempt < max_retries:
+                    wait = retry_queue.schedule((pos, key), attempt + 1)
+                    print(f"↺ {describe(pos, key)}: {error_type}, retry {attempt + 1}/{max_retries} in {wait:.1f}s")
+                    return
+            saved = await loop.run_in_executor(writer, record, pos, key, data, attempt)
+            counts['success' if saved else 'failure'] += 1
+        except Exception as e:
+            logger.error(f"Unexpected error for {describe(pos, key)}: {e}")
+            if log_error is not None:
+                log_error(key, f'Unexpected error: {str(e)[:100]}', error_types.UNKNOWN_ERROR)
+            print(f"✗ {describe(pos, key)}: Failed with {type(e).__name__}")
+            counts['failure'] += 1
+        finally:
+            in_flight[key] -= 1
+            semaphore.release()
+
+    async def wait_recorded(key):
+        while in_flight[key]:
+            await asyncio.wait(set(tasks), return_when=asyncio.FIRST_COMPLETED)
+
+    async def start(pos: int, key, attempt: int):
+        await semaphore.acquire()
+        in_flight[key] += 1
+        task = asyncio.create_task(worker(pos, key, attempt))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+
+    try:
+        for pos, key in enumerate(keys, 1):
+            await wait_recorded(key)
+            if should_skip(pos, key):
+                counts['skipped'] += 1
+                continue
+            await start(pos, key, 0)
+
+        # Low-priority pass: retry transient failures once their backoff has elapsed
+        while retry_queue or tasks:
+            if not retry_queue:
+                await asyncio.wait(set(tasks), return_when=asyncio.FIRST_COMPLETED)
+                continue
+            (pos, key), attempt = await retry_queue.pop_async()
+            logger.info(f"Retrying {describe(pos, key)} (attempt {attempt}/{max_retries})")
+            await wait_recorded(key)
+            await start(pos, key, attempt)
+    finally:
+        writer.shutdown(wait=True)
+        if own_transport:
+            await transport.close()
+        # Flush the master CSV and apply overwrite-mode replacements
+        close_all_writers()
+        if close is not None:
+            close()
+        if adaptive:
+            remove_response_listener(limiter.observe)
+            logger.info(f"Adaptive rate {limiter.report()}")
+            print(f"\n⚙  Adaptive rate {limiter.report()}")
+
+    return counts['success'], counts['failure'], counts['skipped']
+
+
+async def scrape_indices_async(indices: Iterable[int], total: int, delay: float = 0.0,
+                               mode: str = 'append', concurrency: int = 100,
+                               transport=None, adaptive: bool = False,
+                               max_rate: float = 20.0, max_retries: int = 3) -> Tuple[int, int, int]:
+    """
+    Asyncio counterpart of hitachi_website_data_batch_scraper.scrape_indices.
+    Applies the same error-log and append-mode skip rules and output lines.
+
+    Args:
+        indices: Index numbers to scrape, in processing order
+        total: Number of indices (for progress output)
+        delay: Delay in seconds between request starts (0 = unlimited)
+        mode: Write mode - 'append', 'overwrite' or 'scratch'
+        concurrency: Maximum number of requests in flight
+        transport: Async transport (default: create_transport('auto'))
+        adaptive: Steer the request rate with the AIMD controller
+        max_rate: Upper bound in requests/second for the adaptive controller
+        max_retries: Retries per index for transient errors (default: 3)
+
+    Returns:
+        Tuple of (success_count, failure_count, skipped_count)
+    """
+    if mode == 'scratch':
+        crossref_batch.clean_scratch_mode()
+
+    error_log_indices = crossref.get_error_log_indices()
+    transient_indices = crossref.get_transient_error_log_indices()
+    logger.info(f"Loaded {len(error_log_indices)} permanent and {len(transient_indices)} transient failures from error log")
+    crossref_batch.load_processed_index()
+    crossref_batch.open_status_map()
+
+    def should_skip(pos: int, i: int) -> bool:
+        if i in error_log_indices:
+            crossref.delete_raw_html(i)
+            logger.info(f"Skipping index {i} (in error log, HTML deleted if existed) ({pos}/{total})")
+            print(f"⊘ Index {i}: Skipped (in error log)")
+            return True
+        if mode == 'append' and crossref_batch.check_index_exists(i):
+            logger.info(f"Skipping index {i} (already exists) ({pos}/{total})")
+            print(f"⊘ Index {i}: Skipped (already processed)")
+            return True
+        logger.info(f"Processing index {i} ({pos}/{total})")
+        return False
+
+    def record(pos: int, i: int, data, attempt: int) -> bool:
+        if not crossref_batch.record_result(i, data, mode):
+            return False
+        if attempt > 0 or i in transient_indices:
+            crossref.clear_error_from_csv(i)
+        return True
+
+    return await run_batch_async(indices, should_skip, scrape_bushing_data_async, record,
+                                 concurrency, delay, transport, adaptive, max_rate, max_retries,
+                                 crossref.get_last_error_type, lambda pos, i: f"Index {i}",
+                                 crossref.log_error_to_csv, crossref_batch.close_status_map)
+
+
+async def scrape_styles_async(style_numbers: list, delay: float = 0.0, mode: str = 'append',
+                              concurrency: int = 100, transport=None, adaptive: bool = False,
+                              max_rate: float = 20.0, max_retries: int = 3) -> Tuple[int, int, int]:
+    """
+    Asyncio counterpart of hitachi_website_catalog_batch_scraper.scrape_batch.
+    Applies the same error-log and append-mode skip rules and output lines.
+
+    Args:
+        style_numbers: List of ABB style numbers to scrape
+        delay: Delay in seconds between request starts (0 = unlimited)
+        mode: Write mode - 'append', 'overwrite' or 'scratch'
+        concurrency: Maximum number of requests in flight
+        transport: Async transport (default: create_transport('auto'))
+        adaptive: Steer the request rate with the AIMD controller
+        max_rate: Upper bound in requests/second for the adaptive controller
+        max_retries: Retries per style for transient errors (default: 3)
+
+    Returns:
+        Tuple of (success_count, failure_count, skipped_count)
+    """
+    if mode == 'scratch':
+        catalog_batch.clean_scratch_mode()
+        print("Reinitializing catalog master list after scratch...\n")
+        if not catalog_batch.initialize_catalog_master_list(force=True):
+            logger.error("Failed to reinitialize catalog master list")
+            sys.exit(1)
+
+    error_log_styles = catalog.get_error_log_style_numbers()
+    transient_styles = catalog.get_transient_error_log_style_numbers()
+    logger.info(f"Loaded {len(error_log_styles)} permanent and {len(transient_styles)} transient failures from error log")
+    catalog_batch.load_processed_index()
+    total = len(style_numbers)
+
+    def should_skip(pos: int, style: str) -> bool:
+        if style in error_log_styles:
+            catalog.delete_raw_html(style)
+            logger.info(f"Skipping style {style} (in error log, HTML deleted if existed) ({pos}/{total})")
+            print(f"⊘ [{pos}/{total}] Style {style}: Skipped (in error log)")
+            return True
+        if mode == 'append' and catalog_batch.check_style_exists(style):
+            logger.info(f"Skipping style {style} (already exists) ({pos}/{total})")
+            print(f"⊘ [{pos}/{total}] Style {style}: Skipped (already processed)")
+            return True
+        logger.info(f"Processing style {style} ({pos}/{total})")
+        return False
+
+    def record(pos: int, style: str, data, attempt: int) -> bool:
+        if not catalog_batch.record_result(pos, total, style, data, mode):
+            return False
+        if attempt > 0 or style in transient_styles:
+            catalog.clear_error_from_csv(style)
+        return True
+
+    return await run_batch_async(style_numbers, should_skip, scrape_catalog_data_async, record,
+                                 concurrency, delay, transport, adaptive, max_rate, max_retries,
+                                 catalog.get_last_error_type, lambda pos, style: f"[{pos}/{total}] Style {style}",
+                                 catalog.log_error_to_csv)
+
+
+async def run_with_transport(transport, coroutine):
+    """Await a batch coroutine and close its transport afterwards."""
+    try:
+        return await coroutine
+    finally:
+        await transport.close()
+
+
+def print_summary(title: str, total: int, counts: Tuple[int, int, int], output_csv: str, error_log_csv: str):
+    """Print the end-of-run summary in the same format as the batch scrapers."""
+    success_count, failure_count, skipped_count = counts
+    logger.info(f"Batch scrape completed: {success_count} successful, {failure_count} failed, {skipped_count} skipped")
+    print(f"\n{'='*70}")
+    print(title)
+    print(f"{'='*70}")
+    print(f"Total: {total}")
+    print(f"Successful: {success_count}")
+    print(f"Failed: {failure_count}")
+    print(f"Skipped: {skipped_count}")
+    print(f"Success Rate: {(success_count/(total-skipped_count)*100 if total-skipped_count > 0 else 0):.1f}%")
+    if failure_count > 0:
+        print(f"\n⚠  Errors logged to: {error_log_csv}")
+    if success_count > 0:
+        print(f"\n✓ Data saved to: {output_csv}")
+
+
+def read_keys_file(filepath: str) -> list:
+    """Read one key per line, skipping blank lines and # comments."""
+    with open(filepath, 'r') as f:
+        return [line.strip() for line in f if line.strip() and not line.strip().startswith('#')]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Asyncio batch scraper for Hitachi Energy cross-reference and catalog data',
+        epilog='Examples:\n'
+               '  python hitachi_website_async_scraper.py crossref --start 1 --end 50000 --concurrency 500 --delay 0.01\n'
+               '  python hitachi_website_async_scraper.py crossref --indices 42131,42246 --mode overwrite\n'
+               '  python hitachi_website_async_scraper.py catalog --all --concurrency 200 --delay 0.05\n',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    crossref_parser = subparsers.add_parser('crossref', help='Scrape cross-reference pages by INDEX')
+    crossref_input = crossref_parser.add_mutually_exclusive_group(required=True)
+    crossref_input.add_argument('--start', type=int, help='Starting index (use with --end)')
+    crossref_input.add_argument('--indices', type=str, help='Comma-separated list of indices')
+    crossref_input.add_argument('--file', type=str, help='File containing indices (one per line)')
+    crossref_parser.add_argument('--end', type=int, help='Ending index (use with --start)')
+
+    catalog_parser = subparsers.add_parser('catalog', help='Scrape catalog pages by style number')
+    catalog_input = catalog_parser.add_mutually_exclusive_group(required=True)
+    catalog_input.add_argument('--all', action='store_true', help='Process all style numbers from catalog master list')
+    catalog_input.add_argument('--styles', type=str, help='Comma-separated list of style numbers')
+    catalog_input.add_argument('--file', type=str, help='File containing style numbers (one per line)')
+
+    for sub in (crossref_parser, catalog_parser):
+        sub.add_argument('--concurrency', type=int, default=100,
+                         help='Maximum number of requests in flight (default: 100)')
+        sub.add_argument('--delay', type=float, default=1.0,
+                         help='Global delay in seconds between request starts, 0 for unlimited (default: 1.0)')
+        sub.add_argument('--mode', type=str, default='append',
+                         choices=['append', 'overwrite', 'scratch'],
+                         help='Write mode: append (default, skip existing), overwrite (replace existing), scratch (delete all first)')
+        sub.add_argument('--transport', type=str, default='auto',
+                         choices=['auto', 'stream', 'aiohttp'],
+                         help='HTTP transport: auto (aiohttp if installed), stream (stdlib) or aiohttp')
+        sub.add_argument('--adaptive', action='store_true',
+                         help='Adapt the request rate (AIMD) from latency, HTTP 5xx and timeouts')
+        sub.add_argument('--max-rate', type=float, default=20.0,
+                         help='Upper bound in requests/second for --adaptive (default: 20.0)')
+        sub.add_argument('--max-retries', type=int, default=3,
+                         help='Retries per key for transient errors (timeouts, connection errors, '
+                              'HTTP 5xx) with exponential backoff after the main pass (default: 3)')
+        sub.add_argument('--base-url', type=str, default=None,
+                         help='Site root to scrape instead of the live site, e.g. http://127.0.0.1:8765 '
+                              'for hitachi_website_replay_server.py')
+        sub.add_argument('--storage', type=str, default='csv', choices=['csv', 'sqlite'],
+                         help='Master list storage: csv (default) or sqlite (upsert into the .db next to the CSV)')
+        sub.add_argument('--raw-storage', type=str, default='files', choices=['files', 'archive'],
+                         help='Raw HTML storage: files (default) or archive (compressed .pack next to the folder)')
+        sub.add_argument('--raw-content', type=str, default='full', choices=['full', 'fragment'],
+                         help='Raw HTML content: full (default) or fragment (boilerplate stripped, verified to parse identically)')
+        sub.add_argument('--parse-cache', action='store_true',
+                         help='Look parsed records up by page hash before parsing (hitachi_website_parse_cache.py)')
+    crossref_parser.add_argument('--parser', type=str, default='fast', choices=['fast', 'soup'],
+                                 help='Page parser: fast (default, lxml) or soup (the BeautifulSoup reference parser)')
+
+    args = parser.parse_args()
+
+    if args.concurrency < 1:
+        parser.error('--concurrency must be at least 1')
+    if args.max_retries < 0:
+        parser.error('--max-retries must not be negative')
+    if args.transport == 'aiohttp' and aiohttp is None:
+        parser.error('--transport aiohttp requires the aiohttp package')
+    if args.base_url:
+        crossref.configure_base_url(args.base_url)
+        catalog.configure_base_url(args.base_url)
+    crossref.configure_storage(args.storage)
+    catalog.configure_storage(args.storage)
+    crossref.configure_raw_storage(args.raw_storage)
+    catalog.configure_raw_storage(args.raw_storage)
+    crossref.configure_raw_content(args.raw_content)
+    catalog.configure_raw_content(args.raw_content)
+    crossref.configure_parse_cache(args.parse_cache)
+    catalog.configure_parse_cache(args.parse_cache)
+    if args.command == 'crossref':
+        crossref.configure_parser(args.parser)
+
+    transport = create_transport(args.transport, args.concurrency)
+
+    if args.command == 'crossref':
+        if args.start is not None:
+            if args.end is None:
+                parser.error('--start requires --end')
+            if args.start > args.end:
+                parser.error('--start must be less than or equal to --end')
+            indices = range(args.start, args.end + 1)
+        else:
+            raw = args.indices.split(',') if args.indices else read_keys_file(args.file)
+            try:
+                indices = [int(x.strip()) for x in raw]
+            except ValueError:
+                parser.error('indices must be integers')
+
+        counts = asyncio.run(run_with_transport(transport, scrape_indices_async(
+            indices, len(indices), args.delay, args.mode, args.concurrency, transport,
+            args.adaptive, args.max_rate, args.max_retries
+        )))
+        print_summary(f"Async Batch Scraping Complete - Mode: {args.mode.upper()}", len(indices),
+                      counts, crossref_batch.master_list_path(), crossref.ERROR_LOG_CSV)
+
+    else:
+        if args.all:
+            if not os.path.exists(catalog.OUTPUT_CSV):
+                parser.error(f'Catalog master list not found: {catalog.OUTPUT_CSV} (run the catalog batch scraper with --initialize first)')
+            style_numbers = pd.read_csv(catalog.OUTPUT_CSV)['Style Number'].dropna().unique().tolist()
+        elif args.styles:
+            style_numbers = [s.strip() for s in args.styles.split(',')]
+        else:
+            style_numbers = read_keys_file(args.file)
+
+        counts = asyncio.run(run_with_transport(transport, scrape_styles_async(
+            style_numbers, args.delay, args.mode, args.concurrency, transport,
+            args.adaptive, args.max_rate, args.max_retries
+        )))
+        print_summary(f"Async Catalog Scraping Complete - Mode: {args.mode.upper()}", len(style_numbers),
+                      counts, catalog_batch.master_list_path(), catalog.ERROR_LOG_CSV)
+
+
+if __name__ == "__main__":
+    main()
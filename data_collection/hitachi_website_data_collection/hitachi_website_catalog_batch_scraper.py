@@ -20,10 +20,43 @@ Usage:
     python hitachi_website_catalog_batch_scraper.py --style 138W0800XA
     python hitachi_website_catalog_batch_scraper.py --styles 138W0800XA,196W1620UW --mode overwrite
     python hitachi_website_catalog_batch_scraper.py --file style_numbers.txt --delay 0.5
+    python hitachi_website_catalog_batch_scraper.py --all --delay 0.5 --adaptive --max-rate 10
+    python hitachi_website_catalog_batch_scraper.py --all --delay 0.5 --max-retries 5
+    python hitachi_website_catalog_batch_scraper.py --all --delay 0.5 --shard 2/4
+
+Sharded Runs:
+    --shard K/N takes only the style numbers of shard K (CRC32 of the style number
+    modulo N) and writes a separate catalog CSV, error log and raw HTML folder
+    (suffix _shardKofN). The style numbers for --all still come from the canonical
+    catalog master list. Combine the outputs afterwards with
+    `python hitachi_website_sharding.py merge catalog`.
+
+Resuming:
+    Every run writes an append-only progress journal (hitachi_website_catalog_scraping_journal.log).
+    --resume continues the last run with the style numbers that have no recorded outcome yet;
+    --progress reports how far the last run got. Both accept --shard K/N.
+
+Storage:
+    --storage sqlite upserts records into hitachi_website_bushing_catalog_master_list.db
+    (seeded from the catalog CSV) instead of appending to the CSV; the CSV is
+    rewritten only by `python hitachi_website_sqlite_store.py export catalog`.
+    --raw-storage archive appends the raw HTML pages to a compressed pack
+    (catalog_data.pack) instead of writing one file per page; extract
+    pages with `python hitachi_website_html_archive.py extract catalog <key>`.
+    --raw-content fragment saves only the data-bearing part of each page (the
+    site template is stored once) when it parses to the same record.
+    --parse-cache looks each page's record up by page hash before parsing it
+    (hitachi_website_parse_cache.py), so an overwrite refresh does not parse
+    unchanged pages again.
+
+Error Handling:
+    Permanent failures (NO_BUSHING_FOUND, HTTP_404, NO_DATA) are skipped on later runs.
+    Transient failures (timeouts, connection errors, HTTP 5xx, ...) are retried with
+    exponential backoff and jitter after the main pass, and fetched again on the next run.
 
 Author: Data Collection System
 Date: February 13, 2026
-Version: 1.0 - Initial catalog batch scraping implementation
+Version: 1.9 - Content-hash keyed parse result cache (--parse-cache)
 """
 
 import argparse
@@ -33,6 +66,7 @@ import os
 import shutil
 import pandas as pd
 from pathlib import Path
+from typing import List, Optional, Tuple
 from hitachi_website_catalog_scraper import (
     scrape_catalog_data,
     save_to_csv,
@@ -42,9 +76,128 @@ from hitachi_website_catalog_scraper import (
     OUTPUT_CSV,
     RAW_DATA_DIR,
     COLUMNS,
+    configure_output_paths,
     get_error_log_style_numbers,
-    delete_raw_html
+    get_transient_error_log_style_numbers,
+    get_last_error_type,
+    clear_error_from_csv,
+    write_error_entry,
+    delete_raw_html,
+    raw_html_filename,
+    configure_base_url,
+    configure_storage,
+    database_path,
+    get_store,
+    configure_raw_storage,
+    configure_raw_content,
+    configure_parse_cache,
+    archive_path
 )
+from hitachi_website_error_types import is_transient_error
+from hitachi_website_rate_limiter import AdaptiveRateLimiter
+from hitachi_website_retry_queue import RetryQueue
+from hitachi_website_csv_writer import close_writer, close_all_writers
+from hitachi_website_processed_index import ProcessedKeyIndex
+from hitachi_website_sqlite_store import remove_database
+from hitachi_website_error_index import error_index_path
+from hitachi_website_raw_layout import iter_raw_files, prepare_directory
+from hitachi_website_html_archive import remove_archive
+from hitachi_website_sharding import Shard, parse_shard, shard_path, filter_styles
+from hitachi_website_progress_journal import (
+    ProgressJournal,
+    load_journal,
+    remaining_keys,
+    summarize,
+    format_report,
+    OUTCOME_OK,
+    OUTCOME_FAIL,
+    OUTCOME_SKIP
+)
+from scraping_http_client import (
+    configure_pools,
+    add_response_listener,
+    remove_response_listener,
+    DEFAULT_POOL_MAXSIZE
+)
+
+# Canonical outputs; a shard run writes elsewhere but still skips what these already hold
+CANONICAL_OUTPUT_CSV = OUTPUT_CSV
+CANONICAL_ERROR_LOG_CSV = ERROR_LOG_CSV
+CANONICAL_RAW_DATA_DIR = RAW_DATA_DIR
+
+JOURNAL_FILE = "hitachi_website_catalog_scraping_journal.log"
+
+# Journal of the run in progress (None outside of a run)
+_journal: Optional[ProgressJournal] = None
+
+# Keys with data in the master CSV or raw HTML folder (see load_processed_index)
+_processed: Optional[ProcessedKeyIndex] = None
+
+
+def configure_shard(shard: Shard):
+    """
+    Point the catalog CSV, error log and raw HTML folder at the per-shard files.
+    
+    Args:
+        shard: Tuple of (K, N)
+    """
+    global OUTPUT_CSV, ERROR_LOG_CSV, RAW_DATA_DIR
+    OUTPUT_CSV, ERROR_LOG_CSV, RAW_DATA_DIR = configure_output_paths(
+        shard_path(CANONICAL_OUTPUT_CSV, shard),
+        shard_path(CANONICAL_ERROR_LOG_CSV, shard),
+        shard_path(CANONICAL_RAW_DATA_DIR, shard)
+    )
+
+
+def journal_path(shard: Optional[Shard] = None) -> str:
+    """Progress journal path for the canonical run or a shard."""
+    return shard_path(JOURNAL_FILE, shard) if shard else JOURNAL_FILE
+
+
+def start_journal(params: dict, shard: Optional[Shard] = None):
+    """
+    Start a new progress journal for this run, unless a resumed one is already open.
+    
+    Args:
+        params: Key list and settings of the run (stored in the journal header)
+        shard: Tuple of (K, N) when running as a shard
+    """
+    global _journal
+    if _journal is None:
+        _journal = ProgressJournal(journal_path(shard))
+        _journal.start('catalog', {**params, 'storage': configure_storage(),
+                                   'raw_storage': configure_raw_storage(),
+                                   'raw_content': configure_raw_content(),
+                                   'parse_cache': configure_parse_cache(),
+                                   'shard': list(shard) if shard else None})
+
+
+def close_journal():
+    """Flush and close the progress journal of the current run."""
+    global _journal
+    if _journal is not None:
+        _journal.close()
+        _journal = None
+
+
+def record_outcome(style: str, outcome: str, detail: str = ''):
+    """Append a style number's final outcome to the progress journal."""
+    if _journal is not None:
+        if outcome == OUTCOME_FAIL:
+            # The error log entry goes first; a journaled failure is never missing from it
+            write_error_entry(style)
+        _journal.record(style, outcome, detail)
+
+
+def output_locations() -> List[Tuple[str, str]]:
+    """
+    (raw HTML folder, catalog CSV) pairs to check for existing data: the current
+    outputs, plus the canonical ones when running as a shard.
+    """
+    locations = [(RAW_DATA_DIR, OUTPUT_CSV)]
+    if OUTPUT_CSV != CANONICAL_OUTPUT_CSV:
+        locations.append((CANONICAL_RAW_DATA_DIR, CANONICAL_OUTPUT_CSV))
+    return locations
 
 
 def initialize_catalog_master_list(force: bool = False) -> bool:
@@ -106,10 +259,39 @@ def initialize_catalog_master_list(force: bool = False) -> bool:
         return False
 
 
+def raw_store_path() -> str:
+    """Where this run's raw HTML goes: the raw HTML folder, or its archive with --raw-storage archive."""
+    return archive_path(RAW_DATA_DIR) if configure_raw_storage() == 'archive' else RAW_DATA_DIR
+
+
+def master_list_path() -> str:
+    """Where this run's records go: the catalog CSV, or its database with --storage sqlite."""
+    return database_path(OUTPUT_CSV) if configure_storage() == 'sqlite' else OUTPUT_CSV
+
+
+def load_processed_index() -> ProcessedKeyIndex:
+    """
+    (Re)build the processed-key index from the current output locations
+    (one read of each master CSV and database, one listing of each raw HTML folder).
+    Placeholder rows without catalog data do not count as processed.
+    
+    Returns:
+        The index now used by check_style_exists
+    """
+    global _processed
+    _processed = ProcessedKeyIndex('Style Number', raw_html_filename, str, populated_only=True).load(output_locations())
+    if configure_storage() == 'sqlite':
+        for _, output_csv in output_locations():
+            if os.path.exists(database_path(output_csv)):
+                _processed.csv_keys |= get_store(output_csv).keys(populated_only=True)
+    return _processed
+
+
 def check_style_exists(style_number: str) -> bool:
     """
     Check if a style number already has complete data in CSV or raw HTML files.
     Does NOT check error log (error log is checked separately).
+    Answered from the processed-key index, built on first use.
     
     Args:
         style_number: The bushing style number to check
@@ -117,75 +299,119 @@ def check_style_exists(style_number: str) -> bool:
     Returns:
         True if the style number has data in CSV or HTML file; False otherwise
     """
-    # Check if raw HTML file exists
-    safe_style = style_number.replace("/", "_").replace("\\", "_")
-    html_file = Path(RAW_DATA_DIR) / f"Hitachi_website_bushing_{safe_style}.html"
-    html_exists = html_file.exists()
-    
-    # Check if style number exists in CSV with populated data
-    csv_exists = False
-    if os.path.exists(OUTPUT_CSV):
-        try:
-            df = pd.read_csv(OUTPUT_CSV)
-            matching_rows = df[df['Style Number'] == style_number]
-            if not matching_rows.empty:
-                # Check if at least one field besides Style Number is populated
-                row = matching_rows.iloc[0]
-                for col in COLUMNS[1:]:  # Skip first column (Style Number)
-                    if pd.notna(row[col]) and str(row[col]).strip() != "":
-                        csv_exists = True
-                        break
-        except Exception as e:
-            logger.warning(f"Error checking CSV for style {style_number}: {e}")
-    
-    return html_exists or csv_exists
+    return (_processed or load_processed_index()).exists(style_number)
 
 
 def clean_scratch_mode():
     """
     Clean all existing catalog data for scratch mode (fresh start).
-    Deletes the CSV file, error log, and all raw HTML files in catalog_data/.
+    Deletes the CSV file, its SQLite database, error log, and all raw HTML files in catalog_data/ and its archive.
     """
     logger.info("SCRATCH MODE: Cleaning all existing catalog data...")
     print("🗑️  SCRATCH MODE: Cleaning all existing catalog data...")
     
     # Delete CSV file
+    close_writer(OUTPUT_CSV)
     if os.path.exists(OUTPUT_CSV):
         os.remove(OUTPUT_CSV)
         logger.info(f"Deleted {OUTPUT_CSV}")
         print(f"  ✓ Deleted {OUTPUT_CSV}")
     
+    # Delete SQLite database (re-seeded from the reinitialized CSV on first save)
+    close_writer(database_path(OUTPUT_CSV))
+    if remove_database(database_path(OUTPUT_CSV)):
+        logger.info(f"Deleted {database_path(OUTPUT_CSV)}")
+        print(f"  ✓ Deleted {database_path(OUTPUT_CSV)}")
+    
     # Delete error log
+    close_writer(ERROR_LOG_CSV)
     if os.path.exists(ERROR_LOG_CSV):
         os.remove(ERROR_LOG_CSV)
         logger.info(f"Deleted {ERROR_LOG_CSV}")
+    if os.path.exists(error_index_path(ERROR_LOG_CSV)):
+        os.remove(error_index_path(ERROR_LOG_CSV))
         print(f"  ✓ Deleted {ERROR_LOG_CSV}")
     
     # Delete all raw HTML files in catalog_data
     raw_data_path = Path(RAW_DATA_DIR)
     if raw_data_path.exists():
-        file_count = len(list(raw_data_path.glob("*.html")))
+        file_count = sum(1 for _ in iter_raw_files(RAW_DATA_DIR))
         shutil.rmtree(raw_data_path)
         logger.info(f"Deleted {RAW_DATA_DIR}/ directory ({file_count} HTML files)")
         print(f"  ✓ Deleted {RAW_DATA_DIR}/ directory ({file_count} HTML files)")
     
-    # Recreate the raw data directory
-    raw_data_path.mkdir(parents=True, exist_ok=True)
+    # Delete raw HTML archive
+    close_writer(archive_path(RAW_DATA_DIR))
+    if remove_archive(archive_path(RAW_DATA_DIR)):
+        logger.info(f"Deleted {archive_path(RAW_DATA_DIR)}")
+        print(f"  ✓ Deleted {archive_path(RAW_DATA_DIR)}")
+    
+    # Recreate the raw data directory (in the default layout)
+    prepare_directory(RAW_DATA_DIR)
     logger.info("Clean completed - starting fresh")
     print("  ✓ Clean completed - starting fresh\n")
 
 
-def scrape_batch(style_numbers: list, delay: float = 1.0, mode: str = 'append'):
+def record_result(idx: int, total: int, style: str, catalog_data, mode: str) -> bool:
+    """
+    Save one scraped catalog record to CSV and print its outcome line.
+    
+    Args:
+        idx: Position of the style number in the batch (1-based)
+        total: Number of style numbers in the batch
+        style: The style number that was scraped
+        catalog_data: Dictionary returned by scrape_catalog_data (None on failure)
+        mode: Write mode - 'append', 'overwrite' or 'scratch'
+        
+    Returns:
+        True if the record was scraped and saved, False otherwise
+    """
+    if catalog_data:
+        if save_to_csv(catalog_data, mode=mode):
+            prefix = "↻" if mode == 'overwrite' and check_style_exists(style) else "✓"
+            (_processed or load_processed_index()).mark_processed(style)
+            print(f"{prefix} [{idx}/{total}] Style {style}: {catalog_data['Voltage Class']} | "
+                  f"{catalog_data['Current Rating Draw Lead']} | "
+                  f"{catalog_data['Apparatus']}")
+            return True
+        print(f"✗ [{idx}/{total}] Style {style}: Failed to save to CSV")
+        return False
+    print(f"✗ [{idx}/{total}] Style {style}: Failed to scrape (logged to error log)")
+    return False
+
+
+def scrape_batch(style_numbers: list, delay: float = 1.0, mode: str = 'append',
+                 adaptive: bool = False, max_rate: float = 20.0, max_retries: int = 3,
+                 shard: Optional[Shard] = None):
     """
     Scrape a list of style numbers.
     
+    With adaptive=True the fixed delay is replaced by an AIMD rate controller
+    that starts at 1/delay requests per second, speeds up while responses stay
+    fast and healthy, and backs off on HTTP 5xx, timeouts or latency spikes.
+    
+    Style numbers that fail with a transient error are retried with exponential
+    backoff after the main pass; they only count as failed once max_retries is
+    exhausted.
+    
     Args:
         style_numbers: List of ABB style numbers to scrape
         delay: Delay in seconds between requests (default: 1.0)
         mode: Write mode - 'append' (skip existing), 'overwrite' (replace existing), 'scratch' (delete all first)
+        adaptive: Adjust the request rate from latency and server errors (AIMD)
+        max_rate: Upper bound in requests/second for the adaptive controller
+        max_retries: Retries per style number for transient errors (default: 3)
+        shard: Only scrape the style numbers of this (K, N) shard and write to its own files
     """
+    if shard:
+        configure_shard(shard)
+        style_numbers = filter_styles(style_numbers, shard)
+    
     # Handle scratch mode
-    if mode == 'scratch':
+    if mode == 'scratch' and shard:
+        # Shard outputs start empty; the canonical master list is left alone
+        clean_scratch_mode()
+    elif mode == 'scratch':
         clean_scratch_mode()
         # Re-initialize the catalog master list after cleaning
         print("Reinitializing catalog master list after scratch...\n")
@@ -193,9 +419,14 @@ def scrape_batch(style_numbers: list, delay: float = 1.0, mode: str = 'append'):
             logger.error("Failed to reinitialize catalog master list")
             sys.exit(1)
     
-    # Load error log style numbers once at the start
+    # Load error log style numbers once at the start (permanent failures are skipped,
+    # transient ones are fetched again and cleared from the log on success)
     error_log_styles = get_error_log_style_numbers()
-    logger.info(f"Loaded {len(error_log_styles)} style numbers from error log")
+    if ERROR_LOG_CSV != CANONICAL_ERROR_LOG_CSV and mode == 'append':
+        error_log_styles |= get_error_log_style_numbers(CANONICAL_ERROR_LOG_CSV)
+    transient_styles = get_transient_error_log_style_numbers()
+    logger.info(f"Loaded {len(error_log_styles)} permanent and {len(transient_styles)} transient failures from error log")
+    load_processed_index()
     
     total = len(style_numbers)
     success_count = 0
@@ -207,7 +438,33 @@ def scrape_batch(style_numbers: list, delay: float = 1.0, mode: str = 'append'):
     print(f"Batch Scraping Catalog Data - Mode: {mode.upper()}")
     print(f"{'='*70}")
     print(f"Total style numbers to process: {total}")
-    print(f"Delay between requests: {delay}s\n")
+    if shard:
+        print(f"Shard: {shard[0]}/{shard[1]} (writing to {OUTPUT_CSV})")
+    print(f"Delay between requests: {delay}s{' (adaptive)' if adaptive else ''}\n")
+    
+    limiter = None
+    if adaptive:
+        limiter = AdaptiveRateLimiter.from_delay(delay, max_rate=max_rate)
+        add_response_listener(limiter.observe)
+    retry_queue = RetryQueue()
+    start_journal({'source': 'list', 'keys': list(style_numbers), 'mode': mode, 'total': total}, shard)
+    
+    def handle(idx: int, style: str, catalog_data, attempt: int) -> None:
+        nonlocal success_count, failure_count
+        if not catalog_data:
+            error_type = get_last_error_type(style)
+            if is_transient_error(error_type) and attempt < max_retries:
+                wait = retry_queue.schedule((idx, style), attempt + 1)
+                print(f"↺ [{idx}/{total}] Style {style}: {error_type}, retry {attempt + 1}/{max_retries} in {wait:.1f}s")
+                return
+        if record_result(idx, total, style, catalog_data, mode):
+            success_count += 1
+            if attempt > 0 or style in transient_styles:
+                clear_error_from_csv(style)
+            record_outcome(style, OUTCOME_OK)
+        else:
+            failure_count += 1
+            record_outcome(style, OUTCOME_FAIL, get_last_error_type(style) or '')
     
     for idx, style in enumerate(style_numbers, 1):
         # Check if this style is in the error log
@@ -217,6 +474,7 @@ def scrape_batch(style_numbers: list, delay: float = 1.0, mode: str = 'append'):
             delete_raw_html(style)
             logger.info(f"Skipping style {style} (in error log, HTML deleted if existed) ({idx}/{total})")
             print(f"⊘ [{idx}/{total}] Style {style}: Skipped (in error log)")
+            record_outcome(style, OUTCOME_SKIP, 'error_log')
             continue
         
         # Check if we should skip this style (append mode only)
@@ -224,31 +482,40 @@ def scrape_batch(style_numbers: list, delay: float = 1.0, mode: str = 'append'):
             skipped_count += 1
             logger.info(f"Skipping style {style} (already exists) ({idx}/{total})")
             print(f"⊘ [{idx}/{total}] Style {style}: Skipped (already processed)")
+            record_outcome(style, OUTCOME_SKIP, 'exists')
             continue
         
         action = "Overwriting" if mode == 'overwrite' and check_style_exists(style) else "Processing"
         logger.info(f"{action} style {style} ({idx}/{total})")
         
-        catalog_data = scrape_catalog_data(style)
+        if limiter:
+            limiter.acquire()
         
-        if catalog_data:
-            if save_to_csv(catalog_data, mode=mode):
-                success_count += 1
-                prefix = "↻" if mode == 'overwrite' and check_style_exists(style) else "✓"
-                print(f"{prefix} [{idx}/{total}] Style {style}: {catalog_data['Voltage Class']} | "
-                      f"{catalog_data['Current Rating Draw Lead']} | "
-                      f"{catalog_data['Apparatus']}")
-            else:
-                failure_count += 1
-                print(f"✗ [{idx}/{total}] Style {style}: Failed to save to CSV")
-        else:
-            failure_count += 1
-            print(f"✗ [{idx}/{total}] Style {style}: Failed to scrape (logged to error log)")
+        handle(idx, style, scrape_catalog_data(style), 0)
         
         # Delay between requests (except for the last one)
-        if idx < total:
+        if idx < total and not limiter:
             time.sleep(delay)
     
+    # Low-priority pass: retry transient failures once their backoff has elapsed
+    if retry_queue:
+        logger.info(f"Retrying {len(retry_queue)} style numbers with transient errors")
+    while retry_queue:
+        (idx, style), attempt = retry_queue.pop(wait=True)
+        logger.info(f"Retrying style {style} (attempt {attempt}/{max_retries})")
+        if limiter:
+            limiter.acquire()
+        handle(idx, style, scrape_catalog_data(style), attempt)
+        if retry_queue and not limiter:
+            time.sleep(delay)
+    
+    close_journal()
+    # Flush the catalog CSV and apply overwrite-mode replacements
+    close_all_writers()
+    if limiter:
+        remove_response_listener(limiter.observe)
+        logger.info(f"Adaptive rate {limiter.report()}")
+    
     logger.info(f"Batch scrape completed: {success_count} successful, {failure_count} failed, {skipped_count} skipped")
     print(f"\n{'='*70}")
     print(f"Batch Scraping Complete - Mode: {mode.upper()}")
@@ -259,6 +526,8 @@ def scrape_batch(style_numbers: list, delay: float = 1.0, mode: str = 'append'):
     if mode == 'append' or mode == 'overwrite':
         print(f"Skipped (already exist or in error log): {skipped_count}")
     print(f"Success Rate: {(success_count/(total-skipped_count)*100 if total-skipped_count > 0 else 0):.1f}%")
+    if limiter:
+        print(f"Adaptive rate {limiter.report()}")
     
     # Check if error log exists and inform user
     if failure_count > 0 and os.path.exists(ERROR_LOG_CSV):
@@ -266,28 +535,33 @@ def scrape_batch(style_numbers: list, delay: float = 1.0, mode: str = 'append'):
         print(f"   Review this file for details on {failure_count} failed style numbers")
     
     if success_count > 0:
-        print(f"\n✓ Data saved to: {OUTPUT_CSV}")
-        print(f"✓ Raw HTML saved to: {RAW_DATA_DIR}/")
+        print(f"\n✓ Data saved to: {master_list_path()}")
+        print(f"✓ Raw HTML saved to: {raw_store_path()}")
 
 
-def scrape_all(delay: float = 1.0, mode: str = 'append'):
+def scrape_all(delay: float = 1.0, mode: str = 'append', adaptive: bool = False, max_rate: float = 20.0,
+               max_retries: int = 3, shard: Optional[Shard] = None):
     """
     Scrape all style numbers from the catalog master list.
     
     Args:
         delay: Delay in seconds between requests (default: 1.0)
         mode: Write mode - 'append' (skip existing), 'overwrite' (replace existing), 'scratch' (delete all first)
+        adaptive: Adjust the request rate from latency and server errors (AIMD)
+        max_rate: Upper bound in requests/second for the adaptive controller
+        max_retries: Retries per style number for transient errors (default: 3)
+        shard: Only scrape the style numbers of this (K, N) shard and write to its own files
     """
     try:
-        # Check if catalog master list exists
-        if not os.path.exists(OUTPUT_CSV):
-            logger.error(f"Catalog master list not found: {OUTPUT_CSV}")
-            print(f"✗ Catalog master list not found: {OUTPUT_CSV}")
+        # Check if catalog master list exists (shards read it too, but write elsewhere)
+        if not os.path.exists(CANONICAL_OUTPUT_CSV):
+            logger.error(f"Catalog master list not found: {CANONICAL_OUTPUT_CSV}")
+            print(f"✗ Catalog master list not found: {CANONICAL_OUTPUT_CSV}")
             print(f"  Run with --initialize first to create the master list")
             sys.exit(1)
         
         # Load all style numbers from the master list
-        df = pd.read_csv(OUTPUT_CSV)
+        df = pd.read_csv(CANONICAL_OUTPUT_CSV)
         style_numbers = df['Style Number'].dropna().unique().tolist()
         
         if not style_numbers:
@@ -299,7 +573,7 @@ def scrape_all(delay: float = 1.0, mode: str = 'append'):
         print(f"📋 Loaded {len(style_numbers)} style numbers from catalog master list")
         
         # Start batch scraping
-        scrape_batch(style_numbers, delay, mode)
+        scrape_batch(style_numbers, delay, mode, adaptive, max_rate, max_retries, shard)
         
     except Exception as e:
         logger.error(f"Error in scrape_all: {e}")
@@ -307,7 +581,9 @@ def scrape_all(delay: float = 1.0, mode: str = 'append'):
         sys.exit(1)
 
 
-def scrape_from_file(filepath: str, delay: float = 1.0, mode: str = 'append'):
+def scrape_from_file(filepath: str, delay: float = 1.0, mode: str = 'append',
+                     adaptive: bool = False, max_rate: float = 20.0, max_retries: int = 3,
+                     shard: Optional[Shard] = None):
     """
     Scrape style numbers listed in a text file (one style number per line).
     
@@ -315,6 +591,10 @@ def scrape_from_file(filepath: str, delay: float = 1.0, mode: str = 'append'):
         filepath: Path to file containing style numbers
         delay: Delay in seconds between requests (default: 1.0)
         mode: Write mode - 'append' (skip existing), 'overwrite' (replace existing), 'scratch' (delete all first)
+        adaptive: Adjust the request rate from latency and server errors (AIMD)
+        max_rate: Upper bound in requests/second for the adaptive controller
+        max_retries: Retries per style number for transient errors (default: 3)
+        shard: Only scrape the style numbers of this (K, N) shard and write to its own files
     """
     try:
         with open(filepath, 'r') as f:
@@ -332,7 +612,7 @@ def scrape_from_file(filepath: str, delay: float = 1.0, mode: str = 'append'):
         logger.info(f"Loaded {len(style_numbers)} style numbers from file: {filepath}")
         print(f"📋 Loaded {len(style_numbers)} style numbers from file: {filepath}")
         
-        scrape_batch(style_numbers, delay, mode)
+        scrape_batch(style_numbers, delay, mode, adaptive, max_rate, max_retries, shard)
         
     except FileNotFoundError:
         logger.error(f"File not found: {filepath}")
@@ -344,6 +624,81 @@ def scrape_from_file(filepath: str, delay: float = 1.0, mode: str = 'append'):
         sys.exit(1)
 
 
+def load_run_journal(shard: Optional[Shard] = None):
+    """
+    Load the progress journal of the last run.
+    
+    Args:
+        shard: Tuple of (K, N) when the run was a shard
+        
+    Returns:
+        Tuple of (header, entries, style_numbers) - see load_journal()
+        
+    Raises:
+        FileNotFoundError: If there is no journal
+        ValueError: If the journal belongs to a different kind of run or shard
+    """
+    header, entries = load_journal(journal_path(shard))
+    params = header['params']
+    if header.get('kind') != 'catalog':
+        raise ValueError(f"{journal_path(shard)} is not a catalog journal")
+    if params.get('shard') != (list(shard) if shard else None):
+        raise ValueError(f"{journal_path(shard)} was written by shard {params.get('shard')}")
+    return header, entries, params['keys']
+
+
+def resume_run(delay: float = 1.0, adaptive: bool = False, max_rate: float = 20.0, max_retries: int = 3,
+               shard: Optional[Shard] = None):
+    """
+    Continue the last run from its progress journal. Only the style numbers without
+    a recorded outcome are processed; the catalog CSV and raw HTML folder are not
+    rescanned to find out what was already done.
+    
+    Args:
+        delay: Delay in seconds between requests (default: 1.0)
+        adaptive: Adjust the request rate from latency and server errors (AIMD)
+        max_rate: Upper bound in requests/second for the adaptive controller
+        max_retries: Retries per style number for transient errors (default: 3)
+        shard: Tuple of (K, N) when resuming a shard run
+    """
+    global _journal
+    header, entries, style_numbers = load_run_journal(shard)
+    remaining = remaining_keys(style_numbers, entries)
+    
+    # A scratch run already cleaned up (and reinitialized the master list) before it was interrupted
+    mode = header['params']['mode']
+    mode = 'append' if mode == 'scratch' else mode
+    configure_storage(header['params'].get('storage', 'csv'))
+    configure_raw_storage(header['params'].get('raw_storage', 'files'))
+    configure_raw_content(header['params'].get('raw_content', 'full'))
+    configure_parse_cache(header['params'].get('parse_cache', False))
+    
+    logger.info(f"Resuming from {journal_path(shard)}: {len(entries)} done, {len(remaining)} remaining")
+    print(f"↻ Resuming from {journal_path(shard)}: {len(entries)} style numbers done, {len(remaining)} remaining")
+    if not remaining:
+        print("✓ Nothing left to do")
+        return
+    
+    _journal = ProgressJournal(journal_path(shard))
+    _journal.resume()
+    scrape_batch(remaining, delay, mode, adaptive, max_rate, max_retries, shard)
+
+
+def print_progress(shard: Optional[Shard] = None):
+    """
+    Report how far the last run got, from its progress journal alone.
+    
+    Args:
+        shard: Tuple of (K, N) to report on a shard run
+    """
+    header, entries, _ = load_run_journal(shard)
+    summary = summarize(header, entries, header['params'].get('total'))
+    print(f"\n{'='*70}")
+    print(f"Catalog Scraping Progress - {journal_path(shard)}")
+    print(f"{'='*70}")
+    print(format_report(summary))
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Batch scraper for Hitachi Energy bushing catalog data',
@@ -352,7 +707,15 @@ def main():
                '  python hitachi_website_catalog_batch_scraper.py --all --delay 0.5\n'
                '  python hitachi_website_catalog_batch_scraper.py --style 138W0800XA\n'
                '  python hitachi_website_catalog_batch_scraper.py --styles 138W0800XA,196W1620UW --mode overwrite\n'
-               '  python hitachi_website_catalog_batch_scraper.py --file style_numbers.txt\n',
+               '  python hitachi_website_catalog_batch_scraper.py --file style_numbers.txt\n'
+               '  python hitachi_website_catalog_batch_scraper.py --all --shard 2/4\n'
+               '  python hitachi_website_catalog_batch_scraper.py --all --storage sqlite\n'
+               '  python hitachi_website_catalog_batch_scraper.py --all --raw-storage archive\n'
+               '  python hitachi_website_catalog_batch_scraper.py --all --raw-content fragment\n'
+               '  python hitachi_website_catalog_batch_scraper.py --all --mode overwrite --parse-cache\n'
+               '  python hitachi_website_catalog_batch_scraper.py --resume --delay 0.5\n'
+               '  python hitachi_website_catalog_batch_scraper.py --progress\n'
+               '  python hitachi_website_catalog_batch_scraper.py --all --delay 0 --base-url http://127.0.0.1:8765\n',
         formatter_class=argparse.RawDescriptionHelpFormatter
     )
     
@@ -368,6 +731,10 @@ def main():
                             help='Comma-separated list of style numbers')
     input_group.add_argument('--file', type=str,
                             help='File containing style numbers (one per line)')
+    input_group.add_argument('--resume', action='store_true',
+                            help='Continue the last run from its progress journal (style numbers without an outcome)')
+    input_group.add_argument('--progress', action='store_true',
+                            help='Report the progress of the last run from its journal and exit')
     
     parser.add_argument('--delay', type=float, default=1.0,
                        help='Delay in seconds between requests (default: 1.0)')
@@ -376,9 +743,63 @@ def main():
                        help='Write mode: append (default, skip existing), overwrite (replace existing), scratch (delete all first)')
     parser.add_argument('--force', action='store_true',
                        help='Force recreation of catalog master list (use with --initialize)')
+    parser.add_argument('--adaptive', action='store_true',
+                       help='Adapt the request rate (AIMD): start at 1/--delay, speed up while the server '
+                            'is healthy, back off on HTTP 5xx, timeouts or latency spikes')
+    parser.add_argument('--max-rate', type=float, default=20.0,
+                       help='Upper bound in requests/second for --adaptive (default: 20.0)')
+    parser.add_argument('--max-retries', type=int, default=3,
+                       help='Retries per style number for transient errors (timeouts, connection errors, '
+                            'HTTP 5xx) with exponential backoff after the main pass (default: 3)')
+    parser.add_argument('--shard', type=str, default=None,
+                       help='Run shard K of N (e.g. 2/4): only the style numbers of that shard, '
+                            'written to separate _shardKofN output files')
+    parser.add_argument('--base-url', type=str, default=None,
+                       help='Site root to scrape instead of the live site, e.g. http://127.0.0.1:8765 '
+                            'for hitachi_website_replay_server.py')
+    parser.add_argument('--pool-size', type=int, default=DEFAULT_POOL_MAXSIZE,
+                       help=f'Keep-alive connections per host in the shared HTTP pool (default: {DEFAULT_POOL_MAXSIZE})')
+    parser.add_argument('--storage', type=str, default='csv', choices=['csv', 'sqlite'],
+                       help='Catalog storage: csv (default, append to the CSV) or sqlite (upsert into '
+                            'the .db next to it; export with hitachi_website_sqlite_store.py)')
+    parser.add_argument('--raw-storage', type=str, default='files', choices=['files', 'archive'],
+                       help='Raw HTML storage: files (default, one file per page) or archive (append to the '
+                            'compressed .pack next to the folder; see hitachi_website_html_archive.py)')
+    parser.add_argument('--raw-content', type=str, default='full', choices=['full', 'fragment'],
+                       help='Raw HTML content: full (default, the page as served) or fragment (only the '
+                            'data-bearing part, kept when it parses identically; see hitachi_website_html_fragment.py)')
+    parser.add_argument('--parse-cache', action='store_true',
+                       help='Look parsed records up by page hash before parsing and cache new ones '
+                            '(hitachi_website_parse_cache.py); unchanged pages are not parsed again')
     
     args = parser.parse_args()
     
+    if args.max_retries < 0:
+        parser.error('--max-retries must not be negative')
+    try:
+        shard = parse_shard(args.shard) if args.shard else None
+    except ValueError as e:
+        parser.error(str(e))
+    if args.base_url:
+        configure_base_url(args.base_url)
+    configure_storage(args.storage)
+    configure_raw_storage(args.raw_storage)
+    configure_raw_content(args.raw_content)
+    configure_parse_cache(args.parse_cache)
+    
+    if args.progress or args.resume:
+        try:
+            load_run_journal(shard)
+        except FileNotFoundError:
+            parser.error(f'no progress journal found ({journal_path(shard)})')
+        except ValueError as e:
+            parser.error(str(e))
+        if args.progress:
+            print_progress(shard)
+            return
+    
+    configure_pools(pool_maxsize=args.pool_size)
+    
     # Handle initialization
     if args.initialize:
         success = initialize_catalog_master_list(force=args.force)
@@ -386,17 +807,21 @@ def main():
     
     # Handle all other modes
     elif args.all:
-        scrape_all(args.delay, args.mode)
+        scrape_all(args.delay, args.mode, args.adaptive, args.max_rate, args.max_retries, shard)
     
     elif args.style:
-        scrape_batch([args.style], args.delay, args.mode)
+        scrape_batch([args.style], args.delay, args.mode, args.adaptive, args.max_rate, args.max_retries, shard)
     
     elif args.styles:
         style_numbers = [s.strip() for s in args.styles.split(',')]
-        scrape_batch(style_numbers, args.delay, args.mode)
+        scrape_batch(style_numbers, args.delay, args.mode, args.adaptive, args.max_rate, args.max_retries, shard)
     
     elif args.file:
-        scrape_from_file(args.file, args.delay, args.mode)
+        scrape_from_file(args.file, args.delay, args.mode, args.adaptive, args.max_rate, args.max_retries,
+                         shard)
+    
+    elif args.resume:
+        resume_run(args.delay, args.adaptive, args.max_rate, args.max_retries, shard)
 
 
 if __name__ == "__main__":
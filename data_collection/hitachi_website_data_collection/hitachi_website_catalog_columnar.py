@@ -0,0 +1,361 @@
+"""
+Hitachi Website Typed Columnar Catalog Export
+
+Export stage that turns the 56 text columns of the catalog master list into a
+typed columnar file, so analytics load it in milliseconds and filter it
+vectorized instead of reparsing strings like '47.172 in.', '474 lbs.' or
+'138 kV' on every read.
+
+Each column is typed from its values:
+- measure: most values are a number with a unit. The column becomes a float
+  (under the original name) plus a categorical "<name> - Unit" column.
+- category: few distinct values (Apparatus, Insulator Type, Color, ...). The
+  column becomes a categorical (dictionary codes plus the category names).
+- text: everything else (comments, catalog numbers, ...).
+Missing markers ('', 'N/A', 'Contact Us', '-', a unit without a number) become
+explicit nulls in every kind.
+
+The file is Parquet when pyarrow is installed, otherwise a NumPy .npz archive
+(float64 with NaN, int16 codes with -1 for null, UTF-8 strings with offsets
+and a validity mask).
+load_catalog_table() reads either into a pandas DataFrame with nullable dtypes.
+
+Usage:
+    python hitachi_website_catalog_columnar.py export
+    python hitachi_website_catalog_columnar.py export --format npz
+    python hitachi_website_catalog_columnar.py export --input hitachi_website_bushing_catalog_master_list.db
+    python hitachi_website_catalog_columnar.py schema
+
+    from hitachi_website_catalog_columnar import load_catalog_table
+    table = load_catalog_table()
+    heavy = table[table['Approximate Weight'] > 500]
+
+Author: Data Collection System
+Date: October 16, 2026
+Version: 1.0 - Typed columnar export of the catalog master list
+"""
+
+import argparse
+import json
+import logging
+import os
+import re
+import sqlite3
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+from hitachi_website_processed_index import NA_VALUES
+
+logger = logging.getLogger(__name__)
+
+CATALOG_CSV = "hitachi_website_bushing_catalog_master_list.csv"
+KEY_COLUMN = "Style Number"
+FORMATS = ('parquet', 'npz')
+FORMAT_SUFFIXES = {'parquet': '.parquet', 'npz': '.npz'}
+UNIT_SUFFIX = " - Unit"
+
+# Values that mean "no data" on the catalog pages
+MISSING_VALUES = NA_VALUES | {'Contact Us', '-'}
+
+# '47.172 in.', '1,200 Amps', 'N/A lbs.', 'pfds.' (a unit without a number)
+MEASURE_VALUE = re.compile(r'^(-?\d[\d,]*(?:\.\d+)?|-?\.\d+|N/A)?\s*([A-Za-z][A-Za-z.]{0,7})$')
+
+# A column is a measure if this share of its values is a unit with or without a
+# number, with at most this many different units (the rest become nulls)
+MEASURE_SHARE = 0.9
+MAX_UNITS = 3
+
+# A column is categorical up to this many distinct values (and a quarter of the rows)
+MAX_CATEGORIES = 255
+
+
+def columnar_path(csv_path: Optional[str] = None, fmt: Optional[str] = None) -> str:
+    """Columnar file of a catalog CSV - same name, .parquet or .npz extension."""
+    return os.path.splitext(csv_path or CATALOG_CSV)[0] + FORMAT_SUFFIXES[fmt or default_format()]
+
+
+def default_format() -> str:
+    """Parquet when pyarrow is installed, otherwise NumPy .npz."""
+    return 'parquet' if pyarrow is not None else 'npz'
+
+
+def read_catalog(path: str) -> pd.DataFrame:
+    """
+    Catalog master list as text, from the CSV or from its SQLite database.
+
+    Args:
+        path: Catalog CSV, or the .db written with --storage sqlite
+
+    Returns:
+        DataFrame of strings (missing fields are '')
+    """
+    if path.endswith('.db'):
+        from hitachi_website_catalog_scraper import SQLITE_TABLE
+        connection = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        try:
+            frame = pd.read_sql_query(f'SELECT * FROM "{SQLITE_TABLE}" ORDER BY rowid', connection)
+        finally:
+            connection.close()
+        return frame.fillna('').astype(str)
+    return pd.read_csv(path, dtype=str, keep_default_na=False)
+
+
+def parse_measure(value: str) -> Optional[Tuple[Optional[float], str]]:
+    """
+    Split a measure like '47.172 in.' into (47.172, 'in.').
+
+    Returns:
+        Tuple of (number or None, unit), or None if the value is not a measure
+    """
+    match = MEASURE_VALUE.match(value.strip())
+    if not match:
+        return None
+    number, unit = match.groups()
+    if number is None or number == 'N/A':
+        return None, unit
+    return float(number.replace(',', '')), unit
+
+
+def _is_missing(value: str) -> bool:
+    return value.strip() in MISSING_VALUES
+
+
+def infer_kind(values: List[str]) -> str:
+    """
+    Column kind from its text values: 'measure', 'category' or 'text'.
+
+    Args:
+        values: The column's values
+    """
+    present = [v.strip() for v in values if not _is_missing(v)]
+    if not present:
+        return 'category'
+    measures = [parse_measure(v) for v in present]
+    parsed = [m for m in measures if m is not None]
+    units = {m[1] for m in parsed}
+    has_number = any(m[0] is not None for m in parsed)
+    if has_number and len(parsed) >= MEASURE_SHARE * len(present) and len(units) <= MAX_UNITS:
+        return 'measure'
+    distinct = len(set(present))
+    if distinct <= MAX_CATEGORIES and distinct <= max(len(values) // 4, 1):
+        return 'category'
+    return 'text'
+
+
+def type_catalog(frame: pd.DataFrame) -> Tuple[pd.DataFrame, List[dict]]:
+    """
+    Typed version of the text catalog.
+
+    Args:
+        frame: Catalog as text (read_catalog())
+
+    Returns:
+        Tuple of (typed DataFrame, schema: one dict per source column with
+        name, kind, and for measures the unit column and unparsed count)
+    """
+    columns: Dict[str, pd.Series] = {}
+    schema = []
+    for name in frame.columns:
+        values = frame[name].tolist()
+        kind = 'text' if name == KEY_COLUMN else infer_kind(values)
+        entry = {'name': name, 'kind': kind}
+        if kind == 'measure':
+            numbers, units, unparsed = [], [], 0
+            for value in values:
+                measure = None if _is_missing(value) else parse_measure(value)
+                if measure is None and not _is_missing(value):
+                    unparsed += 1
+                numbers.append(measure[0] if measure else None)
+                units.append(measure[1] if measure else None)
+            columns[name] = pd.array(numbers, dtype='Float64')
+            columns[name + UNIT_SUFFIX] = pd.Categorical(units)
+            entry.update(unit_column=name + UNIT_SUFFIX, unparsed=unparsed)
+        else:
+            cleaned = [None if _is_missing(v) else v.strip() for v in values]
+            columns[name] = pd.Categorical(cleaned) if kind == 'category' else pd.array(cleaned, dtype='string')
+        schema.append(entry)
+    return pd.DataFrame(columns), schema
+
+
+def _write_parquet(table: pd.DataFrame, schema: List[dict], path: str) -> None:
+    import pyarrow.parquet as pq
+    arrow_table = pyarrow.Table.from_pandas(table, preserve_index=False)
+    metadata = {**(arrow_table.schema.metadata or {}), b'hitachi_schema': json.dumps(schema).encode('utf-8')}
+    pq.write_table(arrow_table.replace_schema_metadata(metadata), path)
+
+
+def _write_npz(table: pd.DataFrame, schema: List[dict], path: str) -> None:
+    # Column names contain '/', '"' and parentheses, so members are numbered and
+    # the names live in the layout entry
+    arrays = {}
+    layout = []
+    for position, name in enumerate(table.columns):
+        column = table[name]
+        prefix = f"c{position}"
+        if isinstance(column.dtype, pd.CategoricalDtype):
+            arrays[prefix + '_codes'] = column.cat.codes.to_numpy(dtype=np.int16)
+            arrays[prefix + '_categories'] = np.array([str(c) for c in column.cat.categories], dtype=str)
+            layout.append({'name': name, 'type': 'category'})
+        elif isinstance(column.dtype, pd.Float64Dtype):
+            arrays[prefix] = column.to_numpy(dtype=np.float64, na_value=np.nan)
+            layout.append({'name': name, 'type': 'float'})
+        else:
+            # UTF-8 bytes plus offsets: fixed-width unicode arrays would pad every
+            # value to the longest comment
+            encoded = [value.encode('utf-8') for value in column.fillna('')]
+            arrays[prefix] = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+            arrays[prefix + '_offsets'] = np.cumsum([0] + [len(value) for value in encoded], dtype=np.int64)
+            arrays[prefix + '_valid'] = column.notna().to_numpy()
+            layout.append({'name': name, 'type': 'string'})
+    arrays['layout'] = np.array(json.dumps(layout))
+    arrays['schema'] = np.array(json.dumps(schema))
+    with open(path, 'wb') as f:
+        np.savez(f, **arrays)
+
+
+def export_catalog(source: Optional[str] = None, output: Optional[str] = None,
+                   fmt: Optional[str] = None) -> Tuple[str, List[dict]]:
+    """
+    Write the typed columnar catalog (atomic replace).
+
+    Args:
+        source: Catalog CSV or SQLite database (default: the catalog CSV)
+        output: Columnar file to write (default: next to the catalog CSV)
+        fmt: 'parquet' or 'npz' (default: parquet if pyarrow is installed)
+
+    Returns:
+        Tuple of (path written, schema)
+    """
+    fmt = fmt or default_format()
+    if fmt == 'parquet' and pyarrow is None:
+        raise RuntimeError("Parquet export requires the pyarrow package (or use --format npz)")
+    source = source or CATALOG_CSV
+    output = output or columnar_path(source if source.endswith('.csv') else None, fmt)
+    table, schema = type_catalog(read_catalog(source))
+    temp_path = f"{output}.tmp"
+    if fmt == 'parquet':
+        _write_parquet(table, schema, temp_path)
+    else:
+        _write_npz(table, schema, temp_path)
+    os.replace(temp_path, output)
+    logger.info(f"Exported {len(table)} rows, {len(table.columns)} typed columns from {source} to {output}")
+    return output, schema
+
+
+def load_catalog_table(path: Optional[str] = None) -> pd.DataFrame:
+    """
+    Load a columnar catalog export.
+
+    Args:
+        path: .parquet or .npz file (default: the export next to the catalog CSV,
+            Parquet first)
+
+    Returns:
+        DataFrame with Float64 measures, categorical and string columns
+    """
+    if path is None:
+        candidates = [columnar_path(fmt=fmt) for fmt in FORMATS]
+        path = next((p for p in candidates if os.path.exists(p)), candidates[-1])
+    if path.endswith('.parquet'):
+        return pd.read_parquet(path)
+    columns = {}
+    with np.load(path, allow_pickle=False) as archive:
+        for position, entry in enumerate(json.loads(str(archive['layout']))):
+            prefix = f"c{position}"
+            if entry['type'] == 'category':
+                columns[entry['name']] = pd.Categorical.from_codes(
+                    archive[prefix + '_codes'], archive[prefix + '_categories'].tolist())
+            elif entry['type'] == 'float':
+                columns[entry['name']] = pd.array(archive[prefix], dtype='Float64')
+            else:
+                data = archive[prefix].tobytes()
+                offsets = archive[prefix + '_offsets'].tolist()
+                values = pd.array([data[start:end].decode('utf-8') for start, end in zip(offsets, offsets[1:])],
+                                  dtype='string')
+                values[~archive[prefix + '_valid']] = pd.NA
+                columns[entry['name']] = values
+    return pd.DataFrame(columns)
+
+
+def load_schema(path: str) -> List[dict]:
+    """Column kinds recorded in a columnar export."""
+    if path.endswith('.parquet'):
+        import pyarrow.parquet as pq
+        return json.loads(pq.read_schema(path).metadata[b'hitachi_schema'])
+    with np.load(path, allow_pickle=False) as archive:
+        return json.loads(str(archive['schema']))
+
+
+def _print_schema(schema: List[dict], table: pd.DataFrame) -> None:
+    print(f"{'Column':<60} {'Kind':<9} {'Nulls':>6}  Detail")
+    for entry in schema:
+        name = entry['name']
+        detail = ''
+        if entry['kind'] == 'measure':
+            units = table[entry['unit_column']].cat.categories.tolist()
+            detail = f"units {units}" + (f", {entry['unparsed']} unparsed" if entry['unparsed'] else '')
+        elif entry['kind'] == 'category':
+            detail = f"{len(table[name].cat.categories)} categories"
+        print(f"{name[:60]:<60} {entry['kind']:<9} {int(table[name].isna().sum()):>6}  {detail}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Export the catalog master list to a typed columnar file (Parquet or NumPy .npz)',
+        epilog='Examples:\n'
+               '  python hitachi_website_catalog_columnar.py export\n'
+               '  python hitachi_website_catalog_columnar.py export --format npz\n'
+               '  python hitachi_website_catalog_columnar.py export --input hitachi_website_bushing_catalog_master_list.db\n'
+               '  python hitachi_website_catalog_columnar.py schema\n',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('command', choices=['export', 'schema'],
+                        help='export: write the typed file; schema: show the column kinds of an export')
+    parser.add_argument('--input', default=None,
+                        help=f'export: catalog CSV or SQLite database (default: {CATALOG_CSV})')
+    parser.add_argument('--output', default=None,
+                        help='export: file to write; schema: file to read (default: next to the catalog CSV)')
+    parser.add_argument('--format', choices=FORMATS, default=None,
+                        help='parquet (needs pyarrow) or npz (default: parquet if pyarrow is installed)')
+    args = parser.parse_args()
+
+    if args.command == 'export':
+        source = args.input or CATALOG_CSV
+        if not os.path.exists(source):
+            print(f"✗ Catalog not found: {source}")
+            sys.exit(1)
+        if args.format == 'parquet' and pyarrow is None:
+            parser.error('--format parquet requires the pyarrow package')
+        started = time.time()
+        path, schema = export_catalog(source, args.output, args.format)
+        kinds = [entry['kind'] for entry in schema]
+        print(f"✓ Exported {source} to {path} in {time.time() - started:.2f} s "
+              f"({kinds.count('measure')} measure, {kinds.count('category')} category, "
+              f"{kinds.count('text')} text columns, {os.path.getsize(path) / 1e3:.0f} KB)")
+        return
+
+    path = args.output or (columnar_path(fmt=args.format) if args.format else None)
+    if path is None:
+        path = next((columnar_path(fmt=fmt) for fmt in FORMATS if os.path.exists(columnar_path(fmt=fmt))), None)
+    if path is None or not os.path.exists(path):
+        print("✗ No columnar export found (run `python hitachi_website_catalog_columnar.py export`)")
+        sys.exit(1)
+    started = time.time()
+    table = load_catalog_table(path)
+    elapsed = time.time() - started
+    _print_schema(load_schema(path), table)
+    print(f"\n📊 {path}: {len(table)} rows, {len(table.columns)} columns, loaded in {elapsed * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    main()
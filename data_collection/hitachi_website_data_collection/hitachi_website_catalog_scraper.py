@@ -18,10 +18,23 @@ import sys
 import logging
 import os
 from pathlib import Path
-from typing import Dict, Optional, Set
-from datetime import datetime
+from typing import Dict, Optional, Set, Tuple
 import re
 
+# Shared pooled HTTP client lives in data_collection/
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from scraping_http_client import http_get, HITACHI_HEADERS
+
+import hitachi_website_error_types as error_types
+from hitachi_website_error_types import classify_error_message
+from hitachi_website_csv_writer import get_writer, get_error_log, flush_error_log, register_writer
+from hitachi_website_error_index import ErrorIndex, load_error_index
+from hitachi_website_sqlite_store import SqliteStore
+from hitachi_website_html_archive import HtmlArchive, archive_path as pack_path
+from hitachi_website_html_fragment import TemplateStore, verified_fragment
+from hitachi_website_raw_layout import find_raw_file, raw_file_path
+from hitachi_website_parse_cache import ParseCache, DEFAULT_MAX_ENTRIES, cache_path, parser_version
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -30,7 +43,9 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # Constants
-BASE_URL = "https://bushing.hitachienergy.com/Scripts/BushingLookupBU.asp"
+SITE_ROOT = "https://bushing.hitachienergy.com"
+PAGE_PATH = "/Scripts/BushingLookupBU.asp"
+BASE_URL = SITE_ROOT + PAGE_PATH
 CROSS_REFERENCE_CSV = "hitachi_website_bushing_master_list.csv"
 OUTPUT_CSV = "hitachi_website_bushing_catalog_master_list.csv"
 ERROR_LOG_CSV = "hitachi_website_catalog_scraping_error_log.csv"
@@ -96,6 +111,203 @@ COLUMNS = [
     "Special Features"
 ]
 
+# Master list storage: 'csv' (default) or 'sqlite' (hitachi_website_sqlite_store.py)
+STORAGE_BACKENDS = ('csv', 'sqlite')
+STORAGE = 'csv'
+SQLITE_TABLE = "catalog_master_list"
+SQLITE_INDEXES = [
+    "Catalog Number",
+    "Alternate Style Number (usually other color)"
+]
+
+# Raw HTML storage: 'files' (default, one file per page) or 'archive' (hitachi_website_html_archive.py)
+RAW_STORAGE_BACKENDS = ('files', 'archive')
+RAW_STORAGE = 'files'
+
+# Raw HTML content: 'full' (default, the page as served) or 'fragment' (hitachi_website_html_fragment.py)
+RAW_CONTENT_MODES = ('full', 'fragment')
+RAW_CONTENT = 'full'
+# Catalog pages are parsed down to the last table, so fragments keep the whole body
+FRAGMENT_CUT_AFTER = None
+_templates = TemplateStore()
+
+# Parse result cache (hitachi_website_parse_cache.py), off by default. Records are cached
+# per parser version, which already changes with this file; bump PARSE_VERSION when a
+# change elsewhere changes the records the parser returns
+PARSE_VERSION = 1
+PARSE_CACHE = False
+PARSE_CACHE_MAX_ENTRIES = DEFAULT_MAX_ENTRIES
+
+# Error type of the latest failure per style number in this process (drives same-run retries)
+_last_error_types: Dict[str, str] = {}
+
+
+def configure_output_paths(output_csv: Optional[str] = None, error_log_csv: Optional[str] = None,
+                           raw_data_dir: Optional[str] = None) -> Tuple[str, str, str]:
+    """
+    Redirect the master CSV, error log and raw HTML folder (e.g. for a shard run).
+    Every function that defaults to these paths picks up the new values.
+    
+    Args:
+        output_csv: Master CSV path (None keeps the current one)
+        error_log_csv: Error log CSV path (None keeps the current one)
+        raw_data_dir: Raw HTML folder (None keeps the current one)
+        
+    Returns:
+        Tuple of (OUTPUT_CSV, ERROR_LOG_CSV, RAW_DATA_DIR) now in effect
+    """
+    global OUTPUT_CSV, ERROR_LOG_CSV, RAW_DATA_DIR
+    OUTPUT_CSV = output_csv or OUTPUT_CSV
+    ERROR_LOG_CSV = error_log_csv or ERROR_LOG_CSV
+    RAW_DATA_DIR = raw_data_dir or RAW_DATA_DIR
+    _last_error_types.clear()
+    logger.info(f"Output paths: {OUTPUT_CSV}, {ERROR_LOG_CSV}, {RAW_DATA_DIR}/")
+    return OUTPUT_CSV, ERROR_LOG_CSV, RAW_DATA_DIR
+
+
+def configure_base_url(site_root: Optional[str] = None) -> str:
+    """
+    Point the scraper at another host serving the same catalog pages (e.g. the local
+    replay server in hitachi_website_replay_server.py).
+    
+    Args:
+        site_root: Scheme and host such as "http://127.0.0.1:8765" (None restores the live site)
+        
+    Returns:
+        BASE_URL now in effect
+    """
+    global BASE_URL
+    BASE_URL = f"{(site_root or SITE_ROOT).rstrip('/')}{PAGE_PATH}"
+    logger.info(f"Base URL: {BASE_URL}")
+    return BASE_URL
+
+
+def configure_storage(storage: Optional[str] = None) -> str:
+    """
+    Select where save_to_csv writes records.
+    
+    Args:
+        storage: 'csv' (append to the master CSV) or 'sqlite' (upsert into the
+            database next to it); None keeps the current one
+        
+    Returns:
+        STORAGE now in effect
+    """
+    global STORAGE
+    if storage is not None:
+        if storage not in STORAGE_BACKENDS:
+            raise ValueError(f"Unknown storage backend: {storage}")
+        STORAGE = storage
+        logger.info(f"Storage: {STORAGE}")
+    return STORAGE
+
+
+def database_path(filepath: Optional[str] = None) -> str:
+    """SQLite database of a master CSV (default: OUTPUT_CSV) - same name, .db extension."""
+    return os.path.splitext(filepath or OUTPUT_CSV)[0] + ".db"
+
+
+def configure_raw_storage(raw_storage: Optional[str] = None) -> str:
+    """
+    Select where save_raw_html writes pages.
+    
+    Args:
+        raw_storage: 'files' (one file per page in RAW_DATA_DIR) or 'archive'
+            (append to the compressed pack next to it); None keeps the current one
+        
+    Returns:
+        RAW_STORAGE now in effect
+    """
+    global RAW_STORAGE
+    if raw_storage is not None:
+        if raw_storage not in RAW_STORAGE_BACKENDS:
+            raise ValueError(f"Unknown raw HTML storage: {raw_storage}")
+        RAW_STORAGE = raw_storage
+        logger.info(f"Raw HTML storage: {RAW_STORAGE}")
+    return RAW_STORAGE
+
+
+def configure_raw_content(raw_content: Optional[str] = None) -> str:
+    """
+    Select what save_raw_html keeps of a page.
+    
+    Args:
+        raw_content: 'full' (the page as served) or 'fragment' (only the
+            data-bearing body, verified to parse to the same record); None
+            keeps the current one
+        
+    Returns:
+        RAW_CONTENT now in effect
+    """
+    global RAW_CONTENT
+    if raw_content is not None:
+        if raw_content not in RAW_CONTENT_MODES:
+            raise ValueError(f"Unknown raw HTML content mode: {raw_content}")
+        RAW_CONTENT = raw_content
+        logger.info(f"Raw HTML content: {RAW_CONTENT}")
+    return RAW_CONTENT
+
+
+def configure_parse_cache(enabled: Optional[bool] = None, max_entries: Optional[int] = None) -> bool:
+    """
+    Turn the parse result cache of check_catalog_page on or off.
+    
+    Args:
+        enabled: True to look parsed records up by page hash before parsing;
+            None keeps the current setting
+        max_entries: Records the cache keeps (None keeps the current bound)
+        
+    Returns:
+        PARSE_CACHE now in effect
+    """
+    global PARSE_CACHE, PARSE_CACHE_MAX_ENTRIES
+    if max_entries is not None:
+        PARSE_CACHE_MAX_ENTRIES = max_entries
+    if enabled is not None:
+        PARSE_CACHE = enabled
+        logger.info(f"Parse cache: {'on' if PARSE_CACHE else 'off'}")
+    return PARSE_CACHE
+
+
+def parse_cache_path(directory: Optional[str] = None) -> str:
+    """Parse cache of a raw HTML folder (default: RAW_DATA_DIR)."""
+    return cache_path(directory or RAW_DATA_DIR)
+
+
+def parse_cache_version() -> str:
+    """Parser version the cached records are keyed on (PARSE_VERSION and this module's source)."""
+    return parser_version('catalog', PARSE_VERSION, 'soup', [__file__])
+
+
+def get_parse_cache(directory: Optional[str] = None) -> ParseCache:
+    """Shared parse result cache of a raw HTML folder (default: RAW_DATA_DIR)."""
+    path = parse_cache_path(directory)
+    return register_writer(path, lambda: ParseCache(path, parse_cache_version(), PARSE_CACHE_MAX_ENTRIES))
+
+
+def archive_path(directory: Optional[str] = None) -> str:
+    """Raw HTML archive of a folder (default: RAW_DATA_DIR) - same name, .pack extension."""
+    return pack_path(directory or RAW_DATA_DIR)
+
+
+def get_archive(directory: Optional[str] = None) -> HtmlArchive:
+    """Shared raw HTML archive of a folder (default: RAW_DATA_DIR); the pack is created on the first save."""
+    path = archive_path(directory)
+    return register_writer(path, lambda: HtmlArchive(path))
+
+
+def get_store(filepath: Optional[str] = None) -> SqliteStore:
+    """
+    Shared SQLite store of a master CSV (default: OUTPUT_CSV), seeded from the
+    CSV when the database is created.
+    """
+    filepath = filepath or OUTPUT_CSV
+    path = database_path(filepath)
+    return register_writer(path, lambda: SqliteStore(
+        path, SQLITE_TABLE, COLUMNS, 'Style Number', integer_key=False,
+        indexes=SQLITE_INDEXES, seed_csv=filepath
+    ))
+
 
 def extract_unique_abb_style_numbers() -> Set[str]:
     """
@@ -141,42 +353,38 @@ def extract_unique_abb_style_numbers() -> Set[str]:
         return set()
 
 
-def log_error_to_csv(style_number: str, error_message: str) -> bool:
+def _error_log(path: Optional[str] = None):
+    """Shared in-memory error log for a path (default: ERROR_LOG_CSV), loaded on first use."""
+    return get_error_log(path or ERROR_LOG_CSV, 'Style_Number', str)
+
+
+def log_error_to_csv(style_number: str, error_message: str, error_type: Optional[str] = None,
+                     http_status: Optional[int] = None) -> bool:
     """
     Log scraping errors to a CSV file for analysis.
+    A style already in the log is only rewritten when a transient error
+    turns into a permanent one, so the log always holds the latest verdict.
     
     Args:
         style_number: The bushing style number that failed
         error_message: Descriptive error message
+        error_type: Enumerated error type (derived from the message if omitted)
+        http_status: HTTP status code of the failed response, if any
         
     Returns:
         True if logged successfully, False otherwise
     """
     try:
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        
-        error_data = {
-            'Timestamp': timestamp,
-            'Style_Number': style_number,
-            'Error_Message': error_message
-        }
-        
-        # Create DataFrame
-        df = pd.DataFrame([error_data])
-        
-        # Append to existing file or create new one
-        try:
-            existing_df = pd.read_csv(ERROR_LOG_CSV)
-            # Check if this style number already exists in error log
-            if style_number not in existing_df['Style_Number'].values:
-                combined_df = pd.concat([existing_df, df], ignore_index=True)
-                combined_df.to_csv(ERROR_LOG_CSV, index=False)
-                logger.info(f"Logged error for style {style_number}: {error_message}")
-            else:
-                logger.debug(f"Style {style_number} already in error log")
-        except FileNotFoundError:
-            df.to_csv(ERROR_LOG_CSV, index=False)
-            logger.info(f"Created error log and logged style {style_number}: {error_message}")
+        error_type = error_type or classify_error_message(error_message)
+        _last_error_types[style_number] = error_type
+        
+        action = _error_log().record(style_number, error_type, error_message, http_status)
+        if action == 'logged':
+            logger.info(f"Logged error for style {style_number} ({error_type}): {error_message}")
+        elif action == 'updated':
+            logger.info(f"Updated error for style {style_number} ({error_type}): {error_message}")
+        else:
+            logger.debug(f"Style {style_number} already in error log")
         
         return True
         
@@ -185,32 +393,149 @@ def log_error_to_csv(style_number: str, error_message: str) -> bool:
         return False
 
 
-def save_raw_html(html_content: str, style_number: str, directory: str = RAW_DATA_DIR) -> bool:
+def get_last_error_type(style_number: str) -> Optional[str]:
+    """
+    Error type of the most recent failure for a style in this process.
+    Lets the batch scrapers decide whether a failed fetch should be retried.
+    
+    Args:
+        style_number: The bushing style number
+        
+    Returns:
+        Error type constant, or None if the style has not failed in this run
+    """
+    return _last_error_types.get(style_number)
+
+
+def clear_error_from_csv(style_number: str) -> bool:
+    """
+    Remove a style from the error log (after a transient failure was retried
+    successfully).
+    
+    Args:
+        style_number: The bushing style number
+        
+    Returns:
+        True if successful or the style was not logged, False on error
+    """
+    try:
+        _last_error_types.pop(style_number, None)
+        if _error_log().clear(style_number):
+            logger.info(f"Cleared style {style_number} from error log")
+        return True
+    except Exception as e:
+        logger.error(f"Failed to clear style {style_number} from error log: {e}")
+        return False
+
+
+def write_error_entry(style_number: str):
     """
-    Save raw HTML response to file.
+    Write a style's new error log entry to disk now instead of with the next
+    batch, so a progress journal that records the failure next never runs
+    ahead of the error log.
+    
+    Args:
+        style_number: The bushing style number
+    """
+    try:
+        _error_log().write_key(style_number)
+    except Exception as e:
+        logger.error(f"Failed to write the error log entry of {style_number}: {e}")
+
+
+def _with_error_types(df: pd.DataFrame) -> pd.DataFrame:
+    """Fill in Error_Type for error log rows written before the column existed."""
+    derived = df['Error_Message'].map(classify_error_message)
+    if 'Error_Type' not in df.columns:
+        df.insert(df.columns.get_loc('Style_Number') + 1, 'Error_Type', derived)
+    else:
+        df['Error_Type'] = df['Error_Type'].fillna(derived)
+    return df
+
+
+def load_error_log(path: Optional[str] = None) -> pd.DataFrame:
+    """
+    Load the error log with an Error_Type for every row.
+    
+    Args:
+        path: Error log CSV to read (default: ERROR_LOG_CSV)
+    
+    Returns:
+        DataFrame with Style_Number, Error_Type and Error_Message columns (empty if no log)
+    """
+    path = path or ERROR_LOG_CSV
+    try:
+        flush_error_log(path)
+        if os.path.exists(path):
+            return _with_error_types(pd.read_csv(path))
+    except Exception as e:
+        logger.warning(f"Error reading error log: {e}")
+    return pd.DataFrame(columns=['Timestamp', 'Style_Number', 'Error_Type', 'Error_Message'])
+
+
+def raw_html_filename(style_number: str) -> str:
+    """Raw HTML file name of a style number ('/' and '\\' are replaced for the filesystem)."""
+    safe_style = style_number.replace("/", "_").replace("\\", "_")
+    return f"Hitachi_website_bushing_{safe_style}.html"
+
+
+def _raw_html_exists(name: str, directory: str) -> bool:
+    """Whether a raw HTML name is saved in a folder or its archive."""
+    if find_raw_file(directory, name):
+        return True
+    return os.path.exists(archive_path(directory)) and name in get_archive(directory)
+
+
+def _write_raw_html(name: str, html_content: str, directory: str) -> str:
+    """Write a raw HTML name to the folder (or the archive); returns where it went."""
+    if RAW_STORAGE == 'archive':
+        get_archive(directory).put(name, html_content)
+        # Readers try the loose file first - an older copy would hide the new page
+        stale = find_raw_file(directory, name)
+        if stale:
+            os.remove(stale)
+            logger.info(f"Removed {stale} (superseded by the archived page)")
+        return archive_path(directory)
+    
+    # Creates the folder (and its bucket in the fan-out layout) if needed
+    filepath = raw_file_path(directory, name, create=True)
+    with open(filepath, 'w', encoding='utf-8') as f:
+        f.write(html_content)
+    return filepath
+
+
+def save_raw_html(html_content: str, style_number: str, directory: Optional[str] = None,
+                  data: Optional[dict] = None) -> bool:
+    """
+    Save raw HTML response to file (or to the archive with configure_raw_storage('archive')).
+    With configure_raw_content('fragment') only the boilerplate-stripped fragment is
+    saved, unless it parses to a different record than the full page.
     
     Args:
         html_content: Raw HTML content from the webpage
         style_number: The bushing style number
         directory: Directory to save the file (default: RAW_DATA_DIR)
+        data: Record already parsed from the page (fragment mode compares against it)
         
     Returns:
         True if successful, False otherwise
     """
     try:
-        # Create directory if it doesn't exist
-        Path(directory).mkdir(parents=True, exist_ok=True)
+        directory = directory or RAW_DATA_DIR
         
-        # Create filename - sanitize style number for filesystem
-        safe_style = style_number.replace("/", "_").replace("\\", "_")
-        filename = f"Hitachi_website_bushing_{safe_style}.html"
-        filepath = os.path.join(directory, filename)
-        
-        # Save HTML content
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        if RAW_CONTENT == 'fragment':
+            fragment = verified_fragment(html_content, lambda soup: parse_catalog_info(soup, style_number), data, FRAGMENT_CUT_AFTER)
+            if fragment is None:
+                logger.warning(f"Fragment of style {style_number} parses differently - saving the full page")
+            else:
+                html_content, template_fingerprint, template = fragment
+                if template is not None:
+                    _templates.ensure(directory, template_fingerprint,
+                                      lambda name: _raw_html_exists(name, directory),
+                                      lambda name: _write_raw_html(name, template, directory))
         
-        logger.info(f"Saved raw HTML to {filepath}")
+        location = _write_raw_html(raw_html_filename(style_number), html_content, directory)
+        logger.info(f"Saved raw HTML to {location}")
         return True
         
     except Exception as e:
@@ -218,7 +543,7 @@ def save_raw_html(html_content: str, style_number: str, directory: str = RAW_DAT
         return False
 
 
-def delete_raw_html(style_number: str, directory: str = RAW_DATA_DIR) -> bool:
+def delete_raw_html(style_number: str, directory: Optional[str] = None) -> bool:
     """
     Delete raw HTML file for a given style number.
     Used to clean up files for style numbers with errors.
@@ -231,16 +556,18 @@ def delete_raw_html(style_number: str, directory: str = RAW_DATA_DIR) -> bool:
         True if successful or file doesn't exist, False on error
     """
     try:
-        safe_style = style_number.replace("/", "_").replace("\\", "_")
-        filename = f"Hitachi_website_bushing_{safe_style}.html"
-        filepath = os.path.join(directory, filename)
+        directory = directory or RAW_DATA_DIR
+        filepath = find_raw_file(directory, raw_html_filename(style_number))
         
-        if os.path.exists(filepath):
+        if RAW_STORAGE == 'archive' and get_archive(directory).delete(raw_html_filename(style_number)):
+            logger.info(f"Deleted raw HTML for {style_number} from {archive_path(directory)}")
+        
+        if filepath:
             os.remove(filepath)
             logger.info(f"Deleted raw HTML file: {filepath}")
             return True
         else:
-            logger.debug(f"HTML file not found (already deleted): {filepath}")
+            logger.debug(f"HTML file not found (already deleted): {raw_html_filename(style_number)}")
             return True
         
     except Exception as e:
@@ -248,21 +575,82 @@ def delete_raw_html(style_number: str, directory: str = RAW_DATA_DIR) -> bool:
         return False
 
 
-def get_error_log_style_numbers() -> set:
+def discard_raw_html(style_number: str, error_type: Optional[str]) -> None:
+    """
+    Delete the raw HTML of a style after a permanent failure. A transient one
+    (timeout, server error, ...) keeps the page that is already saved, since
+    its master list row and status stay as well.
+    
+    Args:
+        style_number: The bushing style number
+        error_type: Error type of the failure
+    """
+    if not error_types.is_transient_error(error_type):
+        delete_raw_html(style_number)
+
+
+def read_raw_html(style_number: str, directory: Optional[str] = None) -> Optional[str]:
+    """
+    Saved raw HTML of a style number, from its file or from the archive.
+    
+    Args:
+        style_number: The bushing style number
+        directory: Raw HTML folder (default: RAW_DATA_DIR)
+        
+    Returns:
+        Page text, or None if the page was not saved
+    """
+    directory = directory or RAW_DATA_DIR
+    name = raw_html_filename(style_number)
+    filepath = find_raw_file(directory, name)
+    if filepath:
+        with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
+            return f.read()
+    path = archive_path(directory)
+    if not os.path.exists(path):
+        return None
+    return get_archive(directory).get(name)
+
+
+def get_error_log_style_numbers(path: Optional[str] = None) -> set:
     """
-    Load all style numbers from the error log CSV.
+    Load the style numbers with permanent failures from the error log CSV.
+    Transient failures (timeouts, connection errors, HTTP 5xx, ...) are not
+    included, so they are fetched again on the next run.
+    
+    Args:
+        path: Error log CSV to read (default: ERROR_LOG_CSV)
     
     Returns:
-        Set of style numbers that have errors
+        Set of style numbers that should be skipped
     """
-    try:
-        if os.path.exists(ERROR_LOG_CSV):
-            df = pd.read_csv(ERROR_LOG_CSV)
-            return set(df['Style_Number'].values)
-        return set()
-    except Exception as e:
-        logger.warning(f"Error reading error log: {e}")
-        return set()
+    return _error_log(path).keys(permanent=True)
+
+
+def get_transient_error_log_style_numbers() -> set:
+    """
+    Load the style numbers whose last logged failure was transient.
+    
+    Returns:
+        Set of style numbers eligible for retry
+    """
+    return _error_log().keys(permanent=False)
+
+
+def get_error_index(path: Optional[str] = None) -> ErrorIndex:
+    """
+    Compact typed view of the error log: error code, HTTP status, attempts and
+    last-attempt time per style number, with per-code key sets (see hitachi_website_error_index.py).
+    
+    Args:
+        path: Error log CSV to read (default: ERROR_LOG_CSV)
+    
+    Returns:
+        ErrorIndex of the log
+    """
+    path = path or ERROR_LOG_CSV
+    flush_error_log(path)
+    return load_error_index(path, str, 'Style_Number')
 
 
 def scrape_catalog_data(style_number: str) -> Optional[Dict[str, str]]:
@@ -280,108 +668,200 @@ def scrape_catalog_data(style_number: str) -> Optional[Dict[str, str]]:
     url = f"{BASE_URL}?StyleNumber={style_number}&Language=English&Units=English"
     logger.info(f"Scraping catalog data for style {style_number} from {url}")
     
-    # Headers to mimic a real browser
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-        'Accept-Language': 'en-US,en;q=0.9',
-        'Accept-Encoding': 'gzip, deflate, br',
-        'Connection': 'keep-alive',
-        'Upgrade-Insecure-Requests': '1',
-        'Referer': 'https://bushing.hitachienergy.com/'
-    }
-    
     try:
-        # Send GET request with browser headers
-        response = requests.get(url, headers=headers, timeout=30)
+        # Send GET request with browser headers over the shared keep-alive session
+        response = http_get(url, headers=HITACHI_HEADERS, timeout=30)
         
         # Check for HTTP errors
         if response.status_code == 404:
-            log_error_to_csv(style_number, 'Page not found (HTTP 404)')
+            log_error_to_csv(style_number, 'Page not found (HTTP 404)', error_types.HTTP_404, 404)
             logger.warning(f"Style {style_number} not found (404)")
-            delete_raw_html(style_number)
+            discard_raw_html(style_number, error_types.HTTP_404)
             return None
         elif response.status_code == 403:
-            log_error_to_csv(style_number, 'Access forbidden (HTTP 403)')
+            log_error_to_csv(style_number, 'Access forbidden (HTTP 403)', error_types.HTTP_403, 403)
             logger.warning(f"Access forbidden for style {style_number} (403)")
-            delete_raw_html(style_number)
+            discard_raw_html(style_number, error_types.HTTP_403)
             return None
         
         response.raise_for_status()
         
-        # Check if response has content
-        if not response.text or len(response.text) < 100:
-            log_error_to_csv(style_number, 'Empty or too short response from server')
-            logger.warning(f"Empty or invalid response for style {style_number}")
-            delete_raw_html(style_number)
-            return None
-        
-        # Check for "No bushing found" message
-        if "No bushing found by that style number" in response.text:
-            log_error_to_csv(style_number, 'No bushing found by that style number')
-            logger.warning(f"No bushing found for style {style_number}")
-            delete_raw_html(style_number)
-            return None
-        
-        # Parse HTML
-        soup = BeautifulSoup(response.content, 'lxml')
-        
-        # Extract catalog information
-        catalog_data = parse_catalog_info(soup, style_number)
-        
-        if catalog_data:
-            # Validate that we got at least the style number confirmed
-            if catalog_data.get("Style Number"):
-                # Save HTML for valid data
-                if not save_raw_html(response.text, style_number):
-                    logger.warning(f"Failed to save raw HTML for style {style_number}, but continuing...")
-                logger.info(f"Successfully scraped catalog data for style {style_number}")
-                return catalog_data
-            else:
-                log_error_to_csv(style_number, 'Style number field empty - no valid data extracted')
-                logger.warning(f"No valid data found for style {style_number}")
-                delete_raw_html(style_number)
-                return None
-        else:
-            log_error_to_csv(style_number, 'HTML parser returned None - could not parse page')
-            logger.warning(f"Parser failed for style {style_number}")
-            delete_raw_html(style_number)
-            return None
+        return process_catalog_page(style_number, response.text, response.content)
     
     except requests.exceptions.Timeout:
-        log_error_to_csv(style_number, 'Request timeout after 30 seconds')
+        log_error_to_csv(style_number, 'Request timeout after 30 seconds', error_types.TIMEOUT)
         logger.error(f"Timeout fetching data for style {style_number}")
-        delete_raw_html(style_number)
+        discard_raw_html(style_number, error_types.TIMEOUT)
         return None
     
     except requests.exceptions.ConnectionError as e:
-        log_error_to_csv(style_number, f'Network connection error: {str(e)[:100]}')
+        log_error_to_csv(style_number, f'Network connection error: {str(e)[:100]}', error_types.CONNECTION_ERROR)
         logger.error(f"Connection error for style {style_number}: {e}")
-        delete_raw_html(style_number)
+        discard_raw_html(style_number, error_types.CONNECTION_ERROR)
         return None
     
     except requests.exceptions.HTTPError as e:
-        log_error_to_csv(style_number, f'HTTP error {e.response.status_code}: {str(e)[:100]}')
+        error_type = error_types.http_error_type(e.response.status_code)
+        log_error_to_csv(style_number, f'HTTP error {e.response.status_code}: {str(e)[:100]}', error_type,
+                         e.response.status_code)
         logger.error(f"HTTP error for style {style_number}: {e}")
-        delete_raw_html(style_number)
+        discard_raw_html(style_number, error_type)
         return None
     
     except requests.exceptions.RequestException as e:
-        log_error_to_csv(style_number, f'Request exception: {str(e)[:100]}')
+        log_error_to_csv(style_number, f'Request exception: {str(e)[:100]}', error_types.REQUEST_ERROR)
         logger.error(f"Request exception for style {style_number}: {e}")
-        delete_raw_html(style_number)
+        discard_raw_html(style_number, error_types.REQUEST_ERROR)
         return None
     
     except Exception as e:
-        log_error_to_csv(style_number, f'Unexpected error: {str(e)[:100]}')
+        log_error_to_csv(style_number, f'Unexpected error: {str(e)[:100]}', error_types.UNKNOWN_ERROR)
         logger.error(f"Unexpected error for style {style_number}: {e}")
-        delete_raw_html(style_number)
+        discard_raw_html(style_number, error_types.UNKNOWN_ERROR)
         return None
 
 
+def check_catalog_page(style_number: str, html_text: str,
+                       html_content: Optional[bytes] = None) -> Tuple[Optional[Dict[str, str]], Optional[str], str]:
+    """
+    Validate and parse a catalog page without touching any file.
+    Shared by process_catalog_page and the offline reparse
+    (hitachi_website_reparse.py), so both accept and reject the same pages.
+    
+    Args:
+        style_number: The ABB style number of the page
+        html_text: Decoded page
+        html_content: Raw page bytes handed to the HTML parser (default: html_text)
+        
+    Returns:
+        Tuple of (catalog data, None, '') for a valid page, or
+        (None, error type, error message) if the page has no valid data
+    """
+    # Check if response has content
+    if not html_text or len(html_text) < 100:
+        logger.warning(f"Empty or invalid response for style {style_number}")
+        return None, error_types.EMPTY_RESPONSE, 'Empty or too short response from server'
+    
+    # Check for "No bushing found" message
+    if "No bushing found by that style number" in html_text:
+        logger.warning(f"No bushing found for style {style_number}")
+        return None, error_types.NO_BUSHING_FOUND, 'No bushing found by that style number'
+    
+    # Parse HTML and extract catalog information (or look the record up by page hash)
+    markup = html_content if html_content is not None else html_text
+    if PARSE_CACHE:
+        catalog_data = get_parse_cache().parse(
+            markup, style_number, lambda: parse_catalog_info(BeautifulSoup(markup, 'lxml'), style_number))
+    else:
+        catalog_data = parse_catalog_info(BeautifulSoup(markup, 'lxml'), style_number)
+    if not catalog_data:
+        logger.warning(f"Parser failed for style {style_number}")
+        return None, error_types.PARSE_FAILED, 'HTML parser returned None - could not parse page'
+    
+    # Validate that we got at least the style number confirmed
+    if not catalog_data.get("Style Number"):
+        logger.warning(f"No valid data found for style {style_number}")
+        return None, error_types.NO_DATA, 'Style number field empty - no valid data extracted'
+    
+    return catalog_data, None, ''
+
+
+def process_catalog_page(style_number: str, html_text: str, html_content: bytes) -> Optional[Dict[str, str]]:
+    """
+    Validate and parse a successfully fetched catalog page.
+    Shared by the blocking and asyncio fetchers so both apply identical checks,
+    error logging and raw HTML handling.
+    
+    Args:
+        style_number: The ABB style number that was fetched
+        html_text: Decoded response body
+        html_content: Raw response body bytes (handed to the HTML parser)
+        
+    Returns:
+        Dictionary containing scraped catalog data or None if the page has no valid data
+    """
+    catalog_data, error_type, error_message = check_catalog_page(style_number, html_text, html_content)
+    
+    if catalog_data is None:
+        log_error_to_csv(style_number, error_message, error_type)
+        discard_raw_html(style_number, error_type)
+        return None
+    
+    # Save HTML for valid data
+    if not save_raw_html(html_text, style_number, data=catalog_data):
+        logger.warning(f"Failed to save raw HTML for style {style_number}, but continuing...")
+    logger.info(f"Successfully scraped catalog data for style {style_number}")
+    return catalog_data
+
+
+class CatalogTableIndex:
+    """
+    Label lookups over the table cells of a catalog page, read in one pass.
+    
+    The page's rows are walked once: each cell's text is normalized (whitespace
+    collapsed, <br> tags replaced by spaces) and kept in document order with the
+    text of the cell after it. value(label) then applies the matching rules of
+    the original extract_table_value to these strings instead of walking and
+    re-reading the tree for every label, which made a page cost about 60 full
+    table walks. The first cell that matches in document order still wins, so
+    fallback labels and partial matches resolve exactly as before.
+    """
+    
+    def __init__(self, soup: BeautifulSoup):
+        """
+        Args:
+            soup: BeautifulSoup object containing the parsed HTML
+        """
+        self.cells = []     # (cell text, text of the next cell in the row or None)
+        self._values = {}   # label -> resolved value
+        # <br> tags inside table cells become spaces, as extract_table_value did;
+        # they do not change the cell texts but do show up in soup.get_text()
+        for br in soup.find_all('br'):
+            cell = br.find_parent(['td', 'th'])
+            if cell is not None and cell.find_parent('tr') is not None:
+                br.replace_with(' ')
+        for row in soup.find_all('tr'):
+            texts = [' '.join(cell.get_text(separator=' ', strip=True).split())
+                     for cell in row.find_all(['td', 'th'])]
+            for i, text in enumerate(texts):
+                self.cells.append((text, texts[i + 1] if i + 1 < len(texts) else None))
+    
+    def value(self, label: str) -> str:
+        """
+        Value of a label: the next cell after the cell holding the label (exact
+        match, or the label is more than 70% of the cell text), or the text after
+        the colon of a "Label: value" cell.
+        
+        Args:
+            label: Label text to search for (e.g., "Catalog Number:")
+            
+        Returns:
+            Extracted value or empty string
+        """
+        value = self._values.get(label)
+        if value is not None:
+            return value
+        value = ""
+        for text, next_text in self.cells:
+            if label not in text:
+                continue
+            if next_text is not None and (label == text or len(label) > len(text) * 0.7):
+                value = next_text
+                break
+            if ':' in text:
+                head, tail = text.split(':', 1)
+                if label in head:
+                    value = tail.strip()
+                    break
+        self._values[label] = value
+        return value
+
+
 def extract_table_value(soup: BeautifulSoup, label: str) -> str:
     """
     Extract value from HTML table by searching for label in table cells.
+    Builds a throwaway CatalogTableIndex; parse_catalog_info builds one per
+    page and resolves every field from it.
     
     Args:
         soup: BeautifulSoup object containing the parsed HTML
@@ -391,46 +871,7 @@ def extract_table_value(soup: BeautifulSoup, label: str) -> str:
         Extracted value or empty string
     """
     try:
-        # Find all table rows
-        all_rows = soup.find_all('tr')
-        
-        for row in all_rows:
-            cells = row.find_all(['td', 'th'])
-            
-            # Check each cell in this row for the label
-            for i, cell in enumerate(cells):
-                # Replace BR tags with spaces BEFORE getting text
-                for br in cell.find_all('br'):
-                    br.replace_with(' ')
-                
-                # Get text and normalize whitespace
-                cell_text = cell.get_text(separator=' ', strip=True)
-                # Normalize whitespace (multiple spaces to single space)
-                cell_text = ' '.join(cell_text.split())
-                
-                # Check if this cell contains our label (exact or partial match)
-                # Try exact match first
-                if label == cell_text or (label in cell_text and len(label) > len(cell_text) * 0.7):
-                    # Value should be in the next cell in the same row
-                    if i + 1 < len(cells):
-                        value_cell = cells[i + 1]
-                        # Process BR tags in value cell too
-                        for br in value_cell.find_all('br'):
-                            br.replace_with(' ')
-                        value = value_cell.get_text(separator=' ', strip=True)
-                        # Clean up the value
-                        value = ' '.join(value.split())  # Normalize whitespace
-                        return value
-                
-                # Sometimes value is in same cell after label (with colon)
-                if label in cell_text and ':' in cell_text:
-                    parts = cell_text.split(':', 1)
-                    if len(parts) == 2 and label in parts[0]:
-                        value = parts[1].strip()
-                        return value
-        
-        return ""
-        
+        return CatalogTableIndex(soup).value(label)
     except Exception as e:
         logger.debug(f"Error extracting table value for '{label}': {e}")
         return ""
@@ -455,88 +896,91 @@ def parse_catalog_info(soup: BeautifulSoup, style_number: str) -> Optional[Dict[
         # Set the style number we're looking for
         data["Style Number"] = style_number
         
+        # Read the tables once; every field below is resolved from this index
+        table = CatalogTableIndex(soup)
+        
         # Extract basic information
-        data["Alternate Style Number (usually other color)"] = extract_table_value(soup, "Alternate Style Number")
-        data["Catalog Number"] = extract_table_value(soup, "Catalog Number:")
-        data["Delivery Ex-Works"] = extract_table_value(soup, "Delivery Ex-Works:")
-        data["Delivery Last Update"] = extract_table_value(soup, "Delivery Last Update:")
-        data["List Price US$"] = extract_table_value(soup, "List Price US$:")
+        data["Alternate Style Number (usually other color)"] = table.value("Alternate Style Number")
+        data["Catalog Number"] = table.value("Catalog Number:")
+        data["Delivery Ex-Works"] = table.value("Delivery Ex-Works:")
+        data["Delivery Last Update"] = table.value("Delivery Last Update:")
+        data["List Price US$"] = table.value("List Price US$:")
         
         # Extract insulator information
-        data["Insulator Type"] = extract_table_value(soup, "Insulator Type:")
-        data["Color"] = extract_table_value(soup, "Color:")
-        data["Outline Drawing"] = extract_table_value(soup, "Outline Drawing:")
-        data["Download Drawing"] = extract_table_value(soup, "Download Drawing:")
+        data["Insulator Type"] = table.value("Insulator Type:")
+        data["Color"] = table.value("Color:")
+        data["Outline Drawing"] = table.value("Outline Drawing:")
+        data["Download Drawing"] = table.value("Download Drawing:")
         
         # Extract specifications
-        data["Apparatus"] = extract_table_value(soup, "Apparatus:")
-        data["Standard"] = extract_table_value(soup, "Standard:")
-        data["Bushing Type"] = extract_table_value(soup, "Bushing Type:")
-        data["Oil Indication"] = extract_table_value(soup, "Oil Indication:")
-        data["Application"] = extract_table_value(soup, "Application:")
-        data["Mounting Position"] = extract_table_value(soup, "Mounting Position:")
-        data["Connection Type"] = extract_table_value(soup, "Connection Type:")
-        data["Current Version"] = extract_table_value(soup, "Current Version:")
+        data["Apparatus"] = table.value("Apparatus:")
+        data["Standard"] = table.value("Standard:")
+        data["Bushing Type"] = table.value("Bushing Type:")
+        data["Oil Indication"] = table.value("Oil Indication:")
+        data["Application"] = table.value("Application:")
+        data["Mounting Position"] = table.value("Mounting Position:")
+        data["Connection Type"] = table.value("Connection Type:")
+        data["Current Version"] = table.value("Current Version:")
         
         # Extract electrical ratings
-        data["Voltage Class"] = extract_table_value(soup, "Voltage Class")
-        data["kV BIL"] = extract_table_value(soup, "kV BIL")
-        data["Max kV L-G"] = extract_table_value(soup, "Max kV L-G")
-        data["Cantilever Design Test Rating Upper Value"] = extract_table_value(soup, "Cantilever Design Test Rating Upper Value")
+        data["Voltage Class"] = table.value("Voltage Class")
+        data["kV BIL"] = table.value("kV BIL")
+        data["Max kV L-G"] = table.value("Max kV L-G")
+        data["Cantilever Design Test Rating Upper Value"] = table.value("Cantilever Design Test Rating Upper Value")
         
         # Try alternate label for lower value
-        lower_value = extract_table_value(soup, "Lower Value")
+        lower_value = table.value("Lower Value")
         if not lower_value:
-            lower_value = extract_table_value(soup, "Cantilever Design Test Rating Lower Value")
+            lower_value = table.value("Cantilever Design Test Rating Lower Value")
         data["Cantilever Design Test Rating Lower Value"] = lower_value
         
         # Extract capacitance and current
-        c1 = extract_table_value(soup, "Approximate Capacitance C1")
+        c1 = table.value("Approximate Capacitance C1")
         if not c1:
-            c1 = extract_table_value(soup, "C1")
+            c1 = table.value("C1")
         data["Approximate Capacitance C1"] = c1
         
-        c2 = extract_table_value(soup, "C2")
+        c2 = table.value("C2")
         if not c2:
-            c2 = extract_table_value(soup, "Approximate Capacitance C2")
+            c2 = table.value("Approximate Capacitance C2")
         data["Approximate Capacitance C2"] = c2
         
-        data["Current Rating Draw Lead"] = extract_table_value(soup, "Current Rating Draw Lead")
-        data["Bottom Connected"] = extract_table_value(soup, "Bottom Connected")
-        data["Oil Circuit Breaker"] = extract_table_value(soup, "Oil Circuit Breaker")
+        data["Current Rating Draw Lead"] = table.value("Current Rating Draw Lead")
+        data["Bottom Connected"] = table.value("Bottom Connected")
+        data["Oil Circuit Breaker"] = table.value("Oil Circuit Breaker")
         
         # Extract dimensions
-        data["Lower End Length (L)"] = extract_table_value(soup, "Lower End Length (L)")
-        data["C.T. Pocket Transformer"] = extract_table_value(soup, "C.T. Pocket Transformer")
-        data["C.T. Pocket Oil Circuit Breaker"] = extract_table_value(soup, "C.T. Pocket Oil Circuit Breaker")
-        data["Exposable Length Transformer (EL)"] = extract_table_value(soup, "Exposable Length Transformer (EL)")
-        data["Exposable Length Oil Circuit Breaker (EL)"] = extract_table_value(soup, "Exposable Length Oil Circuit Breaker (EL)")
-        data['Max. Dia. From 1" below Flange to Lower End of Bushing (D)'] = extract_table_value(soup, 'Max. Dia. From 1" below Flange to Lower End of Bushing (D)')
-        data["Upper End Length (B)"] = extract_table_value(soup, "Upper End Length (B)")
-        data["Minimum Creep"] = extract_table_value(soup, "Minimum Creep")
-        data["Arcing Distance"] = extract_table_value(soup, "Arcing Distance")
-        data["Lowest High Voltage (LHV)"] = extract_table_value(soup, "Lowest High Voltage (LHV)")
-        data["Cable Height/Pin Height for AB Bushings (CH)"] = extract_table_value(soup, "Cable Height/Pin Height for AB Bushings (CH)")
-        data["Maximum Altitude"] = extract_table_value(soup, "Maximum Altitude")
-        data["Approximate Weight"] = extract_table_value(soup, "Approximate Weight")
+        data["Lower End Length (L)"] = table.value("Lower End Length (L)")
+        data["C.T. Pocket Transformer"] = table.value("C.T. Pocket Transformer")
+        data["C.T. Pocket Oil Circuit Breaker"] = table.value("C.T. Pocket Oil Circuit Breaker")
+        data["Exposable Length Transformer (EL)"] = table.value("Exposable Length Transformer (EL)")
+        data["Exposable Length Oil Circuit Breaker (EL)"] = table.value("Exposable Length Oil Circuit Breaker (EL)")
+        data['Max. Dia. From 1" below Flange to Lower End of Bushing (D)'] = table.value('Max. Dia. From 1" below Flange to Lower End of Bushing (D)')
+        data["Upper End Length (B)"] = table.value("Upper End Length (B)")
+        data["Minimum Creep"] = table.value("Minimum Creep")
+        data["Arcing Distance"] = table.value("Arcing Distance")
+        data["Lowest High Voltage (LHV)"] = table.value("Lowest High Voltage (LHV)")
+        data["Cable Height/Pin Height for AB Bushings (CH)"] = table.value("Cable Height/Pin Height for AB Bushings (CH)")
+        data["Maximum Altitude"] = table.value("Maximum Altitude")
+        data["Approximate Weight"] = table.value("Approximate Weight")
         
         # Extract terminal information
-        data["Top End Terminal - Thread Dia and Class or number of Pads and Holes Per Pad"] = extract_table_value(soup, "Thread Dia and Class or number of Pads and Holes Per Pad")
-        data["Top End Terminal - Length and Type or Dia, and Type of Holes"] = extract_table_value(soup, "Length and Type or Dia, and Type of Holes")
-        data["Top End Terminal - Thread Plating"] = extract_table_value(soup, "Thread Plating")
-        data["Top End Terminal - Top Terminal Comments"] = extract_table_value(soup, "Top Terminal Comments")
+        data["Top End Terminal - Thread Dia and Class or number of Pads and Holes Per Pad"] = table.value("Thread Dia and Class or number of Pads and Holes Per Pad")
+        data["Top End Terminal - Length and Type or Dia, and Type of Holes"] = table.value("Length and Type or Dia, and Type of Holes")
+        data["Top End Terminal - Thread Plating"] = table.value("Thread Plating")
+        data["Top End Terminal - Top Terminal Comments"] = table.value("Top Terminal Comments")
         
-        data["Bottom End Terminal - Terminal Type"] = extract_table_value(soup, "Terminal Type")
-        data["Bottom End Terminal - Min Outside Diameter"] = extract_table_value(soup, "Min Outside Diameter")
-        data["Bottom End Terminal - Bottom Terminal Comments"] = extract_table_value(soup, "Bottom Terminal Comments")
+        data["Bottom End Terminal - Terminal Type"] = table.value("Terminal Type")
+        data["Bottom End Terminal - Min Outside Diameter"] = table.value("Min Outside Diameter")
+        data["Bottom End Terminal - Bottom Terminal Comments"] = table.value("Bottom Terminal Comments")
         
         # Extract flange mounting information
-        data["Max Inside Diameter (P)"] = extract_table_value(soup, "Max Inside Diameter (P)")
-        data["Min Outside Diameter (Q)"] = extract_table_value(soup, "Min Outside Diameter (Q)")
-        data["Number of Holes"] = extract_table_value(soup, "Number of Holes")
-        data["Hole/Slot Size"] = extract_table_value(soup, "Hole/Slot Size")
-        data["Bolt Circle Diameter"] = extract_table_value(soup, "Bolt Circle Diameter")
-        data["Epoxy Coated Shield and Terminal Kit"] = extract_table_value(soup, "Epoxy Coated Shield and Terminal Kit")
+        data["Max Inside Diameter (P)"] = table.value("Max Inside Diameter (P)")
+        data["Min Outside Diameter (Q)"] = table.value("Min Outside Diameter (Q)")
+        data["Number of Holes"] = table.value("Number of Holes")
+        data["Hole/Slot Size"] = table.value("Hole/Slot Size")
+        data["Bolt Circle Diameter"] = table.value("Bolt Circle Diameter")
+        data["Epoxy Coated Shield and Terminal Kit"] = table.value("Epoxy Coated Shield and Terminal Kit")
         
         # Extract comments and special features
         # These are often in paragraph form, not tables
@@ -570,42 +1014,36 @@ def parse_catalog_info(soup: BeautifulSoup, style_number: str) -> Optional[Dict[
         return None
 
 
-def save_to_csv(data: Dict[str, str], filepath: str = OUTPUT_CSV, mode: str = 'append') -> bool:
+def save_to_csv(data: Dict[str, str], filepath: Optional[str] = None, mode: str = 'append') -> bool:
     """
     Save catalog data to CSV file.
+    Appends one line to the master CSV kept open by hitachi_website_csv_writer
+    (constant cost per record). Call close_all_writers() - or let the process
+    exit - to apply overwrite-mode replacements.
+    With configure_storage('sqlite') the record is upserted into the master
+    list database instead (see hitachi_website_sqlite_store.py).
     
     Args:
         data: Dictionary containing catalog data
-        filepath: Path to the CSV file
+        filepath: Path to the CSV file (default: OUTPUT_CSV)
         mode: Write mode - 'append' (add new), 'overwrite' (replace existing row with same style number)
         
     Returns:
         True if successful, False otherwise
     """
     try:
-        # Create DataFrame with single row
-        df = pd.DataFrame([data])
+        filepath = filepath or OUTPUT_CSV
         
-        # Reorder columns to match specification
-        df = df[COLUMNS]
+        if STORAGE == 'sqlite':
+            # Upsert: overwrite mode replaces the row in place, committed in batches
+            get_store(filepath).upsert(data)
+            logger.info(f"Upserted data into {database_path(filepath)}")
+            return True
         
-        # Check if file exists
-        try:
-            existing_df = pd.read_csv(filepath)
-            
-            # In overwrite mode, remove any existing row with the same Style Number
-            if mode == 'overwrite':
-                style_to_check = data['Style Number']
-                existing_df = existing_df[existing_df['Style Number'] != style_to_check]
-            
-            # Append new data
-            combined_df = pd.concat([existing_df, df], ignore_index=True)
-            combined_df.to_csv(filepath, index=False)
-            logger.info(f"Appended data to {filepath}")
-        except FileNotFoundError:
-            # Create new file
-            df.to_csv(filepath, index=False)
-            logger.info(f"Created new file {filepath}")
+        # One CSV line per record through the shared open writer; overwrite mode
+        # drops the superseded row in a single compaction when the writer closes
+        get_writer(filepath, COLUMNS, 'Style Number').append(data, replace=(mode == 'overwrite'))
+        logger.info(f"Appended data to {filepath}")
         
         return True
         
@@ -0,0 +1,536 @@
+"""
+Hitachi Website Streaming CSV Writer
+
+Append-only writers for the master CSV files and the scraping error logs. Each
+file is opened once per run and every record is written as a single CSV line,
+so the cost of saving a record no longer grows with the size of the file (the
+previous save_to_csv and log_error_to_csv read the whole file, concatenated one
+row and rewrote it for every record).
+
+Master CSV rows are flushed to the OS after every append, so other readers in
+the same run (e.g. the skip checks) see them immediately, and forced to disk
+with fsync every `fsync_every` rows or `fsync_interval` seconds and on close.
+
+Overwrite mode appends the new row as well and remembers its key. When the
+writer is closed, one compaction pass drops the earlier rows of those keys,
+which leaves the same file as replacing each row in place would have (the
+replaced row moves to the end). A run that is killed before the compaction
+leaves the old and the new row; the skip checks only look for presence, and the
+next overwrite of the key compacts it.
+
+The error log is loaded once into memory (key -> latest entry). New failures
+are deduplicated against it and appended in batches of `flush_every` rows or
+every `flush_interval` seconds; replacing or clearing an entry, or counting
+another attempt of a logged key, marks the file for a single rewrite at the next
+flush. A batch run writes the entry of a failed key at once (write_key) before
+its progress journal records the failure, so a killed run never has a journaled
+failure missing from the log. Each entry carries its error type, HTTP status, attempt count and
+last-attempt time, and closing the log saves its compact index
+(hitachi_website_error_index.py). All writers are closed at exit and on
+SIGTERM/SIGHUP, so a stopped run leaves complete files behind.
+
+Other writers (the SQLite master list stores) join the same registry through
+register_writer(), so they are committed and closed on the same paths.
+
+Usage:
+    writer = get_writer("hitachi_website_bushing_master_list.csv", COLUMNS, "Website Index")
+    writer.append(row, replace=(mode == 'overwrite'))
+    errors = get_error_log("hitachi_website_scraping_error_log.csv", "Index", int)
+    errors.record(42, 'HTTP_404', 'Page not found (HTTP 404)', http_status=404)
+    close_all_writers()   # also registered with atexit
+
+Author: Data Collection System
+Date: October 16, 2026
+Version: 1.4 - Failed keys written ahead of the journal (write_key)
+"""
+
+import atexit
+import csv
+import logging
+import os
+import signal
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Sequence
+
+from hitachi_website_error_types import http_status_of_message, is_permanent_error
+from hitachi_website_error_index import read_error_log_rows, write_error_index
+
+logger = logging.getLogger(__name__)
+
+
+class CsvAppendWriter:
+    """
+    Keeps one CSV file open for appending rows in a fixed column order.
+    """
+
+    def __init__(self, path: str, columns: Sequence[str], key_column: str,
+                 fsync_every: int = 100, fsync_interval: float = 5.0):
+        """
+        Args:
+            path: CSV file (created with a header row if missing or empty)
+            columns: Column order of new files; every row must provide these keys
+            key_column: Column identifying a record (used by overwrite compaction)
+            fsync_every: Force the file to disk after this many rows
+            fsync_interval: ... or after this many seconds, whichever comes first
+        """
+        self.path = path
+        self.columns = list(columns)
+        self.key_column = key_column
+        self.fsync_every = fsync_every
+        self.fsync_interval = fsync_interval
+        self.header: List[str] = self.columns
+        self._file = None
+        self._writer = None
+        self._lock = threading.Lock()
+        self._replaced = set()
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def _open(self):
+        """Open the file for appending, writing the header if the file is new."""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        existing_header = None
+        needs_newline = False
+        if os.path.exists(self.path) and os.path.getsize(self.path) > 0:
+            with open(self.path, 'r', newline='', encoding='utf-8') as f:
+                existing_header = next(csv.reader(f), None)
+            with open(self.path, 'rb') as f:
+                f.seek(-1, os.SEEK_END)
+                needs_newline = f.read(1) not in (b'\n', b'\r')
+
+        self._file = open(self.path, 'a', newline='', encoding='utf-8')
+        # Same line terminator pandas' to_csv uses, so appended and rewritten files look alike
+        self._writer = csv.writer(self._file, lineterminator=os.linesep)
+        if existing_header:
+            # Keep the file's own column order (older files may order or name columns differently)
+            self.header = existing_header
+            if needs_newline:
+                self._file.write(os.linesep)
+        else:
+            self.header = self.columns
+            self._writer.writerow(self.header)
+            logger.info(f"Created new file {self.path}")
+
+    def append(self, row: Dict[str, object], replace: bool = False):
+        """
+        Append one record.
+
+        Args:
+            row: Column -> value (None is written as an empty field)
+            replace: Overwrite mode - earlier rows with the same key are dropped on close()
+
+        Raises:
+            KeyError: If the row lacks one of the writer's columns
+        """
+        missing = [column for column in self.columns if column not in row]
+        if missing:
+            raise KeyError(f"Row is missing columns: {missing}")
+
+        with self._lock:
+            if self._file is None:
+                self._open()
+            self._writer.writerow(['' if row.get(c) is None else row.get(c) for c in self.header])
+            self._file.flush()
+            if replace:
+                self._replaced.add(str(row[self.key_column]))
+            self._unsynced += 1
+            if self._unsynced >= self.fsync_every or time.monotonic() - self._last_sync >= self.fsync_interval:
+                self._sync()
+
+    def _sync(self):
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def close(self):
+        """Flush, fsync and close the file, then compact overwritten keys."""
+        with self._lock:
+            if self._file is not None:
+                self._sync()
+                self._file.close()
+                self._file = None
+                self._writer = None
+            if self._replaced:
+                compact_csv(self.path, self.key_column, self._replaced)
+                self._replaced = set()
+
+
+def compact_csv(path: str, key_column: str, keys) -> int:
+    """
+    Keep only the last row of each of the given keys, preserving the order of
+    all other rows. The file is streamed twice and replaced atomically.
+
+    Args:
+        path: CSV file
+        key_column: Column identifying a record
+        keys: Keys (as text) whose earlier rows should be dropped
+
+    Returns:
+        Number of rows dropped
+    """
+    keys = set(keys)
+    with open(path, 'r', newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None or key_column not in header:
+            return 0
+        key_position = header.index(key_column)
+        last_row = {}
+        for row_number, row in enumerate(reader):
+            if len(row) > key_position and row[key_position] in keys:
+                last_row[row[key_position]] = row_number
+
+    dropped = 0
+    temp_path = f"{path}.tmp"
+    with open(path, 'r', newline='', encoding='utf-8') as source, \
+            open(temp_path, 'w', newline='', encoding='utf-8') as target:
+        reader = csv.reader(source)
+        writer = csv.writer(target, lineterminator=os.linesep)
+        writer.writerow(next(reader))
+        for row_number, row in enumerate(reader):
+            key = row[key_position] if len(row) > key_position else None
+            if key in last_row and last_row[key] != row_number:
+                dropped += 1
+                continue
+            writer.writerow(row)
+        target.flush()
+        os.fsync(target.fileno())
+    os.replace(temp_path, path)
+    logger.info(f"Compacted {path}: replaced {len(last_row)} rows ({dropped} superseded rows dropped)")
+    return dropped
+
+
+class ErrorLogWriter:
+    """
+    In-memory view of an error log CSV with batched writes.
+
+    Holds the latest entry per key; the file is read once on first use.
+    """
+
+    def __init__(self, path: str, key_column: str, key_type: Callable = str,
+                 flush_every: int = 50, flush_interval: float = 5.0):
+        """
+        Args:
+            path: Error log CSV (created with a header row on the first flush)
+            key_column: Key column name ('Index' or 'Style_Number')
+            key_type: Converts key text from the file back to a key (int for indices)
+            flush_every: Write pending rows after this many new entries
+            flush_interval: ... or when this many seconds have passed, whichever comes first
+        """
+        self.path = path
+        self.key_column = key_column
+        self.key_type = key_type
+        self.columns = ['Timestamp', key_column, 'Error_Type', 'HTTP_Status', 'Attempts', 'Error_Message']
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self._entries: Optional[Dict[object, List[str]]] = None
+        self._pending: List[List[str]] = []
+        self._rewrite = False
+        self._legacy_header = False
+        self._lock = threading.RLock()
+        self._last_flush = time.monotonic()
+
+    def _load(self):
+        """Read the existing log once (columns missing from older logs are derived)."""
+        fieldnames, self._entries = read_error_log_rows(self.path, self.key_column, self.key_type)
+        self._legacy_header = fieldnames is not None and fieldnames != self.columns
+
+    def _loaded(self) -> Dict[object, List[str]]:
+        if self._entries is None:
+            self._load()
+        return self._entries
+
+    def record(self, key, error_type: str, error_message: str,
+               http_status: Optional[int] = None) -> Optional[str]:
+        """
+        Log a failure. Every call counts an attempt and stamps the time; the
+        error itself is only replaced while the logged one is transient, so a
+        permanent verdict sticks and the log always holds the latest one.
+
+        Args:
+            key: Index or style number
+            error_type: Enumerated error type
+            error_message: Descriptive error message
+            http_status: HTTP status code (taken from the message if omitted)
+
+        Returns:
+            'logged' for a new entry, 'updated' when a transient entry turned
+            permanent, None if the key was already logged
+        """
+        if http_status is None:
+            http_status = http_status_of_message(error_message)
+        status = '' if http_status is None else str(http_status)
+        with self._lock:
+            entries = self._loaded()
+            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            existing = entries.get(key)
+            if existing is None:
+                row = [timestamp, str(key), error_type, status, '1', error_message]
+                entries[key] = row
+                self._pending.append(row)
+                action = 'logged'
+            else:
+                attempts = str(int(existing[4] or 1) + 1)
+                if is_permanent_error(error_type) and not is_permanent_error(existing[2]):
+                    # Previously transient, now permanent - the entry moves to the end
+                    del entries[key]
+                    entries[key] = [timestamp, str(key), error_type, status, attempts, error_message]
+                    self._rewrite = True
+                    action = 'updated'
+                else:
+                    existing[0] = timestamp
+                    existing[4] = attempts
+                    if not is_permanent_error(existing[2]):
+                        existing[2:4] = [error_type, status]
+                        existing[5] = error_message
+                    # Rows still waiting to be appended pick up the change as they are
+                    if not any(row is existing for row in self._pending):
+                        self._rewrite = True
+                    action = None
+            if self._legacy_header:
+                # First change to an old log adds the new columns
+                self._rewrite = True
+            self._flush_if_due()
+            return action
+
+    def clear(self, key) -> bool:
+        """
+        Remove a key from the log (e.g. after a transient failure was retried
+        successfully).
+
+        Returns:
+            True if the key was logged
+        """
+        with self._lock:
+            entries = self._loaded()
+            if key not in entries:
+                return False
+            del entries[key]
+            self._rewrite = True
+            self._flush_if_due()
+            return True
+
+    def _flush_if_due(self):
+        # Rewrites are batched like appends: a run of retried successes costs one rewrite
+        if (len(self._pending) >= self.flush_every
+                or time.monotonic() - self._last_flush >= self.flush_interval):
+            self.flush()
+
+    def keys(self, permanent: Optional[bool] = None) -> set:
+        """
+        Logged keys.
+
+        Args:
+            permanent: True for permanent failures only, False for transient
+                failures only, None for all
+
+        Returns:
+            Set of keys
+        """
+        with self._lock:
+            entries = self._loaded()
+            if permanent is None:
+                return set(entries)
+            return {key for key, row in entries.items() if is_permanent_error(row[2]) == permanent}
+
+    def error_types(self) -> Dict[object, str]:
+        """Key -> Error_Type of every logged key."""
+        with self._lock:
+            return {key: row[2] for key, row in self._loaded().items()}
+
+    def get(self, key) -> Optional[Dict[str, str]]:
+        """Latest entry for a key as a column -> value dict, or None."""
+        with self._lock:
+            row = self._loaded().get(key)
+            return dict(zip(self.columns, row)) if row else None
+
+    def flush(self):
+        """Write pending entries: append new rows, or rewrite the file after replacements."""
+        with self._lock:
+            self._last_flush = time.monotonic()
+            if self._entries is None or not (self._pending or self._rewrite):
+                return
+            if self._rewrite:
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                temp_path = f"{self.path}.tmp"
+                with open(temp_path, 'w', newline='', encoding='utf-8') as f:
+                    writer = csv.writer(f, lineterminator=os.linesep)
+                    writer.writerow(self.columns)
+                    writer.writerows(self._entries.values())
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_path, self.path)
+                self._rewrite = False
+                self._legacy_header = False
+            else:
+                self._append_pending()
+            logger.debug(f"Flushed {len(self._pending)} new entries to {self.path}")
+            self._pending = []
+
+    def _append_pending(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        new_file = not os.path.exists(self.path) or os.path.getsize(self.path) == 0
+        with open(self.path, 'a', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f, lineterminator=os.linesep)
+            if new_file:
+                writer.writerow(self.columns)
+                logger.info(f"Created error log {self.path}")
+            writer.writerows(self._pending)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def write_key(self, key):
+        """
+        Write a key's new entry to the file now, ahead of the batch (before
+        another file such as the progress journal records the failure). Rows
+        pending with it are appended too; a pending rewrite stays batched, since
+        it only replaces entries that are in the file already.
+        """
+        with self._lock:
+            if self._entries is None:
+                return
+            row = self._entries.get(key)
+            if row is None or not any(pending is row for pending in self._pending):
+                return
+            if self._legacy_header:
+                # New rows cannot be appended under the old header
+                self.flush()
+                return
+            self._append_pending()
+            logger.debug(f"Wrote {len(self._pending)} new entries to {self.path} ahead of the batch")
+            self._pending = []
+
+    def close(self):
+        """Write everything still pending and save the compact index."""
+        with self._lock:
+            self.flush()
+            if self._entries and os.path.exists(self.path):
+                try:
+                    write_error_index(self.path, self._entries)
+                except OSError as e:
+                    logger.warning(f"Could not save the error index of {self.path}: {e}")
+
+
+_writers: Dict[str, object] = {}
+_error_logs: Dict[str, ErrorLogWriter] = {}
+_writers_lock = threading.Lock()
+_signals_installed = False
+
+
+def _close_on_signal(signum, frame):
+    # Unwind normally: finally blocks and atexit (close_all_writers) still run
+    raise SystemExit(128 + signum)
+
+
+def _install_signal_handlers():
+    """Turn SIGTERM/SIGHUP into SystemExit so buffered writers are flushed (main thread only)."""
+    global _signals_installed
+    if _signals_installed or threading.current_thread() is not threading.main_thread():
+        return
+    _signals_installed = True
+    for name in ('SIGTERM', 'SIGHUP'):
+        signum = getattr(signal, name, None)
+        if signum is not None and signal.getsignal(signum) == signal.SIG_DFL:
+            signal.signal(signum, _close_on_signal)
+
+
+def get_writer(path: str, columns: Sequence[str], key_column: str) -> CsvAppendWriter:
+    """
+    Shared writer for a CSV file (one per path and process).
+
+    Args:
+        path: CSV file
+        columns: Column order of new files
+        key_column: Column identifying a record
+
+    Returns:
+        CsvAppendWriter for the path
+    """
+    return register_writer(path, lambda: CsvAppendWriter(path, columns, key_column))
+
+
+def register_writer(path: str, factory: Callable[[], object]):
+    """
+    Shared writer of any kind for a path (one per path and process), closed
+    with the others by close_writer()/close_all_writers().
+
+    Args:
+        path: File the writer owns
+        factory: Creates the writer (an object with .path and .close()) if none is registered
+
+    Returns:
+        The registered writer
+    """
+    full_path = os.path.abspath(path)
+    with _writers_lock:
+        writer = _writers.get(full_path)
+        if writer is None:
+            writer = factory()
+            _writers[full_path] = writer
+            _install_signal_handlers()
+        return writer
+
+
+def get_error_log(path: str, key_column: str, key_type: Callable = str) -> ErrorLogWriter:
+    """
+    Shared error log for a CSV file (one per path and process).
+
+    Args:
+        path: Error log CSV
+        key_column: Key column name ('Index' or 'Style_Number')
+        key_type: Converts key text from the file back to a key
+
+    Returns:
+        ErrorLogWriter for the path
+    """
+    full_path = os.path.abspath(path)
+    with _writers_lock:
+        error_log = _error_logs.get(full_path)
+        if error_log is None:
+            error_log = ErrorLogWriter(path, key_column, key_type)
+            _error_logs[full_path] = error_log
+            _install_signal_handlers()
+        return error_log
+
+
+def flush_error_log(path: str):
+    """Write the pending entries of an open error log (before reading the file directly)."""
+    with _writers_lock:
+        error_log = _error_logs.get(os.path.abspath(path))
+    if error_log is not None:
+        error_log.flush()
+
+
+def close_writer(path: str):
+    """Close the shared writer or error log of one CSV file, if any (e.g. before deleting the file)."""
+    full_path = os.path.abspath(path)
+    with _writers_lock:
+        writers = [w for w in (_writers.pop(full_path, None), _error_logs.pop(full_path, None)) if w is not None]
+    for writer in writers:
+        writer.close()
+
+
+def close_all_writers():
+    """Close every shared writer and error log; runs the pending overwrite compactions."""
+    with _writers_lock:
+        writers = list(_writers.values()) + list(_error_logs.values())
+        _writers.clear()
+        _error_logs.clear()
+    for writer in writers:
+        try:
+            writer.close()
+        except Exception as e:
+            logger.error(f"Error closing {writer.path}: {e}")
+
+
+atexit.register(close_all_writers)
@@ -16,19 +16,60 @@ Usage:
     python hitachi_website_data_batch_scraper.py --start 1 --end 100 --delay 0.5 --mode append
     python hitachi_website_data_batch_scraper.py --indices 42131,42246,50000 --mode overwrite
     python hitachi_website_data_batch_scraper.py --file indices.txt --mode scratch
+    python hitachi_website_data_batch_scraper.py --start 1 --end 50000 --delay 0.1 --workers 8
+    python hitachi_website_data_batch_scraper.py --start 1 --end 50000 --delay 0.5 --workers 8 --adaptive
+    python hitachi_website_data_batch_scraper.py --start 1 --end 50000 --max-retries 5
+    python hitachi_website_data_batch_scraper.py --start 1 --end 50000 --shard 2/4
+
+Sharded Runs:
+    --shard K/N takes only the indices of shard K (index % N == K - 1) and writes
+    a separate master CSV, error log and raw HTML folder (suffix _shardKofN), so
+    several machines can split a sweep. Combine the outputs afterwards with
+    `python hitachi_website_sharding.py merge crossref`.
+
+Resuming:
+    Every run writes an append-only progress journal (hitachi_website_scraping_journal.log).
+    --resume continues the last run with the indices that have no recorded outcome yet;
+    --progress reports how far the last run got. Both accept --shard K/N.
+
+Storage:
+    --storage sqlite upserts records into hitachi_website_bushing_master_list.db
+    (seeded from the master CSV) instead of appending to the CSV; the CSV is
+    rewritten only by `python hitachi_website_sqlite_store.py export crossref`.
+    --raw-storage archive appends the raw HTML pages to a compressed pack
+    (cross_reference_data.pack) instead of writing one file per page; extract
+    pages with `python hitachi_website_html_archive.py extract crossref <key>`.
+    --raw-content fragment saves only the data-bearing part of each page (the
+    site template is stored once) when it parses to the same record.
+    --parser soup parses pages with the BeautifulSoup reference parser instead
+    of the lxml fast path (check both with `hitachi_website_reparse.py crossref --verify`).
+    --fetch stream stops downloading a page at the "No bushing found" message or
+    at the end of the Replacement Information section; the saved raw HTML is
+    that part of the page.
+    --parse-cache looks each page's record up by page hash before parsing it
+    (hitachi_website_parse_cache.py), so an overwrite refresh does not parse
+    unchanged pages again.
+
+Error Handling:
+    Permanent failures (NO_BUSHING_FOUND, HTTP_404, NO_DATA) are skipped on later runs.
+    Transient failures (timeouts, connection errors, HTTP 5xx, ...) are retried with
+    exponential backoff and jitter after the main pass, and fetched again on the next run.
 
 Author: Data Collection System
 Date: February 10, 2026
-Version: 3.0 - Added write modes (append/overwrite/scratch)
+Version: 3.12 - Content-hash keyed parse result cache (--parse-cache)
 """
 
 import argparse
 import time
 import sys
 import os
+import re
 import shutil
-import pandas as pd
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
 from hitachi_website_data_scraper import (
     scrape_bushing_data, 
     save_to_csv, 
@@ -36,15 +77,192 @@ from hitachi_website_data_scraper import (
     ERROR_LOG_CSV, 
     OUTPUT_CSV, 
     RAW_DATA_DIR,
+    configure_output_paths,
     get_error_log_indices,
-    delete_raw_html
+    get_transient_error_log_indices,
+    get_error_log_types,
+    get_last_error_type,
+    clear_error_from_csv,
+    write_error_entry,
+    delete_raw_html,
+    raw_html_filename,
+    configure_base_url,
+    configure_storage,
+    database_path,
+    get_store,
+    configure_raw_storage,
+    configure_raw_content,
+    configure_parser,
+    configure_fetch,
+    configure_parse_cache,
+    archive_path
+)
+from hitachi_website_error_types import is_transient_error
+from hitachi_website_rate_limiter import RateLimiter, AdaptiveRateLimiter
+from hitachi_website_retry_queue import RetryQueue
+from hitachi_website_csv_writer import close_writer, close_all_writers
+from hitachi_website_processed_index import ProcessedKeyIndex
+from hitachi_website_sqlite_store import remove_database
+from hitachi_website_error_index import error_index_path
+from hitachi_website_raw_layout import prepare_directory
+from hitachi_website_html_archive import remove_archive
+from hitachi_website_status_map import (
+    StatusMap,
+    build_status_map,
+    source_signature,
+    status_of_error,
+    STATUS_OK,
+    PERMANENT_STATUSES
+)
+from hitachi_website_sharding import Shard, parse_shard, shard_path, shard_range, filter_indices
+from hitachi_website_progress_journal import (
+    ProgressJournal,
+    load_journal,
+    remaining_keys,
+    summarize,
+    format_report,
+    OUTCOME_OK,
+    OUTCOME_FAIL,
+    OUTCOME_SKIP
 )
+from scraping_http_client import (
+    configure_pools,
+    add_response_listener,
+    remove_response_listener,
+    DEFAULT_POOL_MAXSIZE
+)
+
+# Canonical outputs; a shard run writes elsewhere but still skips what these already hold
+CANONICAL_OUTPUT_CSV = OUTPUT_CSV
+CANONICAL_ERROR_LOG_CSV = ERROR_LOG_CSV
+CANONICAL_RAW_DATA_DIR = RAW_DATA_DIR
+
+JOURNAL_FILE = "hitachi_website_scraping_journal.log"
+
+# Per-index status map mirroring the master CSV, error log and raw HTML folder
+STATUS_MAP_SUFFIX = "_status.bin"
+RAW_HTML_NAME = re.compile(r'^Hitachi_website_bushing_(\d+)\.html$')
+
+# Journal of the run in progress (None outside of a run)
+_journal: Optional[ProgressJournal] = None
+
+# Keys with data in the master CSV or raw HTML folder (see load_processed_index)
+_processed: Optional[ProcessedKeyIndex] = None
+
+# Status map of the run in progress (see open_status_map)
+_status_map: Optional[StatusMap] = None
+
+# Set while resume_run continues a journaled run
+_resuming = False
+
+
+def configure_shard(shard: Shard):
+    """
+    Point the master CSV, error log and raw HTML folder at the per-shard files.
+    
+    Args:
+        shard: Tuple of (K, N)
+    """
+    global OUTPUT_CSV, ERROR_LOG_CSV, RAW_DATA_DIR
+    OUTPUT_CSV, ERROR_LOG_CSV, RAW_DATA_DIR = configure_output_paths(
+        shard_path(CANONICAL_OUTPUT_CSV, shard),
+        shard_path(CANONICAL_ERROR_LOG_CSV, shard),
+        shard_path(CANONICAL_RAW_DATA_DIR, shard)
+    )
+
+
+def journal_path(shard: Optional[Shard] = None) -> str:
+    """Progress journal path for the canonical run or a shard."""
+    return shard_path(JOURNAL_FILE, shard) if shard else JOURNAL_FILE
+
+
+def start_journal(params: dict, shard: Optional[Shard] = None):
+    """
+    Start a new progress journal for this run, unless a resumed one is already open.
+    
+    Args:
+        params: Key source and settings of the run (stored in the journal header)
+        shard: Tuple of (K, N) when running as a shard
+    """
+    global _journal
+    if _journal is None:
+        _journal = ProgressJournal(journal_path(shard))
+        _journal.start('crossref', {**params, 'storage': configure_storage(),
+                                    'raw_storage': configure_raw_storage(),
+                                    'raw_content': configure_raw_content(),
+                                    'parser': configure_parser(),
+                                    'fetch': configure_fetch(),
+                                    'parse_cache': configure_parse_cache(),
+                                    'shard': list(shard) if shard else None})
+
+
+def close_journal():
+    """Flush and close the progress journal of the current run."""
+    global _journal
+    if _journal is not None:
+        _journal.close()
+        _journal = None
+
+
+def record_outcome(i: int, outcome: str, detail: str = ''):
+    """Append an index's final outcome to the progress journal."""
+    if _journal is not None:
+        if outcome == OUTCOME_FAIL:
+            # The error log entry goes first; a journaled failure is never missing from it
+            write_error_entry(i)
+        _journal.record(i, outcome, detail)
+
+
+def output_locations() -> List[Tuple[str, str]]:
+    """
+    (raw HTML folder, master CSV) pairs to check for existing data: the current
+    outputs, plus the canonical ones when running as a shard.
+    """
+    locations = [(RAW_DATA_DIR, OUTPUT_CSV)]
+    if OUTPUT_CSV != CANONICAL_OUTPUT_CSV:
+        locations.append((CANONICAL_RAW_DATA_DIR, CANONICAL_OUTPUT_CSV))
+    return locations
+
+
+def raw_store_path() -> str:
+    """Where this run's raw HTML goes: the raw HTML folder, or its archive with --raw-storage archive."""
+    return archive_path(RAW_DATA_DIR) if configure_raw_storage() == 'archive' else RAW_DATA_DIR
+
+
+def master_list_path() -> str:
+    """Where this run's records go: the master CSV, or its database with --storage sqlite."""
+    return database_path(OUTPUT_CSV) if configure_storage() == 'sqlite' else OUTPUT_CSV
+
+
+def stored_keys(output_csv: str) -> set:
+    """Indices in the SQLite database of a master CSV (empty in CSV mode or without a database)."""
+    if configure_storage() != 'sqlite' or not os.path.exists(database_path(output_csv)):
+        return set()
+    return get_store(output_csv).keys()
+
+
+def load_processed_index() -> ProcessedKeyIndex:
+    """
+    (Re)build the processed-key index from the current output locations
+    (one read of each master CSV and database, one listing of each raw HTML folder).
+    
+    Returns:
+        The index now used by check_index_exists
+    """
+    global _processed
+    _processed = ProcessedKeyIndex('Website Index', raw_html_filename, int).load(output_locations())
+    for _, output_csv in output_locations():
+        _processed.csv_keys |= stored_keys(output_csv)
+    return _processed
 
 
 def check_index_exists(index: int) -> bool:
     """
     Check if an index already exists in CSV or raw HTML files.
     Does NOT check error log (error log is checked separately).
+    Answered from the processed-key index, built on first use. A resumed
+    (unsharded) run answers from the open status map instead, so it does not
+    reread the master CSV.
     
     Args:
         index: The bushing index to check
@@ -52,38 +270,121 @@ def check_index_exists(index: int) -> bool:
     Returns:
         True if the index exists in CSV or HTML file; False otherwise
     """
-    # Check if raw HTML file exists
-    html_file = Path(RAW_DATA_DIR) / f"Hitachi_website_bushing_{index}.html"
-    html_exists = html_file.exists()
+    if _processed is None and _resuming and _status_map is not None and OUTPUT_CSV == CANONICAL_OUTPUT_CSV:
+        return _status_map.get(index) == STATUS_OK
+    return (_processed or load_processed_index()).exists(index)
+
+
+def status_map_path() -> str:
+    """Status map file of the current outputs (follows --shard)."""
+    return os.path.splitext(OUTPUT_CSV)[0] + STATUS_MAP_SUFFIX
+
+
+def status_sources() -> List[str]:
+    """Files the status map mirrors: master list (CSV or database), error log and raw HTML folder (or archive)."""
+    return [master_list_path(), ERROR_LOG_CSV, raw_store_path()]
+
+
+def open_status_map(rebuild: bool = False, trust_existing: bool = False) -> StatusMap:
+    """
+    Open the index status map of the current outputs. A map whose recorded
+    source signature no longer matches the master CSV, error log and raw HTML
+    folder (or a missing map) is rebuilt from them first.
     
-    # Check if index exists in CSV
-    csv_exists = False
-    if os.path.exists(OUTPUT_CSV):
+    Args:
+        rebuild: Rebuild even if the map is up to date
+        trust_existing: Keep an existing map even if its signature is stale. A
+            killed run leaves the signature stale, but its map was in sync when
+            the run started and mirrored every result since, so --resume can
+            go on with it
+        
+    Returns:
+        The open StatusMap (kept until close_status_map)
+    """
+    global _status_map
+    if _status_map is not None and not rebuild:
+        return _status_map
+    if _status_map is not None:
+        _status_map.close()
+        _status_map = None
+    
+    path = status_map_path()
+    if not rebuild and os.path.exists(path):
         try:
-            df = pd.read_csv(OUTPUT_CSV)
-            csv_exists = index in df['Website Index'].values
-        except Exception as e:
-            logger.warning(f"Error checking CSV for index {index}: {e}")
+            status_map = StatusMap(path)
+            if trust_existing or status_map.signature == source_signature(status_sources()):
+                _status_map = status_map
+                return _status_map
+            status_map.close()
+            logger.info(f"{path} is out of date - rebuilding")
+        except ValueError as e:
+            logger.warning(f"{e} - rebuilding")
     
-    return html_exists or csv_exists
+    signature = source_signature(status_sources())
+    index = ProcessedKeyIndex('Website Index', raw_html_filename, int)
+    index.add_raw_dir(RAW_DATA_DIR)
+    index.add_archive(archive_path(RAW_DATA_DIR))
+    index.add_csv(OUTPUT_CSV)
+    scraped = index.csv_keys | stored_keys(OUTPUT_CSV)
+    for name in index.html_names:
+        match = RAW_HTML_NAME.match(name)
+        if match:
+            scraped.add(int(match.group(1)))
+    _status_map = build_status_map(path, scraped, get_error_log_types(), signature)
+    return _status_map
+
+
+def record_status(i: int, saved: bool):
+    """
+    Mirror a final result in the open status map. Like a rebuild, a transient
+    failure does not hide data that is already there.
+    """
+    if _status_map is None:
+        return
+    if saved:
+        _status_map.set(i, STATUS_OK)
+        return
+    status = status_of_error(get_last_error_type(i))
+    if status in PERMANENT_STATUSES or _status_map.get(i) != STATUS_OK:
+        _status_map.set(i, status)
+
+
+def close_status_map():
+    """
+    Close the status map, recording that it matches the sources as they are
+    now. Call after close_all_writers() so the signature covers the final files.
+    """
+    global _status_map
+    if _status_map is not None:
+        _status_map.close(source_signature(status_sources()))
+        _status_map = None
 
 
 def clean_scratch_mode():
     """
     Clean all existing data for scratch mode (fresh start).
-    Deletes the CSV file, error log, and all raw HTML files.
+    Deletes the CSV file, its SQLite database, error log, and all raw HTML files and archive.
     """
     logger.info("SCRATCH MODE: Cleaning all existing data...")
     
     # Delete CSV file
+    close_writer(OUTPUT_CSV)
     if os.path.exists(OUTPUT_CSV):
         os.remove(OUTPUT_CSV)
         logger.info(f"Deleted {OUTPUT_CSV}")
     
+    # Delete SQLite database
+    close_writer(database_path(OUTPUT_CSV))
+    if remove_database(database_path(OUTPUT_CSV)):
+        logger.info(f"Deleted {database_path(OUTPUT_CSV)}")
+    
     # Delete error log
+    close_writer(ERROR_LOG_CSV)
     if os.path.exists(ERROR_LOG_CSV):
         os.remove(ERROR_LOG_CSV)
         logger.info(f"Deleted {ERROR_LOG_CSV}")
+    if os.path.exists(error_index_path(ERROR_LOG_CSV)):
+        os.remove(error_index_path(ERROR_LOG_CSV))
     
     # Delete all raw HTML files
     raw_data_path = Path(RAW_DATA_DIR)
@@ -91,12 +392,217 @@ def clean_scratch_mode():
         shutil.rmtree(raw_data_path)
         logger.info(f"Deleted {RAW_DATA_DIR}/ directory")
     
-    # Recreate the raw data directory
-    raw_data_path.mkdir(parents=True, exist_ok=True)
+    # Delete raw HTML archive
+    close_writer(archive_path(RAW_DATA_DIR))
+    if remove_archive(archive_path(RAW_DATA_DIR)):
+        logger.info(f"Deleted {archive_path(RAW_DATA_DIR)}")
+    
+    # Recreate the raw data directory (in the default layout)
+    prepare_directory(RAW_DATA_DIR)
     logger.info("Clean completed - starting fresh")
 
 
-def scrape_range(start: int, end: int, delay: float = 1.0, mode: str = 'append'):
+def record_result(i: int, bushing_data, mode: str) -> bool:
+    """
+    Save one scraped record to CSV and print its outcome line.
+    
+    Args:
+        i: The bushing index that was scraped
+        bushing_data: Dictionary returned by scrape_bushing_data (None on failure)
+        mode: Write mode - 'append', 'overwrite' or 'scratch'
+        
+    Returns:
+        True if the record was scraped and saved, False otherwise
+    """
+    if bushing_data:
+        if save_to_csv(bushing_data, mode=mode):
+            prefix = "↻" if mode == 'overwrite' and check_index_exists(i) else "✓"
+            if _processed is not None:
+                _processed.mark_processed(i)
+            record_status(i, True)
+            print(f"{prefix} Index {i}: {bushing_data['Original Bushing Information - Original Bushing Manufacturer'] or '(empty)'} | "
+                  f"{bushing_data['Original Bushing Information - Catalog Number']} | "
+                  f"{bushing_data['Replacement Information - ABB Style Number']}")
+            return True
+        print(f"✗ Index {i}: Failed to save to CSV")
+        record_status(i, False)
+        return False
+    print(f"✗ Index {i}: Failed to scrape (logged to error log)")
+    record_status(i, False)
+    return False
+
+
+def scrape_indices(indices: Iterable[int], total: int, delay: float = 1.0,
+                   mode: str = 'append', workers: int = 1, adaptive: bool = False,
+                   max_rate: float = 20.0, max_retries: int = 3) -> Tuple[int, int, int]:
+    """
+    Scrape an ordered sequence of indices, serially or with a bounded worker pool.
+    
+    Skip decisions, CSV writes and progress output always happen on the calling
+    thread in input order, so counts and the master CSV row order are the same
+    for any number of workers. With workers > 1, only the network fetch runs in
+    the pool and `delay` becomes a global requests-per-second budget
+    (1/delay requests per second shared by all workers). An index that repeats
+    while its earlier fetch is still in flight waits until that result is
+    recorded, so duplicates are skipped or fetched again exactly as in a serial run.
+    
+    With adaptive=True the budget starts at 1/delay and is steered by an AIMD
+    controller: it grows while responses stay fast and healthy and is cut on
+    HTTP 5xx, timeouts or latency spikes. The settled rate is reported at the end.
+    
+    Indices that fail with a transient error are put on a low-priority retry
+    queue (exponential backoff with jitter) and fetched again after the main
+    pass; they only count as failed once max_retries is exhausted.
+    
+    Args:
+        indices: Index numbers to scrape, in processing order
+        total: Number of indices (for progress output)
+        delay: Delay in seconds between requests (default: 1.0)
+        mode: Write mode - 'append', 'overwrite' or 'scratch'
+        workers: Number of concurrent fetch workers (default: 1, serial)
+        adaptive: Adjust the request rate from latency and server errors (AIMD)
+        max_rate: Upper bound in requests/second for the adaptive controller
+        max_retries: Retries per index for transient errors (default: 3)
+        
+    Returns:
+        Tuple of (success_count, failure_count, skipped_count)
+    """
+    # Load error log indices once at the start (permanent failures are skipped,
+    # transient ones are fetched again and cleared from the log on success)
+    error_log_indices = get_error_log_indices()
+    if ERROR_LOG_CSV != CANONICAL_ERROR_LOG_CSV and mode == 'append':
+        error_log_indices |= get_error_log_indices(CANONICAL_ERROR_LOG_CSV)
+    transient_indices = get_transient_error_log_indices()
+    logger.info(f"Loaded {len(error_log_indices)} permanent and {len(transient_indices)} transient failures from error log")
+    if _resuming:
+        # The journal has the finished indices; what the others already have
+        # comes from the status map of the interrupted run, not a rescan
+        open_status_map(trust_existing=True)
+    else:
+        load_processed_index()
+        open_status_map()
+    
+    success_count = 0
+    failure_count = 0
+    skipped_count = 0
+    
+    executor = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+    if adaptive:
+        limiter = AdaptiveRateLimiter.from_delay(delay, max_rate=max_rate)
+        add_response_listener(limiter.observe)
+    else:
+        limiter = RateLimiter.from_delay(delay)
+    pending = deque()
+    in_flight = Counter()   # submitted indices whose result is not recorded yet
+    retry_queue = RetryQueue()
+    
+    def submit(i: int, attempt: int):
+        in_flight[i] += 1
+        pending.append((i, attempt, executor.submit(fetch, i)))
+    
+    def fetch(i: int):
+        limiter.acquire()
+        return scrape_bushing_data(i)
+    
+    def handle(i: int, bushing_data, attempt: int):
+        nonlocal success_count, failure_count
+        if not bushing_data:
+            error_type = get_last_error_type(i)
+            if is_transient_error(error_type) and attempt < max_retries:
+                wait = retry_queue.schedule(i, attempt + 1)
+                print(f"↺ Index {i}: {error_type}, retry {attempt + 1}/{max_retries} in {wait:.1f}s")
+                return
+        if record_result(i, bushing_data, mode):
+            success_count += 1
+            if attempt > 0 or i in transient_indices:
+                clear_error_from_csv(i)
+            record_outcome(i, OUTCOME_OK)
+        else:
+            failure_count += 1
+            record_outcome(i, OUTCOME_FAIL, get_last_error_type(i) or '')
+    
+    def drain(limit: int, until_recorded: Optional[int] = None):
+        while len(pending) > limit or (until_recorded is not None and in_flight[until_recorded]):
+            i, attempt, future = pending.popleft()
+            handle(i, future.result(), attempt)
+            in_flight[i] -= 1
+    
+    try:
+        for pos, i in enumerate(indices, 1):
+            # A repeated index waits for its earlier fetch to be recorded, so the
+            # checks below see the same state as in a serial run
+            if in_flight[i]:
+                drain(workers * 2, until_recorded=i)
+            
+            # Check if this index is in the error log
+            if i in error_log_indices:
+                skipped_count += 1
+                # Delete HTML file if it exists
+                delete_raw_html(i)
+                logger.info(f"Skipping index {i} (in error log, HTML deleted if existed) ({pos}/{total})")
+                print(f"⊘ Index {i}: Skipped (in error log)")
+                record_outcome(i, OUTCOME_SKIP, 'error_log')
+                continue
+            
+            # Check if we should skip this index (append mode only)
+            if mode == 'append' and check_index_exists(i):
+                skipped_count += 1
+                logger.info(f"Skipping index {i} (already exists) ({pos}/{total})")
+                print(f"⊘ Index {i}: Skipped (already processed)")
+                record_outcome(i, OUTCOME_SKIP, 'exists')
+                continue
+            
+            action = "Overwriting" if mode == 'overwrite' and check_index_exists(i) else "Processing"
+            logger.info(f"{action} index {i} ({pos}/{total})")
+            
+            if executor:
+                # Keep a bounded window in flight and record results in input order
+                submit(i, 0)
+                drain(workers * 2)
+                continue
+            
+            if adaptive:
+                limiter.acquire()
+            
+            handle(i, scrape_bushing_data(i), 0)
+            
+            # Delay between requests (except for the last one)
+            if pos < total and not adaptive:
+                time.sleep(delay)
+        
+        drain(0)
+        
+        # Low-priority pass: retry transient failures once their backoff has elapsed
+        if retry_queue:
+            logger.info(f"Retrying {len(retry_queue)} indices with transient errors")
+        while retry_queue or pending:
+            if not retry_queue:
+                drain(0)
+                continue
+            i, attempt = retry_queue.pop(wait=True)
+            logger.info(f"Retrying index {i} (attempt {attempt}/{max_retries})")
+            if executor:
+                submit(i, attempt)
+                drain(workers * 2)
+            else:
+                handle(i, fetch(i), attempt)
+    finally:
+        if executor:
+            executor.shutdown(wait=True, cancel_futures=True)
+        # Flush the master CSV and apply overwrite-mode replacements
+        close_all_writers()
+        close_status_map()
+        if adaptive:
+            remove_response_listener(limiter.observe)
+            logger.info(f"Adaptive rate {limiter.report()}")
+            print(f"\n⚙  Adaptive rate {limiter.report()}")
+    
+    return success_count, failure_count, skipped_count
+
+
+def scrape_range(start: int, end: int, delay: float = 1.0, mode: str = 'append', workers: int = 1,
+                 adaptive: bool = False, max_rate: float = 20.0, max_retries: int = 3,
+                 shard: Optional[Shard] = None):
     """
     Scrape a range of indices.
     
@@ -105,61 +611,31 @@ def scrape_range(start: int, end: int, delay: float = 1.0, mode: str = 'append')
         end: Ending index (inclusive)
         delay: Delay in seconds between requests (default: 1.0)
         mode: Write mode - 'append' (skip existing), 'overwrite' (replace existing), 'scratch' (delete all first)
+        workers: Number of concurrent fetch workers (default: 1, serial)
+        adaptive: Adjust the request rate from latency and server errors (AIMD)
+        max_rate: Upper bound in requests/second for the adaptive controller
+        max_retries: Retries per index for transient errors (default: 3)
+        shard: Only scrape the indices of this (K, N) shard and write to its own files
     """
+    if shard:
+        configure_shard(shard)
+    
     # Handle scratch mode
     if mode == 'scratch':
         clean_scratch_mode()
     
-    # Load error log indices once at the start
-    error_log_indices = get_error_log_indices()
-    logger.info(f"Loaded {len(error_log_indices)} indices from error log")
+    indices = shard_range(start, end, shard) if shard else range(start, end + 1)
+    total = len(indices)
     
-    total = end - start + 1
-    success_count = 0
-    failure_count = 0
-    skipped_count = 0
+    logger.info(f"Starting batch scrape for indices {start} to {end} ({total} total) - Mode: {mode.upper()}, Workers: {workers}")
     
-    logger.info(f"Starting batch scrape for indices {start} to {end} ({total} total) - Mode: {mode.upper()}")
-    
-    for i in range(start, end + 1):
-        # Check if this index is in the error log
-        if i in error_log_indices:
-            skipped_count += 1
-            # Delete HTML file if it exists
-            delete_raw_html(i)
-            logger.info(f"Skipping index {i} (in error log, HTML deleted if existed) ({i - start + 1}/{total})")
-            print(f"⊘ Index {i}: Skipped (in error log)")
-            continue
-        
-        # Check if we should skip this index (append mode only)
-        if mode == 'append' and check_index_exists(i):
-            skipped_count += 1
-            logger.info(f"Skipping index {i} (already exists) ({i - start + 1}/{total})")
-            print(f"⊘ Index {i}: Skipped (already processed)")
-            continue
-        
-        action = "Overwriting" if mode == 'overwrite' and check_index_exists(i) else "Processing"
-        logger.info(f"{action} index {i} ({i - start + 1}/{total})")
-        
-        bushing_data = scrape_bushing_data(i)
-        
-        if bushing_data:
-            if save_to_csv(bushing_data, mode=mode):
-                success_count += 1
-                prefix = "↻" if mode == 'overwrite' and check_index_exists(i) else "✓"
-                print(f"{prefix} Index {i}: {bushing_data['Original Bushing Information - Original Bushing Manufacturer'] or '(empty)'} | "
-                      f"{bushing_data['Original Bushing Information - Catalog Number']} | "
-                      f"{bushing_data['Replacement Information - ABB Style Number']}")
-            else:
-                failure_count += 1
-                print(f"✗ Index {i}: Failed to save to CSV")
-        else:
-            failure_count += 1
-            print(f"✗ Index {i}: Failed to scrape (logged to error log)")
-        
-        # Delay between requests (except for the last one)
-        if i < end:
-            time.sleep(delay)
+    start_journal({'source': 'range', 'start': start, 'end': end, 'mode': mode, 'total': total}, shard)
+    try:
+        success_count, failure_count, skipped_count = scrape_indices(
+            indices, total, delay, mode, workers, adaptive, max_rate, max_retries
+        )
+    finally:
+        close_journal()
     
     logger.info(f"Batch scrape completed: {success_count} successful, {failure_count} failed, {skipped_count} skipped")
     print(f"\n{'='*70}")
@@ -167,6 +643,8 @@ def scrape_range(start: int, end: int, delay: float = 1.0, mode: str = 'append')
     print(f"{'='*70}")
     print(f"Index Range: {start} to {end}")
     print(f"Total Indices: {total}")
+    if shard:
+        print(f"Shard: {shard[0]}/{shard[1]}")
     print(f"Successful: {success_count}")
     print(f"Failed: {failure_count}")
     if mode == 'append':
@@ -179,11 +657,13 @@ def scrape_range(start: int, end: int, delay: float = 1.0, mode: str = 'append')
         print(f"   Review this file for details on {failure_count} failed indices")
     
     if success_count > 0:
-        print(f"\n✓ Data saved to: {OUTPUT_CSV}")
-        print(f"✓ Raw HTML saved to: {RAW_DATA_DIR}/")
+        print(f"\n✓ Data saved to: {master_list_path()}")
+        print(f"✓ Raw HTML saved to: {raw_store_path()}")
 
 
-def scrape_list(indices: list, delay: float = 1.0, mode: str = 'append'):
+def scrape_list(indices: list, delay: float = 1.0, mode: str = 'append', workers: int = 1,
+                adaptive: bool = False, max_rate: float = 20.0, max_retries: int = 3,
+                shard: Optional[Shard] = None):
     """
     Scrape a list of specific indices.
     
@@ -191,67 +671,40 @@ def scrape_list(indices: list, delay: float = 1.0, mode: str = 'append'):
         indices: List of index numbers to scrape
         delay: Delay in seconds between requests (default: 1.0)
         mode: Write mode - 'append' (skip existing), 'overwrite' (replace existing), 'scratch' (delete all first)
+        workers: Number of concurrent fetch workers (default: 1, serial)
+        adaptive: Adjust the request rate from latency and server errors (AIMD)
+        max_rate: Upper bound in requests/second for the adaptive controller
+        max_retries: Retries per index for transient errors (default: 3)
+        shard: Only scrape the indices of this (K, N) shard and write to its own files
     """
+    if shard:
+        configure_shard(shard)
+    
     # Handle scratch mode
     if mode == 'scratch':
         clean_scratch_mode()
     
-    # Load error log indices once at the start
-    error_log_indices = get_error_log_indices()
-    logger.info(f"Loaded {len(error_log_indices)} indices from error log")
-    
+    if shard:
+        indices = filter_indices(indices, shard)
     total = len(indices)
-    success_count = 0
-    failure_count = 0
-    skipped_count = 0
     
-    logger.info(f"Starting batch scrape for {total} indices - Mode: {mode.upper()}")
-    
-    for idx, i in enumerate(indices, 1):
-        # Check if this index is in the error log
-        if i in error_log_indices:
-            skipped_count += 1
-            # Delete HTML file if it exists
-            delete_raw_html(i)
-            logger.info(f"Skipping index {i} (in error log, HTML deleted if existed) ({idx}/{total})")
-            print(f"⊘ Index {i}: Skipped (in error log)")
-            continue
-        
-        # Check if we should skip this index (append mode only)
-        if mode == 'append' and check_index_exists(i):
-            skipped_count += 1
-            logger.info(f"Skipping index {i} (already exists) ({idx}/{total})")
-            print(f"⊘ Index {i}: Skipped (already processed)")
-            continue
-        
-        action = "Overwriting" if mode == 'overwrite' and check_index_exists(i) else "Processing"
-        logger.info(f"{action} index {i} ({idx}/{total})")
-        
-        bushing_data = scrape_bushing_data(i)
-        
-        if bushing_data:
-            if save_to_csv(bushing_data, mode=mode):
-                success_count += 1
-                prefix = "↻" if mode == 'overwrite' and check_index_exists(i) else "✓"
-                print(f"{prefix} Index {i}: {bushing_data['Original Bushing Information - Original Bushing Manufacturer'] or '(empty)'} | "
-                      f"{bushing_data['Original Bushing Information - Catalog Number']} | "
-                      f"{bushing_data['Replacement Information - ABB Style Number']}")
-            else:
-                failure_count += 1
-                print(f"✗ Index {i}: Failed to save to CSV")
-        else:
-            failure_count += 1
-            print(f"✗ Index {i}: Failed to scrape (logged to error log)")
-        
-        # Delay between requests (except for the last one)
-        if idx < total:
-            time.sleep(delay)
+    logger.info(f"Starting batch scrape for {total} indices - Mode: {mode.upper()}, Workers: {workers}")
+    
+    start_journal({'source': 'list', 'keys': list(indices), 'mode': mode, 'total': total}, shard)
+    try:
+        success_count, failure_count, skipped_count = scrape_indices(
+            indices, total, delay, mode, workers, adaptive, max_rate, max_retries
+        )
+    finally:
+        close_journal()
     
     logger.info(f"Batch scrape completed: {success_count} successful, {failure_count} failed, {skipped_count} skipped")
     print(f"\n{'='*70}")
     print(f"Batch Scraping Complete - Mode: {mode.upper()}")
     print(f"{'='*70}")
     print(f"Total Indices: {total}")
+    if shard:
+        print(f"Shard: {shard[0]}/{shard[1]}")
     print(f"Successful: {success_count}")
     print(f"Failed: {failure_count}")
     if mode == 'append':
@@ -264,11 +717,13 @@ def scrape_list(indices: list, delay: float = 1.0, mode: str = 'append'):
         print(f"   Review this file for details on {failure_count} failed indices")
     
     if success_count > 0:
-        print(f"\n✓ Data saved to: {OUTPUT_CSV}")
-        print(f"✓ Raw HTML saved to: {RAW_DATA_DIR}/")
+        print(f"\n✓ Data saved to: {master_list_path()}")
+        print(f"✓ Raw HTML saved to: {raw_store_path()}")
 
 
-def scrape_from_file(filepath: str, delay: float = 1.0, mode: str = 'append'):
+def scrape_from_file(filepath: str, delay: float = 1.0, mode: str = 'append', workers: int = 1,
+                     adaptive: bool = False, max_rate: float = 20.0, max_retries: int = 3,
+                     shard: Optional[Shard] = None):
     """
     Scrape indices listed in a text file (one index per line).
     
@@ -276,6 +731,11 @@ def scrape_from_file(filepath: str, delay: float = 1.0, mode: str = 'append'):
         filepath: Path to file containing indices
         delay: Delay in seconds between requests (default: 1.0)
         mode: Write mode - 'append' (skip existing), 'overwrite' (replace existing), 'scratch' (delete all first)
+        workers: Number of concurrent fetch workers (default: 1, serial)
+        adaptive: Adjust the request rate from latency and server errors (AIMD)
+        max_rate: Upper bound in requests/second for the adaptive controller
+        max_retries: Retries per index for transient errors (default: 3)
+        shard: Only scrape the indices of this (K, N) shard and write to its own files
     """
     try:
         with open(filepath, 'r') as f:
@@ -292,7 +752,7 @@ def scrape_from_file(filepath: str, delay: float = 1.0, mode: str = 'append'):
             logger.error(f"No valid indices found in file: {filepath}")
             sys.exit(1)
         
-        scrape_list(indices, delay, mode)
+        scrape_list(indices, delay, mode, workers, adaptive, max_rate, max_retries, shard)
         
     except FileNotFoundError:
         logger.error(f"File not found: {filepath}")
@@ -302,6 +762,95 @@ def scrape_from_file(filepath: str, delay: float = 1.0, mode: str = 'append'):
         sys.exit(1)
 
 
+def load_run_journal(shard: Optional[Shard] = None):
+    """
+    Load the progress journal of the last run and rebuild its index sequence.
+    
+    Args:
+        shard: Tuple of (K, N) when the run was a shard
+        
+    Returns:
+        Tuple of (header, entries, indices) - see load_journal()
+        
+    Raises:
+        FileNotFoundError: If there is no journal
+        ValueError: If the journal belongs to a different kind of run or shard
+    """
+    header, entries = load_journal(journal_path(shard), key_type=int)
+    params = header['params']
+    if header.get('kind') != 'crossref':
+        raise ValueError(f"{journal_path(shard)} is not a cross-reference journal")
+    if params.get('shard') != (list(shard) if shard else None):
+        raise ValueError(f"{journal_path(shard)} was written by shard {params.get('shard')}")
+    
+    if params['source'] == 'range':
+        start, end = params['start'], params['end']
+        indices = shard_range(start, end, shard) if shard else range(start, end + 1)
+    else:
+        indices = params['keys']
+    return header, entries, indices
+
+
+def resume_run(delay: float = 1.0, workers: int = 1, adaptive: bool = False, max_rate: float = 20.0,
+               max_retries: int = 3, shard: Optional[Shard] = None):
+    """
+    Continue the last run from its progress journal. Only the indices without a
+    recorded outcome are processed; the master CSV and raw HTML folder are not
+    rescanned to find out what was already done, and the status map is reused
+    even though the interruption left its signature stale.
+    
+    Args:
+        delay: Delay in seconds between requests (default: 1.0)
+        workers: Number of concurrent fetch workers (default: 1, serial)
+        adaptive: Adjust the request rate from latency and server errors (AIMD)
+        max_rate: Upper bound in requests/second for the adaptive controller
+        max_retries: Retries per index for transient errors (default: 3)
+        shard: Tuple of (K, N) when resuming a shard run
+    """
+    global _journal, _resuming
+    header, entries, indices = load_run_journal(shard)
+    remaining = remaining_keys(indices, entries)
+    
+    # A scratch run already cleaned up before it was interrupted
+    mode = header['params']['mode']
+    mode = 'append' if mode == 'scratch' else mode
+    configure_storage(header['params'].get('storage', 'csv'))
+    configure_raw_storage(header['params'].get('raw_storage', 'files'))
+    configure_raw_content(header['params'].get('raw_content', 'full'))
+    configure_parser(header['params'].get('parser', 'fast'))
+    configure_fetch(header['params'].get('fetch', 'full'))
+    configure_parse_cache(header['params'].get('parse_cache', False))
+    
+    logger.info(f"Resuming from {journal_path(shard)}: {len(entries)} done, {len(remaining)} remaining")
+    print(f"↻ Resuming from {journal_path(shard)}: {len(entries)} indices done, {len(remaining)} remaining")
+    if not remaining:
+        print("✓ Nothing left to do")
+        return
+    
+    _journal = ProgressJournal(journal_path(shard))
+    _journal.resume()
+    _resuming = True
+    try:
+        scrape_list(remaining, delay, mode, workers, adaptive, max_rate, max_retries, shard)
+    finally:
+        _resuming = False
+
+
+def print_progress(shard: Optional[Shard] = None):
+    """
+    Report how far the last run got, from its progress journal alone.
+    
+    Args:
+        shard: Tuple of (K, N) to report on a shard run
+    """
+    header, entries, _ = load_run_journal(shard)
+    summary = summarize(header, entries, header['params'].get('total'))
+    print(f"\n{'='*70}")
+    print(f"Batch Scraping Progress - {journal_path(shard)}")
+    print(f"{'='*70}")
+    print(format_report(summary))
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Batch scraper for Hitachi Energy bushing data',
@@ -309,7 +858,17 @@ def main():
                '  python hitachi_website_data_batch_scraper.py --start 1 --end 10\n'
                '  python hitachi_website_data_batch_scraper.py --start 1 --end 100 --mode append\n'
                '  python hitachi_website_data_batch_scraper.py --indices 42131,42246 --mode overwrite\n'
-               '  python hitachi_website_data_batch_scraper.py --file indices.txt --mode scratch\n',
+               '  python hitachi_website_data_batch_scraper.py --file indices.txt --mode scratch\n'
+               '  python hitachi_website_data_batch_scraper.py --start 1 --end 50000 --delay 0.1 --workers 8\n'
+               '  python hitachi_website_data_batch_scraper.py --start 1 --end 50000 --shard 2/4\n'
+               '  python hitachi_website_data_batch_scraper.py --start 1 --end 50000 --storage sqlite\n'
+               '  python hitachi_website_data_batch_scraper.py --start 1 --end 50000 --raw-storage archive\n'
+               '  python hitachi_website_data_batch_scraper.py --start 1 --end 50000 --raw-content fragment\n'
+               '  python hitachi_website_data_batch_scraper.py --start 1 --end 50000 --fetch stream\n'
+               '  python hitachi_website_data_batch_scraper.py --start 1 --end 50000 --mode overwrite --parse-cache\n'
+               '  python hitachi_website_data_batch_scraper.py --resume --delay 0.5\n'
+               '  python hitachi_website_data_batch_scraper.py --progress\n'
+               '  python hitachi_website_data_batch_scraper.py --start 1 --end 1000 --delay 0 --workers 8 --base-url http://127.0.0.1:8765\n',
         formatter_class=argparse.RawDescriptionHelpFormatter
     )
     
@@ -318,6 +877,10 @@ def main():
     input_group.add_argument('--start', type=int, help='Starting index (use with --end)')
     input_group.add_argument('--indices', type=str, help='Comma-separated list of indices')
     input_group.add_argument('--file', type=str, help='File containing indices (one per line)')
+    input_group.add_argument('--resume', action='store_true',
+                            help='Continue the last run from its progress journal (indices without an outcome)')
+    input_group.add_argument('--progress', action='store_true',
+                            help='Report the progress of the last run from its journal and exit')
     
     parser.add_argument('--end', type=int, help='Ending index (use with --start)')
     parser.add_argument('--delay', type=float, default=1.0, 
@@ -325,26 +888,100 @@ def main():
     parser.add_argument('--mode', type=str, default='append', 
                        choices=['append', 'overwrite', 'scratch'],
                        help='Write mode: append (default, skip existing), overwrite (replace existing), scratch (delete all first)')
+    parser.add_argument('--workers', type=int, default=1,
+                       help='Number of concurrent fetch workers; --delay becomes a global '
+                            'requests-per-second budget shared by all workers (default: 1, serial)')
+    parser.add_argument('--adaptive', action='store_true',
+                       help='Adapt the request rate (AIMD): start at 1/--delay, speed up while the server '
+                            'is healthy, back off on HTTP 5xx, timeouts or latency spikes')
+    parser.add_argument('--max-rate', type=float, default=20.0,
+                       help='Upper bound in requests/second for --adaptive (default: 20.0)')
+    parser.add_argument('--max-retries', type=int, default=3,
+                       help='Retries per index for transient errors (timeouts, connection errors, '
+                            'HTTP 5xx) with exponential backoff after the main pass (default: 3)')
+    parser.add_argument('--shard', type=str, default=None,
+                       help='Run shard K of N (e.g. 2/4): only indices with index %% N == K-1, '
+                            'written to separate _shardKofN output files')
+    parser.add_argument('--base-url', type=str, default=None,
+                       help='Site root to scrape instead of the live site, e.g. http://127.0.0.1:8765 '
+                            'for hitachi_website_replay_server.py')
+    parser.add_argument('--pool-size', type=int, default=None,
+                       help=f'Keep-alive connections per host in the shared HTTP pool '
+                            f'(default: max({DEFAULT_POOL_MAXSIZE}, --workers))')
+    parser.add_argument('--storage', type=str, default='csv', choices=['csv', 'sqlite'],
+                       help='Master list storage: csv (default, append to the CSV) or sqlite (upsert into '
+                            'the .db next to it; export with hitachi_website_sqlite_store.py)')
+    parser.add_argument('--raw-storage', type=str, default='files', choices=['files', 'archive'],
+                       help='Raw HTML storage: files (default, one file per page) or archive (append to the '
+                            'compressed .pack next to the folder; see hitachi_website_html_archive.py)')
+    parser.add_argument('--raw-content', type=str, default='full', choices=['full', 'fragment'],
+                       help='Raw HTML content: full (default, the page as served) or fragment (only the '
+                            'data-bearing part, kept when it parses identically; see hitachi_website_html_fragment.py)')
+    parser.add_argument('--parser', type=str, default='fast', choices=['fast', 'soup'],
+                       help='Page parser: fast (default, lxml) or soup (the BeautifulSoup reference parser)')
+    parser.add_argument('--fetch', type=str, default='full', choices=['full', 'stream'],
+                       help='Page download: full (default) or stream (stop reading at the "No bushing found" '
+                            'message or the end of the Replacement Information section)')
+    parser.add_argument('--parse-cache', action='store_true',
+                       help='Look parsed records up by page hash before parsing and cache new ones '
+                            '(hitachi_website_parse_cache.py); unchanged pages are not parsed again')
     
     args = parser.parse_args()
     
+    if args.workers < 1:
+        parser.error('--workers must be at least 1')
+    if args.max_retries < 0:
+        parser.error('--max-retries must not be negative')
+    try:
+        shard = parse_shard(args.shard) if args.shard else None
+    except ValueError as e:
+        parser.error(str(e))
+    if args.base_url:
+        configure_base_url(args.base_url)
+    configure_storage(args.storage)
+    configure_raw_storage(args.raw_storage)
+    configure_raw_content(args.raw_content)
+    configure_parser(args.parser)
+    configure_fetch(args.fetch)
+    configure_parse_cache(args.parse_cache)
+    
+    if args.progress or args.resume:
+        try:
+            load_run_journal(shard)
+        except FileNotFoundError:
+            parser.error(f'no progress journal found ({journal_path(shard)})')
+        except ValueError as e:
+            parser.error(str(e))
+        if args.progress:
+            print_progress(shard)
+            return
+        configure_pools(pool_maxsize=args.pool_size or max(DEFAULT_POOL_MAXSIZE, args.workers))
+        resume_run(args.delay, args.workers, args.adaptive, args.max_rate, args.max_retries, shard)
+        return
+    
+    # Keep at least one pooled keep-alive connection per fetch worker
+    configure_pools(pool_maxsize=args.pool_size or max(DEFAULT_POOL_MAXSIZE, args.workers))
+    
     # Validate arguments
     if args.start is not None:
         if args.end is None:
             parser.error('--start requires --end')
         if args.start > args.end:
             parser.error('--start must be less than or equal to --end')
-        scrape_range(args.start, args.end, args.delay, args.mode)
+        scrape_range(args.start, args.end, args.delay, args.mode, args.workers,
+                     args.adaptive, args.max_rate, args.max_retries, shard)
     
     elif args.indices:
         try:
             indices = [int(x.strip()) for x in args.indices.split(',')]
-            scrape_list(indices, args.delay, args.mode)
+            scrape_list(indices, args.delay, args.mode, args.workers, args.adaptive, args.max_rate,
+                        args.max_retries, shard)
         except ValueError:
             parser.error('--indices must be comma-separated integers')
     
     elif args.file:
-        scrape_from_file(args.file, args.delay, args.mode)
+        scrape_from_file(args.file, args.delay, args.mode, args.workers, args.adaptive, args.max_rate,
+                         args.max_retries, shard)
 
 
 if __name__ == "__main__":
@@ -11,15 +11,30 @@ Version: 2.0 - Reorganized for multi-website support
 
 import requests
 from bs4 import BeautifulSoup
+from bs4.dammit import UnicodeDammit
+from lxml import etree
 import pandas as pd
 import sys
 import logging
 import os
 from pathlib import Path
 from typing import Dict, Optional, Tuple
-from datetime import datetime
 import traceback
 
+# Shared pooled HTTP client lives in data_collection/
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from scraping_http_client import http_get, read_until, HITACHI_HEADERS
+
+import hitachi_website_error_types as error_types
+from hitachi_website_error_types import classify_error_message
+from hitachi_website_csv_writer import get_writer, get_error_log, flush_error_log, register_writer
+from hitachi_website_error_index import ErrorIndex, load_error_index
+from hitachi_website_sqlite_store import SqliteStore
+from hitachi_website_html_archive import HtmlArchive, archive_path as pack_path
+from hitachi_website_html_fragment import TemplateStore, verified_fragment
+from hitachi_website_raw_layout import find_raw_file, raw_file_path
+from hitachi_website_parse_cache import ParseCache, DEFAULT_MAX_ENTRIES, cache_path, parser_version
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -28,7 +43,9 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # Constants
-BASE_URL = "https://bushing.hitachienergy.com/Scripts/BushingCrossReferenceBU.asp"
+SITE_ROOT = "https://bushing.hitachienergy.com"
+PAGE_PATH = "/Scripts/BushingCrossReferenceBU.asp"
+BASE_URL = SITE_ROOT + PAGE_PATH
 OUTPUT_CSV = "hitachi_website_bushing_master_list.csv"
 ERROR_LOG_CSV = "hitachi_website_scraping_error_log.csv"
 RAW_DATA_DIR = "hitachi_website_data_raw/cross_reference_data"
@@ -40,43 +57,293 @@ COLUMNS = [
     "Replacement Information - ABB Style Number"
 ]
 
+# Master list storage: 'csv' (default) or 'sqlite' (hitachi_website_sqlite_store.py)
+STORAGE_BACKENDS = ('csv', 'sqlite')
+STORAGE = 'csv'
+SQLITE_TABLE = "bushing_master_list"
+SQLITE_INDEXES = [
+    "Original Bushing Information - Catalog Number",
+    "Replacement Information - ABB Style Number"
+]
+
+# Raw HTML storage: 'files' (default, one file per page) or 'archive' (hitachi_website_html_archive.py)
+RAW_STORAGE_BACKENDS = ('files', 'archive')
+RAW_STORAGE = 'files'
+
+# Raw HTML content: 'full' (default, the page as served) or 'fragment' (hitachi_website_html_fragment.py)
+RAW_CONTENT_MODES = ('full', 'fragment')
+RAW_CONTENT = 'full'
+# Cross-reference pages end with the dimensional tables; fragments stop after this table
+FRAGMENT_CUT_AFTER = "ABB Style Number"
+_templates = TemplateStore()
+
+# Page parser: 'fast' (default, lxml tree, parse_bushing_html) or 'soup'
+# (BeautifulSoup, parse_bushing_info); both return the same record
+PARSERS = ('fast', 'soup')
+PARSER = 'fast'
+# Text nodes BeautifulSoup's get_text() keeps (not inside scripts, style sheets or templates)
+PAGE_TEXT_NODES = etree.XPath('.//text()[not(ancestor::script or ancestor::style or ancestor::template)]',
+                              smart_strings=False)
+
+# Parse result cache (hitachi_website_parse_cache.py), off by default. Records are cached
+# per parser version, which already changes with this file; bump PARSE_VERSION when a
+# change elsewhere changes the records the parsers return
+PARSE_VERSION = 1
+PARSE_CACHE = False
+PARSE_CACHE_MAX_ENTRIES = DEFAULT_MAX_ENTRIES
+
+# Page download: 'full' (default, the whole page) or 'stream' (stop reading once the
+# page is decided, see bushing_page_end)
+FETCH_MODES = ('full', 'stream')
+FETCH = 'full'
+STREAM_CHUNK_SIZE = 2048
+NO_BUSHING_SENTINEL = "No bushing found by that style number"
+REPLACEMENT_SECTION = "Replacement Information"
+
+# Error type of the latest failure per index in this process (drives same-run retries)
+_last_error_types: Dict[int, str] = {}
+
+
+def configure_output_paths(output_csv: Optional[str] = None, error_log_csv: Optional[str] = None,
+                           raw_data_dir: Optional[str] = None) -> Tuple[str, str, str]:
+    """
+    Redirect the master CSV, error log and raw HTML folder (e.g. for a shard run).
+    Every function that defaults to these paths picks up the new values.
+    
+    Args:
+        output_csv: Master CSV path (None keeps the current one)
+        error_log_csv: Error log CSV path (None keeps the current one)
+        raw_data_dir: Raw HTML folder (None keeps the current one)
+        
+    Returns:
+        Tuple of (OUTPUT_CSV, ERROR_LOG_CSV, RAW_DATA_DIR) now in effect
+    """
+    global OUTPUT_CSV, ERROR_LOG_CSV, RAW_DATA_DIR
+    OUTPUT_CSV = output_csv or OUTPUT_CSV
+    ERROR_LOG_CSV = error_log_csv or ERROR_LOG_CSV
+    RAW_DATA_DIR = raw_data_dir or RAW_DATA_DIR
+    _last_error_types.clear()
+    logger.info(f"Output paths: {OUTPUT_CSV}, {ERROR_LOG_CSV}, {RAW_DATA_DIR}/")
+    return OUTPUT_CSV, ERROR_LOG_CSV, RAW_DATA_DIR
+
+
+def configure_base_url(site_root: Optional[str] = None) -> str:
+    """
+    Point the scraper at another host serving the same cross-reference pages (e.g. the local
+    replay server in hitachi_website_replay_server.py).
+    
+    Args:
+        site_root: Scheme and host such as "http://127.0.0.1:8765" (None restores the live site)
+        
+    Returns:
+        BASE_URL now in effect
+    """
+    global BASE_URL
+    BASE_URL = f"{(site_root or SITE_ROOT).rstrip('/')}{PAGE_PATH}"
+    logger.info(f"Base URL: {BASE_URL}")
+    return BASE_URL
+
+
+def configure_storage(storage: Optional[str] = None) -> str:
+    """
+    Select where save_to_csv writes records.
+    
+    Args:
+        storage: 'csv' (append to the master CSV) or 'sqlite' (upsert into the
+            database next to it); None keeps the current one
+        
+    Returns:
+        STORAGE now in effect
+    """
+    global STORAGE
+    if storage is not None:
+        if storage not in STORAGE_BACKENDS:
+            raise ValueError(f"Unknown storage backend: {storage}")
+        STORAGE = storage
+        logger.info(f"Storage: {STORAGE}")
+    return STORAGE
+
+
+def database_path(filepath: Optional[str] = None) -> str:
+    """SQLite database of a master CSV (default: OUTPUT_CSV) - same name, .db extension."""
+    return os.path.splitext(filepath or OUTPUT_CSV)[0] + ".db"
+
+
+def configure_raw_storage(raw_storage: Optional[str] = None) -> str:
+    """
+    Select where save_raw_html writes pages.
+    
+    Args:
+        raw_storage: 'files' (one file per page in RAW_DATA_DIR) or 'archive'
+            (append to the compressed pack next to it); None keeps the current one
+        
+    Returns:
+        RAW_STORAGE now in effect
+    """
+    global RAW_STORAGE
+    if raw_storage is not None:
+        if raw_storage not in RAW_STORAGE_BACKENDS:
+            raise ValueError(f"Unknown raw HTML storage: {raw_storage}")
+        RAW_STORAGE = raw_storage
+        logger.info(f"Raw HTML storage: {RAW_STORAGE}")
+    return RAW_STORAGE
+
+
+def configure_raw_content(raw_content: Optional[str] = None) -> str:
+    """
+    Select what save_raw_html keeps of a page.
+    
+    Args:
+        raw_content: 'full' (the page as served) or 'fragment' (only the
+            data-bearing body, verified to parse to the same record); None
+            keeps the current one
+        
+    Returns:
+        RAW_CONTENT now in effect
+    """
+    global RAW_CONTENT
+    if raw_content is not None:
+        if raw_content not in RAW_CONTENT_MODES:
+            raise ValueError(f"Unknown raw HTML content mode: {raw_content}")
+        RAW_CONTENT = raw_content
+        logger.info(f"Raw HTML content: {RAW_CONTENT}")
+    return RAW_CONTENT
+
+
+def configure_parser(parser: Optional[str] = None) -> str:
+    """
+    Select the page parser of check_bushing_page.
+    
+    Args:
+        parser: 'fast' (lxml, parse_bushing_html) or 'soup' (BeautifulSoup,
+            parse_bushing_info); None keeps the current one
+        
+    Returns:
+        PARSER now in effect
+    """
+    global PARSER
+    if parser is not None:
+        if parser not in PARSERS:
+            raise ValueError(f"Unknown page parser: {parser}")
+        PARSER = parser
+        logger.info(f"Page parser: {PARSER}")
+    return PARSER
+
+
+def configure_fetch(fetch: Optional[str] = None) -> str:
+    """
+    Select how scrape_bushing_data downloads a page.
+    
+    Args:
+        fetch: 'full' (read the whole page) or 'stream' (stop at the no-bushing
+            sentinel or the end of the Replacement Information section); None
+            keeps the current one
+        
+    Returns:
+        FETCH now in effect
+    """
+    global FETCH
+    if fetch is not None:
+        if fetch not in FETCH_MODES:
+            raise ValueError(f"Unknown fetch mode: {fetch}")
+        FETCH = fetch
+        logger.info(f"Page fetch: {FETCH}")
+    return FETCH
 
-def log_error_to_csv(index: int, error_message: str) -> bool:
+
+def configure_parse_cache(enabled: Optional[bool] = None, max_entries: Optional[int] = None) -> bool:
+    """
+    Turn the parse result cache of check_bushing_page on or off.
+    
+    Args:
+        enabled: True to look parsed records up by page hash before parsing;
+            None keeps the current setting
+        max_entries: Records the cache keeps (None keeps the current bound)
+        
+    Returns:
+        PARSE_CACHE now in effect
+    """
+    global PARSE_CACHE, PARSE_CACHE_MAX_ENTRIES
+    if max_entries is not None:
+        PARSE_CACHE_MAX_ENTRIES = max_entries
+    if enabled is not None:
+        PARSE_CACHE = enabled
+        logger.info(f"Parse cache: {'on' if PARSE_CACHE else 'off'}")
+    return PARSE_CACHE
+
+
+def parse_cache_path(directory: Optional[str] = None) -> str:
+    """Parse cache of a raw HTML folder (default: RAW_DATA_DIR)."""
+    return cache_path(directory or RAW_DATA_DIR)
+
+
+def parse_cache_version() -> str:
+    """Parser version the cached records are keyed on (PARSE_VERSION, PARSER, this module's source)."""
+    return parser_version('crossref', PARSE_VERSION, PARSER, [__file__])
+
+
+def get_parse_cache(directory: Optional[str] = None) -> ParseCache:
+    """Shared parse result cache of a raw HTML folder (default: RAW_DATA_DIR)."""
+    path = parse_cache_path(directory)
+    return register_writer(path, lambda: ParseCache(path, parse_cache_version(), PARSE_CACHE_MAX_ENTRIES))
+
+
+def archive_path(directory: Optional[str] = None) -> str:
+    """Raw HTML archive of a folder (default: RAW_DATA_DIR) - same name, .pack extension."""
+    return pack_path(directory or RAW_DATA_DIR)
+
+
+def get_archive(directory: Optional[str] = None) -> HtmlArchive:
+    """Shared raw HTML archive of a folder (default: RAW_DATA_DIR); the pack is created on the first save."""
+    path = archive_path(directory)
+    return register_writer(path, lambda: HtmlArchive(path))
+
+
+def get_store(filepath: Optional[str] = None) -> SqliteStore:
+    """
+    Shared SQLite store of a master CSV (default: OUTPUT_CSV), seeded from the
+    CSV when the database is created.
+    """
+    filepath = filepath or OUTPUT_CSV
+    path = database_path(filepath)
+    return register_writer(path, lambda: SqliteStore(
+        path, SQLITE_TABLE, COLUMNS, 'Website Index', integer_key=True,
+        indexes=SQLITE_INDEXES, seed_csv=filepath
+    ))
+
+
+def _error_log(path: Optional[str] = None):
+    """Shared in-memory error log for a path (default: ERROR_LOG_CSV), loaded on first use."""
+    return get_error_log(path or ERROR_LOG_CSV, 'Index', int)
+
+
+def log_error_to_csv(index: int, error_message: str, error_type: Optional[str] = None,
+                     http_status: Optional[int] = None) -> bool:
     """
     Log scraping errors to a CSV file for analysis.
+    An index already in the log is only rewritten when a transient error
+    turns into a permanent one, so the log always holds the latest verdict.
     
     Args:
         index: The bushing index that failed
         error_message: Descriptive error message
+        error_type: Enumerated error type (derived from the message if omitted)
+        http_status: HTTP status code of the failed response, if any
         
     Returns:
         True if logged successfully, False otherwise
     """
     try:
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        
-        error_data = {
-            'Timestamp': timestamp,
-            'Index': index,
-            'Error_Message': error_message
-        }
-        
-        # Create DataFrame
-        df = pd.DataFrame([error_data])
-        
-        # Append to existing file or create new one
-        try:
-            existing_df = pd.read_csv(ERROR_LOG_CSV)
-            # Check if this index already exists in error log
-            if index not in existing_df['Index'].values:
-                combined_df = pd.concat([existing_df, df], ignore_index=True)
-                combined_df.to_csv(ERROR_LOG_CSV, index=False)
-                logger.info(f"Logged error for index {index}: {error_message}")
-            else:
-                logger.debug(f"Index {index} already in error log")
-        except FileNotFoundError:
-            df.to_csv(ERROR_LOG_CSV, index=False)
-            logger.info(f"Created error log and logged index {index}: {error_message}")
+        error_type = error_type or classify_error_message(error_message)
+        _last_error_types[index] = error_type
+        
+        action = _error_log().record(index, error_type, error_message, http_status)
+        if action == 'logged':
+            logger.info(f"Logged error for index {index} ({error_type}): {error_message}")
+        elif action == 'updated':
+            logger.info(f"Updated error for index {index} ({error_type}): {error_message}")
+        else:
+            logger.debug(f"Index {index} already in error log")
         
         return True
         
@@ -85,31 +352,148 @@ def log_error_to_csv(index: int, error_message: str) -> bool:
         return False
 
 
-def save_raw_html(html_content: str, index: int, directory: str = RAW_DATA_DIR) -> bool:
+def get_last_error_type(index: int) -> Optional[str]:
+    """
+    Error type of the most recent failure for an index in this process.
+    Lets the batch scrapers decide whether a failed fetch should be retried.
+    
+    Args:
+        index: The bushing index
+        
+    Returns:
+        Error type constant, or None if the index has not failed in this run
+    """
+    return _last_error_types.get(index)
+
+
+def clear_error_from_csv(index: int) -> bool:
+    """
+    Remove an index from the error log (after a transient failure was retried
+    successfully).
+    
+    Args:
+        index: The bushing index
+        
+    Returns:
+        True if successful or the index was not logged, False on error
+    """
+    try:
+        _last_error_types.pop(index, None)
+        if _error_log().clear(index):
+            logger.info(f"Cleared index {index} from error log")
+        return True
+    except Exception as e:
+        logger.error(f"Failed to clear index {index} from error log: {e}")
+        return False
+
+
+def write_error_entry(index: int):
     """
-    Save raw HTML response to file.
+    Write an index's new error log entry to disk now instead of with the next
+    batch, so a progress journal that records the failure next never runs
+    ahead of the error log.
+    
+    Args:
+        index: The bushing index
+    """
+    try:
+        _error_log().write_key(index)
+    except Exception as e:
+        logger.error(f"Failed to write the error log entry of {index}: {e}")
+
+
+def _with_error_types(df: pd.DataFrame) -> pd.DataFrame:
+    """Fill in Error_Type for error log rows written before the column existed."""
+    derived = df['Error_Message'].map(classify_error_message)
+    if 'Error_Type' not in df.columns:
+        df.insert(df.columns.get_loc('Index') + 1, 'Error_Type', derived)
+    else:
+        df['Error_Type'] = df['Error_Type'].fillna(derived)
+    return df
+
+
+def load_error_log(path: Optional[str] = None) -> pd.DataFrame:
+    """
+    Load the error log with an Error_Type for every row.
+    
+    Args:
+        path: Error log CSV to read (default: ERROR_LOG_CSV)
+    
+    Returns:
+        DataFrame with Index, Error_Type and Error_Message columns (empty if no log)
+    """
+    path = path or ERROR_LOG_CSV
+    try:
+        flush_error_log(path)
+        if os.path.exists(path):
+            return _with_error_types(pd.read_csv(path))
+    except Exception as e:
+        logger.warning(f"Error reading error log: {e}")
+    return pd.DataFrame(columns=['Timestamp', 'Index', 'Error_Type', 'Error_Message'])
+
+
+def raw_html_filename(index: int) -> str:
+    """Raw HTML file name of an index."""
+    return f"Hitachi_website_bushing_{index}.html"
+
+
+def _raw_html_exists(name: str, directory: str) -> bool:
+    """Whether a raw HTML name is saved in a folder or its archive."""
+    if find_raw_file(directory, name):
+        return True
+    return os.path.exists(archive_path(directory)) and name in get_archive(directory)
+
+
+def _write_raw_html(name: str, html_content: str, directory: str) -> str:
+    """Write a raw HTML name to the folder (or the archive); returns where it went."""
+    if RAW_STORAGE == 'archive':
+        get_archive(directory).put(name, html_content)
+        # Readers try the loose file first - an older copy would hide the new page
+        stale = find_raw_file(directory, name)
+        if stale:
+            os.remove(stale)
+            logger.info(f"Removed {stale} (superseded by the archived page)")
+        return archive_path(directory)
+    
+    # Creates the folder (and its bucket in the fan-out layout) if needed
+    filepath = raw_file_path(directory, name, create=True)
+    with open(filepath, 'w', encoding='utf-8') as f:
+        f.write(html_content)
+    return filepath
+
+
+def save_raw_html(html_content: str, index: int, directory: Optional[str] = None,
+                  data: Optional[dict] = None) -> bool:
+    """
+    Save raw HTML response to file (or to the archive with configure_raw_storage('archive')).
+    With configure_raw_content('fragment') only the boilerplate-stripped fragment is
+    saved, unless it parses to a different record than the full page.
     
     Args:
         html_content: Raw HTML content from the webpage
         index: The bushing index number
         directory: Directory to save the file (default: RAW_DATA_DIR)
+        data: Record already parsed from the page (fragment mode compares against it)
         
     Returns:
         True if successful, False otherwise
     """
     try:
-        # Create directory if it doesn't exist
-        Path(directory).mkdir(parents=True, exist_ok=True)
+        directory = directory or RAW_DATA_DIR
         
-        # Create filename
-        filename = f"Hitachi_website_bushing_{index}.html"
-        filepath = os.path.join(directory, filename)
-        
-        # Save HTML content
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        if RAW_CONTENT == 'fragment':
+            fragment = verified_fragment(html_content, lambda soup: parse_bushing_info(soup, index), data, FRAGMENT_CUT_AFTER)
+            if fragment is None:
+                logger.warning(f"Fragment of index {index} parses differently - saving the full page")
+            else:
+                html_content, template_fingerprint, template = fragment
+                if template is not None:
+                    _templates.ensure(directory, template_fingerprint,
+                                      lambda name: _raw_html_exists(name, directory),
+                                      lambda name: _write_raw_html(name, template, directory))
         
-        logger.info(f"Saved raw HTML to {filepath}")
+        location = _write_raw_html(raw_html_filename(index), html_content, directory)
+        logger.info(f"Saved raw HTML to {location}")
         return True
         
     except Exception as e:
@@ -117,7 +501,7 @@ def save_raw_html(html_content: str, index: int, directory: str = RAW_DATA_DIR)
         return False
 
 
-def delete_raw_html(index: int, directory: str = RAW_DATA_DIR) -> bool:
+def delete_raw_html(index: int, directory: Optional[str] = None) -> bool:
     """
     Delete raw HTML file for a given index.
     Used to clean up files for indices with errors.
@@ -130,15 +514,18 @@ def delete_raw_html(index: int, directory: str = RAW_DATA_DIR) -> bool:
         True if successful or file doesn't exist, False on error
     """
     try:
-        filename = f"Hitachi_website_bushing_{index}.html"
-        filepath = os.path.join(directory, filename)
+        directory = directory or RAW_DATA_DIR
+        filepath = find_raw_file(directory, raw_html_filename(index))
+        
+        if RAW_STORAGE == 'archive' and get_archive(directory).delete(raw_html_filename(index)):
+            logger.info(f"Deleted raw HTML for {index} from {archive_path(directory)}")
         
-        if os.path.exists(filepath):
+        if filepath:
             os.remove(filepath)
             logger.info(f"Deleted raw HTML file: {filepath}")
             return True
         else:
-            logger.debug(f"HTML file not found (already deleted): {filepath}")
+            logger.debug(f"HTML file not found (already deleted): {raw_html_filename(index)}")
             return True
         
     except Exception as e:
@@ -146,21 +533,95 @@ def delete_raw_html(index: int, directory: str = RAW_DATA_DIR) -> bool:
         return False
 
 
-def get_error_log_indices() -> set:
+def discard_raw_html(index: int, error_type: Optional[str]) -> None:
+    """
+    Delete the raw HTML of an index after a permanent failure. A transient one
+    (timeout, server error, ...) keeps the page that is already saved, since
+    its master list row and status stay as well.
+    
+    Args:
+        index: The bushing index
+        error_type: Error type of the failure
+    """
+    if not error_types.is_transient_error(error_type):
+        delete_raw_html(index)
+
+
+def read_raw_html(index: int, directory: Optional[str] = None) -> Optional[str]:
     """
-    Load all indices from the error log CSV.
+    Saved raw HTML of an index, from its file or from the archive.
     
+    Args:
+        index: The bushing index number
+        directory: Raw HTML folder (default: RAW_DATA_DIR)
+        
     Returns:
-        Set of indices that have errors
+        Page text, or None if the page was not saved
     """
-    try:
-        if os.path.exists(ERROR_LOG_CSV):
-            df = pd.read_csv(ERROR_LOG_CSV)
-            return set(df['Index'].values)
-        return set()
-    except Exception as e:
-        logger.warning(f"Error reading error log: {e}")
-        return set()
+    directory = directory or RAW_DATA_DIR
+    name = raw_html_filename(index)
+    filepath = find_raw_file(directory, name)
+    if filepath:
+        with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
+            return f.read()
+    path = archive_path(directory)
+    if not os.path.exists(path):
+        return None
+    return get_archive(directory).get(name)
+
+
+def get_error_log_indices(path: Optional[str] = None) -> set:
+    """
+    Load the indices with permanent failures from the error log CSV.
+    Transient failures (timeouts, connection errors, HTTP 5xx, ...) are not
+    included, so they are fetched again on the next run.
+    
+    Args:
+        path: Error log CSV to read (default: ERROR_LOG_CSV)
+    
+    Returns:
+        Set of indices that should be skipped
+    """
+    return _error_log(path).keys(permanent=True)
+
+
+def get_error_log_types(path: Optional[str] = None) -> Dict[int, str]:
+    """
+    Load the error type of every index in the error log.
+    
+    Args:
+        path: Error log CSV to read (default: ERROR_LOG_CSV)
+    
+    Returns:
+        Dict of index -> error type
+    """
+    return _error_log(path).error_types()
+
+
+def get_transient_error_log_indices() -> set:
+    """
+    Load the indices whose last logged failure was transient.
+    
+    Returns:
+        Set of indices eligible for retry
+    """
+    return _error_log().keys(permanent=False)
+
+
+def get_error_index(path: Optional[str] = None) -> ErrorIndex:
+    """
+    Compact typed view of the error log: error code, HTTP status, attempts and
+    last-attempt time per index, with per-code key sets (see hitachi_website_error_index.py).
+    
+    Args:
+        path: Error log CSV to read (default: ERROR_LOG_CSV)
+    
+    Returns:
+        ErrorIndex of the log
+    """
+    path = path or ERROR_LOG_CSV
+    flush_error_log(path)
+    return load_error_index(path, int, 'Index')
 
 
 def scrape_bushing_data(index: int) -> Optional[Dict[str, str]]:
@@ -168,6 +629,8 @@ def scrape_bushing_data(index: int) -> Optional[Dict[str, str]]:
     Scrape bushing data for a given index from the Hitachi Energy website.
     Enhanced with comprehensive error handling and logging for large-scale automation.
     Only saves HTML files when valid data is found.
+    With configure_fetch('stream') only the part of the page up to bushing_page_end
+    is downloaded, parsed and saved.
     
     Args:
         index: The bushing index number to scrape
@@ -178,109 +641,208 @@ def scrape_bushing_data(index: int) -> Optional[Dict[str, str]]:
     url = f"{BASE_URL}?INDEX={index}"
     logger.info(f"Scraping data for index {index} from {url}")
     
-    # Headers to mimic a real browser
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-        'Accept-Language': 'en-US,en;q=0.9',
-        'Accept-Encoding': 'gzip, deflate, br',
-        'Connection': 'keep-alive',
-        'Upgrade-Insecure-Requests': '1',
-        'Referer': 'https://bushing.hitachienergy.com/'
-    }
-    
     try:
-        # Send GET request with browser headers
-        response = requests.get(url, headers=headers, timeout=30)
-        
-        # Check for HTTP errors
-        if response.status_code == 404:
-            log_error_to_csv(index, 'Page not found (HTTP 404)')
-            logger.warning(f"Index {index} not found (404)")
-            delete_raw_html(index)  # Clean up any existing file
-            return None
-        elif response.status_code == 403:
-            log_error_to_csv(index, 'Access forbidden (HTTP 403)')
-            logger.warning(f"Access forbidden for index {index} (403)")
-            delete_raw_html(index)  # Clean up any existing file
-            return None
-        
-        response.raise_for_status()
-        
-        # Check if response has content
-        if not response.text or len(response.text) < 100:
-            log_error_to_csv(index, 'Empty or too short response from server')
-            logger.warning(f"Empty or invalid response for index {index}")
-            delete_raw_html(index)  # Clean up any existing file
-            return None
-        
-        # Check for "No bushing found" message
-        if "No bushing found by that style number" in response.text:
-            log_error_to_csv(index, 'No bushing found by that style number')
-            logger.warning(f"No bushing found for index {index}")
-            delete_raw_html(index)  # Clean up any existing file
-            return None
-        
-        # Parse HTML
-        soup = BeautifulSoup(response.content, 'lxml')
-        
-        # Extract bushing information
-        bushing_data = parse_bushing_info(soup, index)
-        
-        if bushing_data:
-            # Validate that we got at least one meaningful field
-            has_data = (bushing_data.get("Original Bushing Information - Catalog Number") or
-                       bushing_data.get("Original Bushing Information - Original Bushing Manufacturer") or
-                       bushing_data.get("Replacement Information - ABB Style Number"))
-            
-            if has_data:
-                # Only save HTML if we have valid data
-                if not save_raw_html(response.text, index):
-                    logger.warning(f"Failed to save raw HTML for index {index}, but continuing...")
-                logger.info(f"Successfully scraped data for index {index}")
-                return bushing_data
-            else:
-                log_error_to_csv(index, 'All fields empty - no bushing data extracted')
-                logger.warning(f"No valid data found for index {index}")
-                delete_raw_html(index)  # Clean up any existing file
+        # Send GET request with browser headers over the shared keep-alive session
+        # (stream mode only reads the headers here, the body is read by read_streamed_page)
+        response = http_get(url, headers=HITACHI_HEADERS, timeout=30, stream=FETCH == 'stream')
+        
+        with response:
+            # Check for HTTP errors
+            if response.status_code == 404:
+                log_error_to_csv(index, 'Page not found (HTTP 404)', error_types.HTTP_404, 404)
+                logger.warning(f"Index {index} not found (404)")
+                discard_raw_html(index, error_types.HTTP_404)
                 return None
-        else:
-            log_error_to_csv(index, 'HTML parser returned None - could not parse page')
-            logger.warning(f"Parser failed for index {index}")
-            delete_raw_html(index)  # Clean up any existing file
-            return None
+            elif response.status_code == 403:
+                log_error_to_csv(index, 'Access forbidden (HTTP 403)', error_types.HTTP_403, 403)
+                logger.warning(f"Access forbidden for index {index} (403)")
+                discard_raw_html(index, error_types.HTTP_403)
+                return None
+            
+            response.raise_for_status()
+            
+            if FETCH == 'stream':
+                html_text, html_content, stopped = read_streamed_page(response, index)
+                return process_bushing_page(index, html_text, html_content, truncated=stopped)
+            return process_bushing_page(index, response.text, response.content)
     
     except requests.exceptions.Timeout:
-        log_error_to_csv(index, 'Request timeout after 30 seconds')
+        log_error_to_csv(index, 'Request timeout after 30 seconds', error_types.TIMEOUT)
         logger.error(f"Timeout fetching data for index {index}")
-        delete_raw_html(index)  # Clean up any existing file
+        discard_raw_html(index, error_types.TIMEOUT)
         return None
     
     except requests.exceptions.ConnectionError as e:
-        log_error_to_csv(index, f'Network connection error: {str(e)[:100]}')
+        log_error_to_csv(index, f'Network connection error: {str(e)[:100]}', error_types.CONNECTION_ERROR)
         logger.error(f"Connection error for index {index}: {e}")
-        delete_raw_html(index)  # Clean up any existing file
+        discard_raw_html(index, error_types.CONNECTION_ERROR)
         return None
     
     except requests.exceptions.HTTPError as e:
-        log_error_to_csv(index, f'HTTP error {e.response.status_code}: {str(e)[:100]}')
+        error_type = error_types.http_error_type(e.response.status_code)
+        log_error_to_csv(index, f'HTTP error {e.response.status_code}: {str(e)[:100]}', error_type,
+                         e.response.status_code)
         logger.error(f"HTTP error for index {index}: {e}")
-        delete_raw_html(index)  # Clean up any existing file
+        discard_raw_html(index, error_type)
         return None
     
     except requests.exceptions.RequestException as e:
-        log_error_to_csv(index, f'Request exception: {str(e)[:100]}')
+        log_error_to_csv(index, f'Request exception: {str(e)[:100]}', error_types.REQUEST_ERROR)
         logger.error(f"Request exception for index {index}: {e}")
-        delete_raw_html(index)  # Clean up any existing file
+        discard_raw_html(index, error_types.REQUEST_ERROR)
         return None
     
     except Exception as e:
-        log_error_to_csv(index, f'Unexpected error: {str(e)[:100]}')
+        log_error_to_csv(index, f'Unexpected error: {str(e)[:100]}', error_types.UNKNOWN_ERROR)
         logger.error(f"Unexpected error for index {index}: {e}")
-        delete_raw_html(index)  # Clean up any existing file
+        discard_raw_html(index, error_types.UNKNOWN_ERROR)
         return None
 
 
+def bushing_page_end(body: bytes) -> Optional[int]:
+    """
+    Where a streamed cross-reference page is decided (read_until callback).
+    
+    A "No bushing found" page is decided as soon as the sentinel arrives. On a
+    bushing page every field the parsers read comes before the end of the
+    Replacement Information table (the same cut fragments use, after the
+    FRAGMENT_CUT_AFTER table); the dimensional tables below it are not needed.
+    A page without these markers is read to the end.
+    
+    Args:
+        body: Page bytes read so far
+        
+    Returns:
+        Length of the page prefix to keep, or None to keep reading
+    """
+    if NO_BUSHING_SENTINEL.encode('ascii') in body:
+        return len(body)
+    section = body.find(REPLACEMENT_SECTION.encode('ascii'))
+    label = body.find(FRAGMENT_CUT_AFTER.encode('ascii'), section) if section != -1 else -1
+    end = body.lower().find(b'</table>', label) if label != -1 else -1
+    return end + len(b'</table>') if end != -1 else None
+
+
+def read_streamed_page(response: requests.Response, index: int) -> Tuple[str, bytes, bool]:
+    """
+    Read a cross-reference page only up to the point where it is decided
+    (bushing_page_end) and close the connection there.
+    
+    Args:
+        response: Response opened with stream=True
+        index: The bushing index number (for logging)
+        
+    Returns:
+        Tuple of (decoded page prefix, page prefix bytes, whether reading
+        stopped before the end of the page), decoded like response.text
+    """
+    html_content, stopped = read_until(response, bushing_page_end, STREAM_CHUNK_SIZE)
+    encoding = response.encoding or UnicodeDammit(html_content, is_html=True).original_encoding or 'utf-8'
+    try:
+        html_text = str(html_content, encoding, errors='replace')
+    except LookupError:
+        html_text = str(html_content, 'utf-8', errors='replace')
+    if stopped:
+        logger.debug(f"Index {index}: stopped reading after {len(html_content)} bytes")
+    return html_text, html_content, stopped
+
+
+def check_bushing_page(index: int, html_text: str,
+                       html_content: Optional[bytes] = None) -> Tuple[Optional[Dict[str, str]], Optional[str], str]:
+    """
+    Validate and parse a cross-reference page without touching any file.
+    Shared by process_bushing_page and the offline reparse
+    (hitachi_website_reparse.py), so both accept and reject the same pages.
+    
+    Args:
+        index: The bushing index number of the page
+        html_text: Decoded page
+        html_content: Raw page bytes handed to the HTML parser (default: html_text)
+        
+    Returns:
+        Tuple of (bushing data, None, '') for a valid page, or
+        (None, error type, error message) if the page has no valid data
+    """
+    # Check if response has content
+    if not html_text or len(html_text) < 100:
+        logger.warning(f"Empty or invalid response for index {index}")
+        return None, error_types.EMPTY_RESPONSE, 'Empty or too short response from server'
+    
+    # Check for "No bushing found" message
+    if NO_BUSHING_SENTINEL in html_text:
+        logger.warning(f"No bushing found for index {index}")
+        return None, error_types.NO_BUSHING_FOUND, 'No bushing found by that style number'
+    
+    # Parse HTML and extract bushing information (or look the record up by page hash)
+    markup = html_content if html_content is not None else html_text
+    if PARSE_CACHE:
+        bushing_data = get_parse_cache().parse(markup, index, lambda: parse_bushing_page(markup, index))
+    else:
+        bushing_data = parse_bushing_page(markup, index)
+    if not bushing_data:
+        logger.warning(f"Parser failed for index {index}")
+        return None, error_types.PARSE_FAILED, 'HTML parser returned None - could not parse page'
+    
+    # Validate that we got at least one meaningful field
+    has_data = (bushing_data.get("Original Bushing Information - Catalog Number") or
+               bushing_data.get("Original Bushing Information - Original Bushing Manufacturer") or
+               bushing_data.get("Replacement Information - ABB Style Number"))
+    if not has_data:
+        logger.warning(f"No valid data found for index {index}")
+        return None, error_types.NO_DATA, 'All fields empty - no bushing data extracted'
+    
+    return bushing_data, None, ''
+
+
+def parse_bushing_page(markup, index: int) -> Optional[Dict[str, str]]:
+    """
+    Parse a cross-reference page with the selected parser (configure_parser).
+    
+    Args:
+        markup: Page as text or bytes
+        index: The bushing index number
+        
+    Returns:
+        Dictionary with extracted bushing data or None if parsing fails
+    """
+    if PARSER == 'fast':
+        return parse_bushing_html(markup, index)
+    return parse_bushing_info(BeautifulSoup(markup, 'lxml'), index)
+
+
+def process_bushing_page(index: int, html_text: str, html_content: bytes,
+                         truncated: bool = False) -> Optional[Dict[str, str]]:
+    """
+    Validate and parse a successfully fetched cross-reference page.
+    Shared by the blocking and asyncio fetchers so both apply identical checks,
+    error logging and raw HTML handling.
+    
+    Args:
+        index: The bushing index number that was fetched
+        html_text: Decoded response body
+        html_content: Raw response body bytes (handed to the HTML parser)
+        truncated: The body is only the part of the page read by --fetch stream;
+            it is saved only if the index has no raw HTML yet
+        
+    Returns:
+        Dictionary containing scraped data or None if the page has no valid data
+    """
+    bushing_data, error_type, error_message = check_bushing_page(index, html_text, html_content)
+    
+    if bushing_data is None:
+        log_error_to_csv(index, error_message, error_type)
+        discard_raw_html(index, error_type)
+        return None
+    
+    # Only save HTML if we have valid data, and never replace a saved page with a cut one
+    if truncated and _raw_html_exists(raw_html_filename(index), RAW_DATA_DIR):
+        logger.debug(f"Keeping the saved raw HTML of index {index} (streamed page was cut)")
+    elif not save_raw_html(html_text, index, data=bushing_data):
+        logger.warning(f"Failed to save raw HTML for index {index}, but continuing...")
+    logger.info(f"Successfully scraped data for index {index}")
+    return bushing_data
+
+
 def parse_bushing_info(soup: BeautifulSoup, index: int) -> Optional[Dict[str, str]]:
     """
     Parse bushing information from the HTML soup.
@@ -295,52 +857,119 @@ def parse_bushing_info(soup: BeautifulSoup, index: int) -> Optional[Dict[str, st
     try:
         # Get all text content
         page_text = soup.get_text()
-        
-        # Initialize data dictionary
-        data = {
-            "Website Index": str(index),
-            "Original Bushing Information - Original Bushing Manufacturer": "",
-            "Original Bushing Information - Catalog Number": "",
-            "Replacement Information - Replacement Bushing Manufacturer": "ABB",
-            "Replacement Information - ABB Style Number": ""
-        }
-        
-        # Extract Original Bushing Manufacturer
-        manufacturer = extract_field_value(
-            page_text, 
-            "Original Bushing Manufacturer:"
-        )
-        if manufacturer:
-            data["Original Bushing Information - Original Bushing Manufacturer"] = manufacturer
-        
-        # Extract Original Catalog Number
-        # Look for catalog number in the Original Bushing Information section
-        catalog_number = extract_catalog_number(soup, page_text)
-        if catalog_number:
-            data["Original Bushing Information - Catalog Number"] = catalog_number
-        
-        # Extract ABB Style Number from Replacement Information section
-        abb_style = extract_abb_style_number(soup, page_text)
-        if abb_style:
-            data["Replacement Information - ABB Style Number"] = abb_style
-        
-        # Validate that we got essential data
-        if not data["Original Bushing Information - Original Bushing Manufacturer"]:
-            logger.warning(f"Missing Original Bushing Manufacturer for index {index}")
-        
-        if not data["Original Bushing Information - Catalog Number"]:
-            logger.warning(f"Missing Catalog Number for index {index}")
-        
-        if not data["Replacement Information - ABB Style Number"]:
-            logger.warning(f"Missing ABB Style Number for index {index}")
-        
-        return data
+        return bushing_record(index, page_text, extract_abb_style_number(soup, page_text))
         
     except Exception as e:
         logger.error(f"Error in parse_bushing_info: {e}")
         return None
 
 
+def parse_bushing_html(html_content, index: int) -> Optional[Dict[str, str]]:
+    """
+    Fast path of parse_bushing_info: the same record from an lxml tree.
+    
+    Building the BeautifulSoup tree is nearly all the cost of parsing a page,
+    while the fields only need the page text and the links. lxml (the parser
+    BeautifulSoup itself runs on) builds its tree several times faster; the
+    page text is assembled from it exactly as soup.get_text() would and goes
+    through the same field extractors. Bytes are decoded the way BeautifulSoup
+    decodes them. A page lxml cannot take as a document falls back to
+    parse_bushing_info. `hitachi_website_reparse.py crossref --verify` compares
+    both parsers on the saved corpus.
+    
+    Args:
+        html_content: Page as text or bytes
+        index: The bushing index number
+        
+    Returns:
+        Dictionary with extracted bushing data or None if parsing fails
+    """
+    try:
+        if isinstance(html_content, bytes):
+            html_content = UnicodeDammit(html_content, is_html=True).unicode_markup
+        root = etree.HTML(html_content)
+    except (etree.LxmlError, ValueError, TypeError):
+        root = None
+    if root is None:
+        return parse_bushing_info(BeautifulSoup(html_content, 'lxml'), index)
+    
+    try:
+        page_text = lxml_text(root)
+        return bushing_record(index, page_text, extract_abb_style_number_lxml(root, page_text))
+        
+    except Exception as e:
+        logger.error(f"Error in parse_bushing_html: {e}")
+        return None
+
+
+def lxml_text(element) -> str:
+    """
+    Text of an lxml element as BeautifulSoup's get_text() returns it: every
+    text node in document order, without comments, scripts, style sheets and
+    templates. Clears the text of the script and style elements below the
+    element, so the text comes out of one C-level serialization.
+    """
+    for node in element.iter('script', 'style', 'template'):
+        if node.tag == 'template':
+            # Everything nested in a template is left out, not just its own text
+            return ''.join(PAGE_TEXT_NODES(element))
+        node.text = None
+    return etree.tostring(element, method='text', encoding='unicode', with_tail=False)
+
+
+def bushing_record(index: int, page_text: str, abb_style: str) -> Dict[str, str]:
+    """
+    Cross-reference record of a page from its text and ABB style number
+    (shared by parse_bushing_info and parse_bushing_html).
+    
+    Args:
+        index: The bushing index number
+        page_text: Text content of the page
+        abb_style: ABB Style Number found on the page (may be empty)
+        
+    Returns:
+        Dictionary with extracted bushing data
+    """
+    # Initialize data dictionary
+    data = {
+        "Website Index": str(index),
+        "Original Bushing Information - Original Bushing Manufacturer": "",
+        "Original Bushing Information - Catalog Number": "",
+        "Replacement Information - Replacement Bushing Manufacturer": "ABB",
+        "Replacement Information - ABB Style Number": ""
+    }
+    
+    # Extract Original Bushing Manufacturer
+    manufacturer = extract_field_value(
+        page_text,
+        "Original Bushing Manufacturer:"
+    )
+    if manufacturer:
+        data["Original Bushing Information - Original Bushing Manufacturer"] = manufacturer
+    
+    # Extract Original Catalog Number
+    # Look for catalog number in the Original Bushing Information section
+    catalog_number = extract_catalog_number(None, page_text)
+    if catalog_number:
+        data["Original Bushing Information - Catalog Number"] = catalog_number
+    
+    # ABB Style Number from Replacement Information section
+    if abb_style:
+        data["Replacement Information - ABB Style Number"] = abb_style
+    
+    # Validate that we got essential data
+    if not data["Original Bushing Information - Original Bushing Manufacturer"]:
+        logger.warning(f"Missing Original Bushing Manufacturer for index {index}")
+    
+    if not data["Original Bushing Information - Catalog Number"]:
+        logger.warning(f"Missing Catalog Number for index {index}")
+    
+    if not data["Replacement Information - ABB Style Number"]:
+        logger.warning(f"Missing ABB Style Number for index {index}")
+    
+    return data
+
+
 def extract_field_value(text: str, label: str) -> str:
     """
     Extract value following a label in the text.
@@ -387,12 +1016,12 @@ def extract_field_value(text: str, label: str) -> str:
         return ""
 
 
-def extract_catalog_number(soup: BeautifulSoup, text: str) -> str:
+def extract_catalog_number(soup: Optional[BeautifulSoup], text: str) -> str:
     """
     Extract the original catalog number from the page.
     
     Args:
-        soup: BeautifulSoup object
+        soup: BeautifulSoup object (unused, the page text is enough)
         text: Page text content
         
     Returns:
@@ -457,68 +1086,103 @@ def extract_abb_style_number(soup: BeautifulSoup, text: str) -> str:
                 if 'ABB Style' in parent_text or 'Replacement' in parent_text:
                     return link_text
         
-        # Method 2: Text-based extraction from Replacement Information section
-        replacement_marker = "Replacement Information"
-        if replacement_marker in text:
-            start = text.find(replacement_marker)
-            replacement_section = text[start:start+500]  # Look ahead 500 chars
-            
-            abb_style_label = "ABB Style Number:"
-            if abb_style_label in replacement_section:
-                start_pos = replacement_section.find(abb_style_label) + len(abb_style_label)
-                remaining = replacement_section[start_pos:].strip()
-                
-                lines = remaining.split('\n')
-                for line in lines:
-                    line = line.strip()
-                    if line and not any(x in line for x in ['ABB Style', 'Replacement', 'Dimensional']):
-                        return line
+        return abb_style_number_from_text(text)
         
-        # Method 3: Fallback
-        abb_value = extract_field_value(text, "ABB Style Number:")
-        return abb_value
+    except Exception as e:
+        logger.error(f"Error extracting ABB Style Number: {e}")
+        return ""
+
+
+def extract_abb_style_number_lxml(root, text: str) -> str:
+    """
+    extract_abb_style_number for an lxml tree (used by parse_bushing_html).
+    
+    Args:
+        root: lxml root element of the page
+        text: Page text content
+        
+    Returns:
+        ABB Style Number or empty string
+    """
+    try:
+        # Method 1: link with the style number whose parent mentions the section
+        for link in root.iter('a'):
+            link_text = lxml_text(link).strip()
+            if link_text and len(link_text) > 5 and any(char.isdigit() for char in link_text):
+                parent_text = etree.tostring(link.getparent(), method='html', encoding='unicode', with_tail=False)
+                if 'ABB Style' in parent_text or 'Replacement' in parent_text:
+                    return link_text
+        
+        return abb_style_number_from_text(text)
         
     except Exception as e:
         logger.error(f"Error extracting ABB Style Number: {e}")
         return ""
 
 
-def save_to_csv(data: Dict[str, str], filepath: str = OUTPUT_CSV, mode: str = 'append') -> bool:
+def abb_style_number_from_text(text: str) -> str:
+    """
+    ABB Style Number from the page text: the first line after "ABB Style Number:"
+    in the Replacement Information section, else the generic field extractor.
+    
+    Args:
+        text: Page text content
+        
+    Returns:
+        ABB Style Number or empty string
+    """
+    # Method 2: Text-based extraction from Replacement Information section
+    replacement_marker = "Replacement Information"
+    if replacement_marker in text:
+        start = text.find(replacement_marker)
+        replacement_section = text[start:start+500]  # Look ahead 500 chars
+        
+        abb_style_label = "ABB Style Number:"
+        if abb_style_label in replacement_section:
+            start_pos = replacement_section.find(abb_style_label) + len(abb_style_label)
+            remaining = replacement_section[start_pos:].strip()
+            
+            lines = remaining.split('\n')
+            for line in lines:
+                line = line.strip()
+                if line and not any(x in line for x in ['ABB Style', 'Replacement', 'Dimensional']):
+                    return line
+    
+    # Method 3: Fallback
+    abb_value = extract_field_value(text, "ABB Style Number:")
+    return abb_value
+
+
+def save_to_csv(data: Dict[str, str], filepath: Optional[str] = None, mode: str = 'append') -> bool:
     """
     Save bushing data to CSV file.
+    Appends one line to the master CSV kept open by hitachi_website_csv_writer
+    (constant cost per record). Call close_all_writers() - or let the process
+    exit - to apply overwrite-mode replacements.
+    With configure_storage('sqlite') the record is upserted into the master
+    list database instead (see hitachi_website_sqlite_store.py).
     
     Args:
         data: Dictionary containing bushing data
-        filepath: Path to the CSV file
+        filepath: Path to the CSV file (default: OUTPUT_CSV)
         mode: Write mode - 'append' (add new), 'overwrite' (replace existing row with same index)
         
     Returns:
         True if successful, False otherwise
     """
     try:
-        # Create DataFrame with single row
-        df = pd.DataFrame([data])
+        filepath = filepath or OUTPUT_CSV
         
-        # Reorder columns to match specification
-        df = df[COLUMNS]
+        if STORAGE == 'sqlite':
+            # Upsert: overwrite mode replaces the row in place, committed in batches
+            get_store(filepath).upsert(data)
+            logger.info(f"Upserted data into {database_path(filepath)}")
+            return True
         
-        # Check if file exists
-        try:
-            existing_df = pd.read_csv(filepath)
-            
-            # In overwrite mode, remove any existing row with the same Website Index
-            if mode == 'overwrite':
-                index_to_check = data['Website Index']
-                existing_df = existing_df[existing_df['Website Index'] != int(index_to_check)]
-            
-            # Append new data
-            combined_df = pd.concat([existing_df, df], ignore_index=True)
-            combined_df.to_csv(filepath, index=False)
-            logger.info(f"Appended data to {filepath}")
-        except FileNotFoundError:
-            # Create new file
-            df.to_csv(filepath, index=False)
-            logger.info(f"Created new file {filepath}")
+        # One CSV line per record through the shared open writer; overwrite mode
+        # drops the superseded row in a single compaction when the writer closes
+        get_writer(filepath, COLUMNS, 'Website Index').append(data, replace=(mode == 'overwrite'))
+        logger.info(f"Appended data to {filepath}")
         
         return True
         
@@ -0,0 +1,334 @@
+"""
+Hitachi Website Compact Error Log Index
+
+Typed, compact copy of a scraping error log: one row per logged key with the
+numeric error code, HTTP status, attempt count and last-attempt time, stored as
+NumPy arrays next to the CSV (hitachi_website_scraping_error_log.npz). Retry and
+skip policies and reports ("all HTTP 500s since last night") become array
+filters and set operations instead of scans of the free-text Error_Message.
+
+The CSV stays the log of record. The index carries the size and mtime of the
+CSV it was built from; load_error_index() uses it while they match and rebuilds
+it from the CSV otherwise (the error log writers save it when they are closed).
+
+Usage:
+    python hitachi_website_error_index.py summary crossref
+    python hitachi_website_error_index.py keys crossref --status 500 --since "2026-10-15 18:00"
+    python hitachi_website_error_index.py keys catalog --type TIMEOUT --min-attempts 2 --output retry.txt
+
+    from hitachi_website_error_index import load_error_index
+    errors = load_error_index("hitachi_website_scraping_error_log.csv", int)
+    by_type = errors.by_type()                  # error type -> set of keys
+    recent_500s = errors.keys(http_status=500, since="2026-10-15 18:00")
+
+Author: Data Collection System
+Date: October 16, 2026
+Version: 1.0 - Compact typed error log index with per-code key sets
+"""
+
+import argparse
+import csv
+import logging
+import os
+import sys
+import time
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+
+import hitachi_website_error_types as error_types
+from hitachi_website_error_types import classify_error_message, http_status_of_message
+
+logger = logging.getLogger(__name__)
+
+INDEX_SUFFIX = '.npz'
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+MAX_ATTEMPTS = np.iinfo(np.uint16).max
+
+
+def error_index_path(log_path: str) -> str:
+    """Compact index of an error log CSV - same name, .npz extension."""
+    return os.path.splitext(log_path)[0] + INDEX_SUFFIX
+
+
+def _signature(path: str) -> np.ndarray:
+    try:
+        stat = os.stat(path)
+        return np.array([stat.st_size, stat.st_mtime_ns], dtype=np.int64)
+    except OSError:
+        return np.array([-1, -1], dtype=np.int64)
+
+
+def parse_timestamp(value: Union[str, datetime, float, None]) -> float:
+    """Epoch seconds of a log timestamp ('YYYY-MM-DD HH:MM[:SS]', datetime or epoch)."""
+    if value is None or value == '':
+        return 0.0
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, datetime):
+        return value.timestamp()
+    for fmt in (TIMESTAMP_FORMAT, '%Y-%m-%d %H:%M', '%Y-%m-%d'):
+        try:
+            return time.mktime(time.strptime(value.strip(), fmt))
+        except ValueError:
+            continue
+    raise ValueError(f"Unrecognised timestamp: {value}")
+
+
+def read_error_log_rows(path: str, key_column: str, key_type: Callable = str):
+    """
+    Read an error log CSV of any layout into typed rows.
+
+    Logs written before the Error_Type, HTTP_Status or Attempts columns existed
+    get them derived: the type and status from Error_Message, one attempt.
+
+    Args:
+        path: Error log CSV
+        key_column: Key column name ('Index' or 'Style_Number')
+        key_type: Converts key text back to a key (int for indices)
+
+    Returns:
+        Tuple of (header fields, dict of key -> [Timestamp, key text, Error_Type,
+        HTTP_Status, Attempts, Error_Message] as strings)
+    """
+    entries: Dict[object, List[str]] = {}
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        return None, entries
+    with open(path, 'r', newline='', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            text = (row.get(key_column) or '').strip()
+            if not text:
+                continue
+            try:
+                key = key_type(text)
+            except ValueError:
+                key = text
+            message = row.get('Error_Message') or ''
+            error_type = row.get('Error_Type') or classify_error_message(message)
+            status = row.get('HTTP_Status')
+            if status is None:
+                derived = http_status_of_message(message)
+                status = '' if derived is None else str(derived)
+            attempts = row.get('Attempts') or '1'
+            entries[key] = [row.get('Timestamp') or '', text, error_type, status, attempts, message]
+        return reader.fieldnames, entries
+
+
+def write_error_index(log_path: str, entries: Dict[object, Sequence[str]]) -> str:
+    """
+    Save the compact index of an error log (atomic replace).
+
+    Args:
+        log_path: Error log CSV the entries were written to (its size and mtime
+            are stored to detect later changes)
+        entries: Key -> [Timestamp, key text, Error_Type, HTTP_Status, Attempts, ...]
+
+    Returns:
+        Path of the index
+    """
+    rows = list(entries.items())
+    keys = [key for key, _ in rows]
+    integer_keys = all(isinstance(key, int) for key in keys)
+    arrays = {
+        'keys': np.array(keys, dtype=np.int64) if integer_keys else np.array([str(k) for k in keys], dtype=str),
+        'codes': np.array([error_types.error_code(row[2]) for _, row in rows], dtype=np.uint8),
+        'statuses': np.array([int(row[3]) if row[3] else 0 for _, row in rows], dtype=np.uint16),
+        'attempts': np.array([min(int(row[4] or 1), MAX_ATTEMPTS) for _, row in rows], dtype=np.uint16),
+        'last_attempt': np.array([parse_timestamp(row[0]) for _, row in rows], dtype=np.int64),
+        'signature': _signature(log_path),
+    }
+    path = error_index_path(log_path)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'wb') as f:
+        np.savez(f, **arrays)
+    os.replace(temp_path, path)
+    logger.debug(f"Saved error index {path} ({len(rows)} entries)")
+    return path
+
+
+class ErrorIndex:
+    """
+    Typed error log as parallel arrays (one element per logged key).
+    """
+
+    def __init__(self, keys: np.ndarray, codes: np.ndarray, statuses: np.ndarray,
+                 attempts: np.ndarray, last_attempt: np.ndarray):
+        self.key_array = keys
+        self.codes = codes
+        self.statuses = statuses
+        self.attempts = attempts
+        self.last_attempt = last_attempt
+
+    def __len__(self) -> int:
+        return len(self.key_array)
+
+    def mask(self, error_type: Union[str, Iterable[str], None] = None, http_status: Optional[int] = None,
+             since: Union[str, datetime, float, None] = None, min_attempts: Optional[int] = None,
+             permanent: Optional[bool] = None) -> np.ndarray:
+        """
+        Boolean selection over the entries (all filters are combined with AND).
+
+        Args:
+            error_type: One error type or several
+            http_status: HTTP status code
+            since: Last attempt at or after this time
+            min_attempts: At least this many attempts
+            permanent: True for permanent failures, False for transient ones
+        """
+        selected = np.ones(len(self), dtype=bool)
+        if error_type is not None:
+            types = [error_type] if isinstance(error_type, str) else list(error_type)
+            selected &= np.isin(self.codes, [error_types.error_code(t) for t in types])
+        if http_status is not None:
+            selected &= self.statuses == http_status
+        if since is not None:
+            selected &= self.last_attempt >= parse_timestamp(since)
+        if min_attempts is not None:
+            selected &= self.attempts >= min_attempts
+        if permanent is not None:
+            permanent_codes = [error_types.error_code(t) for t in error_types.PERMANENT_ERROR_TYPES]
+            selected &= np.isin(self.codes, permanent_codes) == permanent
+        return selected
+
+    def keys(self, **filters) -> set:
+        """Keys matching the filters of mask()."""
+        return set(self.key_array[self.mask(**filters)].tolist())
+
+    def by_type(self) -> Dict[str, set]:
+        """Error type -> set of keys."""
+        order = np.argsort(self.codes, kind='stable')
+        codes = self.codes[order]
+        keys = self.key_array[order]
+        bounds = np.flatnonzero(np.diff(codes)) + 1
+        result = {}
+        for start, end in zip(np.r_[0, bounds], np.r_[bounds, len(codes)]):
+            if end > start:
+                error_type = error_types.ERROR_TYPES_BY_CODE.get(int(codes[start]), error_types.UNKNOWN_ERROR)
+                result[error_type] = set(keys[start:end].tolist())
+        return result
+
+    def by_status(self) -> Dict[int, set]:
+        """HTTP status -> set of keys (failures without a status are left out)."""
+        return {int(status): set(self.key_array[self.statuses == status].tolist())
+                for status in np.unique(self.statuses) if status}
+
+
+def _from_entries(entries: Dict[object, Sequence[str]]) -> ErrorIndex:
+    keys = list(entries)
+    key_array = (np.array(keys, dtype=np.int64) if keys and all(isinstance(k, int) for k in keys)
+                 else np.array([str(k) for k in keys], dtype=str))
+    rows = list(entries.values())
+    return ErrorIndex(
+        key_array,
+        np.array([error_types.error_code(row[2]) for row in rows], dtype=np.uint8),
+        np.array([int(row[3]) if row[3] else 0 for row in rows], dtype=np.uint16),
+        np.array([min(int(row[4] or 1), MAX_ATTEMPTS) for row in rows], dtype=np.uint16),
+        np.array([parse_timestamp(row[0]) for row in rows], dtype=np.int64),
+    )
+
+
+def load_error_index(log_path: str, key_type: Callable = str, key_column: Optional[str] = None) -> ErrorIndex:
+    """
+    Compact index of an error log, rebuilt from the CSV if it is missing or stale.
+
+    Args:
+        log_path: Error log CSV
+        key_type: Converts key text back to a key (int for indices)
+        key_column: Key column name (default: the second column of the CSV)
+
+    Returns:
+        ErrorIndex (empty if there is no log)
+    """
+    path = error_index_path(log_path)
+    if os.path.exists(path):
+        try:
+            with np.load(path, allow_pickle=False) as archive:
+                if np.array_equal(archive['signature'], _signature(log_path)):
+                    return ErrorIndex(archive['keys'], archive['codes'], archive['statuses'],
+                                      archive['attempts'], archive['last_attempt'])
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable error index {path}: {e}")
+    if key_column is None and os.path.exists(log_path):
+        with open(log_path, 'r', newline='', encoding='utf-8') as f:
+            header = next(csv.reader(f), [])
+        key_column = header[1] if len(header) > 1 else 'Index'
+    _, entries = read_error_log_rows(log_path, key_column or 'Index', key_type)
+    if entries:
+        try:
+            write_error_index(log_path, entries)
+        except OSError as e:
+            logger.warning(f"Could not save error index {path}: {e}")
+    return _from_entries(entries)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Query the scraping error logs by error code, HTTP status, attempts and time',
+        epilog='Examples:\n'
+               '  python hitachi_website_error_index.py summary crossref\n'
+               '  python hitachi_website_error_index.py keys crossref --status 500 --since "2026-10-15 18:00"\n'
+               '  python hitachi_website_error_index.py keys catalog --type TIMEOUT --min-attempts 2 --output retry.txt\n',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('command', choices=['summary', 'keys'],
+                        help='summary: counts per error type and HTTP status; keys: list matching keys')
+    parser.add_argument('kind', choices=['crossref', 'catalog'], help='Which error log')
+    parser.add_argument('--type', dest='error_type', action='append', default=None,
+                        choices=sorted(error_types.ERROR_CODES), help='Error type (repeatable)')
+    parser.add_argument('--status', type=int, default=None, help='HTTP status code')
+    parser.add_argument('--since', default=None, help='Last attempt at or after "YYYY-MM-DD[ HH:MM[:SS]]"')
+    parser.add_argument('--min-attempts', type=int, default=None, help='At least this many attempts')
+    parser.add_argument('--permanent', action='store_true', help='Permanent failures only')
+    parser.add_argument('--transient', action='store_true', help='Transient failures only')
+    parser.add_argument('--output', default=None, help='keys: write one key per line (for the batch scrapers\' --file)')
+    args = parser.parse_args()
+
+    if args.kind == 'crossref':
+        import hitachi_website_data_scraper as scraper
+    else:
+        import hitachi_website_catalog_scraper as scraper
+
+    if not os.path.exists(scraper.ERROR_LOG_CSV):
+        print(f"✗ No error log at {scraper.ERROR_LOG_CSV}")
+        sys.exit(1)
+    try:
+        filters = dict(error_type=args.error_type, http_status=args.status, since=args.since,
+                       min_attempts=args.min_attempts,
+                       permanent=True if args.permanent else False if args.transient else None)
+        started = time.time()
+        errors = scraper.get_error_index()
+        selected = errors.mask(**filters)
+    except ValueError as e:
+        parser.error(str(e))
+    elapsed = time.time() - started
+
+    if args.command == 'keys':
+        keys = sorted(errors.key_array[selected].tolist())
+        lines = [str(key) for key in keys]
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                f.write('\n'.join(lines) + ('\n' if lines else ''))
+            print(f"✓ Wrote {len(lines)} keys to {args.output}")
+        else:
+            print('\n'.join(lines))
+        return
+
+    print(f"\n{'='*70}")
+    print(f"Error Log Summary - {scraper.ERROR_LOG_CSV}")
+    print(f"{'='*70}")
+    print(f"{'Error type':<20} {'Kind':<10} {'Keys':>7} {'Attempts':>9}  HTTP statuses")
+    for code in sorted(set(errors.codes[selected].tolist())):
+        in_code = selected & (errors.codes == code)
+        error_type = error_types.ERROR_TYPES_BY_CODE.get(code, error_types.UNKNOWN_ERROR)
+        kind = 'permanent' if error_types.is_permanent_error(error_type) else 'transient'
+        statuses, counts = np.unique(errors.statuses[in_code], return_counts=True)
+        detail = ', '.join(f"{s}: {c}" for s, c in zip(statuses.tolist(), counts.tolist()) if s)
+        print(f"{error_type:<20} {kind:<10} {int(in_code.sum()):>7} {int(errors.attempts[in_code].sum()):>9}  {detail}")
+    print(f"\n📊 {int(selected.sum())} of {len(errors)} logged keys, loaded and filtered in {elapsed * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    main()
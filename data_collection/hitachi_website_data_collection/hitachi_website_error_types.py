@@ -0,0 +1,136 @@
+"""
+Hitachi Website Scraping Error Types
+
+Enumerated error types shared by the cross-reference and catalog scrapers, and
+their classification into permanent and transient failures.
+
+Permanent failures (the page really has no usable bushing data) are skipped on
+later runs. Transient failures (timeouts, connection problems, server errors)
+are retried within the same run and stay eligible on the next run until they
+either succeed or turn into a permanent failure.
+
+Every type also has a fixed numeric code (ERROR_CODES) for the compact error
+log index, and HTTP failures carry their status code. An HTTP error status picks
+its type (http_error_type): 5xx and 429 are transient HTTP_ERROR, any other 4xx
+is the permanent HTTP_CLIENT_ERROR.
+
+Author: Data Collection System
+Date: October 16, 2026
+Version: 1.2 - HTTP error type chosen by status code (4xx permanent)
+"""
+
+import re
+from typing import Optional
+
+# Error types (see PERFORMANCE_IMPROVEMENTS.md)
+NO_DATA = 'NO_DATA'
+NO_BUSHING_FOUND = 'NO_BUSHING_FOUND'
+HTTP_404 = 'HTTP_404'
+HTTP_403 = 'HTTP_403'
+EMPTY_RESPONSE = 'EMPTY_RESPONSE'
+TIMEOUT = 'TIMEOUT'
+CONNECTION_ERROR = 'CONNECTION_ERROR'
+HTTP_ERROR = 'HTTP_ERROR'
+HTTP_CLIENT_ERROR = 'HTTP_CLIENT_ERROR'
+REQUEST_ERROR = 'REQUEST_ERROR'
+PARSE_FAILED = 'PARSE_FAILED'
+UNKNOWN_ERROR = 'UNKNOWN_ERROR'
+
+# Failures that will not change on refetch - skipped on later runs
+PERMANENT_ERROR_TYPES = frozenset({NO_BUSHING_FOUND, HTTP_404, NO_DATA, HTTP_CLIENT_ERROR})
+
+# Everything else is worth retrying
+TRANSIENT_ERROR_TYPES = frozenset({
+    HTTP_403, EMPTY_RESPONSE, TIMEOUT, CONNECTION_ERROR, HTTP_ERROR,
+    REQUEST_ERROR, PARSE_FAILED, UNKNOWN_ERROR
+})
+
+# Numeric codes (append only - stored in compact error log indexes); they match
+# the failure statuses of hitachi_website_status_map.py
+ERROR_CODES = {
+    NO_DATA: 2, NO_BUSHING_FOUND: 3, HTTP_404: 4, HTTP_403: 5, EMPTY_RESPONSE: 6,
+    TIMEOUT: 7, CONNECTION_ERROR: 8, HTTP_ERROR: 9, REQUEST_ERROR: 10,
+    PARSE_FAILED: 11, UNKNOWN_ERROR: 12, HTTP_CLIENT_ERROR: 13,
+}
+ERROR_TYPES_BY_CODE = {code: error_type for error_type, code in ERROR_CODES.items()}
+
+# 'Page not found (HTTP 404)', 'HTTP error 500: 500 Server Error: ...'
+HTTP_STATUS_PATTERN = re.compile(r'HTTP (?:error )?(\d{3})\b')
+
+
+def error_code(error_type: Optional[str]) -> int:
+    """Numeric code of an error type (unknown or missing types map to UNKNOWN_ERROR)."""
+    return ERROR_CODES.get(error_type, ERROR_CODES[UNKNOWN_ERROR])
+
+
+def http_status_of_message(error_message) -> Optional[int]:
+    """HTTP status code named in an error message, or None."""
+    match = HTTP_STATUS_PATTERN.search(str(error_message) if error_message is not None else '')
+    return int(match.group(1)) if match else None
+
+
+def http_error_type(status: int) -> str:
+    """
+    Error type of an HTTP error status: 5xx and 429 (rate limited) are worth
+    retrying, any other 4xx will not change on refetch.
+
+    Args:
+        status: HTTP status code (400 or above)
+
+    Returns:
+        HTTP_404, HTTP_403, HTTP_ERROR or HTTP_CLIENT_ERROR
+    """
+    if status == 404:
+        return HTTP_404
+    if status == 403:
+        return HTTP_403
+    if status >= 500 or status == 429:
+        return HTTP_ERROR
+    return HTTP_CLIENT_ERROR
+
+
+def is_permanent_error(error_type: Optional[str]) -> bool:
+    """True if the error type is a permanent failure."""
+    return error_type in PERMANENT_ERROR_TYPES
+
+
+def is_transient_error(error_type: Optional[str]) -> bool:
+    """True if the error type is a transient failure (unknown types count as transient)."""
+    return error_type is not None and error_type not in PERMANENT_ERROR_TYPES
+
+
+def classify_error_message(error_message) -> str:
+    """
+    Derive the error type from a free-text Error_Message.
+    Used for error log rows written before the Error_Type column existed.
+
+    Args:
+        error_message: Error message as written by log_error_to_csv
+
+    Returns:
+        One of the error type constants
+    """
+    message = str(error_message) if error_message is not None else ''
+
+    if 'HTTP 404' in message:
+        return HTTP_404
+    if 'HTTP 403' in message:
+        return HTTP_403
+    if 'No bushing found' in message:
+        return NO_BUSHING_FOUND
+    if 'All fields empty' in message or 'field empty' in message:
+        return NO_DATA
+    if 'Empty or too short' in message:
+        return EMPTY_RESPONSE
+    if 'timeout' in message.lower():
+        return TIMEOUT
+    if 'Network connection error' in message:
+        return CONNECTION_ERROR
+    if message.startswith('HTTP error'):
+        status = http_status_of_message(message)
+        return http_error_type(status) if status is not None else HTTP_ERROR
+    if message.startswith('Request exception'):
+        return REQUEST_ERROR
+    if 'parser returned None' in message:
+        return PARSE_FAILED
+    return UNKNOWN_ERROR
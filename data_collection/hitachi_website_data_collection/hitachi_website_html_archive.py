@@ -0,0 +1,588 @@
+"""
+Hitachi Website Raw HTML Archive
+
+Append-only compressed pack file for the raw HTML pages, used instead of one
+loose file per page with --raw-storage archive. The cross-reference and catalog
+folders hold thousands of ~17 KB pages that are almost entirely the same page
+chrome; compressed one by one against a shared dictionary taken from the
+corpus, a page shrinks to a few hundred bytes, and saving or deleting a page is
+one append to an open file instead of an open/stat/unlink.
+
+Pages are stored under their raw HTML file name (Hitachi_website_bushing_<key>.html),
+so the archive and the raw HTML folder are interchangeable. The folder
+cross_reference_data/ is archived as cross_reference_data.pack, with the offset
+index in cross_reference_data.pack.idx.
+
+File layout:
+    header   magic, codec (zlib or zstd), dictionary length, dictionary
+    records  op (put/delete), key, compressed page, original length, CRC32
+A later record of a name replaces the earlier one. The offset index (name ->
+offset, length) is written next to the pack when it is closed; on open the
+records appended after it are scanned, so a pack that was not closed cleanly is
+still read completely (a torn last record is dropped).
+
+Compression uses zstd with a trained dictionary when the optional zstandard
+package is installed, otherwise zlib (deflate) with a preset dictionary: the
+sample page that compresses the other samples best.
+
+Usage:
+    python hitachi_website_html_archive.py import crossref
+    python hitachi_website_html_archive.py import catalog --remove-files
+    python hitachi_website_html_archive.py extract crossref 42131 --output page.html
+    python hitachi_website_html_archive.py stats crossref
+    python hitachi_website_html_archive.py repack crossref
+    python hitachi_website_data_batch_scraper.py --start 1 --end 50000 --raw-storage archive
+
+Author: Data Collection System
+Date: October 16, 2026
+Version: 1.1 - Import from fan-out raw HTML folders
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import struct
+import sys
+import threading
+import zlib
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import zstandard
+except ImportError:  # optional, zlib is used without it
+    zstandard = None
+
+from hitachi_website_raw_layout import iter_raw_files, raw_file_paths
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_SUFFIX = ".pack"
+INDEX_SUFFIX = ".idx"
+
+MAGIC = b'HWHTMLPK'
+FORMAT_VERSION = 1
+HEADER_FORMAT = '<8sBBHI'                 # magic, version, codec, reserved, dictionary length
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+RECORD_FORMAT = '<BBHIII'                 # op, reserved, name length, data length, original length, CRC32
+RECORD_SIZE = struct.calcsize(RECORD_FORMAT)
+
+CODEC_ZLIB = 1
+CODEC_ZSTD = 2
+CODEC_NAMES = {CODEC_ZLIB: 'zlib', CODEC_ZSTD: 'zstd'}
+
+OP_PUT = 1
+OP_DELETE = 2
+
+ZLIB_LEVEL = 9
+ZLIB_WINDOW = 32768                       # deflate only looks back 32 KB into the dictionary
+ZSTD_LEVEL = 19
+ZSTD_DICT_SIZE = 112640
+
+DICTIONARY_SAMPLES = 200                  # pages sampled to pick/train the dictionary
+ZLIB_CANDIDATES = 8                       # sample pages tried as the zlib dictionary
+
+
+def archive_path(directory: str) -> str:
+    """Pack file that stands in for a raw HTML folder (cross_reference_data -> cross_reference_data.pack)."""
+    return os.path.normpath(directory) + ARCHIVE_SUFFIX
+
+
+def default_codec() -> int:
+    """zstd when the zstandard package is installed, zlib otherwise."""
+    return CODEC_ZSTD if zstandard is not None else CODEC_ZLIB
+
+
+def _zlib_compress(data: bytes, dictionary: bytes) -> bytes:
+    compressor = zlib.compressobj(ZLIB_LEVEL, zlib.DEFLATED, -15, 9, zlib.Z_DEFAULT_STRATEGY, dictionary)
+    return compressor.compress(data) + compressor.flush()
+
+
+def train_dictionary(samples: List[bytes], codec: Optional[int] = None) -> bytes:
+    """
+    Build the shared compression dictionary from sample pages.
+
+    Args:
+        samples: Page bodies (a few hundred is plenty)
+        codec: CODEC_ZLIB or CODEC_ZSTD (default: default_codec())
+
+    Returns:
+        Dictionary bytes (empty if there are no samples)
+    """
+    samples = [s for s in samples if s]
+    if not samples:
+        return b''
+    codec = codec or default_codec()
+    if codec == CODEC_ZSTD:
+        try:
+            return zstandard.train_dictionary(ZSTD_DICT_SIZE, samples).as_bytes()
+        except zstandard.ZstdError as e:
+            # Too few samples to train on: use a page as raw-content dictionary
+            logger.info(f"zstd dictionary training failed ({e}) - using a sample page")
+            return samples[0][-ZSTD_DICT_SIZE:]
+
+    # Deflate has no trained dictionaries; the best preset is a typical page
+    step = max(1, len(samples) // ZLIB_CANDIDATES)
+    candidates = [s[-ZLIB_WINDOW:] for s in samples[::step][:ZLIB_CANDIDATES]]
+    probe = samples[:64]
+    return min(candidates, key=lambda d: sum(len(_zlib_compress(s, d)) for s in probe))
+
+
+class HtmlArchive:
+    """
+    Append-only pack of compressed pages with an in-memory offset index.
+    Safe to use from several threads; put/get/delete are O(1).
+    """
+
+    def __init__(self, path: str, dictionary: Optional[bytes] = None, codec: Optional[int] = None,
+                 readonly: bool = False):
+        """
+        Args:
+            path: Pack file (.pack); created on the first put if missing
+            dictionary: Dictionary for a new pack (default: the first page stored)
+            codec: Codec for a new pack (default: default_codec())
+            readonly: Open an existing pack for reading only
+
+        Raises:
+            FileNotFoundError: If readonly and the pack does not exist
+            ValueError: If the file is not a pack or needs an unavailable codec
+        """
+        self.path = path
+        self.index_path = path + INDEX_SUFFIX
+        self.readonly = readonly
+        self.codec = codec or default_codec()
+        self.dictionary = dictionary
+        self.records = 0
+        self._entries: Dict[str, Tuple[int, int, int, int]] = {}   # name -> (offset, length, original, crc)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._file = None
+        self._reader = None
+        self._read_lock = threading.Lock()
+        self._size = 0
+        self._header_crc = 0
+        self._dirty = False
+
+        if os.path.exists(path):
+            self._open()
+        elif readonly:
+            raise FileNotFoundError(path)
+
+    # ------------------------------------------------------------------ #
+    # Opening
+    # ------------------------------------------------------------------ #
+
+    def _open(self):
+        self._reader = open(self.path, 'rb')
+        header = self._read_at(0, HEADER_SIZE)
+        if len(header) < HEADER_SIZE:
+            raise ValueError(f"{self.path} is not an HTML archive")
+        magic, version, codec, _, dictionary_length = struct.unpack(HEADER_FORMAT, header)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"{self.path} is not an HTML archive (or has an unknown version)")
+        if codec == CODEC_ZSTD and zstandard is None:
+            raise ValueError(f"{self.path} is zstd-compressed; install the zstandard package to read it")
+        self.codec = codec
+        self.dictionary = self._read_at(HEADER_SIZE, dictionary_length)
+        start = HEADER_SIZE + dictionary_length
+        self._header_crc = zlib.crc32(header + self.dictionary)
+
+        start = self._load_index(start)
+        end = self._scan(start)
+        if not self.readonly:
+            self._file = open(self.path, 'r+b')
+            if end < os.fstat(self._reader.fileno()).st_size:
+                logger.warning(f"{self.path}: dropping a torn record at offset {end}")
+                self._file.truncate(end)
+            self._file.seek(end)
+        self._size = end
+
+    def _load_index(self, start: int) -> int:
+        """Load the saved offset index; returns where the scan for newer records starts."""
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+            size = saved['size']
+            if saved['header'] != self._header_crc or not start <= size <= os.fstat(self._reader.fileno()).st_size:
+                return start
+            self._entries = {name: tuple(entry) for name, entry in saved['entries'].items()}
+            self.records = saved['records']
+            return size
+        except (OSError, ValueError, KeyError):
+            return start
+
+    def _scan(self, offset: int) -> int:
+        """Index the records from offset to the end; returns the end of the last complete record."""
+        file_size = os.fstat(self._reader.fileno()).st_size
+        while offset + RECORD_SIZE <= file_size:
+            op, _, name_length, length, original, crc = struct.unpack(
+                RECORD_FORMAT, self._read_at(offset, RECORD_SIZE))
+            data_offset = offset + RECORD_SIZE + name_length
+            if op not in (OP_PUT, OP_DELETE) or data_offset + length > file_size:
+                break
+            name = self._read_at(offset + RECORD_SIZE, name_length).decode('utf-8')
+            if op == OP_PUT:
+                self._entries[name] = (data_offset, length, original, crc)
+            else:
+                self._entries.pop(name, None)
+            self.records += 1
+            self._dirty = True
+            offset = data_offset + length
+        return offset
+
+    def _create(self, first_page: bytes):
+        """Write the header of a new pack (dictionary defaults to the first page)."""
+        if self.dictionary is None:
+            self.dictionary = first_page[-(ZLIB_WINDOW if self.codec == CODEC_ZLIB else ZSTD_DICT_SIZE):]
+        if self.codec == CODEC_ZSTD and zstandard is None:
+            raise ValueError("zstd archives need the zstandard package")
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        header = struct.pack(HEADER_FORMAT, MAGIC, FORMAT_VERSION, self.codec, 0, len(self.dictionary))
+        self._header_crc = zlib.crc32(header + self.dictionary)
+        self._file = open(self.path, 'w+b')
+        self._file.write(header)
+        self._file.write(self.dictionary)
+        self._file.flush()
+        self._reader = open(self.path, 'rb')
+        self._size = self._file.tell()
+        if os.path.exists(self.index_path):
+            os.remove(self.index_path)
+
+    def _read_at(self, offset: int, length: int) -> bytes:
+        with self._read_lock:
+            self._reader.seek(offset)
+            return self._reader.read(length)
+
+    # ------------------------------------------------------------------ #
+    # Codec
+    # ------------------------------------------------------------------ #
+
+    def _compress(self, data: bytes) -> bytes:
+        if self.codec == CODEC_ZLIB:
+            return _zlib_compress(data, self.dictionary)
+        compressor = getattr(self._local, 'compressor', None)
+        if compressor is None:
+            compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL,
+                                                  dict_data=zstandard.ZstdCompressionDict(self.dictionary))
+            self._local.compressor = compressor
+        return compressor.compress(data)
+
+    def _decompress(self, data: bytes) -> bytes:
+        if self.codec == CODEC_ZLIB:
+            decompressor = zlib.decompressobj(-15, self.dictionary)
+            return decompressor.decompress(data) + decompressor.flush()
+        decompressor = getattr(self._local, 'decompressor', None)
+        if decompressor is None:
+            decompressor = zstandard.ZstdDecompressor(dict_data=zstandard.ZstdCompressionDict(self.dictionary))
+            self._local.decompressor = decompressor
+        return decompressor.decompress(data)
+
+    # ------------------------------------------------------------------ #
+    # Access
+    # ------------------------------------------------------------------ #
+
+    def _append(self, op: int, name: str, data: bytes = b'', original: int = 0):
+        encoded = name.encode('utf-8')
+        crc = zlib.crc32(data)
+        record = struct.pack(RECORD_FORMAT, op, 0, len(encoded), len(data), original, crc) + encoded + data
+        self._file.write(record)
+        self._file.flush()
+        data_offset = self._size + RECORD_SIZE + len(encoded)
+        if op == OP_PUT:
+            self._entries[name] = (data_offset, len(data), original, crc)
+        else:
+            self._entries.pop(name, None)
+        self._size += len(record)
+        self.records += 1
+        self._dirty = True
+
+    def put(self, name: str, page) -> int:
+        """
+        Store a page under its raw HTML file name (replaces an earlier copy).
+
+        Args:
+            name: Raw HTML file name
+            page: Page text (str, stored as UTF-8) or bytes
+
+        Returns:
+            Compressed size in bytes
+        """
+        if self.readonly:
+            raise ValueError(f"{self.path} is open read-only")
+        data = page.encode('utf-8') if isinstance(page, str) else page
+        with self._lock:
+            if self._file is None:
+                self._create(data)
+        compressed = self._compress(data)
+        with self._lock:
+            self._append(OP_PUT, name, compressed, len(data))
+        return len(compressed)
+
+    def delete(self, name: str) -> bool:
+        """Remove a page; True if it was stored."""
+        with self._lock:
+            if name not in self._entries:
+                return False
+            self._append(OP_DELETE, name)
+            return True
+
+    def get_bytes(self, name: str) -> Optional[bytes]:
+        """
+        Stored page bytes, or None if the name is not in the archive.
+
+        Raises:
+            ValueError: If the stored record is corrupt (CRC mismatch)
+        """
+        entry = self._entries.get(name)
+        if entry is None:
+            return None
+        offset, length, _, crc = entry
+        data = self._read_at(offset, length)
+        if zlib.crc32(data) != crc:
+            raise ValueError(f"{self.path}: corrupt record for {name}")
+        return self._decompress(data)
+
+    def get(self, name: str) -> Optional[str]:
+        """Stored page text (UTF-8), or None if the name is not in the archive."""
+        data = self.get_bytes(name)
+        return None if data is None else data.decode('utf-8', errors='replace')
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def names(self) -> List[str]:
+        """Names of the stored pages."""
+        return list(self._entries)
+
+    def stats(self) -> dict:
+        """Pages, records, pack size and stored vs. original bytes."""
+        stored = sum(entry[1] for entry in self._entries.values())
+        original = sum(entry[2] for entry in self._entries.values())
+        return {
+            'codec': CODEC_NAMES.get(self.codec, str(self.codec)),
+            'pages': len(self._entries),
+            'records': self.records,
+            'dictionary_bytes': len(self.dictionary or b''),
+            'file_bytes': self._size,
+            'stored_bytes': stored,
+            'original_bytes': original,
+        }
+
+    # ------------------------------------------------------------------ #
+    # Closing
+    # ------------------------------------------------------------------ #
+
+    def _save_index(self):
+        temp_path = self.index_path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({'header': self._header_crc, 'size': self._size, 'records': self.records,
+                       'entries': self._entries}, f)
+        os.replace(temp_path, self.index_path)
+        self._dirty = False
+
+    def flush(self):
+        """Force appended records to disk and save the offset index."""
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+                os.fsync(self._file.fileno())
+            if self._reader is not None and self._dirty and not self.readonly:
+                self._save_index()
+
+    def close(self):
+        """Flush, save the offset index and close the pack."""
+        self.flush()
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            if self._reader is not None:
+                self._reader.close()
+                self._reader = None
+
+
+def remove_archive(path: str) -> bool:
+    """Delete a pack and its offset index; True if the pack existed."""
+    existed = os.path.exists(path)
+    for file_path in (path, path + INDEX_SUFFIX):
+        if os.path.exists(file_path):
+            os.remove(file_path)
+    return existed
+
+
+def list_html_files(directory: str) -> List[str]:
+    """Names of the .html files in a raw HTML folder (flat or fanned out into buckets)."""
+    return sorted(name for name, _ in iter_raw_files(directory))
+
+
+def import_directory(directory: str, path: Optional[str] = None, remove_files: bool = False,
+                     samples: int = DICTIONARY_SAMPLES) -> dict:
+    """
+    Pack every raw HTML file of a folder. A new pack gets a dictionary trained
+    on a random sample of the pages; an existing one keeps its dictionary.
+
+    Args:
+        directory: Raw HTML folder
+        path: Pack file (default: archive_path(directory))
+        remove_files: Delete each file once the pack holding it is on disk
+        samples: Pages sampled for the dictionary
+
+    Returns:
+        Dict with pages imported and byte counts
+    """
+    path = path or archive_path(directory)
+    files = raw_file_paths(directory)
+    names = sorted(files)
+    dictionary = None
+    if names and not os.path.exists(path):
+        sample_names = random.Random(0).sample(names, min(samples, len(names)))
+        sample_pages = []
+        for name in sample_names:
+            with open(files[name], 'rb') as f:
+                sample_pages.append(f.read())
+        dictionary = train_dictionary(sample_pages)
+
+    archive = HtmlArchive(path, dictionary=dictionary)
+    original = 0
+    try:
+        for name in names:
+            with open(files[name], 'rb') as f:
+                page = f.read()
+            archive.put(name, page)
+            original += len(page)
+    finally:
+        archive.close()
+
+    if remove_files:
+        for name in names:
+            os.remove(files[name])
+    stats = archive.stats()
+    stats.update({'imported': len(names), 'imported_bytes': original})
+    return stats
+
+
+def copy_archive(source: str, destination: str) -> int:
+    """
+    Append every page of one pack to another (created with the source's
+    dictionary and codec if missing).
+
+    Returns:
+        Number of pages copied
+    """
+    reader = HtmlArchive(source, readonly=True)
+    writer = HtmlArchive(destination, dictionary=reader.dictionary, codec=reader.codec)
+    try:
+        for name in reader.names():
+            writer.put(name, reader.get_bytes(name))
+        return len(reader)
+    finally:
+        reader.close()
+        writer.close()
+
+
+def repack(path: str) -> dict:
+    """
+    Rewrite a pack with only the current copy of each page (drops replaced and
+    deleted records), then swap it in atomically.
+
+    Returns:
+        Stats of the rewritten pack
+    """
+    temp_path = path + ".repack"
+    remove_archive(temp_path)
+    if not copy_archive(path, temp_path):
+        remove_archive(temp_path)
+        raise ValueError(f"{path} holds no pages - delete it instead")
+    os.replace(temp_path, path)
+    os.replace(temp_path + INDEX_SUFFIX, path + INDEX_SUFFIX)
+    archive = HtmlArchive(path, readonly=True)
+    try:
+        return archive.stats()
+    finally:
+        archive.close()
+
+
+def _format_stats(stats: dict) -> str:
+    ratio = stats['original_bytes'] / stats['stored_bytes'] if stats.get('stored_bytes') else 0
+    return (f"{stats['pages']} pages in {stats['records']} records, codec {stats['codec']}, "
+            f"pack {stats['file_bytes'] / 1e6:.1f} MB "
+            f"(pages {stats['original_bytes'] / 1e6:.1f} MB -> {stats['stored_bytes'] / 1e6:.1f} MB, {ratio:.1f}x)")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Pack, inspect and extract the raw HTML archives',
+        epilog='Examples:\n'
+               '  python hitachi_website_html_archive.py import crossref\n'
+               '  python hitachi_website_html_archive.py import catalog --remove-files\n'
+               '  python hitachi_website_html_archive.py extract crossref 42131 --output page.html\n'
+               '  python hitachi_website_html_archive.py stats crossref\n'
+               '  python hitachi_website_html_archive.py repack crossref\n',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('command', choices=['import', 'extract', 'stats', 'repack'],
+                        help='import: pack the raw HTML folder; extract: write one page; '
+                             'stats: sizes; repack: drop replaced/deleted records')
+    parser.add_argument('kind', choices=['crossref', 'catalog'], help='Which raw HTML folder')
+    parser.add_argument('key', nargs='?', help='extract: index or style number')
+    parser.add_argument('--output', default=None, help='extract: file to write (default: stdout)')
+    parser.add_argument('--remove-files', action='store_true',
+                        help='import: delete the loose HTML files after packing them')
+    args = parser.parse_args()
+
+    if args.kind == 'crossref':
+        import hitachi_website_data_scraper as scraper
+    else:
+        import hitachi_website_catalog_scraper as scraper
+    path = archive_path(scraper.RAW_DATA_DIR)
+
+    if args.command == 'import':
+        stats = import_directory(scraper.RAW_DATA_DIR, path, remove_files=args.remove_files)
+        if not stats['imported']:
+            print(f"✗ No HTML files in {scraper.RAW_DATA_DIR}/")
+            sys.exit(1)
+        print(f"✓ Imported {stats['imported']} files from {scraper.RAW_DATA_DIR}/ into {path}")
+        print(f"  {_format_stats(stats)}")
+        if args.remove_files:
+            print(f"  ✓ Removed {stats['imported']} loose HTML files")
+        return
+
+    if not os.path.exists(path):
+        print(f"✗ No archive at {path}")
+        sys.exit(1)
+
+    if args.command == 'repack':
+        print(f"✓ Repacked {path}: {_format_stats(repack(path))}")
+        return
+
+    archive = HtmlArchive(path, readonly=True)
+    try:
+        if args.command == 'stats':
+            print(f"{path}: {_format_stats(archive.stats())}")
+            return
+        if args.key is None:
+            parser.error('extract needs an index or style number')
+        key = int(args.key) if args.kind == 'crossref' else args.key
+        page = archive.get_bytes(scraper.raw_html_filename(key))
+        if page is None:
+            print(f"✗ {scraper.raw_html_filename(key)} is not in {path}")
+            sys.exit(1)
+        if args.output:
+            with open(args.output, 'wb') as f:
+                f.write(page)
+            print(f"✓ Wrote {len(page)} bytes to {args.output}")
+        else:
+            sys.stdout.buffer.write(page)
+    finally:
+        archive.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    main()
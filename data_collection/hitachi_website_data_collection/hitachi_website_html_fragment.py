@@ -0,0 +1,310 @@
+"""
+Hitachi Website Boilerplate-Stripped HTML Fragments
+
+Optional raw HTML content mode (--raw-content fragment) that saves only the part
+of a page the parsers read instead of the whole page. Most of every saved page
+is shared site layout: the <HEAD> with its style sheet, comments, images,
+presentation attributes, spacer rows and indentation, and on cross-reference
+pages the dimensional comparison tables below the Replacement Information
+section. A fragment keeps the body's tags and text (and link targets) without
+all of that:
+
+    <!-- fragment template=363965efbea5dbdd -->
+    <BODY>
+    ...
+    <TR>
+    <TD><B>Original Bushing Manufacturer:</B></TD>
+    <TD>PCORE&nbsp;</TD>
+    ...
+
+The part before <BODY> (doctype, head, style sheet) is the site template. It is
+stored once per site, as Hitachi_website_template_<fingerprint>.html next to the
+pages (or in the archive), and each fragment names the fingerprint of the
+template it was cut from, so a change of the site layout shows up as a new
+template.
+
+A fragment is only saved when parse_bushing_info / parse_catalog_info return
+exactly the same record for it as for the full page; otherwise the full page is
+kept. Fragments are read by the unchanged parsers, so offline reparsing works on
+either.
+
+Usage:
+    python hitachi_website_data_batch_scraper.py --start 1 --end 50000 --raw-content fragment
+    python hitachi_website_html_fragment.py convert crossref
+    python hitachi_website_html_fragment.py convert catalog --dry-run
+
+Author: Data Collection System
+Date: October 16, 2026
+Version: 1.1 - Fan-out raw HTML folders
+"""
+
+import argparse
+import hashlib
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from typing import Callable, Optional, Tuple
+
+from bs4 import BeautifulSoup
+
+from hitachi_website_html_archive import HtmlArchive, archive_path
+from hitachi_website_raw_layout import find_raw_file, raw_file_path, raw_file_paths
+
+logger = logging.getLogger(__name__)
+
+TEMPLATE_PREFIX = "Hitachi_website_template_"
+FRAGMENT_HEADER = "<!-- fragment template={} -->\n"
+FRAGMENT_HEADER_RE = re.compile(r'^<!-- fragment template=([0-9a-f]+) -->')
+
+BODY_START = re.compile(r'<body\b', re.I)
+BOILERPLATE = re.compile(r'<!--.*?-->|<script\b.*?</script\s*>|<style\b.*?</style\s*>|<img\b[^>]*>', re.I | re.S)
+START_TAG = re.compile(r'<([A-Za-z][A-Za-z0-9]*)(\s[^<>]*?)?(/?)>')
+HREF = re.compile(r'''\shref\s*=\s*("[^"]*"|'[^']*'|[^\s>]+)''', re.I)
+BETWEEN_TAGS = re.compile(r'>\s+<')
+SPACER_ROW = re.compile(r'<tr>\s*<td>(?:&nbsp;|\s)*</td>\s*</tr>', re.I)
+TABLE_END = '</table>'
+
+
+def _strip_attributes(match: re.Match) -> str:
+    """Start tag without attributes (links keep their href)."""
+    name = match.group(1)
+    if name.lower() == 'a' and match.group(2):
+        href = HREF.search(match.group(2))
+        if href:
+            return f'<{name} href={href.group(1)}>'
+    return f'<{name}{match.group(3)}>'
+
+
+def template_name(fingerprint: str) -> str:
+    """Raw HTML file name of a site template."""
+    return f"{TEMPLATE_PREFIX}{fingerprint}.html"
+
+
+def split_template(html: str) -> Tuple[str, str]:
+    """
+    Split a page into its site template (everything before <BODY>) and body.
+
+    Returns:
+        Tuple of (template, body); the template is empty if there is no <BODY>
+    """
+    match = BODY_START.search(html)
+    if not match:
+        return '', html
+    return html[:match.start()], html[match.start():]
+
+
+def fingerprint(template: str) -> str:
+    """Short SHA-256 fingerprint of a site template."""
+    return hashlib.sha256(template.encode('utf-8')).hexdigest()[:16]
+
+
+def make_fragment(html: str, cut_after: Optional[str] = None) -> Tuple[str, str, Optional[str]]:
+    """
+    Strip the boilerplate from a page.
+
+    Args:
+        html: Full page
+        cut_after: Drop everything after the table holding this label
+            (the cross-reference pages end with "ABB Style Number")
+
+    Returns:
+        Tuple of (fragment, template fingerprint, template); the template is
+        None if the page already was a fragment (e.g. served by the replay server)
+    """
+    existing = fragment_template(html)
+    if existing:
+        html = html[len(FRAGMENT_HEADER.format(existing)):]
+    template, body = split_template(html)
+    body = BOILERPLATE.sub('', body)
+    body = START_TAG.sub(_strip_attributes, body)
+    body = BETWEEN_TAGS.sub('>\n<', body)
+    body = SPACER_ROW.sub('', body)
+    if cut_after:
+        label = body.find(cut_after)
+        end = body.lower().find(TABLE_END, label) if label != -1 else -1
+        if end != -1:
+            body = body[:end + len(TABLE_END)] + '\n</BODY>\n</HTML>\n'
+    if existing:
+        return FRAGMENT_HEADER.format(existing) + body, existing, None
+    template_fingerprint = fingerprint(template)
+    return FRAGMENT_HEADER.format(template_fingerprint) + body, template_fingerprint, template
+
+
+def fragment_template(html: str) -> Optional[str]:
+    """Template fingerprint of a saved fragment, or None for a full page."""
+    match = FRAGMENT_HEADER_RE.match(html)
+    return match.group(1) if match else None
+
+
+def verified_fragment(html: str, parse: Callable[[BeautifulSoup], Optional[dict]],
+                      expected: Optional[dict] = None,
+                      cut_after: Optional[str] = None) -> Optional[Tuple[str, str, Optional[str]]]:
+    """
+    Fragment of a page, if the parser reads the same record from it.
+
+    Args:
+        html: Full page
+        parse: Parser taking a soup (e.g. lambda soup: parse_bushing_info(soup, index))
+        expected: Record parsed from the full page (parsed here if not given)
+        cut_after: See make_fragment()
+
+    Returns:
+        Tuple of (fragment, fingerprint, template), or None if the records differ
+    """
+    if expected is None:
+        expected = parse(BeautifulSoup(html.encode('utf-8'), 'lxml'))
+    fragment, template_fingerprint, template = make_fragment(html, cut_after)
+    if parse(BeautifulSoup(fragment.encode('utf-8'), 'lxml')) != expected:
+        return None
+    return fragment, template_fingerprint, template
+
+
+class TemplateStore:
+    """
+    Remembers which site templates are already saved in a raw HTML location, so
+    each is written once.
+    """
+
+    def __init__(self):
+        self._saved = set()
+        self._lock = threading.Lock()
+
+    def ensure(self, location: str, template_fingerprint: str, exists: Callable[[str], bool],
+               write: Callable[[str], None]) -> None:
+        """
+        Save a template unless it is already there (or was seen before in this process).
+
+        Args:
+            location: Raw HTML folder (or archive) the template belongs to
+            template_fingerprint: Fingerprint of the template
+            exists: Tells whether a raw HTML name is stored in the location
+            write: Stores the template under its name
+        """
+        key = (os.path.abspath(location), template_fingerprint)
+        with self._lock:
+            if key in self._saved:
+                return
+            self._saved.add(key)
+        name = template_name(template_fingerprint)
+        if not exists(name):
+            write(name)
+            logger.info(f"Saved site template {name} in {location}")
+
+
+def _parser_for(kind: str, name: str):
+    """Parse function and cut-off label for a raw HTML file name."""
+    key = name[len("Hitachi_website_bushing_"):-len(".html")]
+    if kind == 'crossref':
+        import hitachi_website_data_scraper as scraper
+        return (lambda soup: scraper.parse_bushing_info(soup, int(key))), scraper.FRAGMENT_CUT_AFTER
+    import hitachi_website_catalog_scraper as scraper
+    return (lambda soup: scraper.parse_catalog_info(soup, key)), scraper.FRAGMENT_CUT_AFTER
+
+
+def convert(kind: str, directory: str, dry_run: bool = False) -> dict:
+    """
+    Replace the full pages of a raw HTML folder and its archive with verified
+    fragments (pages whose fragment parses differently stay as they are).
+
+    Args:
+        kind: 'crossref' or 'catalog'
+        directory: Raw HTML folder
+        dry_run: Only report what would change
+
+    Returns:
+        Dict with page and byte counts
+    """
+    stats = {'pages': 0, 'converted': 0, 'kept': 0, 'already': 0, 'bytes_before': 0, 'bytes_after': 0}
+    templates = TemplateStore()
+    started = time.time()
+
+    def convert_page(name: str, html: str, exists: Callable[[str], bool],
+                     write: Callable[[str, str], None], location: str):
+        stats['pages'] += 1
+        size = len(html.encode('utf-8'))
+        stats['bytes_before'] += size
+        if fragment_template(html) or not name.startswith("Hitachi_website_bushing_"):
+            stats['already'] += 1
+            stats['bytes_after'] += size
+            return
+        parse, cut_after = _parser_for(kind, name)
+        result = verified_fragment(html, parse, cut_after=cut_after)
+        if result is None:
+            stats['kept'] += 1
+            stats['bytes_after'] += size
+            return
+        fragment, template_fingerprint, template = result
+        stats['converted'] += 1
+        stats['bytes_after'] += len(fragment.encode('utf-8'))
+        if not dry_run:
+            templates.ensure(location, template_fingerprint, exists, lambda n: write(n, template))
+            write(name, fragment)
+        if stats['pages'] % 500 == 0:
+            print(f"  {stats['pages']} pages ({time.time() - started:.0f} s)")
+
+    def write_file(name: str, content: str):
+        path = find_raw_file(directory, name) or raw_file_path(directory, name, create=True)
+        with open(path + ".tmp", 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(path + ".tmp", path)
+
+    for name, path in sorted(raw_file_paths(directory).items()):
+        with open(path, 'r', encoding='utf-8') as f:
+            html = f.read()
+        convert_page(name, html, lambda n: find_raw_file(directory, n) is not None, write_file, directory)
+
+    path = archive_path(directory)
+    if os.path.exists(path):
+        archive = HtmlArchive(path, readonly=dry_run)
+        try:
+            for name in archive.names():
+                convert_page(name, archive.get(name), archive.__contains__, archive.put, path)
+        finally:
+            archive.close()
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Replace saved raw HTML pages with boilerplate-stripped fragments',
+        epilog='Examples:\n'
+               '  python hitachi_website_html_fragment.py convert crossref\n'
+               '  python hitachi_website_html_fragment.py convert catalog --dry-run\n',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('command', choices=['convert'],
+                        help='convert: rewrite the raw HTML folder and archive as verified fragments')
+    parser.add_argument('kind', choices=['crossref', 'catalog'], help='Which raw HTML folder')
+    parser.add_argument('--dry-run', action='store_true', help='Only report the savings')
+    args = parser.parse_args()
+
+    if args.kind == 'crossref':
+        import hitachi_website_data_scraper as scraper
+    else:
+        import hitachi_website_catalog_scraper as scraper
+
+    # The parsers log a warning for every missing field; only the summary matters here
+    logging.getLogger(scraper.__name__).setLevel(logging.ERROR)
+    stats = convert(args.kind, scraper.RAW_DATA_DIR, args.dry_run)
+    if not stats['pages']:
+        print(f"✗ No raw HTML in {scraper.RAW_DATA_DIR}/ or {archive_path(scraper.RAW_DATA_DIR)}")
+        sys.exit(1)
+    ratio = stats['bytes_before'] / stats['bytes_after'] if stats['bytes_after'] else 0
+    print(f"\n{'='*70}")
+    print(f"Fragment Conversion {'(dry run) ' if args.dry_run else ''}- {args.kind}")
+    print(f"{'='*70}")
+    print(f"Pages: {stats['pages']}")
+    print(f"Converted: {stats['converted']}")
+    print(f"Kept as full page (fragment parses differently): {stats['kept']}")
+    print(f"Already fragments or templates: {stats['already']}")
+    print(f"Size: {stats['bytes_before'] / 1e6:.1f} MB -> {stats['bytes_after'] / 1e6:.1f} MB ({ratio:.1f}x)")
+    if not args.dry_run and os.path.exists(archive_path(scraper.RAW_DATA_DIR)):
+        print(f"\nRun `python hitachi_website_html_archive.py repack {args.kind}` to drop the replaced pages from the archive")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    main()
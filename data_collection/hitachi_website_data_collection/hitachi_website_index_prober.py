@@ -0,0 +1,427 @@
+"""
+Hitachi Website Sparse Index Prober
+
+Discovery mode for BushingCrossReferenceBU.asp sweeps. Most of the INDEX space is
+empty (valid indices come in dense clusters with long empty stretches between
+them), so probing every index wastes most requests on "No bushing found" pages.
+
+The prober splits the index range into blocks and:
+  1. Samples a few evenly spaced indices per block. Indices already in the master
+     CSV (hits) or logged as permanent failures (misses) count as free samples.
+  2. Estimates the density of valid indices per block and visits blocks from the
+     densest to the sparsest.
+  3. Fills in dense blocks completely. Sparse blocks are probed at low resolution
+     (every --stride-th index); the neighbourhood of a hit is then filled in,
+     following the cluster until it runs out.
+
+Valid records are saved to the master CSV and raw HTML folder exactly as the batch
+scraper does; misses go to the error log. After every block it prints the
+estimated number of valid indices in the range, the coverage so far and an ETA
+for the remaining plan.
+
+Usage:
+    python hitachi_website_index_prober.py --start 1 --end 50000 --sample-only
+    python hitachi_website_index_prober.py --start 1 --end 50000 --delay 0.5
+    python hitachi_website_index_prober.py --start 1 --end 50000 --delay 0.1 --workers 4 --budget 5000
+    python hitachi_website_index_prober.py --start 1 --end 50000 --block-size 1000 --stride 50
+
+Author: Data Collection System
+Date: October 16, 2026
+Version: 1.0 - Density-sampling sparse index prober
+"""
+
+import argparse
+import math
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set
+
+import numpy as np
+
+from hitachi_website_data_scraper import (
+    scrape_bushing_data,
+    get_last_error_type,
+    logger,
+    OUTPUT_CSV
+)
+from hitachi_website_data_batch_scraper import record_result, open_status_map, close_status_map
+from hitachi_website_status_map import STATUS_OK, PERMANENT_STATUSES
+from hitachi_website_error_types import is_permanent_error
+from hitachi_website_rate_limiter import RateLimiter
+from hitachi_website_csv_writer import close_all_writers
+from scraping_http_client import configure_pools, DEFAULT_POOL_MAXSIZE
+
+# Beta(0.5, 0.5) prior for the per-block density estimate, so a block with a
+# handful of samples and no hits is "probably sparse", not "certainly empty"
+PRIOR_HITS = 0.5
+PRIOR_MISSES = 0.5
+
+
+@dataclass
+class Block:
+    """A contiguous slice of the index range and what is known about it."""
+    start: int
+    end: int  # inclusive
+    hits: Set[int] = field(default_factory=set)
+    misses: Set[int] = field(default_factory=set)
+    failed: Set[int] = field(default_factory=set)  # transient errors - unknown
+
+    @property
+    def size(self) -> int:
+        return self.end - self.start + 1
+
+    @property
+    def probed(self) -> int:
+        return len(self.hits) + len(self.misses)
+
+    @property
+    def density(self) -> float:
+        """Posterior mean of the fraction of valid indices in the block."""
+        return (len(self.hits) + PRIOR_HITS) / (self.probed + PRIOR_HITS + PRIOR_MISSES)
+
+    def is_known(self, index: int) -> bool:
+        return index in self.hits or index in self.misses or index in self.failed
+
+    def unknown(self, indices=None) -> List[int]:
+        """Indices of the block (or of `indices`) that have not been probed yet."""
+        candidates = range(self.start, self.end + 1) if indices is None else indices
+        return [i for i in candidates if self.start <= i <= self.end and not self.is_known(i)]
+
+    def estimated_hits(self) -> float:
+        """Known hits plus the expected number of hits among unprobed indices."""
+        unprobed = self.size - self.probed - len(self.failed)
+        return len(self.hits) + self.density * unprobed
+
+
+class IndexProber:
+    """
+    Density-driven prober for the cross-reference INDEX space.
+    """
+
+    def __init__(self, start: int, end: int, block_size: int = 500, samples: int = 8,
+                 stride: int = 25, dense_threshold: float = 0.1, delay: float = 1.0,
+                 workers: int = 1, budget: Optional[int] = None, seed: Optional[int] = None):
+        """
+        Args:
+            start: First index of the range (inclusive)
+            end: Last index of the range (inclusive)
+            block_size: Indices per density block
+            samples: Sampled indices per block before blocks are ranked
+            stride: Spacing of the low-resolution probe in sparse blocks
+            dense_threshold: Estimated density at or above which a block is filled in completely
+            delay: Delay in seconds between requests (global budget across workers)
+            workers: Number of concurrent fetch workers
+            budget: Maximum number of requests (None for no limit)
+            seed: Random seed for the sample offsets (reproducible plans)
+        """
+        self.start = start
+        self.end = end
+        self.block_size = block_size
+        self.samples = samples
+        self.stride = max(1, stride)
+        self.dense_threshold = dense_threshold
+        self.delay = delay
+        self.workers = workers
+        self.budget = budget
+        self.random = random.Random(seed)
+
+        self.blocks = [
+            Block(s, min(s + block_size - 1, end)) for s in range(start, end + 1, block_size)
+        ]
+        self.limiter = RateLimiter.from_delay(delay)
+        self.executor = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+        self.requests = 0
+        self.found = 0
+        self.started = time.monotonic()
+
+    # ------------------------------------------------------------------ #
+    # Known results
+    # ------------------------------------------------------------------ #
+
+    def load_known(self) -> int:
+        """
+        Seed the blocks with indices already scraped (hits) or logged as
+        permanent failures (misses), read from the index status map. These
+        never cost a request.
+
+        Returns:
+            Number of known indices inside the range
+        """
+        statuses = open_status_map().statuses(self.start, self.end)
+        hits = np.flatnonzero(statuses == STATUS_OK) + self.start
+        misses = np.flatnonzero(np.isin(statuses, list(PERMANENT_STATUSES))) + self.start
+
+        for index in hits.tolist():
+            self._block_of(index).hits.add(index)
+        for index in misses.tolist():
+            self._block_of(index).misses.add(index)
+        known = len(hits) + len(misses)
+
+        logger.info(f"Loaded {known} known indices in range {self.start}-{self.end}")
+        return known
+
+    def _block_of(self, index: int) -> Optional[Block]:
+        if index < self.start or index > self.end:
+            return None
+        return self.blocks[(index - self.start) // self.block_size]
+
+    # ------------------------------------------------------------------ #
+    # Probing
+    # ------------------------------------------------------------------ #
+
+    def _fetch(self, index: int):
+        self.limiter.acquire()
+        return scrape_bushing_data(index)
+
+    def _out_of_budget(self) -> bool:
+        return self.budget is not None and self.requests >= self.budget
+
+    def probe(self, indices: List[int]) -> List[int]:
+        """
+        Fetch a list of indices and record each outcome in its block.
+        Valid records are saved to the master CSV.
+
+        Args:
+            indices: Unprobed indices to fetch (truncated to the remaining budget)
+
+        Returns:
+            Indices that turned out to be valid
+        """
+        if self.budget is not None:
+            indices = indices[:max(0, self.budget - self.requests)]
+        if not indices:
+            return []
+
+        if self.executor:
+            results = self.executor.map(self._fetch, indices)
+        else:
+            results = map(self._fetch, indices)
+
+        new_hits = []
+        for index, bushing_data in zip(indices, results):
+            self.requests += 1
+            block = self._block_of(index)
+            if record_result(index, bushing_data, 'append'):
+                block.hits.add(index)
+                new_hits.append(index)
+                self.found += 1
+            elif bushing_data is None and is_permanent_error(get_last_error_type(index)):
+                block.misses.add(index)
+            else:
+                block.failed.add(index)
+        return new_hits
+
+    def sample_positions(self, block: Block) -> List[int]:
+        """
+        Evenly spaced sample positions with a random offset (stratified sampling).
+
+        Args:
+            block: Block to sample
+
+        Returns:
+            Unprobed indices to fetch (empty if the block already has enough samples)
+        """
+        needed = self.samples - block.probed
+        if needed <= 0:
+            return []
+        step = block.size / self.samples
+        offset = self.random.random() * step
+        positions = sorted({block.start + int(offset + k * step) for k in range(self.samples)})
+        return block.unknown(positions)[:needed]
+
+    def fill(self, block: Block, seeds: List[int]) -> None:
+        """
+        Fill in the neighbourhood of each hit (+/- stride), following new hits
+        until the cluster runs out.
+
+        Args:
+            block: Block being filled
+            seeds: Hits whose neighbourhood should be probed
+        """
+        frontier = list(seeds)
+        while frontier and not self._out_of_budget():
+            hit = frontier.pop()
+            window = block.unknown(range(hit - self.stride, hit + self.stride + 1))
+            frontier.extend(self.probe(window))
+
+    # ------------------------------------------------------------------ #
+    # Planning and reporting
+    # ------------------------------------------------------------------ #
+
+    def is_dense(self, block: Block) -> bool:
+        return block.density >= self.dense_threshold
+
+    def planned_requests(self, block: Block) -> int:
+        """Expected number of further requests the plan will spend on a block."""
+        unknown = block.size - block.probed - len(block.failed)
+        if self.is_dense(block):
+            return unknown
+        coarse = len(block.unknown(range(block.start, block.end + 1, self.stride)))
+        # A cluster costs about twice its hits plus one stride of misses on each side
+        expected_fill = 2 * block.density * unknown + 2 * self.stride if block.hits else 0
+        return int(min(unknown, coarse + expected_fill))
+
+    def estimated_total(self) -> float:
+        return sum(block.estimated_hits() for block in self.blocks)
+
+    def seconds_per_request(self) -> float:
+        elapsed = time.monotonic() - self.started
+        if self.requests:
+            return elapsed / self.requests
+        return self.delay if self.delay > 0 else 0.5
+
+    def report(self, remaining_blocks: List[Block]) -> str:
+        """One-line progress summary: known hits, estimated total, coverage and ETA."""
+        known_hits = sum(len(block.hits) for block in self.blocks)
+        estimated = self.estimated_total()
+        remaining = sum(self.planned_requests(block) for block in remaining_blocks)
+        if self.budget is not None:
+            remaining = min(remaining, max(0, self.budget - self.requests))
+        eta = remaining * self.seconds_per_request()
+        coverage = known_hits / estimated * 100 if estimated > 0 else 100.0
+        return (f"{known_hits} valid indices known, ~{estimated:.0f} estimated in range "
+                f"({coverage:.1f}% coverage) | {self.requests} requests made, "
+                f"~{remaining} planned, ETA {format_duration(eta)}")
+
+    def print_density_table(self, blocks: List[Block]) -> None:
+        print(f"\n{'Block':>15}  {'Probed':>6}  {'Hits':>5}  {'Density':>7}  {'Est. valid':>10}  Plan")
+        for block in blocks:
+            plan = "fill" if self.is_dense(block) else f"stride {self.stride}"
+            print(f"{block.start:>7}-{block.end:<7}  {block.probed:>6}  {len(block.hits):>5}  "
+                  f"{block.density:>7.1%}  {block.estimated_hits():>10.0f}  {plan}")
+
+    # ------------------------------------------------------------------ #
+    # Driver
+    # ------------------------------------------------------------------ #
+
+    def ranked_blocks(self) -> List[Block]:
+        return sorted(self.blocks, key=lambda block: block.density, reverse=True)
+
+    def run(self, sample_only: bool = False) -> Dict[str, float]:
+        """
+        Sample every block, then probe blocks from the densest to the sparsest.
+
+        Args:
+            sample_only: Stop after the sampling phase and print the estimate
+
+        Returns:
+            Dict with requests made, valid indices found and the estimated total
+        """
+        try:
+            self.load_known()
+
+            print(f"\n🔎 Sampling {len(self.blocks)} blocks of {self.block_size} indices "
+                  f"({self.samples} samples per block)")
+            for block in self.blocks:
+                if self._out_of_budget():
+                    break
+                self.probe(self.sample_positions(block))
+
+            ranked = self.ranked_blocks()
+            self.print_density_table(ranked)
+            print(f"\n📊 {self.report(ranked)}")
+
+            if not sample_only:
+                for position, block in enumerate(ranked):
+                    if self._out_of_budget():
+                        logger.info(f"Request budget of {self.budget} reached")
+                        print(f"\n⚠  Request budget of {self.budget} reached")
+                        break
+
+                    if self.is_dense(block):
+                        logger.info(f"Filling dense block {block.start}-{block.end} ({block.density:.1%})")
+                        self.probe(block.unknown())
+                    else:
+                        logger.info(f"Probing sparse block {block.start}-{block.end} at stride {self.stride}")
+                        coarse = block.unknown(range(block.start, block.end + 1, self.stride))
+                        self.fill(block, list(block.hits) + self.probe(coarse))
+
+                    print(f"📊 Block {block.start}-{block.end} done | {self.report(ranked[position + 1:])}")
+        finally:
+            if self.executor:
+                self.executor.shutdown(wait=True, cancel_futures=True)
+            close_all_writers()
+            close_status_map()
+
+        return {
+            'requests': self.requests,
+            'found': self.found,
+            'known_valid': sum(len(block.hits) for block in self.blocks),
+            'estimated_total': self.estimated_total(),
+            'elapsed': time.monotonic() - self.started,
+        }
+
+
+def format_duration(seconds: float) -> str:
+    """Format seconds as e.g. '2h 05m', '4m 10s' or '12s'."""
+    seconds = int(math.ceil(seconds))
+    if seconds >= 3600:
+        return f"{seconds // 3600}h {seconds % 3600 // 60:02d}m"
+    if seconds >= 60:
+        return f"{seconds // 60}m {seconds % 60:02d}s"
+    return f"{seconds}s"
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Sparse index prober for Hitachi Energy cross-reference sweeps',
+        epilog='Examples:\n'
+               '  python hitachi_website_index_prober.py --start 1 --end 50000 --sample-only\n'
+               '  python hitachi_website_index_prober.py --start 1 --end 50000 --delay 0.5\n'
+               '  python hitachi_website_index_prober.py --start 1 --end 50000 --delay 0.1 --workers 4 --budget 5000\n',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('--start', type=int, required=True, help='Starting index (inclusive)')
+    parser.add_argument('--end', type=int, required=True, help='Ending index (inclusive)')
+    parser.add_argument('--block-size', type=int, default=500,
+                       help='Indices per density block (default: 500)')
+    parser.add_argument('--samples', type=int, default=8,
+                       help='Sampled indices per block before blocks are ranked (default: 8)')
+    parser.add_argument('--stride', type=int, default=25,
+                       help='Spacing of the low-resolution probe in sparse blocks (default: 25)')
+    parser.add_argument('--dense-threshold', type=float, default=0.1,
+                       help='Estimated density at which a block is filled in completely (default: 0.1)')
+    parser.add_argument('--delay', type=float, default=1.0,
+                       help='Delay in seconds between requests (default: 1.0)')
+    parser.add_argument('--workers', type=int, default=1,
+                       help='Number of concurrent fetch workers sharing the --delay budget (default: 1)')
+    parser.add_argument('--budget', type=int, default=None,
+                       help='Stop after this many requests (default: no limit)')
+    parser.add_argument('--sample-only', action='store_true',
+                       help='Only sample the blocks and print the density estimate')
+    parser.add_argument('--seed', type=int, default=None,
+                       help='Random seed for sample positions (default: random)')
+
+    args = parser.parse_args()
+
+    if args.start > args.end:
+        parser.error('--start must be less than or equal to --end')
+    if args.block_size < 1 or args.samples < 1 or args.workers < 1:
+        parser.error('--block-size, --samples and --workers must be at least 1')
+
+    configure_pools(pool_maxsize=max(DEFAULT_POOL_MAXSIZE, args.workers))
+
+    prober = IndexProber(
+        args.start, args.end, args.block_size, args.samples, args.stride,
+        args.dense_threshold, args.delay, args.workers, args.budget, args.seed
+    )
+    result = prober.run(sample_only=args.sample_only)
+
+    logger.info(f"Probe completed: {result['requests']} requests, {result['found']} new valid indices")
+    print(f"\n{'='*70}")
+    print(f"Index Probe Complete{' (sample only)' if args.sample_only else ''}")
+    print(f"{'='*70}")
+    print(f"Index Range: {args.start} to {args.end}")
+    print(f"Requests Made: {result['requests']}")
+    print(f"New Valid Indices: {result['found']}")
+    print(f"Known Valid Indices: {result['known_valid']}")
+    print(f"Estimated Valid Indices: {result['estimated_total']:.0f}")
+    print(f"Elapsed: {format_duration(result['elapsed'])}")
+    if result['found'] > 0:
+        print(f"\n✓ Data saved to: {OUTPUT_CSV}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,289 @@
+"""
+Hitachi Website Parse Result Cache
+
+Optional persistent cache (--parse-cache) of parsed page records, so a page that
+was parsed before is not parsed again. An overwrite-mode refresh refetches pages
+that mostly have not changed, and a repeated reparse reads the same saved pages;
+with the cache both only hash the page and look the record up.
+
+Records are stored in a SQLite database next to the raw HTML folder
+(cross_reference_data.parse_cache.db, catalog_data.parse_cache.db), keyed on
+
+    (parser version, SHA-256 of the page bytes, page key)
+
+The page key is part of the key because the record carries it (Website Index /
+Style Number). The parser version combines the scraper's PARSE_VERSION, the
+selected parser, a fingerprint of the scraper module's source and the bs4/lxml
+versions. Editing the parser, bumping PARSE_VERSION or upgrading the HTML
+libraries therefore gives a new version, and opening the cache with a new
+version drops every entry of the old ones. The cache is bounded to
+`max_entries` records; beyond that the least recently used are evicted. Lookups
+and inserts are buffered and committed in batches, and the database runs in WAL
+mode, so the reparse worker processes can share it.
+
+Usage:
+    python hitachi_website_data_batch_scraper.py --start 1 --end 50000 --mode overwrite --parse-cache
+    python hitachi_website_reparse.py catalog --parse-cache
+    python hitachi_website_parse_cache.py stats catalog
+    python hitachi_website_parse_cache.py clear crossref
+
+Author: Data Collection System
+Date: October 16, 2026
+Version: 1.0 - Content-hash keyed parse result cache
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Callable, Iterable, Optional, Tuple, Union
+
+import bs4
+from lxml import etree
+
+logger = logging.getLogger(__name__)
+
+CACHE_SUFFIX = '.parse_cache.db'
+DEFAULT_MAX_ENTRIES = 200000
+EVICT_TO = 0.9                  # evict down to this fraction of max_entries
+
+
+def cache_path(directory: str) -> str:
+    """Parse cache of a raw HTML folder (cross_reference_data -> cross_reference_data.parse_cache.db)."""
+    return os.path.normpath(directory) + CACHE_SUFFIX
+
+
+def parser_version(kind: str, parse_version: int, parser: str, source_files: Iterable[str]) -> str:
+    """
+    Version of a parser for the cache key.
+
+    Args:
+        kind: 'crossref' or 'catalog'
+        parse_version: PARSE_VERSION of the scraper
+        parser: Parser in use (e.g. 'fast' or 'soup')
+        source_files: Modules whose code produces the records
+
+    Returns:
+        Version such as "crossref-1-fast-3f2a9c0e1b2d"
+    """
+    digest = hashlib.sha256()
+    for path in source_files:
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    digest.update(f"bs4 {bs4.__version__} lxml {etree.LXML_VERSION}".encode('ascii'))
+    return f"{kind}-{parse_version}-{parser}-{digest.hexdigest()[:12]}"
+
+
+def page_digest(page: Union[str, bytes]) -> bytes:
+    """SHA-256 of a page (text is hashed as UTF-8)."""
+    return hashlib.sha256(page.encode('utf-8') if isinstance(page, str) else page).digest()
+
+
+class ParseCache:
+    """
+    (parser version, page SHA-256, page key) -> parsed record, in SQLite.
+    """
+
+    def __init__(self, path: str, version: str, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 batch_size: int = 100, commit_interval: float = 2.0):
+        """
+        Args:
+            path: Database file (created if missing)
+            version: Parser version (parser_version()); entries of other versions are dropped
+            max_entries: Records kept; the least recently used are evicted beyond that
+            batch_size: Commit after this many buffered inserts and lookups
+            commit_interval: ... or after this many seconds, whichever comes first
+        """
+        self.path = path
+        self.version = version
+        self.max_entries = max(1, max_entries)
+        self.batch_size = batch_size
+        self.commit_interval = commit_interval
+        self.hits = 0
+        self.misses = 0
+        self._inserts = {}      # (digest, key) -> (record JSON, last use)
+        self._touches = {}      # (digest, key) -> last use
+        self._lock = threading.Lock()
+        self._last_commit = time.monotonic()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._connection = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute('PRAGMA synchronous=NORMAL')
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS parse_cache (version TEXT NOT NULL, digest BLOB NOT NULL, "
+                "key TEXT NOT NULL, record TEXT NOT NULL, used REAL NOT NULL, PRIMARY KEY (version, digest, key))"
+            )
+            self._connection.execute("CREATE INDEX IF NOT EXISTS idx_parse_cache_used ON parse_cache (used)")
+            dropped = self._connection.execute("DELETE FROM parse_cache WHERE version != ?", (version,)).rowcount
+        if dropped:
+            logger.info(f"Parser changed - dropped {dropped} cached records of older versions from {path}")
+        self._entries = self._connection.execute("SELECT COUNT(*) FROM parse_cache").fetchone()[0]
+
+    def get(self, digest: bytes, key: str) -> Tuple[bool, Optional[dict]]:
+        """
+        Cached record of a page.
+
+        Returns:
+            Tuple of (found, record); the record is None for a page the parser failed on
+        """
+        entry = (digest, key)
+        with self._lock:
+            if entry in self._inserts:
+                return True, json.loads(self._inserts[entry][0])
+            row = self._connection.execute(
+                "SELECT record FROM parse_cache WHERE version = ? AND digest = ? AND key = ?",
+                (self.version, digest, key)
+            ).fetchone()
+            if row is None:
+                return False, None
+            self._touches[entry] = time.time()
+            self._maybe_commit()
+        return True, json.loads(row[0])
+
+    def put(self, digest: bytes, key: str, record: Optional[dict]) -> None:
+        """Cache the record of a page (buffered; committed in batches)."""
+        with self._lock:
+            self._inserts[(digest, key)] = (json.dumps(record), time.time())
+            self._maybe_commit()
+
+    def parse(self, page: Union[str, bytes], key, parse: Callable[[], Optional[dict]]) -> Optional[dict]:
+        """
+        Record of a page from the cache, or from parse() (then cached).
+
+        Args:
+            page: Page text or bytes the parser reads
+            key: Page key the record is parsed for
+            parse: Parses the page
+
+        Returns:
+            Parsed record (None if the parser failed)
+        """
+        digest = page_digest(page)
+        found, record = self.get(digest, str(key))
+        if found:
+            self.hits += 1
+            return record
+        self.misses += 1
+        record = parse()
+        self.put(digest, str(key), record)
+        return record
+
+    def _maybe_commit(self) -> None:
+        if (len(self._inserts) + len(self._touches) >= self.batch_size
+                or time.monotonic() - self._last_commit >= self.commit_interval):
+            self._commit()
+
+    def _commit(self) -> None:
+        if self._inserts or self._touches:
+            with self._connection:
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO parse_cache (version, digest, key, record, used) VALUES (?, ?, ?, ?, ?)",
+                    [(self.version, digest, key, record, used)
+                     for (digest, key), (record, used) in self._inserts.items()]
+                )
+                self._connection.executemany(
+                    "UPDATE parse_cache SET used = ? WHERE version = ? AND digest = ? AND key = ?",
+                    [(used, self.version, digest, key) for (digest, key), used in self._touches.items()]
+                )
+            self._entries += len(self._inserts)
+            self._inserts = {}
+            self._touches = {}
+            if self._entries > self.max_entries:
+                self._evict()
+        self._last_commit = time.monotonic()
+
+    def _evict(self) -> None:
+        """Drop the least recently used records down to EVICT_TO of max_entries."""
+        self._entries = self._connection.execute("SELECT COUNT(*) FROM parse_cache").fetchone()[0]
+        excess = self._entries - int(self.max_entries * EVICT_TO)
+        if self._entries <= self.max_entries or excess <= 0:
+            return
+        with self._connection:
+            self._connection.execute(
+                "DELETE FROM parse_cache WHERE rowid IN (SELECT rowid FROM parse_cache ORDER BY used LIMIT ?)",
+                (excess,)
+            )
+        self._entries -= excess
+        logger.info(f"Evicted {excess} least recently used records from {self.path}")
+
+    def commit(self) -> None:
+        """Write the buffered inserts and lookups in one transaction."""
+        with self._lock:
+            self._commit()
+
+    def close(self) -> None:
+        """Commit, checkpoint the WAL into the database file and close."""
+        with self._lock:
+            if self._connection is None:
+                return
+            self._commit()
+            self._connection.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+            self._connection.close()
+            self._connection = None
+        if self.hits or self.misses:
+            logger.info(f"Parse cache {self.path}: {self.hits} hits, {self.misses} misses")
+
+
+def read_stats(path: str) -> Tuple[int, dict]:
+    """Records per version of a cache file without opening it as a ParseCache (which drops old versions)."""
+    connection = sqlite3.connect(path)
+    try:
+        versions = dict(connection.execute("SELECT version, COUNT(*) FROM parse_cache GROUP BY version").fetchall())
+    finally:
+        connection.close()
+    return sum(versions.values()), versions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Inspect or clear the parse result caches',
+        epilog='Examples:\n'
+               '  python hitachi_website_parse_cache.py stats catalog\n'
+               '  python hitachi_website_parse_cache.py clear crossref\n',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('command', choices=['stats', 'clear'],
+                        help='stats: records per parser version; clear: delete the cache')
+    parser.add_argument('kind', choices=['crossref', 'catalog'], help='Which parse cache')
+    args = parser.parse_args()
+
+    if args.kind == 'crossref':
+        import hitachi_website_data_scraper as scraper
+    else:
+        import hitachi_website_catalog_scraper as scraper
+
+    path = scraper.parse_cache_path()
+    if not os.path.exists(path):
+        print(f"⊘ No parse cache at {path}")
+        return
+
+    if args.command == 'clear':
+        from hitachi_website_sqlite_store import remove_database
+        remove_database(path)
+        print(f"✓ Removed {path}")
+        return
+
+    entries, versions = read_stats(path)
+    current = scraper.parse_cache_version()
+    size = sum(os.path.getsize(path + suffix) for suffix in ('', '-wal') if os.path.exists(path + suffix))
+    print(f"\n{'='*70}")
+    print(f"Parse Cache - {path}")
+    print(f"{'='*70}")
+    print(f"Records: {entries} ({size / 1024 / 1024:.1f} MB)")
+    for version, count in sorted(versions.items()):
+        print(f"  {'✓' if version == current else '⊘'} {version}: {count}")
+    if current not in versions:
+        print(f"\nCurrent parser version {current} has no records yet")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    main()
@@ -0,0 +1,157 @@
+"""
+Hitachi Website Processed-Key Index
+
+In-memory record of which keys (indices or style numbers) already have data,
+built once per run from the master CSV (one streaming read) and the raw HTML
+folder (one os.scandir per bucket) or its archive (the archive's offset index). The batch scrapers used to answer every "already
+processed?" question by re-reading the whole master CSV and stat'ing the HTML
+file, which made the skip check O(rows) per key; with the index it is a set
+lookup. Records written during the run are added in place.
+
+A key counts as processed when its raw HTML page is saved or the master CSV has
+a row for it. For the catalog list, whose rows are created up front as empty
+placeholders, only rows with at least one populated field count.
+
+Usage:
+    index = ProcessedKeyIndex('Website Index', raw_html_filename, int)
+    index.load([(RAW_DATA_DIR, OUTPUT_CSV)])
+    if index.exists(42131): ...
+    index.mark_processed(42131)
+
+Author: Data Collection System
+Date: October 16, 2026
+Version: 1.2 - Fan-out raw HTML folders
+"""
+
+import csv
+import logging
+import os
+import threading
+from typing import Callable, Iterable, Tuple
+
+from hitachi_website_html_archive import HtmlArchive, archive_path
+from hitachi_website_raw_layout import iter_raw_files
+
+logger = logging.getLogger(__name__)
+
+# Strings pandas.read_csv treats as missing; a catalog row holding only these is a placeholder
+NA_VALUES = frozenset({
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND',
+    '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null'
+})
+
+
+class ProcessedKeyIndex:
+    """
+    Keys with data in the master CSV or the raw HTML folder.
+    """
+
+    def __init__(self, key_column: str, html_name: Callable[[object], str],
+                 key_type: Callable = str, populated_only: bool = False):
+        """
+        Args:
+            key_column: Key column of the master CSV
+            html_name: Raw HTML file name of a key
+            key_type: Converts key text from the CSV to a key (int for indices)
+            populated_only: Only count CSV rows with a populated non-key field
+        """
+        self.key_column = key_column
+        self.html_name = html_name
+        self.key_type = key_type
+        self.populated_only = populated_only
+        self.csv_keys = set()
+        self.html_names = set()
+        self._lock = threading.Lock()
+
+    def load(self, locations: Iterable[Tuple[str, str]]) -> 'ProcessedKeyIndex':
+        """
+        Read every (raw HTML folder, master CSV) location once.
+
+        Args:
+            locations: (raw HTML folder, master CSV) pairs
+
+        Returns:
+            self
+        """
+        for raw_data_dir, output_csv in locations:
+            self.add_raw_dir(raw_data_dir)
+            self.add_archive(archive_path(raw_data_dir))
+            self.add_csv(output_csv)
+        logger.info(f"Processed-key index: {len(self.csv_keys)} keys in CSV, {len(self.html_names)} raw HTML files")
+        return self
+
+    def add_raw_dir(self, directory: str) -> int:
+        """
+        Add the HTML files of a folder (one listing per bucket in the fan-out
+        layout, no per-file stat).
+
+        Returns:
+            Number of files added
+        """
+        names = {name for name, _ in iter_raw_files(directory)}
+        self.html_names |= names
+        return len(names)
+
+    def add_archive(self, path: str) -> int:
+        """
+        Add the pages of a raw HTML archive (names from its offset index).
+
+        Returns:
+            Number of pages added
+        """
+        if not os.path.exists(path):
+            return 0
+        try:
+            archive = HtmlArchive(path, readonly=True)
+        except ValueError as e:
+            logger.warning(f"Error indexing {path}: {e}")
+            return 0
+        try:
+            names = archive.names()
+        finally:
+            archive.close()
+        self.html_names.update(names)
+        return len(names)
+
+    def add_csv(self, path: str) -> int:
+        """
+        Add the keys of a master CSV (streamed, one pass).
+
+        Returns:
+            Number of rows whose key was added
+        """
+        if not os.path.exists(path):
+            return 0
+        added = 0
+        try:
+            with open(path, 'r', newline='', encoding='utf-8') as f:
+                reader = csv.reader(f)
+                header = next(reader, None)
+                if not header or self.key_column not in header:
+                    return 0
+                key_position = header.index(self.key_column)
+                for row in reader:
+                    if len(row) <= key_position or row[key_position] in NA_VALUES:
+                        continue
+                    if self.populated_only and not any(
+                            value not in NA_VALUES and value.strip()
+                            for position, value in enumerate(row) if position != key_position):
+                        continue
+                    try:
+                        self.csv_keys.add(self.key_type(row[key_position]))
+                    except ValueError:
+                        continue
+                    added += 1
+        except Exception as e:
+            logger.warning(f"Error indexing {path}: {e}")
+        return added
+
+    def exists(self, key) -> bool:
+        """True if the key has a master CSV row or a raw HTML file."""
+        return key in self.csv_keys or self.html_name(key) in self.html_names
+
+    def mark_processed(self, key) -> None:
+        """Record a key written during the run (CSV row and raw HTML file)."""
+        with self._lock:
+            self.csv_keys.add(key)
+            self.html_names.add(self.html_name(key))
@@ -0,0 +1,254 @@
+"""
+Hitachi Website Progress Journal
+
+Append-only, crash-safe record of a batch run. The first line is a JSON header
+describing the run (which keys, write mode, shard); every processed index or
+style number then gets one tab-separated line with its final outcome:
+
+    {"journal": 1, "kind": "crossref", "started": 1760600000.0, "params": {...}}
+    1<TAB>ok<TAB><TAB>1760600001.2
+    2<TAB>fail<TAB>NO_BUSHING_FOUND<TAB>1760600002.3
+    3<TAB>skip<TAB>exists<TAB>1760600002.3
+
+Lines are flushed as they are written and fsync'ed periodically, so a run that
+is killed loses at most the line being written (a torn last line is ignored on
+load). `--resume` rebuilds the key list from the header and continues with the
+keys that have no outcome yet, without rescanning the master CSV or the raw
+HTML folder. `--progress` reports the state of a run from the journal alone.
+
+Usage:
+    python hitachi_website_data_batch_scraper.py --start 1 --end 50000 --delay 0.5
+    python hitachi_website_data_batch_scraper.py --resume --delay 0.5
+    python hitachi_website_data_batch_scraper.py --progress
+    python hitachi_website_progress_journal.py hitachi_website_scraping_journal.log
+
+Author: Data Collection System
+Date: October 16, 2026
+Version: 1.0 - Append-only progress journal with resume
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_VERSION = 1
+
+# Final outcomes recorded per key
+OUTCOME_OK = 'ok'
+OUTCOME_FAIL = 'fail'
+OUTCOME_SKIP = 'skip'
+
+
+class ProgressJournal:
+    """
+    Writer for one run's journal file.
+    """
+
+    def __init__(self, path: str, fsync_every: int = 100, fsync_interval: float = 5.0):
+        """
+        Args:
+            path: Journal file path
+            fsync_every: Force the journal to disk after this many entries
+            fsync_interval: ... or after this many seconds, whichever comes first
+        """
+        self.path = path
+        self.fsync_every = fsync_every
+        self.fsync_interval = fsync_interval
+        self._file = None
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def start(self, kind: str, params: dict) -> None:
+        """
+        Begin a new run, replacing any previous journal at this path.
+
+        Args:
+            kind: 'crossref' or 'catalog'
+            params: Description of the run's key list and settings (JSON-serializable)
+        """
+        self._file = open(self.path, 'w', encoding='utf-8')
+        header = {'journal': JOURNAL_VERSION, 'kind': kind, 'started': time.time(), 'params': params}
+        self._file.write(json.dumps(header) + '\n')
+        self._sync()
+        logger.info(f"Started progress journal {self.path}")
+
+    def resume(self) -> None:
+        """Reopen an existing journal to append further outcomes."""
+        self._file = open(self.path, 'a', encoding='utf-8')
+        logger.info(f"Resuming progress journal {self.path}")
+
+    def record(self, key, outcome: str, detail: str = '') -> None:
+        """
+        Append the final outcome of one key.
+
+        Args:
+            key: Index or style number
+            outcome: OUTCOME_OK, OUTCOME_FAIL or OUTCOME_SKIP
+            detail: Error type or skip reason
+        """
+        if self._file is None:
+            return
+        self._file.write(f"{key}\t{outcome}\t{detail or ''}\t{time.time():.1f}\n")
+        self._file.flush()
+        self._unsynced += 1
+        if self._unsynced >= self.fsync_every or time.monotonic() - self._last_sync >= self.fsync_interval:
+            self._sync()
+
+    def _sync(self) -> None:
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._sync()
+            self._file.close()
+            self._file = None
+
+
+def load_journal(path: str, key_type=str) -> Tuple[dict, Dict[object, Tuple[str, str, float]]]:
+    """
+    Read a journal.
+
+    Args:
+        path: Journal file path
+        key_type: Converts key text back to a key (int for indices)
+
+    Returns:
+        Tuple of (header, {key: (outcome, detail, timestamp)}); the last entry
+        for a key wins
+
+    Raises:
+        FileNotFoundError: If there is no journal at path
+        ValueError: If the header is missing or unreadable
+    """
+    entries = {}
+    with open(path, 'r', encoding='utf-8') as f:
+        try:
+            header = json.loads(f.readline())
+        except json.JSONDecodeError:
+            raise ValueError(f"{path} is not a progress journal (bad header)")
+        if header.get('journal') != JOURNAL_VERSION:
+            raise ValueError(f"{path} is not a progress journal (version {header.get('journal')})")
+
+        for line in f:
+            if not line.endswith('\n'):
+                break  # torn last line from a crash
+            parts = line.rstrip('\n').split('\t')
+            if len(parts) != 4:
+                continue
+            key, outcome, detail, timestamp = parts
+            try:
+                entries[key_type(key)] = (outcome, detail, float(timestamp))
+            except ValueError:
+                continue
+    return header, entries
+
+
+def remaining_keys(keys: Iterable, entries: Dict) -> List:
+    """
+    Keys of the run that have no recorded outcome yet, in the original order.
+
+    Args:
+        keys: The run's full key sequence
+        entries: Outcomes loaded with load_journal()
+
+    Returns:
+        List of keys still to process
+    """
+    return [key for key in keys if key not in entries]
+
+
+def summarize(header: dict, entries: Dict, total: Optional[int] = None) -> dict:
+    """
+    Progress statistics from a journal.
+
+    Args:
+        header: Journal header
+        entries: Outcomes loaded with load_journal()
+        total: Number of keys in the run (None if unknown)
+
+    Returns:
+        Dict with done/total counts, outcome and error-type counts, rate and ETA
+    """
+    outcomes = Counter(outcome for outcome, _, _ in entries.values())
+    details = Counter(detail for outcome, detail, _ in entries.values() if outcome == OUTCOME_FAIL and detail)
+    timestamps = [timestamp for _, _, timestamp in entries.values()]
+
+    done = len(entries)
+    rate = None
+    eta = None
+    if timestamps:
+        elapsed = max(timestamps) - header.get('started', min(timestamps))
+        # Skips cost no request - only fetched keys give a meaningful rate
+        fetched = outcomes[OUTCOME_OK] + outcomes[OUTCOME_FAIL]
+        if elapsed > 0 and fetched:
+            rate = fetched / elapsed
+            if total is not None:
+                eta = (total - done) / rate
+    return {
+        'kind': header.get('kind'),
+        'params': header.get('params', {}),
+        'started': header.get('started'),
+        'last_update': max(timestamps) if timestamps else None,
+        'done': done,
+        'total': total,
+        'outcomes': dict(outcomes),
+        'error_types': dict(details.most_common()),
+        'rate': rate,
+        'eta': eta,
+    }
+
+
+def format_report(summary: dict) -> str:
+    """Human-readable multi-line progress report."""
+    lines = []
+    total = summary['total']
+    done = summary['done']
+    percent = f" ({done / total * 100:.1f}%)" if total else ""
+    lines.append(f"Run: {summary['kind']} {json.dumps(summary['params'], sort_keys=True)[:200]}")
+    if summary['started']:
+        lines.append(f"Started: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(summary['started']))}")
+    if summary['last_update']:
+        lines.append(f"Last update: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(summary['last_update']))}")
+    lines.append(f"Processed: {done}{f' of {total}' if total is not None else ''}{percent}")
+    outcomes = summary['outcomes']
+    lines.append(f"Successful: {outcomes.get(OUTCOME_OK, 0)} | Failed: {outcomes.get(OUTCOME_FAIL, 0)} | "
+                 f"Skipped: {outcomes.get(OUTCOME_SKIP, 0)}")
+    if summary['error_types']:
+        lines.append("Failures: " + ", ".join(f"{k} {v}" for k, v in summary['error_types'].items()))
+    if summary['rate']:
+        lines.append(f"Rate: {summary['rate']:.2f} pages/s")
+    if summary['eta'] is not None:
+        lines.append(f"ETA at that rate: {summary['eta'] / 60:.1f} min")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Report the progress of a batch run from its journal')
+    parser.add_argument('journal', help='Journal file (e.g. hitachi_website_scraping_journal.log)')
+    parser.add_argument('--json', action='store_true', help='Print the summary as JSON')
+    args = parser.parse_args()
+
+    try:
+        header, entries = load_journal(args.journal)
+    except (FileNotFoundError, ValueError) as e:
+        print(f"✗ {e}")
+        sys.exit(1)
+
+    params = header.get('params', {})
+    total = params.get('total')
+    summary = summarize(header, entries, total)
+    print(json.dumps(summary, indent=2) if args.json else format_report(summary))
+
+
+if __name__ == "__main__":
+    main()
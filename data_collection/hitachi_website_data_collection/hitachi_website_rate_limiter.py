@@ -0,0 +1,258 @@
+"""
+Hitachi Website Request Rate Limiter
+
+Thread-safe request pacing for the batch scrapers. A single RateLimiter is shared
+by every fetch worker so that the configured --delay becomes a global
+requests-per-second budget instead of a per-worker sleep.
+
+AdaptiveRateLimiter adds AIMD (additive-increase / multiplicative-decrease)
+control on top: it subscribes to request outcomes from the shared HTTP client,
+raises the rate step by step while responses are fast and successful, and cuts
+it multiplicatively on HTTP 5xx/429, timeouts, connection errors or latency
+spikes. At the end of a run it reports the rate it settled on.
+
+Author: Data Collection System
+Date: October 16, 2026
+Version: 1.1 - Added AIMD adaptive rate controller
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Optional
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """
+    Space request start times evenly so that all callers together stay within
+    a fixed requests-per-second budget.
+    """
+
+    def __init__(self, rate: float):
+        """
+        Args:
+            rate: Maximum requests per second across all workers (<= 0 disables pacing)
+        """
+        self._lock = threading.Lock()
+        self._next_slot = time.monotonic()
+        self.rate = rate
+
+    @classmethod
+    def from_delay(cls, delay: float) -> "RateLimiter":
+        """
+        Build a limiter from the batch scrapers' --delay value.
+
+        Args:
+            delay: Delay in seconds between requests (0 means unlimited)
+
+        Returns:
+            RateLimiter allowing one request every `delay` seconds
+        """
+        return cls(1.0 / delay if delay > 0 else 0.0)
+
+    @property
+    def interval(self) -> float:
+        """Seconds between consecutive request slots."""
+        return 1.0 / self.rate if self.rate > 0 else 0.0
+
+    def _reserve(self) -> float:
+        """
+        Reserve the next request slot.
+
+        Returns:
+            Seconds the caller has to wait before its slot arrives
+        """
+        interval = self.interval
+        if interval <= 0:
+            return 0.0
+
+        with self._lock:
+            now = time.monotonic()
+            slot = max(self._next_slot, now)
+            self._next_slot = slot + interval
+
+        return slot - now
+
+    def acquire(self) -> float:
+        """
+        Block until the caller's request slot arrives.
+
+        Slots are reserved under the lock and waited for outside of it, so
+        workers queue up in arrival order without holding each other up.
+
+        Returns:
+            Seconds spent waiting for the slot
+        """
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self) -> float:
+        """
+        Event-loop friendly variant of acquire() for the asyncio backend.
+
+        Returns:
+            Seconds spent waiting for the slot
+        """
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+
+class AdaptiveRateLimiter(RateLimiter):
+    """
+    RateLimiter whose rate is steered by observed latency and server errors (AIMD).
+
+    - Every `window` consecutive healthy responses raise the rate by `increase`
+      requests/second, up to `max_rate`.
+    - An HTTP 5xx/429, timeout, connection error or a latency above
+      `spike_factor` x the running latency baseline multiplies the rate by
+      `decrease`, down to `min_rate`. Further backoffs are suppressed for a
+      short cooldown so one burst of in-flight failures counts once.
+    """
+
+    def __init__(self, initial_rate: float, min_rate: float = 0.2, max_rate: float = 20.0,
+                 increase: float = 0.5, decrease: float = 0.5, window: int = 10,
+                 spike_factor: float = 3.0, min_spike_latency: float = 1.0):
+        """
+        Args:
+            initial_rate: Starting requests per second
+            min_rate: Lower bound for the rate
+            max_rate: Upper bound for the rate
+            increase: Additive step (requests/second) after each healthy window
+            decrease: Multiplicative factor applied on backoff (0 < decrease < 1)
+            window: Number of consecutive healthy responses per increase step
+            spike_factor: Latency above baseline * spike_factor counts as a spike
+            min_spike_latency: Latencies below this (seconds) are never spikes
+        """
+        super().__init__(min(max(initial_rate, min_rate), max_rate))
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.window = window
+        self.spike_factor = spike_factor
+        self.min_spike_latency = min_spike_latency
+
+        self.baseline_latency: Optional[float] = None
+        self.healthy_streak = 0
+        self.backoffs = 0
+        self.increases = 0
+        self.responses = 0
+        self.failures = 0
+        self._cooldown_until = 0.0
+        self._started = time.monotonic()
+        self._rate_since = self._started
+        self._rate_seconds = 0.0
+
+    @classmethod
+    def from_delay(cls, delay: float, **kwargs) -> "AdaptiveRateLimiter":
+        """
+        Build an adaptive limiter that starts at the rate implied by --delay.
+
+        Args:
+            delay: Delay in seconds between requests (0 starts at max_rate)
+            **kwargs: Passed to the constructor (min_rate, max_rate, ...)
+        """
+        max_rate = kwargs.get('max_rate', 20.0)
+        return cls(1.0 / delay if delay > 0 else max_rate, **kwargs)
+
+    def _set_rate(self, rate: float):
+        # Accumulate rate x time for the time-weighted average in summary()
+        now = time.monotonic()
+        self._rate_seconds += self.rate * (now - self._rate_since)
+        self._rate_since = now
+        self.rate = rate
+
+    def observe(self, status_code: Optional[int], latency: float,
+                error: Optional[BaseException] = None) -> None:
+        """
+        Feed one request outcome into the controller. Signature matches
+        scraping_http_client response listeners.
+
+        Args:
+            status_code: HTTP status code (None when the request raised)
+            latency: Request latency in seconds
+            error: Exception raised by the request, if any
+        """
+        overloaded = (
+            isinstance(error, (requests.exceptions.Timeout, requests.exceptions.ConnectionError,
+                               asyncio.TimeoutError, ConnectionError))
+            or (status_code is not None and (status_code >= 500 or status_code == 429))
+        )
+
+        with self._lock:
+            self.responses += 1
+            spike = (
+                self.baseline_latency is not None
+                and latency > self.min_spike_latency
+                and latency > self.baseline_latency * self.spike_factor
+            )
+
+            if overloaded or spike:
+                self.failures += 1
+                self.healthy_streak = 0
+                now = time.monotonic()
+                if now >= self._cooldown_until:
+                    new_rate = max(self.min_rate, self.rate * self.decrease)
+                    reason = f"HTTP {status_code}" if status_code else (type(error).__name__ if error else "latency spike")
+                    logger.info(f"Rate backoff ({reason}, {latency:.2f}s): {self.rate:.2f} -> {new_rate:.2f} req/s")
+                    self._set_rate(new_rate)
+                    self.backoffs += 1
+                    self._cooldown_until = now + max(1.0, 2 * (self.baseline_latency or latency))
+                return
+
+            if error is not None:
+                # Non-overload errors (e.g. malformed response) neither raise nor lower the rate
+                return
+
+            # Exponentially weighted latency baseline from healthy responses only
+            if self.baseline_latency is None:
+                self.baseline_latency = latency
+            else:
+                self.baseline_latency = 0.8 * self.baseline_latency + 0.2 * latency
+
+            self.healthy_streak += 1
+            if self.healthy_streak >= self.window and self.rate < self.max_rate:
+                self.healthy_streak = 0
+                self._set_rate(min(self.max_rate, self.rate + self.increase))
+                self.increases += 1
+                logger.debug(f"Rate increase: {self.rate:.2f} req/s")
+
+    def summary(self) -> dict:
+        """
+        Report the controller state.
+
+        Returns:
+            Dict with the settled rate, time-weighted average rate, number of
+            backoffs/increases, responses seen and baseline latency
+        """
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._started
+            weighted = self._rate_seconds + self.rate * (now - self._rate_since)
+            return {
+                'settled_rate': self.rate,
+                'average_rate': weighted / elapsed if elapsed > 0 else self.rate,
+                'backoffs': self.backoffs,
+                'increases': self.increases,
+                'responses': self.responses,
+                'failures': self.failures,
+                'baseline_latency': self.baseline_latency,
+            }
+
+    def report(self) -> str:
+        """One-line human-readable summary for the end-of-run output."""
+        info = self.summary()
+        latency = f"{info['baseline_latency']:.3f}s" if info['baseline_latency'] is not None else "n/a"
+        return (f"settled at {info['settled_rate']:.2f} req/s "
+                f"(time-weighted average {info['average_rate']:.2f} req/s, "
+                f"{info['increases']} increases, {info['backoffs']} backoffs, "
+                f"{info['failures']}/{info['responses']} unhealthy responses, baseline latency {latency})")
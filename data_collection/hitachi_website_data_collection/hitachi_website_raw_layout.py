@@ -0,0 +1,313 @@
+"""
+Hitachi Website Raw HTML Folder Layout
+
+Fan-out layout for the raw HTML folders. A flat folder with tens of thousands of
+pages makes every exists/open/remove pay for one huge directory. In the fan-out
+layout each page goes into a bucket subfolder instead:
+
+    cross_reference_data/00042/Hitachi_website_bushing_42131.html   (index // 1000)
+    catalog_data/h3f/Hitachi_website_bushing_138W0800XA.html        (CRC32 of the key % 256)
+
+A folder's layout is recorded in a small marker file (.layout) inside it.
+Folders created from now on start in the fan-out layout. Existing flat folders
+keep working and are converted with `migrate`. Lookups try the folder's own
+layout first and then the other one, so a folder whose migration was
+interrupted (or that got flat files copied in) stays fully readable. Listing a
+folder walks the top level and the bucket subfolders.
+
+Usage:
+    python hitachi_website_raw_layout.py stats crossref
+    python hitachi_website_raw_layout.py migrate crossref
+    python hitachi_website_raw_layout.py migrate catalog --layout flat
+
+Author: Data Collection System
+Date: October 16, 2026
+Version: 1.0 - Fan-out raw HTML folder layout with migration
+"""
+
+import argparse
+import logging
+import os
+import re
+import sys
+import threading
+import time
+import zlib
+from typing import Dict, Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+LAYOUTS = ('flat', 'fanout')
+DEFAULT_LAYOUT = 'fanout'       # for folders created from now on
+LAYOUT_FILE = '.layout'
+BUCKET_SIZE = 1000              # indices per range bucket
+HASH_BUCKETS = 256              # buckets for non-numeric keys (style numbers)
+
+RAW_FILE_KEY = re.compile(r'^Hitachi_website_[a-z]+_(.+)\.html$')
+BUCKET_NAME = re.compile(r'^(?:\d{5,}|h[0-9a-f]{2})$')
+
+_layouts: Dict[str, str] = {}
+_layouts_lock = threading.Lock()
+
+
+def bucket_of(name: str) -> str:
+    """
+    Bucket subfolder of a raw HTML file name: index // 1000 as five digits
+    for numeric keys, 'h' + two hex digits of the key's CRC32 otherwise.
+    """
+    match = RAW_FILE_KEY.match(name)
+    key = match.group(1) if match else name
+    if key.isdigit():
+        return f"{int(key) // BUCKET_SIZE:05d}"
+    return f"h{zlib.crc32(key.encode('utf-8')) % HASH_BUCKETS:02x}"
+
+
+def directory_layout(directory: str) -> str:
+    """
+    Layout of a raw HTML folder: the one in its marker file, 'flat' for an
+    existing folder without one, DEFAULT_LAYOUT for a folder that does not exist yet.
+    """
+    full_path = os.path.abspath(directory)
+    with _layouts_lock:
+        layout = _layouts.get(full_path)
+    if layout is not None:
+        return layout
+    marker = os.path.join(directory, LAYOUT_FILE)
+    if os.path.exists(marker):
+        with open(marker, 'r', encoding='utf-8') as f:
+            layout = f.read().strip()
+        if layout not in LAYOUTS:
+            logger.warning(f"Unknown layout '{layout}' in {marker} - treating {directory} as flat")
+            layout = 'flat'
+    elif os.path.isdir(directory):
+        layout = 'flat'
+    else:
+        # Not cached: the folder may still be created with the default layout
+        return DEFAULT_LAYOUT
+    with _layouts_lock:
+        _layouts[full_path] = layout
+    return layout
+
+
+def set_directory_layout(directory: str, layout: str) -> None:
+    """Record the layout of a folder in its marker file (creating the folder)."""
+    if layout not in LAYOUTS:
+        raise ValueError(f"Unknown raw HTML layout: {layout}")
+    os.makedirs(directory, exist_ok=True)
+    marker = os.path.join(directory, LAYOUT_FILE)
+    with open(f"{marker}.tmp", 'w', encoding='utf-8') as f:
+        f.write(layout + '\n')
+    os.replace(f"{marker}.tmp", marker)
+    with _layouts_lock:
+        _layouts[os.path.abspath(directory)] = layout
+
+
+def prepare_directory(directory: str) -> str:
+    """
+    Make sure a raw HTML folder exists; a new one gets DEFAULT_LAYOUT.
+
+    Returns:
+        Layout of the folder
+    """
+    if not os.path.isdir(directory):
+        try:
+            os.makedirs(directory)
+        except FileExistsError:
+            pass
+        else:
+            set_directory_layout(directory, DEFAULT_LAYOUT)
+    return directory_layout(directory)
+
+
+def layout_path(directory: str, name: str, layout: str) -> str:
+    """Path of a raw HTML file name in a given layout."""
+    if layout == 'fanout':
+        return os.path.join(directory, bucket_of(name), name)
+    return os.path.join(directory, name)
+
+
+def raw_file_path(directory: str, name: str, create: bool = False) -> str:
+    """
+    Where a raw HTML file name is written in its folder.
+
+    Args:
+        directory: Raw HTML folder
+        name: Raw HTML file name
+        create: Create the folder (and the bucket subfolder) if missing
+
+    Returns:
+        File path
+    """
+    layout = prepare_directory(directory) if create else directory_layout(directory)
+    path = layout_path(directory, name, layout)
+    if create and layout == 'fanout':
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    return path
+
+
+def find_raw_file(directory: str, name: str) -> Optional[str]:
+    """
+    Path of a saved raw HTML file, in the folder's layout or the other one.
+
+    Returns:
+        File path, or None if the file is not in the folder
+    """
+    layout = directory_layout(directory)
+    for candidate in (layout, 'flat' if layout == 'fanout' else 'fanout'):
+        path = layout_path(directory, name, candidate)
+        if os.path.isfile(path):
+            return path
+    return None
+
+
+def iter_raw_files(directory: str) -> Iterator[Tuple[str, str]]:
+    """
+    (name, path) of every .html file in a raw HTML folder, at the top level
+    and in bucket subfolders, whatever the folder's layout.
+    """
+    if not os.path.isdir(directory):
+        return
+    buckets = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.endswith('.html') and entry.is_file():
+                yield entry.name, entry.path
+            elif BUCKET_NAME.match(entry.name) and entry.is_dir():
+                buckets.append(entry.path)
+    for bucket in buckets:
+        with os.scandir(bucket) as entries:
+            for entry in entries:
+                if entry.name.endswith('.html') and entry.is_file():
+                    yield entry.name, entry.path
+
+
+def raw_file_paths(directory: str) -> Dict[str, str]:
+    """Name -> path of every raw HTML file in a folder."""
+    return dict(iter_raw_files(directory))
+
+
+def tree_mtime_ns(directory: str) -> int:
+    """
+    Latest mtime of a folder and its bucket subfolders. Adding or removing a
+    page in a fan-out folder only touches its bucket.
+    """
+    latest = os.stat(directory).st_mtime_ns
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if BUCKET_NAME.match(entry.name) and entry.is_dir():
+                latest = max(latest, entry.stat().st_mtime_ns)
+    return latest
+
+
+def migrate(directory: str, layout: str = 'fanout') -> dict:
+    """
+    Move every raw HTML file of a folder into the given layout.
+
+    The marker is written first, so pages saved meanwhile already go to the new
+    layout, and each move is an atomic rename; an interrupted migration leaves
+    a readable folder and can simply be run again.
+
+    Args:
+        directory: Raw HTML folder
+        layout: 'fanout' or 'flat'
+
+    Returns:
+        Dict with files moved, files already in place and buckets used
+    """
+    set_directory_layout(directory, layout)
+    stats = {'moved': 0, 'in_place': 0, 'buckets': 0}
+    created = set()
+    started = time.time()
+    for name, path in list(iter_raw_files(directory)):
+        target = layout_path(directory, name, layout)
+        if os.path.normpath(path) == os.path.normpath(target):
+            stats['in_place'] += 1
+            continue
+        bucket = os.path.dirname(target)
+        if bucket not in created:
+            os.makedirs(bucket, exist_ok=True)
+            created.add(bucket)
+        os.replace(path, target)
+        stats['moved'] += 1
+        if stats['moved'] % 5000 == 0:
+            print(f"  {stats['moved']} files moved ({time.time() - started:.0f} s)")
+    # Flattening leaves empty buckets behind
+    with os.scandir(directory) as entries:
+        buckets = [entry.path for entry in entries if BUCKET_NAME.match(entry.name) and entry.is_dir()]
+    for bucket in buckets:
+        try:
+            os.rmdir(bucket)
+        except OSError:
+            stats['buckets'] += 1
+    logger.info(f"Migrated {directory} to the {layout} layout: {stats}")
+    return stats
+
+
+def layout_stats(directory: str) -> dict:
+    """Layout, file count, top-level entries and bucket sizes of a raw HTML folder."""
+    top_files = 0
+    bucket_sizes = {}
+    for name, path in iter_raw_files(directory):
+        parent = os.path.dirname(path)
+        if os.path.normpath(parent) == os.path.normpath(directory):
+            top_files += 1
+        else:
+            bucket = os.path.basename(parent)
+            bucket_sizes[bucket] = bucket_sizes.get(bucket, 0) + 1
+    return {
+        'layout': directory_layout(directory),
+        'files': top_files + sum(bucket_sizes.values()),
+        'top_level_files': top_files,
+        'buckets': len(bucket_sizes),
+        'largest_bucket': max(bucket_sizes.values(), default=0),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Inspect or convert the layout of the raw HTML folders',
+        epilog='Examples:\n'
+               '  python hitachi_website_raw_layout.py stats crossref\n'
+               '  python hitachi_website_raw_layout.py migrate crossref\n'
+               '  python hitachi_website_raw_layout.py migrate catalog --layout flat\n',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('command', choices=['stats', 'migrate'],
+                        help='stats: layout and bucket sizes; migrate: move the files into --layout')
+    parser.add_argument('kind', choices=['crossref', 'catalog'], help='Which raw HTML folder')
+    parser.add_argument('--layout', choices=LAYOUTS, default='fanout',
+                        help='migrate: target layout (default: fanout)')
+    args = parser.parse_args()
+
+    if args.kind == 'crossref':
+        import hitachi_website_data_scraper as scraper
+    else:
+        import hitachi_website_catalog_scraper as scraper
+
+    directory = scraper.RAW_DATA_DIR
+    if not os.path.isdir(directory):
+        print(f"✗ No raw HTML folder at {directory}/")
+        sys.exit(1)
+
+    if args.command == 'migrate':
+        started = time.time()
+        stats = migrate(directory, args.layout)
+        print(f"✓ {directory}/ is now {args.layout}: {stats['moved']} files moved, "
+              f"{stats['in_place']} already in place ({time.time() - started:.1f} s)")
+        return
+
+    stats = layout_stats(directory)
+    print(f"\n{'='*70}")
+    print(f"Raw HTML Layout - {directory}/")
+    print(f"{'='*70}")
+    print(f"Layout: {stats['layout']}")
+    print(f"Files: {stats['files']}")
+    print(f"Top-level files: {stats['top_level_files']}")
+    print(f"Buckets: {stats['buckets']} (largest: {stats['largest_bucket']} files)")
+    if stats['layout'] == 'flat' and stats['files']:
+        print(f"\nRun `python hitachi_website_raw_layout.py migrate {args.kind}` to fan the folder out")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    main()
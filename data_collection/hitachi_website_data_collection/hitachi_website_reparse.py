@@ -0,0 +1,533 @@
+"""
+Hitachi Website Offline Reparse
+
+Rebuilds a master list from the saved raw HTML with the current parsers, without
+any network access. After a fix to parse_bushing_info or parse_catalog_info this
+applies the fix to every saved page in seconds instead of a multi-hour refetch.
+
+Pages are read from the raw HTML folder (flat or fan-out) and from its archive
+(.pack); a page present in both is read from the folder, as read_raw_html does.
+Page names are split into chunks over a process pool with one worker per core.
+Each worker reads and parses its own pages with check_bushing_page /
+check_catalog_page, the same checks a scrape applies. Only page names and the
+parsed rows cross process boundaries.
+
+The new master list keeps the row order of the current one, and new keys are
+appended in key order. Rows whose key has no saved page, or whose page the
+parser now rejects, are carried over unchanged (dropped with --drop-missing).
+The file is written to a temporary file and replaced atomically. Do not run it
+while a scrape of the same kind is writing the master list. The change report
+ignores differences pandas introduces when it rewrites a master list ('N/A' or
+'None' read back as empty, '1' as '1.0'), so it only counts real parser changes.
+
+--verify (crossref) runs both cross-reference parsers, the BeautifulSoup
+parse_bushing_info and the lxml fast path parse_bushing_html, on every saved
+page. It reports each field they disagree on and the time per page of each.
+It also parses the part of each page a streamed fetch (--fetch stream) keeps
+and reports any field that differs from the full page. Nothing is written.
+
+--parse-cache takes the record of a page from the parse result cache
+(hitachi_website_parse_cache.py) when the same parser version already parsed
+the same page bytes, and caches the others, so a repeated reparse only hashes
+the pages. Editing a parser changes its version, so a reparse after a parser
+fix parses every page again. --parser picks the parser a reparse uses.
+
+Usage:
+    python hitachi_website_reparse.py crossref
+    python hitachi_website_reparse.py catalog --workers 8
+    python hitachi_website_reparse.py crossref --dry-run
+    python hitachi_website_reparse.py crossref --source archive --output reparsed.csv
+    python hitachi_website_reparse.py crossref --verify
+    python hitachi_website_reparse.py catalog --parse-cache
+
+Author: Data Collection System
+Date: October 16, 2026
+Version: 1.3 - Parse result cache (--parse-cache)
+"""
+
+import argparse
+import csv
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from bs4 import BeautifulSoup
+
+from hitachi_website_csv_writer import close_writer
+from hitachi_website_html_archive import HtmlArchive
+from hitachi_website_processed_index import NA_VALUES
+from hitachi_website_raw_layout import iter_raw_files
+
+logger = logging.getLogger(__name__)
+
+PAGE_PREFIX = "Hitachi_website_bushing_"
+SOURCES = ('all', 'files', 'archive')
+CHUNKS_PER_WORKER = 8           # chunks handed to each worker (load balancing)
+MIN_CHUNK_SIZE = 16
+
+KEY_COLUMNS = {'crossref': 'Website Index', 'catalog': 'Style Number'}
+
+# Per-process state of the pool workers
+_worker_archives: Dict[str, HtmlArchive] = {}
+
+
+def scraper_module(kind: str):
+    """Scraper module of a master list kind ('crossref' or 'catalog')."""
+    if kind == 'crossref':
+        import hitachi_website_data_scraper as scraper
+    elif kind == 'catalog':
+        import hitachi_website_catalog_scraper as scraper
+    else:
+        raise ValueError(f"Unknown master list kind: {kind}")
+    return scraper
+
+
+def page_keys(kind: str, names) -> Dict[str, object]:
+    """
+    Key of each raw HTML page name (INDEX or style number); names that are not
+    pages (site templates, stray files) are left out.
+
+    Catalog file names replace '/' and '\\' in the style number, so the real
+    style numbers are looked up in the catalog and cross-reference master lists
+    and the name is only used as a fallback.
+    """
+    scraper = scraper_module(kind)
+    styles = {}
+    if kind == 'catalog':
+        known = set(scraper.extract_unique_abb_style_numbers())
+        known.update(key for key, _ in read_master_list(scraper.OUTPUT_CSV, KEY_COLUMNS[kind])[1])
+        styles = {scraper.raw_html_filename(style): style for style in known}
+
+    keys = {}
+    for name in names:
+        if not (name.startswith(PAGE_PREFIX) and name.endswith('.html')):
+            continue
+        key = name[len(PAGE_PREFIX):-len('.html')]
+        if kind == 'crossref':
+            if key.isdigit():
+                keys[name] = int(key)
+        elif key:
+            keys[name] = styles.get(name, key)
+    return keys
+
+
+def read_master_list(path: str, key_column: str) -> Tuple[List[str], List[Tuple[str, Dict[str, str]]]]:
+    """
+    Rows of a master list CSV as text, in file order.
+
+    Returns:
+        Tuple of (fieldnames, [(key, row)]); empty if the file does not exist
+    """
+    if not os.path.exists(path):
+        return [], []
+    with open(path, 'r', newline='', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        rows = [(row.get(key_column) or '', row) for row in reader]
+        return list(reader.fieldnames or []), rows
+
+
+def write_master_list(path: str, columns: List[str], rows) -> int:
+    """
+    Write a master list CSV atomically (temporary file, fsync, replace).
+
+    Returns:
+        Number of rows written
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp_path = f"{path}.tmp"
+    count = 0
+    with open(temp_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f, lineterminator=os.linesep)
+        writer.writerow(columns)
+        for row in rows:
+            writer.writerow([row.get(column, '') for column in columns])
+            count += 1
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+    return count
+
+
+def same_value(new, old: Optional[str]) -> bool:
+    """Whether a parsed value matches a master list cell, up to pandas' NA and float rewriting."""
+    new = '' if new is None else str(new)
+    old = old or ''
+    if new == old:
+        return True
+    if new in NA_VALUES and old in NA_VALUES:
+        return True
+    try:
+        return float(new) == float(old)
+    except ValueError:
+        return False
+
+
+def _init_worker(kind: str, parser: Optional[str] = None, parse_cache: bool = False):
+    """
+    Silence the per-page parser warnings (rejected pages are counted instead),
+    select the parser and turn the parse cache on or off.
+    """
+    scraper = scraper_module(kind)
+    logging.getLogger(scraper.__name__).setLevel(logging.ERROR)
+    if parser is not None:
+        scraper.configure_parser(parser)
+    scraper.configure_parse_cache(parse_cache)
+
+
+def _read_page(path: Optional[str], archive: Optional[str], name: str) -> Optional[str]:
+    """Page text from its file, or from the archive if path is None."""
+    if path is not None:
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            return f.read()
+    pack = _worker_archives.get(archive)
+    if pack is None:
+        pack = _worker_archives[archive] = HtmlArchive(archive, readonly=True)
+    return pack.get(name)
+
+
+def _parse_chunk(kind: str, archive: Optional[str],
+                 items: List[Tuple[object, str, Optional[str]]]) -> List[Tuple[object, Optional[dict], Optional[str]]]:
+    """
+    Parse a chunk of pages (runs in a pool worker).
+
+    Args:
+        kind: 'crossref' or 'catalog'
+        archive: Archive to read pages without a file from
+        items: (key, page name, file path or None) per page
+
+    Returns:
+        (key, parsed row or None, error type or None) per page
+    """
+    scraper = scraper_module(kind)
+    check_page = scraper.check_bushing_page if kind == 'crossref' else scraper.check_catalog_page
+    results = []
+    for key, name, path in items:
+        try:
+            html = _read_page(path, archive, name)
+            if html is None:
+                results.append((key, None, 'MISSING_PAGE'))
+                continue
+            data, error_type, _ = check_page(key, html)
+            results.append((key, data, error_type))
+        except Exception as e:
+            logger.error(f"Reparse of {name} failed: {e}")
+            results.append((key, None, type(e).__name__))
+    if scraper.PARSE_CACHE:
+        # Pool workers exit without running atexit handlers
+        scraper.get_parse_cache().commit()
+    return results
+
+
+def _record_differences(reference: Optional[dict], other: Optional[dict]) -> list:
+    """[(field, reference value, other value)] of the fields two parsed records differ in."""
+    if reference is None or other is None:
+        return [] if reference == other else [('(record)', reference, other)]
+    return [(field, value, other.get(field)) for field, value in reference.items()
+            if other.get(field) != value]
+
+
+def _verify_chunk(kind: str, archive: Optional[str],
+                  items: List[Tuple[object, str, Optional[str]]]) -> List[tuple]:
+    """
+    Parse a chunk of cross-reference pages with both parsers, and both parsers
+    again on the part of the page a streamed fetch keeps (runs in a pool worker).
+
+    Returns:
+        (key, [(field, soup value, fast value)] that differ, soup seconds, fast seconds,
+        [(field, full page value, streamed value)] that differ, page bytes, streamed bytes) per page
+    """
+    scraper = scraper_module(kind)
+    results = []
+    for key, name, path in items:
+        html = _read_page(path, archive, name)
+        if html is None:
+            continue
+        started = time.perf_counter()
+        reference = scraper.parse_bushing_info(BeautifulSoup(html, 'lxml'), key)
+        soup_seconds = time.perf_counter() - started
+        started = time.perf_counter()
+        fast = scraper.parse_bushing_html(html, key)
+        fast_seconds = time.perf_counter() - started
+        differences = _record_differences(reference, fast)
+        page = html.encode('utf-8')
+        end = scraper.bushing_page_end(page)
+        stream_differences = []
+        if end is not None:
+            streamed = page[:end]
+            stream_differences = (
+                _record_differences(reference, scraper.parse_bushing_info(BeautifulSoup(streamed, 'lxml'), key)) +
+                _record_differences(fast, scraper.parse_bushing_html(streamed, key)))
+        results.append((key, differences, soup_seconds, fast_seconds,
+                        stream_differences, len(page), len(page) if end is None else end))
+    return results
+
+
+def saved_pages(kind: str, source: str = 'all') -> Tuple[List[Tuple[object, str, Optional[str]]], Optional[str]]:
+    """
+    Saved raw HTML pages of a kind, in key order.
+
+    Args:
+        kind: 'crossref' or 'catalog'
+        source: 'all' (folder and archive), 'files' or 'archive'
+
+    Returns:
+        Tuple of ([(key, page name, file path or None for archive pages)], archive path or None)
+    """
+    if source not in SOURCES:
+        raise ValueError(f"Unknown reparse source: {source}")
+    scraper = scraper_module(kind)
+
+    # Folder first, then archive pages without a file
+    paths = {}
+    if source in ('all', 'files'):
+        paths = dict(iter_raw_files(scraper.RAW_DATA_DIR))
+    archive = scraper.archive_path()
+    archive_names = []
+    if source in ('all', 'archive') and os.path.exists(archive):
+        pack = HtmlArchive(archive, readonly=True)
+        archive_names = [name for name in pack.names() if name not in paths]
+        pack.close()
+    else:
+        archive = None
+    keys = page_keys(kind, list(paths) + archive_names)
+    items = sorted(((key, name, paths.get(name)) for name, key in keys.items()), key=lambda item: item[1])
+    return items, archive
+
+
+def run_chunks(function, kind: str, archive: Optional[str], items: list,
+               workers: int, parser: Optional[str] = None, parse_cache: bool = False) -> Iterator[list]:
+    """
+    Run a chunk function over the pages on a process pool (in this process for
+    one worker) and yield each chunk's results in order.
+    """
+    chunk_size = max(MIN_CHUNK_SIZE, -(-len(items) // (workers * CHUNKS_PER_WORKER)))
+    chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+    logger.info(f"Processing {len(items)} {kind} pages in {len(chunks)} chunks with {workers} workers")
+    if workers == 1 or len(chunks) <= 1:
+        _init_worker(kind, parser, parse_cache)
+        for chunk in chunks:
+            yield function(kind, archive, chunk)
+        return
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(kind, parser, parse_cache)) as pool:
+        yield from pool.map(function, [kind] * len(chunks), [archive] * len(chunks), chunks)
+
+
+def verify(source: str = 'all', workers: Optional[int] = None) -> dict:
+    """
+    Compare the BeautifulSoup and the lxml cross-reference parsers on every saved
+    page, and each parser on the full page and on its streamed prefix (--fetch stream).
+
+    Args:
+        source: 'all' (folder and archive), 'files' or 'archive'
+        workers: Worker processes (default: one per core)
+
+    Returns:
+        Dict with pages, disagreements [(key, field, soup value, fast value)],
+        the total parse seconds of each parser, stream disagreements
+        [(key, field, full page value, streamed value)] and the bytes a streamed
+        fetch reads of the pages
+    """
+    items, archive = saved_pages('crossref', source)
+    workers = workers or os.cpu_count() or 1
+    stats = {'pages': 0, 'disagreements': [], 'soup_seconds': 0.0, 'fast_seconds': 0.0, 'workers': workers,
+             'stream_disagreements': [], 'page_bytes': 0, 'streamed_bytes': 0}
+    for results in run_chunks(_verify_chunk, 'crossref', archive, items, workers):
+        for (key, differences, soup_seconds, fast_seconds,
+             stream_differences, page_bytes, streamed_bytes) in results:
+            stats['pages'] += 1
+            stats['soup_seconds'] += soup_seconds
+            stats['fast_seconds'] += fast_seconds
+            stats['disagreements'].extend((key, *difference) for difference in differences)
+            stats['stream_disagreements'].extend((key, *difference) for difference in stream_differences)
+            stats['page_bytes'] += page_bytes
+            stats['streamed_bytes'] += streamed_bytes
+    return stats
+
+
+def reparse(kind: str, source: str = 'all', workers: Optional[int] = None,
+            output: Optional[str] = None, drop_missing: bool = False, dry_run: bool = False,
+            parser: Optional[str] = None, parse_cache: bool = False) -> dict:
+    """
+    Rebuild a master list from the saved raw HTML with the current parser.
+
+    Args:
+        kind: 'crossref' or 'catalog'
+        source: 'all' (folder and archive), 'files' or 'archive'
+        workers: Worker processes (default: one per core; 1 parses in this process)
+        output: CSV to write (default: the master CSV itself)
+        drop_missing: Leave out rows that have no page or whose page is rejected
+        dry_run: Only compare against the current master list, write nothing
+        parser: Cross-reference page parser, 'fast' or 'soup' (default: the scraper's)
+        parse_cache: Look records up in (and add them to) the parse result cache
+
+    Returns:
+        Dict of statistics (pages, parsed, rejected by type, changed rows and fields, ...)
+    """
+    scraper = scraper_module(kind)
+    key_column = KEY_COLUMNS[kind]
+    columns = list(scraper.COLUMNS)
+    master_csv = scraper.OUTPUT_CSV
+    output = output or master_csv
+    started = time.time()
+
+    items, archive = saved_pages(kind, source)
+    workers = workers or os.cpu_count() or 1
+    parsed: Dict[str, dict] = {}
+    rejected: Dict[str, int] = {}
+    for results in run_chunks(_parse_chunk, kind, archive, items, workers, parser, parse_cache):
+        for key, data, error_type in results:
+            if data is None:
+                rejected[error_type] = rejected.get(error_type, 0) + 1
+            else:
+                parsed[str(key)] = data
+    if parse_cache:
+        close_writer(scraper.parse_cache_path())
+    parse_seconds = time.time() - started
+
+    # Merge with the current master list: keep its order, append new keys
+    _, current = read_master_list(master_csv, key_column)
+    stats = {
+        'pages': len(items), 'parsed': len(parsed), 'rejected': rejected,
+        'unchanged': 0, 'changed': 0, 'added': 0, 'carried_over': 0, 'dropped': 0,
+        'changed_fields': {}, 'workers': workers, 'parse_seconds': parse_seconds,
+    }
+    rows = []
+    seen = set()
+    for key, old in current:
+        if key in seen:
+            continue
+        seen.add(key)
+        new = parsed.get(key)
+        if new is None:
+            if drop_missing:
+                stats['dropped'] += 1
+            else:
+                stats['carried_over'] += 1
+                rows.append(old)
+            continue
+        changed = [column for column in columns if not same_value(new.get(column, ''), old.get(column))]
+        for column in changed:
+            stats['changed_fields'][column] = stats['changed_fields'].get(column, 0) + 1
+        stats['changed' if changed else 'unchanged'] += 1
+        rows.append(new)
+    for key, new in parsed.items():
+        if key not in seen:
+            stats['added'] += 1
+            rows.append(new)
+    stats['rows'] = len(rows)
+
+    if not dry_run:
+        write_master_list(output, columns, rows)
+        logger.info(f"Wrote {len(rows)} rows to {output}")
+    stats['seconds'] = time.time() - started
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Rebuild a master list from the saved raw HTML with the current parser (no network)',
+        epilog='Examples:\n'
+               '  python hitachi_website_reparse.py crossref\n'
+               '  python hitachi_website_reparse.py catalog --workers 8\n'
+               '  python hitachi_website_reparse.py crossref --dry-run\n'
+               '  python hitachi_website_reparse.py crossref --source archive --output reparsed.csv\n'
+               '  python hitachi_website_reparse.py crossref --verify\n'
+               '  python hitachi_website_reparse.py catalog --parse-cache\n',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('kind', choices=['crossref', 'catalog'], help='Which master list to rebuild')
+    parser.add_argument('--source', choices=SOURCES, default='all',
+                        help='Read pages from the raw HTML folder, its archive or both (default: all)')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Worker processes (default: one per core)')
+    parser.add_argument('--output', default=None, help='CSV to write (default: the master CSV)')
+    parser.add_argument('--drop-missing', action='store_true',
+                        help='Leave out rows without a page or whose page no longer parses')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='Only report what would change')
+    parser.add_argument('--parser', choices=['fast', 'soup'], default=None,
+                        help='crossref: page parser for the reparse (default: fast)')
+    parser.add_argument('--parse-cache', action='store_true',
+                        help='Reuse records of pages parsed before by the same parser version and cache '
+                             'the new ones (hitachi_website_parse_cache.py)')
+    parser.add_argument('--verify', action='store_true',
+                        help='crossref: run both page parsers (and the streamed-fetch cut) on every page and report disagreements')
+    args = parser.parse_args()
+
+    if args.workers is not None and args.workers < 1:
+        print("✗ --workers must be at least 1")
+        sys.exit(1)
+    if (args.verify or args.parser) and args.kind != 'crossref':
+        print("✗ --verify and --parser apply to crossref pages only")
+        sys.exit(1)
+
+    if args.verify:
+        print(f"\n{'='*70}")
+        print("Parser check - BeautifulSoup vs lxml fast path, full vs streamed crossref pages")
+        print(f"{'='*70}\n")
+        stats = verify(source=args.source, workers=args.workers)
+        if not stats['pages']:
+            print("⊘ No saved raw HTML pages found")
+            return
+        soup_ms = stats['soup_seconds'] / stats['pages'] * 1000
+        fast_ms = stats['fast_seconds'] / stats['pages'] * 1000
+        print(f"📊 Pages: {stats['pages']} ({stats['workers']} workers)")
+        print(f"   soup: {soup_ms:.2f} ms/page, fast: {fast_ms:.2f} ms/page "
+              f"({soup_ms / fast_ms if fast_ms else 0:.1f}x)")
+        print(f"   stream: {stats['streamed_bytes'] / stats['page_bytes'] * 100 if stats['page_bytes'] else 0:.0f}% "
+              f"of the page bytes read")
+        failed = False
+        for disagreements, labels, agreed in (
+                (stats['disagreements'], ('soup', 'fast'), 'Both parsers agree'),
+                (stats['stream_disagreements'], ('full', 'streamed'), 'Streamed pages parse like full pages')):
+            if not disagreements:
+                print(f"✓ {agreed} on all {stats['pages']} pages")
+                continue
+            failed = True
+            for key, field, value, other in disagreements[:20]:
+                print(f"✗ {key} {field}: {labels[0]}={value!r} {labels[1]}={other!r}")
+            if len(disagreements) > 20:
+                print(f"  ... {len(disagreements) - 20} more")
+            print(f"✗ {len(disagreements)} {labels[0]}/{labels[1]} disagreements on "
+                  f"{len({key for key, *_ in disagreements})} pages")
+        if failed:
+            sys.exit(1)
+        return
+
+    print(f"\n{'='*70}")
+    print(f"Reparse - {args.kind} master list from saved raw HTML")
+    print(f"{'='*70}\n")
+
+    stats = reparse(args.kind, source=args.source, workers=args.workers, output=args.output,
+                    drop_missing=args.drop_missing, dry_run=args.dry_run, parser=args.parser,
+                    parse_cache=args.parse_cache)
+    if not stats['pages']:
+        print("⊘ No saved raw HTML pages found")
+        return
+
+    rate = stats['pages'] / stats['parse_seconds'] if stats['parse_seconds'] else 0
+    print(f"📊 Pages: {stats['pages']} parsed in {stats['parse_seconds']:.1f} s "
+          f"({rate:.0f} pages/s, {stats['workers']} workers)")
+    print(f"✓ Parsed: {stats['parsed']}")
+    for error_type, count in sorted(stats['rejected'].items()):
+        print(f"✗ Rejected ({error_type}): {count}")
+    print(f"\nRows: {stats['rows']} (unchanged {stats['unchanged']}, changed {stats['changed']}, "
+          f"added {stats['added']}, carried over {stats['carried_over']}, dropped {stats['dropped']})")
+    for column, count in sorted(stats['changed_fields'].items(), key=lambda item: -item[1]):
+        print(f"  ↻ {column}: {count}")
+
+    if args.dry_run:
+        print("\n⊘ Dry run - nothing written")
+    else:
+        print(f"\n✓ Master list written to: {args.output or scraper_module(args.kind).OUTPUT_CSV}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    main()
@@ -0,0 +1,460 @@
+"""
+Hitachi Website Replay Server
+
+Local HTTP stand-in for bushing.hitachienergy.com built from the saved raw HTML
+corpus. It serves
+    /Scripts/BushingCrossReferenceBU.asp?INDEX=<index>           (cross_reference_data)
+    /Scripts/BushingLookupBU.asp?StyleNumber=<style number>      (catalog_data)
+from hitachi_website_data_raw (loose files or the .pack archives written with
+--raw-storage archive) and answers unknown keys with the site's
+"No bushing found by that style number" page, so the batch scrapers can be
+load-tested and benchmarked offline and reproducibly.
+
+Server behaviour can be degraded on purpose:
+    --latency / --jitter     per-request service time in milliseconds
+    --error-rate             fraction of requests answered with --error-status (default 500)
+    --drop-rate              fraction of connections closed without a response
+    --rate-limit / --burst   token bucket over all requests; excess requests get HTTP 429
+    --synthesize             answer unknown keys with a corpus page instead of "No bushing
+                             found" (benchmarks with more keys than the corpus holds)
+Random decisions come from --seed, so a run with the same settings and request
+order injects the same failures.
+
+GET /__stats returns request counters as JSON.
+
+Usage:
+    python hitachi_website_replay_server.py --port 8765
+    python hitachi_website_replay_server.py --port 8765 --latency 80 --jitter 40 --error-rate 0.02 --rate-limit 50
+    python hitachi_website_data_batch_scraper.py --start 1 --end 1000 --delay 0 --workers 8 --base-url http://127.0.0.1:8765
+    python hitachi_website_catalog_batch_scraper.py --all --delay 0 --base-url http://127.0.0.1:8765
+
+Author: Data Collection System
+Date: October 16, 2026
+Version: 1.3 - Fan-out raw HTML folders
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import re
+import threading
+import time
+import zlib
+from collections import Counter
+from dataclasses import dataclass
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Dict, List, Optional, Tuple, Union
+from urllib.parse import urlsplit, parse_qs
+
+from hitachi_website_html_archive import HtmlArchive, archive_path
+from hitachi_website_raw_layout import iter_raw_files
+
+logger = logging.getLogger(__name__)
+
+CROSS_REFERENCE_PATH = "/Scripts/BushingCrossReferenceBU.asp"
+CATALOG_PATH = "/Scripts/BushingLookupBU.asp"
+STATS_PATH = "/__stats"
+
+DEFAULT_RAW_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "hitachi_website_data_raw")
+
+# Same file naming as save_raw_html() in both scrapers
+RAW_FILE_PATTERN = re.compile(r'^Hitachi_website_bushing_(.+)\.html$')
+
+# What the site answers for a key it does not know
+NO_BUSHING_FOUND_PAGE = (
+    "<HTML>\n<HEAD>\n<TITLE>Bushing Information</TITLE>\n</HEAD>\n<BODY>\n"
+    "<p class=\"body_text\">No bushing found by that style number. "
+    "Please check the number and try again.</p>\n</BODY>\n</HTML>\n"
+).encode('utf-8')
+
+
+@dataclass
+class ReplayConfig:
+    """Fault and timing settings of the replay server."""
+    latency: float = 0.0        # Base service time per request in seconds
+    jitter: float = 0.0         # Extra uniform random service time in seconds
+    error_rate: float = 0.0     # Fraction of requests answered with error_status
+    error_status: int = 500
+    drop_rate: float = 0.0      # Fraction of connections closed without a response
+    rate_limit: float = 0.0     # Requests per second across all clients (0 = unlimited)
+    burst: int = 10             # Token bucket size for rate_limit
+    seed: Optional[int] = None
+    cache: bool = True          # Keep pages in memory after the first read
+    synthesize: bool = False    # Serve a corpus page (picked by key hash) for unknown keys
+
+
+def scan_raw_pages(directory: str) -> Tuple[Dict[str, Union[str, Tuple[HtmlArchive, str]]], Optional[HtmlArchive]]:
+    """
+    Map the key in each raw HTML file name to its path, or to (archive, name)
+    for archived pages.
+
+    Args:
+        directory: Raw HTML folder (flat or bucketed, with or without an archive)
+
+    Returns:
+        Tuple of (key -> location, the folder's archive opened read-only or None);
+        the caller closes the archive when it is done with the pages
+    """
+    files = {}
+    for name, path in iter_raw_files(directory):
+        match = RAW_FILE_PATTERN.match(name)
+        if match:
+            files[match.group(1)] = path
+    archive = None
+    if os.path.exists(archive_path(directory)):
+        archive = HtmlArchive(archive_path(directory), readonly=True)
+        for name in archive.names():
+            match = RAW_FILE_PATTERN.match(name)
+            if match and match.group(1) not in files:
+                files[match.group(1)] = (archive, name)
+    return files, archive
+
+
+def corpus_keys(directory: str) -> List[str]:
+    """Sorted keys of the saved pages in a raw HTML folder (files and archive)."""
+    files, archive = scan_raw_pages(directory)
+    if archive is not None:
+        archive.close()
+    return sorted(files)
+
+
+class Corpus:
+    """
+    Key -> page lookup for the saved cross-reference and catalog pages. A page
+    lives in a raw HTML file, or in the folder's archive when there is no file.
+    """
+
+    def __init__(self, raw_root: str = DEFAULT_RAW_ROOT, cache: bool = True):
+        """
+        Args:
+            raw_root: Folder holding cross_reference_data/ and catalog_data/
+            cache: Keep page bytes in memory after the first read
+        """
+        self._archives = []
+        self.cross_reference = self._scan(os.path.join(raw_root, "cross_reference_data"))
+        self.catalog = self._scan(os.path.join(raw_root, "catalog_data"))
+        self._files = {'crossref': self.cross_reference, 'catalog': self.catalog}
+        # Stable page order for synthesized_page(), whether a page is a flat or
+        # bucketed file or archived
+        self._ordered = {kind: sorted(files.values(), key=self._location_name)
+                         for kind, files in self._files.items()}
+        self.cache = cache
+        self._pages: Dict[str, bytes] = {}
+        logger.info(f"Replay corpus: {len(self.cross_reference)} cross-reference pages, "
+                    f"{len(self.catalog)} catalog pages from {raw_root}")
+
+    def _scan(self, directory: str) -> Dict[str, Union[str, Tuple[HtmlArchive, str]]]:
+        files, archive = scan_raw_pages(directory)
+        if archive is not None:
+            self._archives.append(archive)
+        return files
+
+    @staticmethod
+    def _location_name(location) -> str:
+        return os.path.basename(location) if isinstance(location, str) else location[1]
+
+    @staticmethod
+    def _location_path(location) -> str:
+        if isinstance(location, str):
+            return location
+        archive, name = location
+        return os.path.join(os.path.splitext(archive.path)[0], name)
+
+    def page(self, kind: str, key: str) -> Optional[bytes]:
+        """
+        Body of the saved page for a key.
+
+        Args:
+            kind: 'crossref' or 'catalog'
+            key: Index or style number as given in the query string
+
+        Returns:
+            Page bytes or None if the key is not in the corpus
+        """
+        location = self._files[kind].get(key)
+        if location is None:
+            return None
+        return self._read(location)
+
+    def synthesized_page(self, kind: str, key: str) -> Optional[bytes]:
+        """
+        A corpus page standing in for an unknown key, picked by the key's CRC32
+        so the same key always gets the same page.
+
+        Args:
+            kind: 'crossref' or 'catalog'
+            key: Index or style number as given in the query string
+
+        Returns:
+            Page bytes or None if the corpus has no pages of this kind
+        """
+        locations = self._ordered[kind]
+        if not locations:
+            return None
+        return self._read(locations[zlib.crc32(key.encode('utf-8')) % len(locations)])
+
+    def _read(self, location) -> bytes:
+        path = self._location_path(location)
+        body = self._pages.get(path)
+        if body is None:
+            if isinstance(location, str):
+                with open(path, 'rb') as f:
+                    body = f.read()
+            else:
+                archive, name = location
+                body = archive.get_bytes(name)
+            if self.cache:
+                self._pages[path] = body
+        return body
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket; take() fails instead of waiting when it is empty.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def take(self) -> bool:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+
+class ReplayRequestHandler(BaseHTTPRequestHandler):
+    """
+    Serves one request from server.corpus under server.config.
+    """
+
+    protocol_version = 'HTTP/1.1'
+    # Headers and body go out as separate writes; without TCP_NODELAY the body waits for a delayed ACK
+    disable_nagle_algorithm = True
+    server_version = 'Microsoft-IIS/10.0'
+    sys_version = ''
+
+    def log_message(self, format, *args):
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+    def do_GET(self):
+        server = self.server
+        parts = urlsplit(self.path)
+
+        if parts.path == STATS_PATH:
+            self._send(200, json.dumps(server.stats()).encode('utf-8'), 'application/json')
+            return
+
+        query = {k.lower(): v[0] for k, v in parse_qs(parts.query).items()}
+        if parts.path.lower() == CROSS_REFERENCE_PATH.lower():
+            key, kind = query.get('index', ''), 'crossref'
+        elif parts.path.lower() == CATALOG_PATH.lower():
+            key, kind = query.get('stylenumber', ''), 'catalog'
+        else:
+            server.count('not_found')
+            self._send(404, b'<html><body>Page not found</body></html>')
+            return
+
+        if server.bucket is not None and not server.bucket.take():
+            server.count('rate_limited')
+            self._send(429, b'<html><body>Too many requests</body></html>', extra_headers={'Retry-After': '1'})
+            return
+
+        drop, error, delay = server.draw()
+        if delay > 0:
+            time.sleep(delay)
+        if drop:
+            server.count('dropped')
+            self.close_connection = True
+            return
+        if error:
+            server.count('errors')
+            self._send(server.config.error_status, b'<html><body>Internal Server Error</body></html>')
+            return
+
+        body = server.corpus.page(kind, key)
+        if body is None and server.config.synthesize:
+            body = server.corpus.synthesized_page(kind, key)
+            if body is not None:
+                server.count(f'{kind}_synthesized')
+        if body is None:
+            server.count(f'{kind}_missing')
+            body = NO_BUSHING_FOUND_PAGE
+        else:
+            server.count(f'{kind}_served')
+        self._send(200, body)
+
+    def _send(self, status: int, body: bytes, content_type: str = 'text/html; charset=utf-8',
+              extra_headers: Optional[Dict[str, str]] = None):
+        self.server.count_bytes(len(body))
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (extra_headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class ReplayServer(ThreadingHTTPServer):
+    """
+    Threading HTTP server with the corpus, fault settings and counters attached.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], corpus: Corpus, config: ReplayConfig):
+        super().__init__(address, ReplayRequestHandler)
+        self.corpus = corpus
+        self.config = config
+        self.bucket = TokenBucket(config.rate_limit, config.burst) if config.rate_limit > 0 else None
+        self._random = random.Random(config.seed)
+        self._lock = threading.Lock()
+        self._counts = Counter()
+        self._bytes = 0
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        """Site root to pass as --base-url."""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def draw(self) -> Tuple[bool, bool, float]:
+        """
+        Fault decisions for one request.
+
+        Returns:
+            Tuple of (drop connection, send error status, service delay in seconds)
+        """
+        config = self.config
+        with self._lock:
+            self._counts['requests'] += 1
+            drop = self._random.random() < config.drop_rate
+            error = self._random.random() < config.error_rate
+            delay = config.latency + (self._random.uniform(0, config.jitter) if config.jitter > 0 else 0.0)
+        return drop, error, delay
+
+    def count(self, name: str):
+        with self._lock:
+            self._counts[name] += 1
+
+    def count_bytes(self, size: int):
+        with self._lock:
+            self._bytes += size
+
+    def stats(self) -> dict:
+        """Request counters since start."""
+        with self._lock:
+            return {**self._counts, 'bytes_sent': self._bytes}
+
+    def start(self) -> str:
+        """
+        Serve from a background thread (for benchmarks and tests in the same process).
+
+        Returns:
+            Site root URL of the server
+        """
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self.base_url
+
+    def stop(self):
+        """Stop a server started with start()."""
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+
+def create_server(host: str = '127.0.0.1', port: int = 0, raw_root: str = DEFAULT_RAW_ROOT,
+                  config: Optional[ReplayConfig] = None) -> ReplayServer:
+    """
+    Build a replay server over a raw HTML corpus.
+
+    Args:
+        host: Interface to bind
+        port: Port to bind (0 picks a free port)
+        raw_root: Folder holding cross_reference_data/ and catalog_data/
+        config: Latency, fault and rate-limit settings (default: a healthy, fast server)
+
+    Returns:
+        Bound ReplayServer (call serve_forever() or start())
+    """
+    config = config or ReplayConfig()
+    return ReplayServer((host, port), Corpus(raw_root, cache=config.cache), config)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Serve the saved Hitachi raw HTML corpus at the real site paths for offline load tests',
+        epilog='Examples:\n'
+               '  python hitachi_website_replay_server.py --port 8765\n'
+               '  python hitachi_website_replay_server.py --port 8765 --latency 80 --jitter 40 --error-rate 0.02\n'
+               '  python hitachi_website_replay_server.py --port 8765 --rate-limit 20 --burst 5 --seed 1\n',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('--host', type=str, default='127.0.0.1', help='Interface to bind (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8765, help='Port to listen on (default: 8765)')
+    parser.add_argument('--raw-dir', type=str, default=DEFAULT_RAW_ROOT,
+                       help='Raw HTML root holding cross_reference_data/ and catalog_data/')
+    parser.add_argument('--latency', type=float, default=0.0, help='Service time per request in ms (default: 0)')
+    parser.add_argument('--jitter', type=float, default=0.0, help='Extra uniform random service time in ms (default: 0)')
+    parser.add_argument('--error-rate', type=float, default=0.0,
+                       help='Fraction of requests answered with --error-status (default: 0)')
+    parser.add_argument('--error-status', type=int, default=500, help='HTTP status for injected errors (default: 500)')
+    parser.add_argument('--drop-rate', type=float, default=0.0,
+                       help='Fraction of connections closed without a response (default: 0)')
+    parser.add_argument('--rate-limit', type=float, default=0.0,
+                       help='Requests per second across all clients; excess gets HTTP 429 (default: unlimited)')
+    parser.add_argument('--burst', type=int, default=10, help='Token bucket size for --rate-limit (default: 10)')
+    parser.add_argument('--seed', type=int, default=None, help='Seed for injected faults and jitter')
+    parser.add_argument('--synthesize', action='store_true',
+                       help='Answer unknown keys with a corpus page instead of "No bushing found"')
+    parser.add_argument('--no-cache', action='store_true', help='Read every page from disk instead of keeping it in memory')
+    args = parser.parse_args()
+
+    for name in ('error_rate', 'drop_rate'):
+        if not 0.0 <= getattr(args, name) <= 1.0:
+            parser.error(f"--{name.replace('_', '-')} must be between 0 and 1")
+
+    config = ReplayConfig(
+        latency=args.latency / 1000.0,
+        jitter=args.jitter / 1000.0,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        drop_rate=args.drop_rate,
+        rate_limit=args.rate_limit,
+        burst=args.burst,
+        seed=args.seed,
+        cache=not args.no_cache,
+        synthesize=args.synthesize
+    )
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    server = create_server(args.host, args.port, args.raw_dir, config)
+
+    print(f"✓ Replaying {len(server.corpus.cross_reference)} cross-reference and "
+          f"{len(server.corpus.catalog)} catalog pages at {server.base_url}")
+    print(f"  Point the scrapers at it with --base-url {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"\n📊 {json.dumps(server.stats(), sort_keys=True)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Hitachi Website Retry Queue
+
+Low-priority queue of keys (indices or style numbers) whose fetch failed with a
+transient error. Each retry is scheduled with exponential backoff and jitter;
+the batch scrapers drain the queue once the main pass is finished (the asyncio
+backend with pop_async()).
+
+Author: Data Collection System
+Date: October 16, 2026
+Version: 1.1 - Event-loop friendly pop_async()
+"""
+
+import asyncio
+import heapq
+import itertools
+import random
+import time
+from typing import Hashable, Optional, Tuple
+
+
+class RetryQueue:
+    """
+    Min-heap of (ready_time, key, attempt) entries ordered by ready time.
+    """
+
+    def __init__(self, base_delay: float = 2.0, max_delay: float = 60.0):
+        """
+        Args:
+            base_delay: Backoff before the first retry in seconds (doubles per attempt)
+            max_delay: Upper bound for a single backoff in seconds
+        """
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._heap = []
+        self._sequence = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Backoff before the given retry attempt: exponential, capped, with
+        "equal jitter" (half fixed, half random) so retries of a failed burst
+        spread out instead of hitting the server together again.
+
+        Args:
+            attempt: Retry number (1 for the first retry)
+
+        Returns:
+            Delay in seconds
+        """
+        cap = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return cap / 2 + random.uniform(0, cap / 2)
+
+    def schedule(self, key: Hashable, attempt: int) -> float:
+        """
+        Queue a retry for a key.
+
+        Args:
+            key: Index or style number to retry
+            attempt: Retry number (1 for the first retry)
+
+        Returns:
+            Seconds until the retry becomes ready
+        """
+        delay = self.backoff(attempt)
+        heapq.heappush(self._heap, (time.monotonic() + delay, next(self._sequence), key, attempt))
+        return delay
+
+    def pop(self, wait: bool = True) -> Optional[Tuple[Hashable, int]]:
+        """
+        Take the retry that becomes ready first.
+
+        Args:
+            wait: Sleep until it is ready (otherwise return None if none is ready yet)
+
+        Returns:
+            Tuple of (key, attempt) or None if the queue is empty / nothing is ready
+        """
+        if not self._heap:
+            return None
+        ready_at = self._heap[0][0]
+        now = time.monotonic()
+        if ready_at > now:
+            if not wait:
+                return None
+            time.sleep(ready_at - now)
+        _, _, key, attempt = heapq.heappop(self._heap)
+        return key, attempt
+
+    async def pop_async(self) -> Optional[Tuple[Hashable, int]]:
+        """
+        Event-loop friendly variant of pop(wait=True) for the asyncio backend.
+
+        Returns:
+            Tuple of (key, attempt) or None if the queue is empty
+        """
+        if not self._heap:
+            return None
+        wait = self._heap[0][0] - time.monotonic()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        # A retry scheduled while sleeping may be first now; it is ready as well
+        _, _, key, attempt = heapq.heappop(self._heap)
+        return key, attempt
@@ -0,0 +1,406 @@
+"""
+Hitachi Website Sharded Runs and Deterministic Merge
+
+Splits a full sweep across several machines. With `--shard K/N` the batch
+scrapers only take the keys that belong to shard K of N and write to their own
+files, so shards never contend on one CSV:
+
+    hitachi_website_bushing_master_list_shard2of4.csv
+    hitachi_website_scraping_error_log_shard2of4.csv
+    hitachi_website_data_raw/cross_reference_data_shard2of4/
+
+Shard membership is a pure function of the key (index modulo N for
+cross-reference indices, CRC32 of the style number modulo N for catalog style
+numbers), so every machine computes the same disjoint slices without
+coordination.
+
+The merge command combines the shard outputs (and the existing canonical file)
+into the canonical master CSV and error log, deduplicated by key and sorted, by
+k-way merging the per-file row streams. Shard raw HTML files are copied into
+the canonical raw data folder, and the pages of shard raw HTML archives
+(--raw-storage archive) are appended to the canonical archive.
+
+Usage:
+    python hitachi_website_data_batch_scraper.py --start 1 --end 50000 --shard 1/4
+    python hitachi_website_catalog_batch_scraper.py --all --shard 3/4
+    python hitachi_website_sharding.py merge crossref
+    python hitachi_website_sharding.py merge catalog --shards 4 --remove-shards
+
+Author: Data Collection System
+Date: October 16, 2026
+Version: 1.2 - Fan-out raw HTML folders
+"""
+
+import argparse
+import csv
+import glob
+import heapq
+import logging
+import os
+import re
+import shutil
+import sys
+import zlib
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
+
+from hitachi_website_csv_writer import close_writer
+from hitachi_website_html_archive import archive_path, copy_archive, remove_archive
+from hitachi_website_raw_layout import iter_raw_files, raw_file_path
+
+logger = logging.getLogger(__name__)
+
+Shard = Tuple[int, int]
+
+SHARD_SUFFIX_RE = re.compile(r'_shard(\d+)of(\d+)$')
+
+
+def parse_shard(spec: str) -> Shard:
+    """
+    Parse a --shard value.
+
+    Args:
+        spec: Shard specification "K/N" with 1 <= K <= N
+
+    Returns:
+        Tuple of (K, N)
+
+    Raises:
+        ValueError: If the specification is malformed or out of range
+    """
+    match = re.fullmatch(r'\s*(\d+)\s*/\s*(\d+)\s*', spec or '')
+    if not match:
+        raise ValueError(f"Invalid shard '{spec}' (expected K/N, e.g. 2/4)")
+    k, n = int(match.group(1)), int(match.group(2))
+    if n < 1 or not 1 <= k <= n:
+        raise ValueError(f"Invalid shard '{spec}' (K must be between 1 and N)")
+    return k, n
+
+
+def shard_of_index(index: int, shard_count: int) -> int:
+    """Shard number (1-based) an INDEX belongs to."""
+    return index % shard_count + 1
+
+
+def shard_of_style(style_number: str, shard_count: int) -> int:
+    """Shard number (1-based) a style number belongs to (stable across processes)."""
+    return zlib.crc32(str(style_number).encode('utf-8')) % shard_count + 1
+
+
+def shard_range(start: int, end: int, shard: Shard) -> range:
+    """
+    The indices of start..end (inclusive) that belong to a shard, as a lazy range.
+
+    Args:
+        start: Starting index (inclusive)
+        end: Ending index (inclusive)
+        shard: Tuple of (K, N)
+
+    Returns:
+        range stepping by N through the shard's indices
+    """
+    k, n = shard
+    first = start + (k - 1 - start) % n
+    return range(first, end + 1, n)
+
+
+def filter_indices(indices: Iterable[int], shard: Shard) -> List[int]:
+    """Keep the indices that belong to a shard."""
+    k, n = shard
+    return [i for i in indices if shard_of_index(i, n) == k]
+
+
+def filter_styles(style_numbers: Iterable[str], shard: Shard) -> List[str]:
+    """Keep the style numbers that belong to a shard."""
+    k, n = shard
+    return [s for s in style_numbers if shard_of_style(s, n) == k]
+
+
+def shard_path(path: str, shard: Shard) -> str:
+    """
+    Per-shard variant of an output file or directory path.
+
+    Args:
+        path: Canonical path, e.g. "hitachi_website_bushing_master_list.csv"
+        shard: Tuple of (K, N)
+
+    Returns:
+        Path with a _shardKofN suffix before the extension,
+        e.g. "hitachi_website_bushing_master_list_shard2of4.csv"
+    """
+    k, n = shard
+    root, ext = os.path.splitext(path)
+    return f"{root}_shard{k}of{n}{ext}"
+
+
+def find_shard_paths(path: str, shard_count: Optional[int] = None) -> List[str]:
+    """
+    Locate the per-shard variants of a canonical path on disk.
+
+    Args:
+        path: Canonical path
+        shard_count: Only accept shards of this N (None accepts any N)
+
+    Returns:
+        Existing shard paths ordered by shard number
+    """
+    root, ext = os.path.splitext(path)
+    found = []
+    for candidate in glob.glob(f"{glob.escape(root)}_shard*of*{ext}"):
+        match = SHARD_SUFFIX_RE.search(os.path.splitext(candidate)[0] if ext else candidate)
+        if not match:
+            continue
+        k, n = int(match.group(1)), int(match.group(2))
+        if shard_count is None or n == shard_count:
+            found.append((n, k, candidate))
+    return [candidate for _, _, candidate in sorted(found)]
+
+
+# ---------------------------------------------------------------------- #
+# Merge
+# ---------------------------------------------------------------------- #
+
+def _index_key(value: str):
+    return int(float(value))
+
+
+def _style_key(value: str):
+    return str(value)
+
+
+def _row_priority_populated(row: dict, key_column: str) -> int:
+    # Rows with data sort before placeholder rows that only carry the key
+    return 0 if any(str(v).strip() for k, v in row.items() if k != key_column and v is not None) else 1
+
+
+def _is_strictly_sorted(path: str, key_column: str, key_func: Callable) -> bool:
+    """True if the keys of a CSV file are strictly increasing (cheap pre-pass)."""
+    previous = None
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        for row in csv.DictReader(f):
+            value = row.get(key_column)
+            if value is None or str(value).strip() == '':
+                continue
+            key = key_func(value)
+            if previous is not None and key <= previous:
+                return False
+            previous = key
+    return True
+
+
+def _iter_sorted_rows(path: str, rank: int, key_column: str, key_func: Callable,
+                      prefer_populated: bool) -> Iterator[tuple]:
+    """
+    Rows of one CSV as (key, populated, rank, -row_number, row) tuples in key order.
+
+    Files already in key order (e.g. written by a previous merge or by a range
+    run) are streamed row by row; otherwise the file is sorted in memory first.
+    """
+    def rows():
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            for number, row in enumerate(csv.DictReader(f)):
+                value = row.get(key_column)
+                if value is None or str(value).strip() == '':
+                    continue
+                priority = _row_priority_populated(row, key_column) if prefer_populated else 0
+                # Later rows of the same file are newer and win the dedupe
+                yield key_func(value), priority, rank, -number, row
+
+    if _is_strictly_sorted(path, key_column, key_func):
+        return rows()
+    logger.info(f"{path} is not in key order - sorting it before merging")
+    return iter(sorted(rows(), key=lambda item: item[:4]))
+
+
+def merge_csv_files(sources: List[str], destination: str, key_column: str, key_func: Callable,
+                    columns: Optional[List[str]] = None, prefer_populated: bool = False) -> Tuple[int, int]:
+    """
+    K-way merge of CSV files into one file sorted and deduplicated by key.
+
+    For duplicate keys the row from the earlier source wins (shards are listed
+    before the existing canonical file); within one file the last row wins.
+
+    Args:
+        sources: CSV files to merge, highest priority first
+        destination: Output CSV (written to a temporary file, then swapped in)
+        key_column: Column to sort and deduplicate by
+        key_func: Converts the key column text to a sortable key
+        columns: Output column order (default: columns of the first source)
+        prefer_populated: Prefer rows with data over key-only placeholder rows
+
+    Returns:
+        Tuple of (rows_written, duplicates_dropped)
+    """
+    sources = [path for path in sources if os.path.exists(path)]
+    if not sources:
+        return 0, 0
+
+    if columns is None:
+        with open(sources[0], 'r', encoding='utf-8', newline='') as f:
+            columns = next(csv.reader(f), [])
+
+    streams = [
+        _iter_sorted_rows(path, rank, key_column, key_func, prefer_populated)
+        for rank, path in enumerate(sources)
+    ]
+
+    written = 0
+    duplicates = 0
+    last_key = None
+    temp_path = f"{destination}.merging"
+    with open(temp_path, 'w', encoding='utf-8', newline='') as out:
+        writer = csv.DictWriter(out, fieldnames=columns, extrasaction='ignore')
+        writer.writeheader()
+        for key, _, _, _, row in heapq.merge(*streams, key=lambda item: item[:4]):
+            if written and key == last_key:
+                duplicates += 1
+                continue
+            writer.writerow({column: row.get(column, '') for column in columns})
+            last_key = key
+            written += 1
+    os.replace(temp_path, destination)
+    return written, duplicates
+
+
+def merge_raw_dirs(sources: List[str], destination: str) -> int:
+    """
+    Copy raw HTML files from shard folders into the canonical folder.
+
+    Args:
+        sources: Shard raw data folders
+        destination: Canonical raw data folder
+
+    Returns:
+        Number of files copied
+    """
+    copied = 0
+    for source in sources:
+        for name, path in iter_raw_files(source):
+            shutil.copy2(path, raw_file_path(destination, name, create=True))
+            copied += 1
+    return copied
+
+
+def merge_archives(sources: List[str], destination: str) -> int:
+    """
+    Append the pages of shard raw HTML archives to the canonical archive.
+
+    Args:
+        sources: Shard archives (.pack)
+        destination: Canonical archive
+
+    Returns:
+        Number of pages copied
+    """
+    return sum(copy_archive(source, destination) for source in sources)
+
+
+def merge_shards(kind: str, shard_count: Optional[int] = None, remove_shards: bool = False) -> dict:
+    """
+    Merge all shard outputs of one scraper into its canonical files.
+
+    Args:
+        kind: 'crossref' or 'catalog'
+        shard_count: Only merge shards of this N (None merges every shard found)
+        remove_shards: Delete shard files and folders after a successful merge
+
+    Returns:
+        Dict with per-file merge statistics
+    """
+    if kind == 'crossref':
+        import hitachi_website_data_scraper as scraper
+        key_column, error_key_column, key_func = 'Website Index', 'Index', _index_key
+    else:
+        import hitachi_website_catalog_scraper as scraper
+        key_column, error_key_column, key_func = 'Style Number', 'Style_Number', _style_key
+
+    output_csv, error_log_csv, raw_data_dir = scraper.OUTPUT_CSV, scraper.ERROR_LOG_CSV, scraper.RAW_DATA_DIR
+
+    shard_csvs = find_shard_paths(output_csv, shard_count)
+    shard_logs = find_shard_paths(error_log_csv, shard_count)
+    shard_dirs = [d for d in find_shard_paths(raw_data_dir, shard_count) if os.path.isdir(d)]
+    shard_archives = find_shard_paths(archive_path(raw_data_dir), shard_count)
+
+    stats = {'shards': max(len(shard_csvs), len(shard_logs), len(shard_dirs), len(shard_archives))}
+    if not stats['shards']:
+        return stats
+
+    # The merge rewrites the canonical error log; an open writer would overwrite it
+    close_writer(error_log_csv)
+
+    stats['rows'], stats['duplicates'] = merge_csv_files(
+        shard_csvs + [output_csv], output_csv, key_column, key_func,
+        columns=scraper.COLUMNS, prefer_populated=(kind == 'catalog')
+    )
+    stats['error_rows'], stats['error_duplicates'] = merge_csv_files(
+        shard_logs + [error_log_csv], error_log_csv, error_key_column, key_func
+    )
+    stats['raw_files'] = merge_raw_dirs(shard_dirs, raw_data_dir)
+    stats['archived_pages'] = merge_archives(shard_archives, archive_path(raw_data_dir))
+
+    # A key that succeeded in one place must not stay in the error log. Cleared
+    # through the scraper's error log, whose close also rebuilds the compact index
+    if os.path.exists(error_log_csv):
+        scraped = set()
+        if stats['rows']:
+            with open(output_csv, 'r', encoding='utf-8', newline='') as f:
+                scraped = {key_func(row[key_column]) for row in csv.DictReader(f)
+                           if _row_priority_populated(row, key_column) == 0}
+        log = scraper._error_log(error_log_csv)
+        stale = [key for key in log.keys() if key_func(str(key)) in scraped]
+        for key in stale:
+            log.clear(key)
+        close_writer(error_log_csv)
+        stats['error_rows'] -= len(stale)
+        stats['errors_cleared'] = len(stale)
+
+    if remove_shards:
+        for path in shard_csvs + shard_logs:
+            os.remove(path)
+        for directory in shard_dirs:
+            shutil.rmtree(directory)
+        for path in shard_archives:
+            remove_archive(path)
+
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Merge sharded Hitachi Energy scraper outputs into the canonical files',
+        epilog='Examples:\n'
+               '  python hitachi_website_sharding.py merge crossref\n'
+               '  python hitachi_website_sharding.py merge catalog --shards 4 --remove-shards\n',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    merge_parser = subparsers.add_parser('merge', help='Merge shard outputs into the canonical files')
+    merge_parser.add_argument('kind', choices=['crossref', 'catalog'],
+                              help='crossref (master list) or catalog (catalog master list)')
+    merge_parser.add_argument('--shards', type=int, default=None,
+                              help='Only merge shards of this N (default: every shard found)')
+    merge_parser.add_argument('--remove-shards', action='store_true',
+                              help='Delete shard CSVs, error logs, raw folders and archives after merging')
+
+    args = parser.parse_args()
+
+    stats = merge_shards(args.kind, args.shards, args.remove_shards)
+    if not stats['shards']:
+        print(f"✗ No shard outputs found for {args.kind}")
+        sys.exit(1)
+
+    print(f"\n{'='*70}")
+    print(f"Shard Merge Complete - {args.kind}")
+    print(f"{'='*70}")
+    print(f"Shards merged: {stats['shards']}")
+    print(f"Rows written: {stats['rows']} ({stats['duplicates']} duplicates dropped)")
+    print(f"Error log rows: {stats['error_rows']} ({stats.get('errors_cleared', 0)} cleared after success elsewhere)")
+    print(f"Raw HTML files copied: {stats['raw_files']}")
+    if stats['archived_pages']:
+        print(f"Archived raw HTML pages copied: {stats['archived_pages']}")
+    if args.remove_shards:
+        print("✓ Shard outputs removed")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    main()
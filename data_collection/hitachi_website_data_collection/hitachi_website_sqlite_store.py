@@ -0,0 +1,285 @@
+"""
+Hitachi Website SQLite Storage Backend
+
+Optional storage for the cross-reference and catalog master lists in a SQLite
+database next to the CSV (hitachi_website_bushing_master_list.db,
+hitachi_website_bushing_catalog_master_list.db), selected with --storage sqlite.
+
+One table per master list holds the CSV columns under their CSV names, keyed on
+Website Index or Style Number. Records are upserted, so overwrite mode replaces
+a row in place at constant cost. Upserts are buffered and committed in
+transactions of `batch_size` rows (or every `commit_interval` seconds), and the
+database runs in WAL mode, so other processes can query it while a scrape is
+writing. A new database is seeded from the existing master CSV; `export` writes
+the table back out in the CSV layout the rest of the tool chain reads.
+
+Usage:
+    python hitachi_website_data_batch_scraper.py --start 1 --end 50000 --storage sqlite
+    python hitachi_website_sqlite_store.py export crossref
+    python hitachi_website_sqlite_store.py export catalog --output catalog_snapshot.csv
+    python hitachi_website_sqlite_store.py count crossref
+
+Author: Data Collection System
+Date: October 16, 2026
+Version: 1.0 - SQLite master list storage with batched upserts
+"""
+
+import argparse
+import csv
+import logging
+import os
+import sqlite3
+import sys
+import threading
+import time
+from typing import Dict, List, Optional, Sequence
+
+from hitachi_website_csv_writer import close_writer
+from hitachi_website_processed_index import NA_VALUES
+
+logger = logging.getLogger(__name__)
+
+
+def _quote(name: str) -> str:
+    """SQL identifier for a CSV column name (names contain spaces and parentheses)."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+class SqliteStore:
+    """
+    One master list table with buffered, transactional upserts.
+    """
+
+    def __init__(self, path: str, table: str, columns: Sequence[str], key_column: str,
+                 integer_key: bool = False, indexes: Sequence[str] = (),
+                 seed_csv: Optional[str] = None, batch_size: int = 100,
+                 commit_interval: float = 2.0):
+        """
+        Args:
+            path: Database file (created if missing)
+            table: Table name
+            columns: CSV column order
+            key_column: Primary key column
+            integer_key: Store the key as INTEGER (Website Index) instead of TEXT
+            indexes: Further columns to index for lookups
+            seed_csv: Master CSV imported when the table is created
+            batch_size: Commit after this many upserts
+            commit_interval: ... or after this many seconds, whichever comes first
+        """
+        self.path = path
+        self.table = table
+        self.columns = list(columns)
+        self.key_column = key_column
+        self.integer_key = integer_key
+        self.batch_size = batch_size
+        self.commit_interval = commit_interval
+        self._pending: List[tuple] = []
+        self._lock = threading.Lock()
+        self._last_commit = time.monotonic()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute('PRAGMA synchronous=NORMAL')
+
+        created = self._create(indexes)
+        names = ', '.join(_quote(c) for c in self.columns)
+        updates = ', '.join(f"{_quote(c)} = excluded.{_quote(c)}" for c in self.columns if c != key_column)
+        self._upsert_sql = (f"INSERT INTO {_quote(table)} ({names}) VALUES ({', '.join('?' * len(self.columns))}) "
+                            f"ON CONFLICT({_quote(key_column)}) DO UPDATE SET {updates}")
+        if created and seed_csv and os.path.exists(seed_csv):
+            count = self.import_csv(seed_csv)
+            logger.info(f"Seeded {path} with {count} rows from {seed_csv}")
+
+    def _create(self, indexes: Sequence[str]) -> bool:
+        """Create the table and indexes if needed; True if the table is new."""
+        exists = self._connection.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (self.table,)
+        ).fetchone()
+        definitions = []
+        for column in self.columns:
+            if column == self.key_column:
+                definitions.append(f"{_quote(column)} {'INTEGER' if self.integer_key else 'TEXT'} PRIMARY KEY")
+            else:
+                definitions.append(f"{_quote(column)} TEXT")
+        with self._connection:
+            self._connection.execute(f"CREATE TABLE IF NOT EXISTS {_quote(self.table)} ({', '.join(definitions)})")
+            for column in indexes:
+                name = f"idx_{self.table}_{''.join(ch if ch.isalnum() else '_' for ch in column).lower()}"
+                self._connection.execute(
+                    f"CREATE INDEX IF NOT EXISTS {_quote(name)} ON {_quote(self.table)} ({_quote(column)})"
+                )
+        return not exists
+
+    def _values(self, row: Dict[str, object]) -> tuple:
+        values = []
+        for column in self.columns:
+            value = row.get(column)
+            if column == self.key_column and self.integer_key:
+                value = int(value)
+            elif value is not None:
+                value = str(value)
+            values.append(value)
+        return tuple(values)
+
+    def upsert(self, row: Dict[str, object]) -> None:
+        """
+        Insert or replace one record (buffered; committed in batches).
+
+        Args:
+            row: Column -> value; must contain the key column
+
+        Raises:
+            KeyError: If the row has no key
+        """
+        if row.get(self.key_column) in (None, ''):
+            raise KeyError(f"Row is missing {self.key_column}")
+        with self._lock:
+            self._pending.append(self._values(row))
+            if (len(self._pending) >= self.batch_size
+                    or time.monotonic() - self._last_commit >= self.commit_interval):
+                self._commit()
+
+    def _commit(self) -> None:
+        if self._pending:
+            with self._connection:
+                self._connection.executemany(self._upsert_sql, self._pending)
+            self._pending = []
+        self._last_commit = time.monotonic()
+
+    def commit(self) -> None:
+        """Write the buffered upserts in one transaction."""
+        with self._lock:
+            self._commit()
+
+    def import_csv(self, path: str) -> int:
+        """
+        Upsert every row of a master CSV in one transaction (later rows of a
+        key win, like overwrite compaction). Empty fields become NULL; all
+        other text is kept as is, so export_csv() reproduces the file.
+
+        Returns:
+            Number of rows read
+        """
+        count = 0
+        with open(path, 'r', newline='', encoding='utf-8') as f:
+            reader = csv.DictReader(f)
+            rows = []
+            for row in reader:
+                if not (row.get(self.key_column) or '').strip():
+                    continue
+                rows.append(self._values({c: (v if v != '' else None) for c, v in row.items()}))
+                count += 1
+        with self._lock, self._connection:
+            self._connection.executemany(self._upsert_sql, rows)
+        return count
+
+    def export_csv(self, path: str) -> int:
+        """
+        Write the table in the master CSV layout (atomic replace). Rows keep
+        their insertion order; NULL becomes an empty field.
+
+        Returns:
+            Number of rows written
+        """
+        self.commit()
+        names = ', '.join(_quote(c) for c in self.columns)
+        temp_path = f"{path}.tmp"
+        count = 0
+        with open(temp_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f, lineterminator=os.linesep)
+            writer.writerow(self.columns)
+            for row in self._connection.execute(f"SELECT {names} FROM {_quote(self.table)} ORDER BY rowid"):
+                writer.writerow(['' if value is None else value for value in row])
+                count += 1
+        os.replace(temp_path, path)
+        logger.info(f"Exported {count} rows from {self.path} to {path}")
+        return count
+
+    def keys(self, populated_only: bool = False) -> set:
+        """
+        Keys in the table.
+
+        Args:
+            populated_only: Only keys whose row has a populated non-key column
+
+        Returns:
+            Set of keys
+        """
+        self.commit()
+        sql = f"SELECT {_quote(self.key_column)} FROM {_quote(self.table)}"
+        if populated_only:
+            missing = ', '.join('?' * len(NA_VALUES))
+            sql += " WHERE " + " OR ".join(
+                f"({_quote(c)} NOT IN ({missing}) AND trim({_quote(c)}) != '')"
+                for c in self.columns if c != self.key_column
+            )
+            parameters = tuple(NA_VALUES) * (len(self.columns) - 1)
+        else:
+            parameters = ()
+        return {row[0] for row in self._connection.execute(sql, parameters)}
+
+    def count(self) -> int:
+        """Number of rows in the table."""
+        self.commit()
+        return self._connection.execute(f"SELECT COUNT(*) FROM {_quote(self.table)}").fetchone()[0]
+
+    def close(self) -> None:
+        """Commit, checkpoint the WAL into the database file and close."""
+        with self._lock:
+            if self._connection is None:
+                return
+            self._commit()
+            self._connection.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+            self._connection.close()
+            self._connection = None
+
+
+def remove_database(path: str) -> bool:
+    """Delete a database file with its WAL and shared-memory files; True if it existed."""
+    existed = os.path.exists(path)
+    for suffix in ('', '-wal', '-shm'):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+    return existed
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Export or inspect the SQLite master list databases',
+        epilog='Examples:\n'
+               '  python hitachi_website_sqlite_store.py export crossref\n'
+               '  python hitachi_website_sqlite_store.py export catalog --output catalog_snapshot.csv\n'
+               '  python hitachi_website_sqlite_store.py count crossref\n',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('command', choices=['export', 'count'],
+                        help='export: write the table to the master CSV layout; count: number of rows')
+    parser.add_argument('kind', choices=['crossref', 'catalog'], help='Which master list')
+    parser.add_argument('--output', default=None, help='export: CSV to write (default: the master CSV)')
+    args = parser.parse_args()
+
+    if args.kind == 'crossref':
+        import hitachi_website_data_scraper as scraper
+    else:
+        import hitachi_website_catalog_scraper as scraper
+
+    if not os.path.exists(scraper.database_path()):
+        print(f"✗ No database at {scraper.database_path()}")
+        sys.exit(1)
+    store = scraper.get_store()
+    try:
+        if args.command == 'export':
+            output = args.output or scraper.OUTPUT_CSV
+            count = store.export_csv(output)
+            print(f"✓ Exported {count} rows from {store.path} to {output}")
+        else:
+            print(f"{store.path}: {store.count()} rows")
+    finally:
+        close_writer(store.path)
+
+
+if __name__ == "__main__":
+    main()
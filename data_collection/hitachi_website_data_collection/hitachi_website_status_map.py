@@ -0,0 +1,364 @@
+"""
+Hitachi Website Index Status Map
+
+Compact binary state of the cross-reference INDEX space: 4 bits per index,
+memory-mapped, so the state of a million indices is a 512 KB file that opens
+and answers range queries in milliseconds. The state is otherwise spread over
+the master CSV, the error log and thousands of raw HTML files, and rebuilding
+it from them takes seconds to minutes.
+
+Status codes (fixed - they are stored in the file):
+     0 UNSEEN            never fetched
+     1 OK                row in the master CSV or raw HTML file present
+     2..13               last failure, one code per error type
+                         (NO_DATA, NO_BUSHING_FOUND, HTTP_404, HTTP_403, ...)
+
+File layout: a 128-byte header (magic, version, capacity and a signature of the
+source files the map was last synchronised with) followed by one nibble per
+index, two indices per byte (even index in the low nibble).
+
+The batch scraper updates the map as results come in and stores the new source
+signature when a run finishes cleanly. If the master CSV, error log or raw HTML
+folder changed in any other way (single-index scraper, manual edits, an aborted
+run), the signature no longer matches and the map is rebuilt from the sources
+on next use.
+
+Usage:
+    python hitachi_website_status_map.py summary
+    python hitachi_website_status_map.py summary --start 1 --end 50000
+    python hitachi_website_status_map.py plan --start 1 --end 1000000 --output indices.txt
+    python hitachi_website_status_map.py build
+
+Author: Data Collection System
+Date: October 16, 2026
+Version: 1.1 - Signature covers fan-out raw HTML buckets
+"""
+
+import argparse
+import logging
+import os
+import struct
+import sys
+import time
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+
+import hitachi_website_error_types as error_types
+from hitachi_website_raw_layout import tree_mtime_ns
+
+logger = logging.getLogger(__name__)
+
+STATUS_MAGIC = b'HWIDXST1'
+STATUS_VERSION = 1
+HEADER_SIZE = 128
+# magic, version, reserved, capacity, signature length, signature (6 x int64)
+HEADER_FORMAT = '<8sIIQI6q'
+SIGNATURE_FIELDS = 6
+MIN_CAPACITY = 1 << 16
+
+STATUS_UNSEEN = 0
+STATUS_OK = 1
+# Append only - codes are stored in existing files
+STATUS_NAMES = [
+    'UNSEEN', 'OK',
+    error_types.NO_DATA, error_types.NO_BUSHING_FOUND, error_types.HTTP_404,
+    error_types.HTTP_403, error_types.EMPTY_RESPONSE, error_types.TIMEOUT,
+    error_types.CONNECTION_ERROR, error_types.HTTP_ERROR, error_types.REQUEST_ERROR,
+    error_types.PARSE_FAILED, error_types.UNKNOWN_ERROR, error_types.HTTP_CLIENT_ERROR,
+]
+STATUS_CODES = {name: code for code, name in enumerate(STATUS_NAMES)}
+PERMANENT_STATUSES = frozenset(
+    STATUS_CODES[name] for name in error_types.PERMANENT_ERROR_TYPES
+)
+TRANSIENT_STATUSES = frozenset(
+    code for code in range(len(STATUS_NAMES)) if code not in PERMANENT_STATUSES | {STATUS_UNSEEN, STATUS_OK}
+)
+
+
+def status_of_error(error_type: Optional[str]) -> int:
+    """Status code of a failure (unknown or missing types map to UNKNOWN_ERROR)."""
+    return STATUS_CODES.get(error_type or error_types.UNKNOWN_ERROR, STATUS_CODES[error_types.UNKNOWN_ERROR])
+
+
+def source_signature(paths: Sequence[str]) -> Tuple[int, ...]:
+    """
+    Cheap fingerprint of the map's source files: size and mtime of up to three
+    paths (master CSV, error log, raw HTML folder). A folder's mtime changes
+    whenever a file is added or removed; for a fan-out folder the latest
+    mtime of its buckets counts.
+
+    Args:
+        paths: Source files and folders
+
+    Returns:
+        Tuple of SIGNATURE_FIELDS integers
+    """
+    values = []
+    for path in list(paths)[:SIGNATURE_FIELDS // 2]:
+        try:
+            if os.path.isdir(path):
+                values += [0, tree_mtime_ns(path)]
+            else:
+                stat = os.stat(path)
+                values += [stat.st_size, stat.st_mtime_ns]
+        except OSError:
+            values += [-1, -1]
+    values += [0] * (SIGNATURE_FIELDS - len(values))
+    return tuple(values)
+
+
+class StatusMap:
+    """
+    Memory-mapped 4-bit status per index.
+    """
+
+    def __init__(self, path: str, capacity: int = MIN_CAPACITY):
+        """
+        Open the map at path, creating an empty one if the file does not exist.
+
+        Args:
+            path: Status map file
+            capacity: Initial number of indices for a new file (grows on demand)
+
+        Raises:
+            ValueError: If the file exists but is not a status map
+        """
+        self.path = path
+        self.signature: Tuple[int, ...] = (0,) * SIGNATURE_FIELDS
+        if not os.path.exists(path) or os.path.getsize(path) < HEADER_SIZE:
+            self.capacity = _round_capacity(capacity)
+            self._write_header(create=True)
+        else:
+            with open(path, 'rb') as f:
+                header = f.read(HEADER_SIZE)
+            magic, version, _, capacity, length, *signature = struct.unpack_from(HEADER_FORMAT, header)
+            if magic != STATUS_MAGIC or version != STATUS_VERSION:
+                raise ValueError(f"{path} is not an index status map")
+            self.capacity = capacity
+            self.signature = tuple(signature[:length])
+        self._map()
+
+    def _map(self):
+        self.data = np.memmap(self.path, dtype=np.uint8, mode='r+', offset=HEADER_SIZE,
+                              shape=(self.capacity // 2,))
+
+    def _write_header(self, create: bool = False):
+        header = struct.pack(HEADER_FORMAT, STATUS_MAGIC, STATUS_VERSION, 0, self.capacity,
+                             len(self.signature), *self.signature)
+        with open(self.path, 'wb' if create else 'r+b') as f:
+            f.write(header.ljust(HEADER_SIZE, b'\0'))
+            if create:
+                f.truncate(HEADER_SIZE + self.capacity // 2)
+
+    def _grow(self, index: int):
+        """Extend the file so that index fits (capacity doubles)."""
+        capacity = self.capacity
+        while index >= capacity:
+            capacity *= 2
+        self.data.flush()
+        del self.data
+        with open(self.path, 'r+b') as f:
+            f.truncate(HEADER_SIZE + capacity // 2)
+        self.capacity = capacity
+        self._write_header()
+        self._map()
+
+    def get(self, index: int) -> int:
+        """Status code of one index (UNSEEN beyond the mapped range)."""
+        if index < 0 or index >= self.capacity:
+            return STATUS_UNSEEN
+        return (int(self.data[index >> 1]) >> ((index & 1) * 4)) & 0xF
+
+    def set(self, index: int, status: int) -> None:
+        """Store the status code of one index."""
+        if index < 0:
+            raise ValueError(f"Negative index {index}")
+        if index >= self.capacity:
+            self._grow(index)
+        shift = (index & 1) * 4
+        position = index >> 1
+        self.data[position] = (int(self.data[position]) & (0xF0 >> shift)) | ((status & 0xF) << shift)
+
+    def statuses(self, start: int, end: int) -> np.ndarray:
+        """
+        Status codes of an inclusive index range.
+
+        Returns:
+            uint8 array with one status code per index in start..end
+        """
+        start = max(start, 0)
+        end = min(end, self.capacity - 1)
+        if end < start:
+            return np.zeros(0, dtype=np.uint8)
+        packed = np.asarray(self.data[start >> 1:(end >> 1) + 1])
+        unpacked = np.empty(len(packed) * 2, dtype=np.uint8)
+        unpacked[0::2] = packed & 0xF
+        unpacked[1::2] = packed >> 4
+        offset = start & 1
+        return unpacked[offset:offset + end - start + 1]
+
+    def counts(self, start: int, end: int) -> Dict[str, int]:
+        """
+        Number of indices per status in an inclusive range (indices beyond the
+        mapped range count as UNSEEN).
+
+        Returns:
+            Dict of status name -> count (zero counts omitted)
+        """
+        statuses = self.statuses(start, end)
+        counts = np.bincount(statuses, minlength=16)
+        result = {STATUS_NAMES[code]: int(count) for code, count in enumerate(counts[:len(STATUS_NAMES)]) if count}
+        beyond = (end - start + 1) - len(statuses)
+        if beyond > 0:
+            result['UNSEEN'] = result.get('UNSEEN', 0) + beyond
+        return result
+
+    def select(self, start: int, end: int, statuses: Iterable[int]) -> np.ndarray:
+        """
+        Indices of an inclusive range whose status is one of the given codes.
+
+        Returns:
+            int64 array of indices in ascending order
+        """
+        codes = np.fromiter(statuses, dtype=np.uint8)
+        found = np.flatnonzero(np.isin(self.statuses(start, end), codes)) + max(start, 0)
+        if STATUS_UNSEEN in codes and end >= self.capacity:
+            found = np.concatenate([found, np.arange(max(start, self.capacity), end + 1)])
+        return found
+
+    def plan(self, start: int, end: int, retry_transient: bool = True) -> np.ndarray:
+        """
+        Indices of a range that a batch run would fetch: never seen, plus the
+        last transient failures (unless retry_transient is False).
+
+        Returns:
+            int64 array of indices in ascending order
+        """
+        wanted = {STATUS_UNSEEN} | (TRANSIENT_STATUSES if retry_transient else set())
+        return self.select(start, end, wanted)
+
+    def flush(self) -> None:
+        self.data.flush()
+
+    def close(self, signature: Optional[Tuple[int, ...]] = None) -> None:
+        """
+        Flush the map and optionally record the source signature it is now in sync with.
+
+        Args:
+            signature: Result of source_signature() after the sources were written
+        """
+        self.data.flush()
+        if signature is not None:
+            self.signature = tuple(signature)
+            self._write_header()
+        del self.data
+
+
+def _round_capacity(capacity: int) -> int:
+    size = MIN_CAPACITY
+    while size < capacity:
+        size *= 2
+    return size
+
+
+def build_status_map(path: str, scraped: Iterable[int], errors: Dict[int, str],
+                     signature: Tuple[int, ...]) -> StatusMap:
+    """
+    Write a fresh status map from the current sources.
+
+    A permanent failure wins over scraped data (the batch scraper skips such an
+    index as "in error log" first), scraped data wins over a transient failure.
+
+    Args:
+        path: Status map file (replaced)
+        scraped: Indices with a master CSV row or raw HTML file
+        errors: Index -> error type from the error log
+        signature: source_signature() of the sources read
+
+    Returns:
+        The open StatusMap
+    """
+    scraped = np.fromiter((int(i) for i in scraped), dtype=np.int64)
+    error_indices = np.fromiter((int(i) for i in errors), dtype=np.int64)
+    error_codes = np.fromiter((status_of_error(t) for t in errors.values()), dtype=np.uint8)
+    highest = max([0] + [int(a.max()) for a in (scraped, error_indices) if len(a)])
+
+    statuses = np.zeros(_round_capacity(highest + 1), dtype=np.uint8)
+    transient = ~np.isin(error_codes, list(PERMANENT_STATUSES))
+    statuses[error_indices[transient]] = error_codes[transient]
+    statuses[scraped] = STATUS_OK
+    statuses[error_indices[~transient]] = error_codes[~transient]
+
+    temp_path = f"{path}.tmp"
+    if os.path.exists(temp_path):
+        os.remove(temp_path)
+    status_map = StatusMap(temp_path, len(statuses))
+    status_map.data[:] = statuses[0::2] | (statuses[1::2] << 4)
+    status_map.close(signature)
+    os.replace(temp_path, path)
+    logger.info(f"Built index status map {path}: {len(scraped)} scraped, {len(errors)} logged failures")
+    return StatusMap(path)
+
+
+def format_counts(counts: Dict[str, int]) -> str:
+    """One-line 'NAME count' summary in status-code order."""
+    return ", ".join(f"{name} {counts[name]}" for name in STATUS_NAMES if counts.get(name))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Inspect the cross-reference index status map',
+        epilog='Examples:\n'
+               '  python hitachi_website_status_map.py summary --start 1 --end 50000\n'
+               '  python hitachi_website_status_map.py plan --start 1 --end 1000000 --output indices.txt\n'
+               '  python hitachi_website_status_map.py build\n',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('command', choices=['summary', 'plan', 'build'],
+                        help='summary: counts per status; plan: indices a batch run would fetch; '
+                             'build: rebuild from the master CSV, error log and raw HTML folder')
+    parser.add_argument('--start', type=int, default=1, help='First index (default: 1)')
+    parser.add_argument('--end', type=int, default=None, help='Last index (default: highest known index)')
+    parser.add_argument('--no-retry', action='store_true', help='plan: leave out indices whose last failure was transient')
+    parser.add_argument('--output', default=None, help='plan: write the indices to this file (one per line) for --file')
+    args = parser.parse_args()
+
+    # The batch scraper owns the source paths and the rebuild rules
+    import hitachi_website_data_batch_scraper as batch
+
+    started = time.perf_counter()
+    status_map = batch.open_status_map(rebuild=(args.command == 'build'))
+    opened = time.perf_counter() - started
+    try:
+        end = args.end
+        if end is None:
+            known = np.flatnonzero(status_map.statuses(0, status_map.capacity - 1))
+            end = int(known[-1]) if len(known) else args.start
+        if args.start > end:
+            parser.error('--start must be less than or equal to --end')
+
+        if args.command in ('summary', 'build'):
+            counts = status_map.counts(args.start, end)
+            print(f"Index status {args.start}-{end} ({status_map.path}, opened in {opened * 1000:.0f} ms)")
+            print(f"  {format_counts(counts)}")
+            permanent = sum(counts.get(STATUS_NAMES[code], 0) for code in PERMANENT_STATUSES)
+            transient = sum(counts.get(STATUS_NAMES[code], 0) for code in TRANSIENT_STATUSES)
+            print(f"  OK {counts.get('OK', 0)} | permanent failures {permanent} | "
+                  f"transient failures {transient} | unseen {counts.get('UNSEEN', 0)}")
+        else:
+            started = time.perf_counter()
+            indices = status_map.plan(args.start, end, retry_transient=not args.no_retry)
+            elapsed = time.perf_counter() - started
+            if args.output:
+                np.savetxt(args.output, indices, fmt='%d')
+                print(f"✓ {len(indices)} indices to fetch in {args.start}-{end} written to {args.output} "
+                      f"({elapsed * 1000:.0f} ms)")
+            else:
+                sys.stdout.write("\n".join(map(str, indices.tolist())) + ("\n" if len(indices) else ""))
+    finally:
+        status_map.close()
+
+
+if __name__ == "__main__":
+    main()
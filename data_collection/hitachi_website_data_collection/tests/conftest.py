@@ -0,0 +1,82 @@
+"""
+Shared fixtures for the Hitachi website scraper tests.
+
+Every test runs in its own temporary working directory, so the scrapers'
+relative output paths (master CSV, error log, raw HTML folder, journal) never
+touch the real files next to the scripts. Network tests talk to the local
+replay server (hitachi_website_replay_server.py) over a small copy of the saved
+raw HTML corpus.
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PACKAGE_DIR)
+
+from hitachi_website_csv_writer import close_all_writers
+from hitachi_website_replay_server import ReplayConfig, create_server
+
+CORPUS_DIR = os.path.join(PACKAGE_DIR, "hitachi_website_data_raw", "cross_reference_data")
+
+# Indices 1..30 of the saved corpus; 24 has no page, so the site answers "No bushing found"
+CORPUS_INDICES = list(range(1, 31))
+MISSING_INDEX = 24
+
+
+def raw_name(index) -> str:
+    """Raw HTML file name of an index or style number (as save_raw_html() writes it)."""
+    return f"Hitachi_website_bushing_{index}.html"
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """Temporary working directory; writers opened by a test are closed afterwards."""
+    monkeypatch.chdir(tmp_path)
+    yield tmp_path
+    close_all_writers()
+
+
+@pytest.fixture(scope="session")
+def corpus_root(tmp_path_factory):
+    """Raw HTML root (cross_reference_data/) holding the saved pages of CORPUS_INDICES."""
+    root = tmp_path_factory.mktemp("corpus")
+    target = root / "cross_reference_data"
+    target.mkdir()
+    for index in CORPUS_INDICES:
+        source = os.path.join(CORPUS_DIR, raw_name(index))
+        if os.path.exists(source):
+            shutil.copy(source, target / raw_name(index))
+    return str(root)
+
+
+@pytest.fixture
+def replay_server(corpus_root):
+    """
+    Factory for replay servers over the test corpus. Keyword arguments are
+    ReplayConfig fields; the servers are stopped after the test.
+    """
+    servers = []
+
+    def start(**config):
+        server = create_server(raw_root=corpus_root, config=ReplayConfig(seed=1, **config))
+        server.start()
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.stop()
+
+
+def run_script(script: str, *args: str, cwd, check: bool = True) -> subprocess.CompletedProcess:
+    """Run one of the scraper command-line scripts in a fresh interpreter."""
+    result = subprocess.run([sys.executable, os.path.join(PACKAGE_DIR, script), *args],
+                            cwd=str(cwd), capture_output=True, text=True, timeout=300)
+    if check and result.returncode != 0:
+        raise AssertionError(f"{script} {' '.join(args)} exited with {result.returncode}:\n{result.stderr[-2000:]}")
+    return result
@@ -0,0 +1,74 @@
+"""
+Overwrite-mode compaction of the streaming master CSV writer.
+"""
+
+import csv
+
+import hitachi_website_data_scraper as crossref
+from hitachi_website_csv_writer import CsvAppendWriter, compact_csv
+
+from conftest import run_script
+
+COLUMNS = ["Website Index", "Manufacturer", "Style"]
+
+
+def read_rows(path):
+    with open(path, newline='', encoding='utf-8') as f:
+        return list(csv.reader(f))
+
+
+def row(index, manufacturer, style):
+    return {"Website Index": index, "Manufacturer": manufacturer, "Style": style}
+
+
+def test_overwrite_replaces_rows_on_close(workdir):
+    path = str(workdir / "master.csv")
+    writer = CsvAppendWriter(path, COLUMNS, "Website Index")
+    for index in (1, 2, 3):
+        writer.append(row(index, "GE", f"old-{index}"))
+    writer.close()
+
+    writer = CsvAppendWriter(path, COLUMNS, "Website Index")
+    writer.append(row(2, "ABB", "new-2"), replace=True)
+    # Until the writer is closed the old and the new row are both in the file
+    assert [r[0] for r in read_rows(path)[1:]] == ['1', '2', '3', '2']
+    writer.close()
+
+    # Same file as replacing the row in place, with the replaced row moved to the end
+    assert read_rows(path) == [COLUMNS, ['1', 'GE', 'old-1'], ['3', 'GE', 'old-3'], ['2', 'ABB', 'new-2']]
+
+
+def test_next_overwrite_compacts_rows_left_by_a_killed_run(workdir):
+    path = str(workdir / "master.csv")
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        csv.writer(f).writerows([COLUMNS, ['1', 'GE', 'a'], ['2', 'GE', 'b'], ['2', 'ABB', 'c'], ['3', 'GE', 'd']])
+
+    writer = CsvAppendWriter(path, COLUMNS, "Website Index")
+    writer.append(row(2, "ABB", "e"), replace=True)
+    writer.close()
+
+    assert read_rows(path) == [COLUMNS, ['1', 'GE', 'a'], ['3', 'GE', 'd'], ['2', 'ABB', 'e']]
+
+
+def test_compact_csv_keeps_last_row_of_given_keys_only(workdir):
+    path = str(workdir / "master.csv")
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        csv.writer(f).writerows([COLUMNS, ['1', 'x', 'a'], ['1', 'x', 'b'], ['2', 'x', 'c'], ['2', 'x', 'd']])
+
+    assert compact_csv(path, "Website Index", {'1'}) == 1
+    assert read_rows(path)[1:] == [['1', 'x', 'b'], ['2', 'x', 'c'], ['2', 'x', 'd']]
+
+
+def test_overwrite_run_leaves_one_row_per_index(workdir, replay_server):
+    base_url = replay_server().base_url
+    run_script("hitachi_website_data_batch_scraper.py", '--start', '1', '--end', '10', '--delay', '0',
+               '--base-url', base_url, cwd=workdir)
+    before = read_rows(crossref.OUTPUT_CSV)
+
+    run_script("hitachi_website_data_batch_scraper.py", '--indices', '2,5,5,9,2', '--mode', 'overwrite',
+               '--delay', '0', '--workers', '4', '--base-url', base_url, cwd=workdir)
+
+    after = read_rows(crossref.OUTPUT_CSV)
+    assert after[0] == before[0]
+    assert sorted(int(r[0]) for r in after[1:]) == list(range(1, 11))
+    assert sorted(after[1:]) == sorted(before[1:])
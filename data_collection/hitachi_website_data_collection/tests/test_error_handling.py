@@ -0,0 +1,97 @@
+"""
+Transient vs permanent error classification, and what a failed fetch does to
+the raw HTML that is already saved for the key.
+"""
+
+import pytest
+
+import hitachi_website_data_scraper as crossref
+import hitachi_website_error_types as error_types
+from hitachi_website_raw_layout import find_raw_file
+
+from conftest import MISSING_INDEX, raw_name
+
+
+@pytest.mark.parametrize("status, error_type, permanent", [
+    (400, error_types.HTTP_CLIENT_ERROR, True),
+    (401, error_types.HTTP_CLIENT_ERROR, True),
+    (403, error_types.HTTP_403, False),
+    (404, error_types.HTTP_404, True),
+    (410, error_types.HTTP_CLIENT_ERROR, True),
+    (429, error_types.HTTP_ERROR, False),
+    (500, error_types.HTTP_ERROR, False),
+    (503, error_types.HTTP_ERROR, False),
+])
+def test_http_status_classification(status, error_type, permanent):
+    assert error_types.http_error_type(status) == error_type
+    assert error_types.is_permanent_error(error_type) is permanent
+    assert error_types.is_transient_error(error_type) is not permanent
+    assert error_types.classify_error_message(f"HTTP error {status}: Server said no") == error_type
+
+
+@pytest.fixture
+def site(workdir, replay_server):
+    """Point the cross-reference scraper at a replay server configured by the test."""
+    def start(**config):
+        crossref.configure_base_url(replay_server(**config).base_url)
+    yield start
+    crossref.configure_base_url(None)
+
+
+def saved_page(index):
+    """Save a placeholder raw page for an index, as an earlier successful run would have."""
+    assert crossref.save_raw_html("<html><body>saved earlier</body></html>", index)
+    return find_raw_file(crossref.RAW_DATA_DIR, raw_name(index))
+
+
+@pytest.mark.parametrize("config, error_type", [
+    ({'error_rate': 1.0, 'error_status': 500}, error_types.HTTP_ERROR),
+    ({'error_rate': 1.0, 'error_status': 503}, error_types.HTTP_ERROR),
+    ({'error_rate': 1.0, 'error_status': 429}, error_types.HTTP_ERROR),
+    ({'error_rate': 1.0, 'error_status': 403}, error_types.HTTP_403),
+    ({'drop_rate': 1.0}, error_types.CONNECTION_ERROR),
+])
+def test_transient_failure_keeps_saved_raw_html(site, config, error_type):
+    site(**config)
+    path = saved_page(5)
+
+    assert crossref.scrape_bushing_data(5) is None
+
+    assert crossref.get_last_error_type(5) == error_type
+    assert crossref._error_log().get(5)['Error_Type'] == error_type
+    assert find_raw_file(crossref.RAW_DATA_DIR, raw_name(5)) == path
+
+
+@pytest.mark.parametrize("config, error_type", [
+    ({'error_rate': 1.0, 'error_status': 404}, error_types.HTTP_404),
+    ({'error_rate': 1.0, 'error_status': 410}, error_types.HTTP_CLIENT_ERROR),
+    ({'error_rate': 1.0, 'error_status': 400}, error_types.HTTP_CLIENT_ERROR),
+])
+def test_permanent_failure_deletes_saved_raw_html(site, config, error_type):
+    site(**config)
+    saved_page(5)
+
+    assert crossref.scrape_bushing_data(5) is None
+
+    assert crossref.get_last_error_type(5) == error_type
+    assert crossref._error_log().get(5)['Error_Type'] == error_type
+    assert find_raw_file(crossref.RAW_DATA_DIR, raw_name(5)) is None
+
+
+def test_no_bushing_found_page_is_permanent(site):
+    site()
+    saved_page(MISSING_INDEX)
+
+    assert crossref.scrape_bushing_data(MISSING_INDEX) is None
+
+    assert crossref.get_last_error_type(MISSING_INDEX) == error_types.NO_BUSHING_FOUND
+    assert find_raw_file(crossref.RAW_DATA_DIR, raw_name(MISSING_INDEX)) is None
+
+
+def test_success_saves_raw_html(site):
+    site()
+
+    data = crossref.scrape_bushing_data(5)
+
+    assert data is not None and data['Website Index'] == '5'
+    assert find_raw_file(crossref.RAW_DATA_DIR, raw_name(5)) is not None
@@ -0,0 +1,53 @@
+"""
+The lxml fast path (parse_bushing_html) must return exactly the record the
+BeautifulSoup parser (parse_bushing_info) returns for the same page.
+"""
+
+import pytest
+from bs4 import BeautifulSoup
+
+import hitachi_website_data_scraper as crossref
+from hitachi_website_raw_layout import iter_raw_files
+from hitachi_website_replay_server import NO_BUSHING_FOUND_PAGE
+
+from conftest import CORPUS_DIR
+
+# Every SAMPLE_STEP-th saved page in key order keeps the test fast on the full corpus
+SAMPLE_STEP = 50
+
+
+def sampled_pages():
+    pages = sorted(
+        (int(name[len("Hitachi_website_bushing_"):-len(".html")]), path)
+        for name, path in iter_raw_files(CORPUS_DIR)
+    )
+    return pages[::SAMPLE_STEP]
+
+
+@pytest.mark.parametrize("index, path", sampled_pages(), ids=lambda value: str(value) if isinstance(value, int) else '')
+def test_fast_parser_matches_soup_parser(index, path):
+    with open(path, 'rb') as f:
+        content = f.read()
+    html = content.decode('utf-8', errors='replace')
+
+    reference = crossref.parse_bushing_info(BeautifulSoup(html, 'lxml'), index)
+    assert reference is not None
+
+    assert crossref.parse_bushing_html(html, index) == reference
+    # Bytes are decoded the way BeautifulSoup decodes them
+    reference = crossref.parse_bushing_info(BeautifulSoup(content, 'lxml'), index)
+    assert crossref.parse_bushing_html(content, index) == reference
+
+
+@pytest.mark.parametrize("html", [
+    NO_BUSHING_FOUND_PAGE.decode('utf-8'),
+    "<html><body><p>Bushing Information</p></body></html>",
+    "",
+])
+def test_fast_parser_matches_soup_parser_on_pages_without_a_bushing(html):
+    assert crossref.parse_bushing_html(html, 7) == crossref.parse_bushing_info(BeautifulSoup(html, 'lxml'), 7)
+
+
+def test_corpus_is_sampled():
+    # An empty sample would pass the equality test vacuously
+    assert len(sampled_pages()) > 10
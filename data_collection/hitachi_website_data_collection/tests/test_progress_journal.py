@@ -0,0 +1,82 @@
+"""
+Progress journal loading and `--resume` of an interrupted batch run.
+"""
+
+import csv
+import os
+import signal
+import subprocess
+import sys
+import time
+
+import hitachi_website_data_batch_scraper as crossref_batch
+import hitachi_website_data_scraper as crossref
+from hitachi_website_progress_journal import (
+    OUTCOME_FAIL, OUTCOME_OK, ProgressJournal, load_journal, remaining_keys
+)
+
+from conftest import CORPUS_INDICES, MISSING_INDEX, PACKAGE_DIR, run_script
+
+BATCH = "hitachi_website_data_batch_scraper.py"
+
+
+def test_load_journal_ignores_torn_last_line(workdir):
+    journal = ProgressJournal("journal.log")
+    journal.start('crossref', {'source': 'list', 'keys': [1, 2, 3, 4], 'mode': 'append'})
+    journal.record(1, OUTCOME_OK)
+    journal.record(2, OUTCOME_FAIL, 'TIMEOUT')
+    journal.record(2, OUTCOME_OK)
+    journal.close()
+    with open("journal.log", 'a', encoding='utf-8') as f:
+        f.write("3\tok\t\t17606")   # killed while writing the line
+
+    header, entries = load_journal("journal.log", key_type=int)
+
+    assert header['params']['keys'] == [1, 2, 3, 4]
+    assert {key: outcome for key, (outcome, _, _) in entries.items()} == {1: OUTCOME_OK, 2: OUTCOME_OK}
+    assert remaining_keys(header['params']['keys'], entries) == [3, 4]
+
+
+def journaled_keys(path):
+    _, entries = load_journal(path, key_type=int)
+    return entries
+
+
+def test_resume_continues_an_interrupted_run(tmp_path, replay_server):
+    server = replay_server(latency=0.15)
+    journal = tmp_path / crossref_batch.JOURNAL_FILE
+    run = subprocess.Popen(
+        [sys.executable, os.path.join(PACKAGE_DIR, BATCH), '--start', str(CORPUS_INDICES[0]),
+         '--end', str(CORPUS_INDICES[-1]), '--delay', '0', '--base-url', server.base_url],
+        cwd=str(tmp_path), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        deadline = time.monotonic() + 60
+        while time.monotonic() < deadline and not (journal.exists() and len(journaled_keys(journal)) >= 8):
+            time.sleep(0.05)
+        run.send_signal(signal.SIGTERM)
+        assert run.wait(timeout=60) != 0
+    finally:
+        if run.poll() is None:
+            run.kill()
+
+    done = journaled_keys(journal)
+    assert 8 <= len(done) < len(CORPUS_INDICES)
+
+    resumed = replay_server()
+    run_script(BATCH, '--resume', '--delay', '0', '--base-url', resumed.base_url, cwd=tmp_path)
+
+    # Only the keys without an outcome were fetched again (the one cut off by
+    # the kill may already be in the master list and is then skipped)
+    fetched = resumed.stats()['requests']
+    assert len(CORPUS_INDICES) - len(done) - 1 <= fetched <= len(CORPUS_INDICES) - len(done)
+    entries = journaled_keys(journal)
+    assert sorted(entries) == CORPUS_INDICES
+    assert all(entries[key] == done[key] for key in done)
+
+    with open(tmp_path / crossref.OUTPUT_CSV, newline='', encoding='utf-8') as f:
+        scraped = [int(row['Website Index']) for row in csv.DictReader(f)]
+    assert sorted(scraped) == [i for i in CORPUS_INDICES if i != MISSING_INDEX]
+
+    result = run_script(BATCH, '--resume', '--delay', '0', '--base-url', resumed.base_url, cwd=tmp_path)
+    assert 'Nothing left to do' in result.stdout
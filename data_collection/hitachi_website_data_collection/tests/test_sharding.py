@@ -0,0 +1,112 @@
+"""
+A sweep split into shards and merged must leave the same master list, error
+log and raw HTML folder as the same sweep run on one machine, whatever order
+the shards ran or finished in.
+"""
+
+import csv
+import filecmp
+import os
+import shutil
+
+import numpy as np
+
+import hitachi_website_data_scraper as crossref
+from hitachi_website_error_index import error_index_path
+from hitachi_website_raw_layout import raw_file_paths
+
+from conftest import CORPUS_INDICES, MISSING_INDEX, run_script
+
+BATCH = "hitachi_website_data_batch_scraper.py"
+SHARDING = "hitachi_website_sharding.py"
+SHARDS = 3
+
+
+def read_table(path):
+    with open(path, newline='', encoding='utf-8') as f:
+        return list(csv.reader(f))
+
+
+def error_types_by_key(path):
+    with open(path, newline='', encoding='utf-8') as f:
+        return {row['Index']: row['Error_Type'] for row in csv.DictReader(f)}
+
+
+def sweep(directory, base_url, *args):
+    run_script(BATCH, '--start', str(CORPUS_INDICES[0]), '--end', str(CORPUS_INDICES[-1]),
+               '--delay', '0', '--base-url', base_url, *args, cwd=directory)
+
+
+def sharded_sweep(directory, base_url):
+    # Last shard first, several workers: shard files are not in key order
+    for k in range(SHARDS, 0, -1):
+        sweep(directory, base_url, '--shard', f'{k}/{SHARDS}', '--workers', '3')
+
+
+def test_merged_shards_match_a_single_machine_run(tmp_path, replay_server):
+    base_url = replay_server().base_url
+    single, sharded = tmp_path / "single", tmp_path / "sharded"
+    single.mkdir()
+    sharded.mkdir()
+
+    sweep(single, base_url)
+    sharded_sweep(sharded, base_url)
+    run_script(SHARDING, 'merge', 'crossref', '--remove-shards', cwd=sharded)
+
+    assert read_table(sharded / crossref.OUTPUT_CSV) == read_table(single / crossref.OUTPUT_CSV)
+    assert error_types_by_key(sharded / crossref.ERROR_LOG_CSV) == \
+        error_types_by_key(single / crossref.ERROR_LOG_CSV) == {str(MISSING_INDEX): 'NO_BUSHING_FOUND'}
+
+    single_raw = raw_file_paths(str(single / crossref.RAW_DATA_DIR))
+    merged_raw = raw_file_paths(str(sharded / crossref.RAW_DATA_DIR))
+    assert sorted(merged_raw) == sorted(single_raw)
+    assert all(filecmp.cmp(merged_raw[name], single_raw[name], shallow=False) for name in single_raw)
+    # --remove-shards deleted the shard CSVs, error logs and raw folders
+    assert not [name for name in os.listdir(sharded) if '_shard' in name and name.endswith('.csv')]
+    assert os.listdir(sharded / os.path.dirname(crossref.RAW_DATA_DIR)) == [os.path.basename(crossref.RAW_DATA_DIR)]
+
+
+def test_merge_is_deterministic(tmp_path, replay_server):
+    base_url = replay_server().base_url
+    first, second = tmp_path / "first", tmp_path / "second"
+    first.mkdir()
+    sharded_sweep(first, base_url)
+    shutil.copytree(first, second)
+
+    for directory in (first, second):
+        run_script(SHARDING, 'merge', 'crossref', cwd=directory)
+
+    for name in (crossref.OUTPUT_CSV, crossref.ERROR_LOG_CSV):
+        assert filecmp.cmp(first / name, second / name, shallow=False)
+    keys = [int(row[0]) for row in read_table(first / crossref.OUTPUT_CSV)[1:]]
+    assert keys == sorted(set(keys))
+
+    # Merging again changes nothing
+    merged = read_table(first / crossref.OUTPUT_CSV)
+    run_script(SHARDING, 'merge', 'crossref', cwd=first)
+    assert read_table(first / crossref.OUTPUT_CSV) == merged
+
+
+def test_merge_clears_errors_of_keys_scraped_in_another_shard(tmp_path, replay_server):
+    base_url = replay_server().base_url
+    # Shard 1 of 3 takes the indices divisible by 3, MISSING_INDEX among them
+    sweep(tmp_path, base_url, '--shard', f'1/{SHARDS}')
+    # An earlier canonical run failed on a key that shard 1 has now scraped
+    scraped = 3
+    with open(tmp_path / crossref.ERROR_LOG_CSV, 'w', newline='', encoding='utf-8') as f:
+        csv.writer(f).writerows([
+            ['Timestamp', 'Index', 'Error_Type', 'HTTP_Status', 'Attempts', 'Error_Message'],
+            ['2026-10-16 10:00:00', str(scraped), 'TIMEOUT', '', '3', 'Request timeout after 30 seconds'],
+        ])
+
+    result = run_script(SHARDING, 'merge', 'crossref', cwd=tmp_path)
+
+    assert '(1 cleared' in result.stdout
+    rows = read_table(tmp_path / crossref.ERROR_LOG_CSV)
+    assert rows[0] == ['Timestamp', 'Index', 'Error_Type', 'HTTP_Status', 'Attempts', 'Error_Message']
+    assert [(row[1], row[2], row[4]) for row in rows[1:]] == [(str(MISSING_INDEX), 'NO_BUSHING_FOUND', '1')]
+    # The merge saved the compact index of the rewritten log (not a stale one)
+    log_path = str(tmp_path / crossref.ERROR_LOG_CSV)
+    with np.load(error_index_path(log_path)) as saved:
+        assert saved['signature'].tolist() == [os.path.getsize(log_path), os.stat(log_path).st_mtime_ns]
+        assert saved['keys'].tolist() == [MISSING_INDEX]
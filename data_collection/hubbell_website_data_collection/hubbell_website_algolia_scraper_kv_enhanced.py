@@ -37,6 +37,12 @@ import logging
 import time
 from typing import Optional, Dict, List
 from urllib.parse import quote
+from pathlib import Path
+import sys
+
+# Shared pooled HTTP client lives in data_collection/
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from scraping_http_client import http_post
 
 # Configure logging
 logging.basicConfig(
@@ -51,10 +57,38 @@ ALGOLIA_API_KEY = "69e73c81a774c3c152e24bc652cfd6da"
 ALGOLIA_INDEX = "Products_featured"
 ALGOLIA_URL = f"https://{ALGOLIA_APP_ID.lower()}-dsn.algolia.net/1/indexes/*/queries"
 
+# Built once and reused for every request over the shared keep-alive session
+ALGOLIA_HEADERS = {
+    "Content-Type": "application/json",
+    "X-Algolia-API-Key": ALGOLIA_API_KEY,
+    "X-Algolia-Application-Id": ALGOLIA_APP_ID
+}
+
+# Politeness delays in seconds: between sampling/gap-filling queries and between result pages
+QUERY_DELAY = 0.2
+PAGE_DELAY = 0.3
+
 # Category filter for Condenser Bushings
 CATEGORY_FILTER = "Categories.lvl3:'Power & Utilities > Bushings > Power Apparatus Bushings > Condenser Bushings'"
 
 
+def configure_algolia_url(url: Optional[str] = None) -> str:
+    """
+    Send search queries to another Algolia-compatible endpoint (e.g. the stand-in
+    server of scraping_benchmark.py).
+    
+    Args:
+        url: Full queries endpoint URL (None restores the live Algolia endpoint)
+    
+    Returns:
+        ALGOLIA_URL now in effect
+    """
+    global ALGOLIA_URL
+    ALGOLIA_URL = url or f"https://{ALGOLIA_APP_ID.lower()}-dsn.algolia.net/1/indexes/*/queries"
+    logger.info(f"Algolia endpoint: {ALGOLIA_URL}")
+    return ALGOLIA_URL
+
+
 def search_products(category_filter: str, hits_per_page: int = 100, page: int = 0) -> Optional[Dict]:
     """
     Query Algolia Search API with category filter, pagination.
@@ -67,12 +101,6 @@ def search_products(category_filter: str, hits_per_page: int = 100, page: int =
     Returns:
         API response as dictionary, or None if request failed
     """
-    headers = {
-        "Content-Type": "application/json",
-        "X-Algolia-API-Key": ALGOLIA_API_KEY,
-        "X-Algolia-Application-Id": ALGOLIA_APP_ID
-    }
-    
     # Use the same payload structure as the original working scraper
     payload = {
         "requests": [{
@@ -88,7 +116,7 @@ def search_products(category_filter: str, hits_per_page: int = 100, page: int =
     }
     
     try:
-        response = requests.post(ALGOLIA_URL, headers=headers, json=payload, timeout=30)
+        response = http_post(ALGOLIA_URL, headers=ALGOLIA_HEADERS, json=payload, timeout=30)
         response.raise_for_status()
         return response.json()
     
@@ -163,7 +191,7 @@ def get_unique_kv_classes(brand_filter: str, max_samples: int = 500) -> List[str
                 kv_class = hit.get('kV Class')
                 if kv_class:
                     kv_classes.add(kv_class)
-        time.sleep(0.2)
+        time.sleep(QUERY_DELAY)
     
     kv_list = sorted(list(kv_classes))
     logger.info(f"  Found {len(kv_list)} unique kV classes: {kv_list}")
@@ -237,7 +265,7 @@ def scrape_with_kv_filtering(brand: str, all_products: List[Dict]) -> int:
                     break
                 
                 page += 1
-                time.sleep(0.3)
+                time.sleep(PAGE_DELAY)
                 
         except Exception as e:
             logger.error(f"    Error scraping {brand} - {kv_class} page {page}: {e}")
@@ -273,7 +301,7 @@ def get_unique_bil_values(brand_filter: str, max_samples: int = 500) -> List[str
                 bil = hit.get('BIL')
                 if bil:
                     bil_values.add(bil)
-        time.sleep(0.2)
+        time.sleep(QUERY_DELAY)
     
     bil_list = sorted(list(bil_values))
     logger.info(f"  Found {len(bil_list)} unique BIL values")
@@ -347,7 +375,7 @@ def scrape_with_bil_filtering(brand: str, all_products: List[Dict]) -> int:
                     break
                 
                 page += 1
-                time.sleep(0.3)
+                time.sleep(PAGE_DELAY)
                 
         except Exception as e:
             logger.error(f"    Error scraping {brand} - BIL {bil} page {page}: {e}")
@@ -383,7 +411,7 @@ def get_unique_current_ratings(brand_filter: str, max_samples: int = 500) -> Lis
                 rating = hit.get('Current Rating')
                 if rating:
                     current_ratings.add(rating)
-        time.sleep(0.2)
+        time.sleep(QUERY_DELAY)
     
     rating_list = sorted(list(current_ratings))
     logger.info(f"  Found {len(rating_list)} unique Current Rating values")
@@ -455,7 +483,7 @@ def scrape_with_current_rating_filtering(brand: str, all_products: List[Dict]) -
                     break
                 
                 page += 1
-                time.sleep(0.3)
+                time.sleep(PAGE_DELAY)
                 
         except Exception as e:
             logger.error(f"    Error scraping {brand} - Rating {rating} page {page}: {e}")
@@ -510,7 +538,7 @@ def scrape_missing_products(all_products: List[Dict]) -> int:
                             product = parse_algolia_product(hit)
                             if product:
                                 all_products.append(product)
-                time.sleep(0.2)
+                time.sleep(QUERY_DELAY)
             except Exception as e:
                 logger.error(f"  Error querying {brand} - {kv_class}: {e}")
                 continue
@@ -538,7 +566,7 @@ def scrape_missing_products(all_products: List[Dict]) -> int:
                             product = parse_algolia_product(hit)
                             if product:
                                 all_products.append(product)
-                    time.sleep(0.3)
+                    time.sleep(PAGE_DELAY)
     except Exception as e:
         logger.error(f"  Error querying without brand filter: {e}")
     
@@ -0,0 +1,591 @@
+"""
+End-to-End Throughput Benchmark for the Scraping Pipelines
+
+Runs the real collection code against local stand-in servers and measures it:
+    crossref - hitachi_website_data_batch_scraper.scrape_range(1, N) against the
+               replay server (hitachi_website_replay_server.py), real INDEX sparsity
+    catalog  - hitachi_website_catalog_batch_scraper.scrape_batch() on N style numbers
+               against the replay server; keys beyond the saved corpus get a
+               synthesized corpus page
+    hubbell  - scrape_all_products_complete() against a stand-in Algolia endpoint
+               holding N synthetic condenser bushing products
+
+Every case runs in a fresh child process inside an empty temporary folder, so
+peak RSS, output files and module state are per case. Each case reports wall
+time, pages/sec, p50/p95 request latency, peak RSS, bytes written and the time
+spent in fetch, parse and write (summed over worker threads). Results are
+written as JSON so runs of different versions can be compared with --compare.
+
+Logging below ERROR and the scrapers' console output are silenced during a
+case, and the Hubbell scraper's politeness delays are set to 0: the benchmark
+measures the pipeline, not the configured pacing.
+
+Usage:
+    python scraping_benchmark.py
+    python scraping_benchmark.py --pipelines crossref,catalog --sizes 1000,10000 --workers 8
+    python scraping_benchmark.py --sizes 1000 --latency 50 --output after.json --compare before.json
+
+Author: Data Collection System
+Date: October 16, 2026
+Version: 1.0 - Initial benchmark suite
+"""
+
+import argparse
+import contextlib
+import functools
+import json
+import logging
+import math
+import os
+import platform
+import random
+import re
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from pathlib import Path
+from typing import Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Not available on Windows - peak RSS is reported as null
+    resource = None
+
+ROOT_DIR = Path(__file__).resolve().parent
+HITACHI_DIR = ROOT_DIR / "hitachi_website_data_collection"
+HUBBELL_DIR = ROOT_DIR / "hubbell_website_data_collection"
+
+PIPELINES = ("crossref", "catalog", "hubbell")
+DEFAULT_SIZES = (1000, 10000, 50000)
+RESULT_FORMAT_VERSION = 1
+
+# Algolia answers at most this many hits per query, however it is paginated
+ALGOLIA_PAGINATION_LIMIT = 1000
+
+# field:'value' or 'field name':'value' terms of an Algolia filter string
+ALGOLIA_FILTER_TERM = re.compile(r"(?:'([^']+)'|([\w.]+)):'([^']*)'")
+
+ALGOLIA_BRANDS = ("PCORE Electric", "Electro Composites")
+ALGOLIA_KV_CLASSES = [f"{v} kV" for v in (
+    0.68, 1.2, 2.5, 5, 8.7, 15, 25, 34.5, 46, 69, 115, 138, 161, 230, 345, 500,
+    4, 13.8, 14.4, 22, 23, 24.5, 30, 44, 92, 245, 300
+)]
+ALGOLIA_BIL_VALUES = [f"{v} kV" for v in (
+    30, 45, 60, 75, 95, 110, 150, 200, 250, 350, 450, 550, 650, 750, 825, 900, 1050, 1300, 1425, 1550, 1800
+)]
+ALGOLIA_CURRENT_RATINGS = [f"{v} A" for v in range(400, 6400, 200)]
+
+logger = logging.getLogger(__name__)
+
+
+# ---------------------------------------------------------------------------
+# Stand-in Algolia endpoint for the Hubbell scraper
+# ---------------------------------------------------------------------------
+
+def synthetic_products(count: int, seed: int = 0) -> List[Dict]:
+    """
+    Condenser bushing hits shaped like the Products_featured index.
+    A few products lack kV Class, BIL or Current Rating, as on the live index.
+
+    Args:
+        count: Number of products
+        seed: Seed for the field values
+
+    Returns:
+        List of hit dictionaries
+    """
+    rng = random.Random(seed)
+    products = []
+    for i in range(count):
+        kv_class = rng.choice(ALGOLIA_KV_CLASSES)
+        product = {
+            "objectID": str(7200000 + i),
+            "title": f"POC Type Bushing {kv_class}",
+            "Brand": ALGOLIA_BRANDS[i % len(ALGOLIA_BRANDS)],
+            "Catalog Number": f"BENCH{i:06d}",
+            "kV Class": kv_class if rng.random() > 0.04 else None,
+            "BIL": rng.choice(ALGOLIA_BIL_VALUES) if rng.random() > 0.05 else None,
+            "Current Rating": rng.choice(ALGOLIA_CURRENT_RATINGS) if rng.random() > 0.05 else None,
+        }
+        products.append({k: v for k, v in product.items() if v is not None})
+    return products
+
+
+class AlgoliaRequestHandler(BaseHTTPRequestHandler):
+    """
+    Answers POST /1/indexes/*/queries with hits matching the request's filters.
+    """
+
+    protocol_version = 'HTTP/1.1'
+    # Headers and body go out as separate writes; without TCP_NODELAY the body waits for a delayed ACK
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+    def do_POST(self):
+        server = self.server
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        if server.latency > 0:
+            time.sleep(server.latency)
+        try:
+            query = json.loads(body)['requests'][0]
+        except (ValueError, KeyError, IndexError):
+            self._send(400, {"message": "Invalid request"})
+            return
+
+        matches = server.matching(query.get('filters', ''))
+        hits_per_page = max(1, int(query.get('hitsPerPage', 20)))
+        page = int(query.get('page', 0))
+        start = page * hits_per_page
+        reachable = min(len(matches), ALGOLIA_PAGINATION_LIMIT)
+        hits = matches[start:min(start + hits_per_page, reachable)]
+        self._send(200, {"results": [{
+            "hits": hits,
+            "nbHits": len(matches),
+            "page": page,
+            "nbPages": math.ceil(reachable / hits_per_page),
+            "hitsPerPage": hits_per_page,
+        }]})
+
+    def _send(self, status: int, payload: dict):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=UTF-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class AlgoliaStandIn(ThreadingHTTPServer):
+    """
+    In-memory product index behind AlgoliaRequestHandler.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, products: List[Dict], latency: float = 0.0, host: str = '127.0.0.1', port: int = 0):
+        super().__init__((host, port), AlgoliaRequestHandler)
+        self.products = products
+        self.latency = latency
+        self._filter_cache: Dict[str, List[Dict]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def queries_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/1/indexes/*/queries"
+
+    def matching(self, filters: str) -> List[Dict]:
+        """Products matching every field:'value' term (categories are not modelled)."""
+        with self._lock:
+            cached = self._filter_cache.get(filters)
+        if cached is not None:
+            return cached
+        terms = []
+        for quoted, bare, value in ALGOLIA_FILTER_TERM.findall(filters):
+            field = quoted or bare
+            if field.startswith('Categories.'):
+                continue
+            terms.append(('Brand' if field == 'Brands' else field, value))
+        result = [p for p in self.products if all(p.get(field) == value for field, value in terms)]
+        with self._lock:
+            self._filter_cache[filters] = result
+        return result
+
+    def start(self) -> str:
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self.queries_url
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+# ---------------------------------------------------------------------------
+# Case runner (child process)
+# ---------------------------------------------------------------------------
+
+class Stopwatch:
+    """
+    Accumulates wall time per phase across threads by wrapping module functions.
+    """
+
+    def __init__(self):
+        self.totals = Counter()
+        self._lock = threading.Lock()
+
+    def wrap(self, owner, name: str, phase: str):
+        """
+        Replace owner.name with a timed wrapper (no-op if the attribute is missing).
+
+        Args:
+            owner: Module or class holding the function
+            name: Attribute name
+            phase: 'fetch', 'parse' or 'write'
+        """
+        original = getattr(owner, name, None)
+        if original is None:
+            return
+
+        @functools.wraps(original)
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                with self._lock:
+                    self.totals[phase] += elapsed
+
+        setattr(owner, name, timed)
+
+
+def percentile(values: List[float], fraction: float) -> Optional[float]:
+    """Nearest-rank percentile of a list (None if empty)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(fraction * len(ordered)))
+    return ordered[rank - 1]
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process in MiB."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in KiB on Linux
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def directory_size(path: str) -> int:
+    """Total size in bytes of all files below a folder."""
+    total = 0
+    for folder, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(folder, name))
+            except OSError:
+                pass
+    return total
+
+
+def catalog_keys(size: int) -> List[str]:
+    """
+    Style numbers for the catalog case: the saved corpus first, then synthetic
+    keys (served a synthesized corpus page by the replay server).
+    """
+    import hitachi_website_replay_server as replay
+    styles = replay.corpus_keys(os.path.join(replay.DEFAULT_RAW_ROOT, "catalog_data"))
+    if size <= len(styles):
+        return styles[:size]
+    return styles + [f"BENCH{n:06d}" for n in range(size - len(styles))]
+
+
+def run_case(case: dict) -> dict:
+    """
+    Run one benchmark case in the current process (called in the child).
+
+    Args:
+        case: Dict with pipeline, size, workers and the stand-in server URL
+
+    Returns:
+        Measurements for the case
+    """
+    sys.path.insert(0, str(ROOT_DIR))
+    sys.path.insert(0, str(HITACHI_DIR))
+    sys.path.insert(0, str(HUBBELL_DIR))
+    from scraping_http_client import add_response_listener, configure_pools, DEFAULT_POOL_MAXSIZE
+
+    pipeline = case['pipeline']
+    size = case['size']
+    stopwatch = Stopwatch()
+    latencies: List[float] = []
+    statuses = Counter()
+
+    def observe(status_code, latency, error=None):
+        latencies.append(latency)
+        statuses[str(status_code) if status_code is not None else 'error'] += 1
+
+    if pipeline == 'crossref':
+        import hitachi_website_data_scraper as crossref
+        import hitachi_website_data_batch_scraper as crossref_batch
+        crossref.configure_base_url(case['url'])
+        stopwatch.wrap(crossref, 'http_get', 'fetch')
+        # Both parsers (and the fast parser's soup fallback) run inside parse_bushing_page
+        stopwatch.wrap(crossref, 'parse_bushing_page', 'parse')
+        stopwatch.wrap(crossref, 'save_raw_html', 'write')
+        stopwatch.wrap(crossref, 'log_error_to_csv', 'write')
+        stopwatch.wrap(crossref_batch, 'save_to_csv', 'write')
+
+        def run():
+            crossref_batch.scrape_range(1, size, delay=0, mode='append', workers=case['workers'])
+
+    elif pipeline == 'catalog':
+        import hitachi_website_catalog_scraper as catalog
+        import hitachi_website_catalog_batch_scraper as catalog_batch
+        catalog.configure_base_url(case['url'])
+        keys = catalog_keys(size)
+        stopwatch.wrap(catalog, 'http_get', 'fetch')
+        stopwatch.wrap(catalog, 'BeautifulSoup', 'parse')
+        stopwatch.wrap(catalog, 'parse_catalog_info', 'parse')
+        stopwatch.wrap(catalog, 'save_raw_html', 'write')
+        stopwatch.wrap(catalog, 'log_error_to_csv', 'write')
+        stopwatch.wrap(catalog_batch, 'save_to_csv', 'write')
+
+        def run():
+            catalog_batch.scrape_batch(keys, delay=0, mode='append')
+
+    else:
+        import pandas as pd
+        import hubbell_website_algolia_scraper_kv_enhanced as hubbell
+        hubbell.configure_algolia_url(case['url'])
+        hubbell.QUERY_DELAY = 0
+        hubbell.PAGE_DELAY = 0
+        stopwatch.wrap(hubbell, 'http_post', 'fetch')
+        stopwatch.wrap(hubbell, 'parse_algolia_product', 'parse')
+        stopwatch.wrap(pd.DataFrame, 'to_csv', 'write')
+
+        def run():
+            hubbell.scrape_all_products_complete()
+
+    configure_pools(pool_maxsize=max(DEFAULT_POOL_MAXSIZE, case['workers']))
+    add_response_listener(observe)
+
+    start = time.perf_counter()
+    with open(os.devnull, 'w', encoding='utf-8') as devnull, contextlib.redirect_stdout(devnull):
+        run()
+    wall = time.perf_counter() - start
+
+    requests_made = len(latencies)
+    return {
+        'pipeline': pipeline,
+        'size': size,
+        'workers': case['workers'] if pipeline == 'crossref' else 1,
+        'server_latency_ms': case['latency_ms'],
+        'wall_seconds': round(wall, 3),
+        'requests': requests_made,
+        'pages_per_sec': round(requests_made / wall, 2) if wall > 0 else None,
+        'keys_per_sec': round(size / wall, 2) if wall > 0 else None,
+        'latency_p50_ms': round(percentile(latencies, 0.50) * 1000, 2) if latencies else None,
+        'latency_p95_ms': round(percentile(latencies, 0.95) * 1000, 2) if latencies else None,
+        'peak_rss_mb': round(peak_rss_mb(), 1) if resource is not None else None,
+        'bytes_written': directory_size(os.getcwd()),
+        'fetch_seconds': round(stopwatch.totals['fetch'], 3),
+        'parse_seconds': round(stopwatch.totals['parse'], 3),
+        'write_seconds': round(stopwatch.totals['write'], 3),
+        'status_counts': dict(statuses),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Driver (parent process)
+# ---------------------------------------------------------------------------
+
+def run_case_in_child(case: dict, verbose: bool = False) -> dict:
+    """
+    Run one case in a fresh Python process inside an empty temporary folder.
+
+    Args:
+        case: Case description (see run_case)
+        verbose: Keep the child's logging output
+
+    Returns:
+        Measurements reported by the child
+
+    Raises:
+        RuntimeError: If the child failed
+    """
+    with tempfile.TemporaryDirectory(prefix=f"bench_{case['pipeline']}_") as workdir:
+        result_path = os.path.join(workdir, '.result.json')
+        command = [sys.executable, str(Path(__file__).resolve()), '--run-case', json.dumps(case),
+                   '--result-file', result_path]
+        if verbose:
+            command.append('--verbose')
+        completed = subprocess.run(command, cwd=workdir,
+                                   stderr=None if verbose else subprocess.PIPE, text=True)
+        if completed.returncode != 0 or not os.path.exists(result_path):
+            raise RuntimeError(f"{case['pipeline']} x {case['size']} failed: "
+                               f"{(completed.stderr or '').strip()[-500:]}")
+        with open(result_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+
+def git_revision() -> Optional[str]:
+    """Commit of the code being benchmarked (None outside a git checkout)."""
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def format_results(results: List[dict]) -> str:
+    """Fixed-width table of the measurements."""
+    header = (f"{'Pipeline':<9} {'Keys':>7} {'Reqs':>7} {'Wall s':>8} {'Pages/s':>8} {'p50 ms':>7} "
+              f"{'p95 ms':>7} {'RSS MB':>7} {'Written':>10} {'Fetch s':>8} {'Parse s':>8} {'Write s':>8}")
+    lines = [header, '-' * len(header)]
+    for r in results:
+        lines.append(
+            f"{r['pipeline']:<9} {r['size']:>7} {r['requests']:>7} {r['wall_seconds']:>8.2f} "
+            f"{r['pages_per_sec'] or 0:>8.1f} {r['latency_p50_ms'] or 0:>7.1f} {r['latency_p95_ms'] or 0:>7.1f} "
+            f"{r['peak_rss_mb'] or 0:>7.1f} {r['bytes_written']:>10} {r['fetch_seconds']:>8.2f} "
+            f"{r['parse_seconds']:>8.2f} {r['write_seconds']:>8.2f}"
+        )
+    return "\n".join(lines)
+
+
+def format_comparison(results: List[dict], baseline: dict) -> str:
+    """Pages/sec and peak RSS of this run against a previous result file."""
+    previous = {(r['pipeline'], r['size']): r for r in baseline.get('results', [])}
+    lines = [f"Compared with {baseline.get('git_revision') or 'baseline'} ({baseline.get('created', '?')}):"]
+    for r in results:
+        old = previous.get((r['pipeline'], r['size']))
+        if not old or not old.get('pages_per_sec') or not r.get('pages_per_sec'):
+            lines.append(f"  {r['pipeline']} x {r['size']}: no baseline")
+            continue
+        speedup = r['pages_per_sec'] / old['pages_per_sec']
+        rss = ""
+        if old.get('peak_rss_mb') and r.get('peak_rss_mb'):
+            rss = f", peak RSS {old['peak_rss_mb']:.0f} -> {r['peak_rss_mb']:.0f} MB"
+        lines.append(f"  {r['pipeline']} x {r['size']}: {old['pages_per_sec']:.1f} -> {r['pages_per_sec']:.1f} "
+                     f"pages/s ({speedup:.2f}x){rss}")
+    return "\n".join(lines)
+
+
+def run_benchmark(pipelines: List[str], sizes: List[int], workers: int = 8, latency_ms: float = 0.0,
+                  verbose: bool = False) -> dict:
+    """
+    Run every pipeline x size case against fresh stand-in servers.
+
+    Args:
+        pipelines: Subset of PIPELINES
+        sizes: Numbers of keys per case
+        workers: Fetch workers for the crossref pipeline
+        latency_ms: Service time added by the stand-in servers per request
+        verbose: Keep the children's logging output
+
+    Returns:
+        JSON-serializable result document
+    """
+    sys.path.insert(0, str(HITACHI_DIR))
+    import hitachi_website_replay_server as replay
+
+    results = []
+    for pipeline in pipelines:
+        for size in sizes:
+            if pipeline == 'hubbell':
+                server = AlgoliaStandIn(synthetic_products(size), latency=latency_ms / 1000.0)
+                url = server.start()
+            else:
+                config = replay.ReplayConfig(latency=latency_ms / 1000.0, synthesize=pipeline == 'catalog')
+                server = replay.create_server(config=config)
+                server.start()
+                url = server.base_url
+            case = {'pipeline': pipeline, 'size': size, 'workers': workers, 'latency_ms': latency_ms, 'url': url}
+            print(f"▶ {pipeline} x {size} ...", flush=True)
+            try:
+                result = run_case_in_child(case, verbose)
+            finally:
+                server.stop()
+            print(f"  {result['requests']} requests in {result['wall_seconds']:.1f}s "
+                  f"({result['pages_per_sec']} pages/s)", flush=True)
+            results.append(result)
+
+    return {
+        'format': RESULT_FORMAT_VERSION,
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'git_revision': git_revision(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'config': {'pipelines': pipelines, 'sizes': sizes, 'workers': workers, 'server_latency_ms': latency_ms},
+        'results': results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Throughput benchmark of the scraping pipelines against local stand-in servers',
+        epilog='Examples:\n'
+               '  python scraping_benchmark.py\n'
+               '  python scraping_benchmark.py --pipelines crossref,catalog --sizes 1000,10000 --workers 8\n'
+               '  python scraping_benchmark.py --sizes 1000 --latency 50 --output after.json --compare before.json\n',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('--pipelines', type=str, default=','.join(PIPELINES),
+                       help=f'Comma-separated pipelines to run (default: {",".join(PIPELINES)})')
+    parser.add_argument('--sizes', type=str, default=','.join(str(s) for s in DEFAULT_SIZES),
+                       help=f'Comma-separated key counts per case (default: {",".join(str(s) for s in DEFAULT_SIZES)})')
+    parser.add_argument('--workers', type=int, default=8,
+                       help='Fetch workers for the crossref pipeline (default: 8)')
+    parser.add_argument('--latency', type=float, default=0.0,
+                       help='Service time of the stand-in servers per request in ms (default: 0)')
+    parser.add_argument('--output', type=str, default='scraping_benchmark_results.json',
+                       help='Result JSON file (default: scraping_benchmark_results.json)')
+    parser.add_argument('--compare', type=str, default=None,
+                       help='Previous result JSON file to compare pages/sec and peak RSS against')
+    parser.add_argument('--verbose', action='store_true', help='Show the scrapers\' logging output')
+    parser.add_argument('--run-case', type=str, default=None, help=argparse.SUPPRESS)
+    parser.add_argument('--result-file', type=str, default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_case:
+        # Child process: one case in the current (temporary) folder
+        if not args.verbose:
+            logging.disable(logging.WARNING)
+        result = run_case(json.loads(args.run_case))
+        with open(args.result_file, 'w', encoding='utf-8') as f:
+            json.dump(result, f)
+        return
+
+    pipelines = [p.strip() for p in args.pipelines.split(',') if p.strip()]
+    unknown = [p for p in pipelines if p not in PIPELINES]
+    if unknown:
+        parser.error(f"unknown pipeline(s): {', '.join(unknown)} (choose from {', '.join(PIPELINES)})")
+    try:
+        sizes = [int(s) for s in args.sizes.split(',')]
+    except ValueError:
+        parser.error('--sizes must be comma-separated integers')
+    if any(s < 1 for s in sizes):
+        parser.error('--sizes must be positive')
+    if args.workers < 1:
+        parser.error('--workers must be at least 1')
+
+    baseline = None
+    if args.compare:
+        try:
+            with open(args.compare, 'r', encoding='utf-8') as f:
+                baseline = json.load(f)
+        except (OSError, ValueError) as e:
+            parser.error(f'cannot read --compare file: {e}')
+
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING,
+                        format='%(asctime)s - %(levelname)s - %(message)s')
+    try:
+        document = run_benchmark(pipelines, sizes, args.workers, args.latency, args.verbose)
+    except RuntimeError as e:
+        print(f"✗ {e}")
+        sys.exit(1)
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(document, f, indent=2)
+
+    print(f"\n{'='*70}")
+    print("Scraping Benchmark Results")
+    print(f"{'='*70}")
+    print(format_results(document['results']))
+    if baseline:
+        print()
+        print(format_comparison(document['results'], baseline))
+    print(f"\n✓ Results saved to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+"""
+Shared Pooled HTTP Client for the Website Data Collectors
+
+One requests.Session per process, shared by the Hitachi cross-reference and
+catalog scrapers and the Hubbell Algolia scraper. The session keeps a
+connection pool per host (urllib3 PoolManager behind an HTTPAdapter), so
+consecutive requests to bushing.hitachienergy.com or the Algolia DSN reuse the
+same TCP+TLS connection instead of paying the handshake on every request.
+Header dictionaries are built once at import time and reused.
+
+Pool sizing:
+    pool_connections - number of per-host pools kept alive (one per distinct host)
+    pool_maxsize     - connections kept per host; should be >= concurrent workers
+
+Response listeners (e.g. the adaptive rate controller) can subscribe with
+add_response_listener() to see the status code, latency and any exception of
+every request made through http_get()/http_post().
+
+read_until() reads a response opened with stream=True only as far as the caller
+needs: the body is read chunk by chunk until a callback finds the point where
+the rest no longer matters, and the connection is closed there.
+
+Usage:
+    from scraping_http_client import http_get, HITACHI_HEADERS
+    response = http_get(url, headers=HITACHI_HEADERS, timeout=30)
+
+Author: Data Collection System
+Date: October 16, 2026
+Version: 1.2 - Early-terminating body reads (read_until)
+"""
+
+import logging
+import threading
+import time
+from typing import Callable, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_CONNECTIONS = 4
+DEFAULT_POOL_MAXSIZE = 16
+DEFAULT_CHUNK_SIZE = 2048
+
+# Browser headers shared by the Hitachi fetchers (built once, reused per request)
+BROWSER_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+}
+
+HITACHI_HEADERS = {
+    **BROWSER_HEADERS,
+    'Referer': 'https://bushing.hitachienergy.com/'
+}
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+_pool_connections = DEFAULT_POOL_CONNECTIONS
+_pool_maxsize = DEFAULT_POOL_MAXSIZE
+
+# Callables (status_code or None, latency seconds, exception or None)
+ResponseListener = Callable[[Optional[int], float, Optional[BaseException]], None]
+_listeners: List[ResponseListener] = []
+
+
+def _build_session() -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=_pool_connections, pool_maxsize=_pool_maxsize)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    logger.debug(f"Created pooled HTTP session ({_pool_connections} host pools x {_pool_maxsize} connections)")
+    return session
+
+
+def get_session() -> requests.Session:
+    """
+    Return the process-wide pooled session, creating it on first use.
+
+    The urllib3 pools behind the session are thread-safe, so the batch
+    scrapers' fetch workers can share it.
+
+    Returns:
+        Shared requests.Session
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _build_session()
+    return _session
+
+
+def configure_pools(pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+                    pool_maxsize: int = DEFAULT_POOL_MAXSIZE) -> None:
+    """
+    Resize the connection pools. Takes effect immediately: the current session
+    (if any) is closed and a new one is built on the next get_session() call.
+
+    Args:
+        pool_connections: Number of per-host pools to keep alive
+        pool_maxsize: Maximum connections kept per host
+    """
+    global _session, _pool_connections, _pool_maxsize
+    with _session_lock:
+        _pool_connections = max(1, pool_connections)
+        _pool_maxsize = max(1, pool_maxsize)
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+def close_session() -> None:
+    """Close the shared session and release its pooled connections."""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+def add_response_listener(listener: ResponseListener) -> None:
+    """
+    Subscribe to request outcomes.
+
+    Args:
+        listener: Called after every request with (status_code, latency, error);
+                  status_code is None when the request raised
+    """
+    with _session_lock:
+        _listeners.append(listener)
+
+
+def remove_response_listener(listener: ResponseListener) -> None:
+    """Unsubscribe a listener added with add_response_listener()."""
+    with _session_lock:
+        if listener in _listeners:
+            _listeners.remove(listener)
+
+
+def notify_response(status_code: Optional[int], latency: float,
+                    error: Optional[BaseException] = None) -> None:
+    """
+    Report one request outcome to all listeners. Used by http_get/http_post and
+    by transports that do not go through the shared session (asyncio backend).
+    """
+    for listener in list(_listeners):
+        try:
+            listener(status_code, latency, error)
+        except Exception as e:
+            logger.warning(f"Response listener failed: {e}")
+
+
+def _timed_request(method: str, url: str, **kwargs) -> requests.Response:
+    start = time.monotonic()
+    try:
+        response = get_session().request(method, url, **kwargs)
+    except requests.exceptions.RequestException as e:
+        notify_response(None, time.monotonic() - start, e)
+        raise
+    notify_response(response.status_code, time.monotonic() - start)
+    return response
+
+
+def http_get(url: str, **kwargs) -> requests.Response:
+    """GET through the shared session and report the outcome to listeners."""
+    return _timed_request('GET', url, **kwargs)
+
+
+def http_post(url: str, **kwargs) -> requests.Response:
+    """POST through the shared session and report the outcome to listeners."""
+    return _timed_request('POST', url, **kwargs)
+
+
+def read_until(response: requests.Response, end_of: Callable[[bytes], Optional[int]],
+               chunk_size: int = DEFAULT_CHUNK_SIZE) -> Tuple[bytes, bool]:
+    """
+    Read the body of a streamed response (stream=True) until end_of finds
+    where the part the caller needs ends, then close the response.
+
+    The body is decoded (gzip/deflate) as it arrives. Stopping before the end
+    discards the connection instead of returning it to the pool, so the next
+    request to the host opens a new one.
+
+    Args:
+        response: Response of http_get(url, stream=True, ...)
+        end_of: Called with the body read so far after every chunk; returns the
+                length of the prefix to keep, or None to keep reading
+        chunk_size: Bytes read per chunk
+
+    Returns:
+        Tuple of (body or its prefix, True if the read stopped early)
+    """
+    body = bytearray()
+    try:
+        for chunk in response.iter_content(chunk_size=chunk_size):
+            body += chunk
+            end = end_of(bytes(body))
+            if end is not None:
+                return bytes(body[:end]), True
+        return bytes(body), False
+    finally:
+        response.close()